@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""Two-tier rule-acquisition cache: memory per open plan, disk per GeoPackage.
+
+Pure python — no QGIS imports. Keys are ``generation.rule_cache_key`` values
+(config, input fingerprints, scope, step, RPL fingerprint, tolerance), so an
+entry is only ever reused for identical acquisition inputs. The memory tier
+is the dict the analysis used before; the disk tier persists footprint and
+no-data intervals in ``bp_acq_cache`` so reopening a project re-acquires
+only rules whose inputs changed.
+
+Each persisted row also stores the resolved input fingerprint
+(``map_layers.layer_fingerprint`` / ``depth_config_fingerprint``) it was
+acquired against; a row whose fingerprint differs from the live one is
+ignored and overwritten on the next run. The disk tier is bounded by size
+with least-recently-used eviction (``lru_evictions``).
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..workbench.rules_engine import Interval
+from . import schema
+
+Acquisition = Tuple[List[Interval], List[Interval]]
+
+# Interval lists are small (tens of bytes per interval); 16 MB holds
+# thousands of rule acquisitions before the oldest are evicted.
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+
+def encode_acquisition(footprint: Sequence[Interval],
+                       nodata: Sequence[Interval]) -> str:
+    """Intervals → JSON text (floats written with full ``repr`` precision)."""
+    return json.dumps({
+        "footprint": [[iv.start_km, iv.end_km] for iv in footprint],
+        "nodata": [[iv.start_km, iv.end_km] for iv in nodata],
+    }, separators=(",", ":"))
+
+
+def decode_acquisition(text: str) -> Optional[Acquisition]:
+    """Inverse of :func:`encode_acquisition`; None when unreadable."""
+    try:
+        data = json.loads(text or "")
+        return ([Interval(float(a), float(b)) for a, b in data["footprint"]],
+                [Interval(float(a), float(b)) for a, b in data["nodata"]])
+    except (ValueError, TypeError, KeyError):
+        return None
+
+
+def lru_evictions(entries: Sequence[Tuple[str, int, str]],
+                  max_bytes: int) -> List[str]:
+    """Keys to drop so the total size fits ``max_bytes``.
+
+    ``entries`` are ``(cache_key, size_bytes, used_utc)``; the most recently
+    used entries are kept (ties broken by key for determinism).
+    """
+    ordered = sorted(entries, key=lambda e: (str(e[2] or ""), str(e[0])),
+                     reverse=True)
+    total = 0
+    drop: List[str] = []
+    for key, size, _used in ordered:
+        total += max(int(size or 0), 0)
+        if total > max_bytes:
+            drop.append(str(key))
+    return drop
+
+
+class AcquisitionCache(dict):
+    """The in-memory cache dict, backed by the plan GeoPackage.
+
+    Still a plain ``{cache_key: (footprint, nodata)}`` mapping for callers
+    that only read and write the memory tier. ``lookup`` falls through to
+    the store; ``put`` queues a row and ``flush`` writes queued rows and
+    recency updates in one transaction, then evicts.
+
+    ``store_fn`` returns the current store (the dock swaps stores when the
+    project's GeoPackage changes); the store provides ``get_acquisition``
+    and ``save_acquisitions``.
+    """
+
+    def __init__(self, store_fn: Callable[[], object],
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        super().__init__()
+        self._store_fn = store_fn
+        self.max_bytes = max_bytes
+        self._fingerprints: Dict[str, str] = {}
+        self._pending: Dict[str, Dict] = {}
+        self._touched: set = set()
+
+    def lookup(self, cache_key: str,
+               input_fingerprint: str = "") -> Optional[Acquisition]:
+        """Memory first, then the persisted row if its fingerprint matches."""
+        self._fingerprints[cache_key] = input_fingerprint or ""
+        cached = self.get(cache_key)
+        if cached is not None:
+            return cached
+        store = self._store_fn()
+        if store is None:
+            return None
+        try:
+            row = store.get_acquisition(cache_key)
+        except Exception:
+            return None  # a cache read must never block an analysis
+        if not row or str(row.get("input_fingerprint") or "") \
+                != (input_fingerprint or ""):
+            return None
+        cached = decode_acquisition(row.get("intervals_json") or "")
+        if cached is None:
+            return None
+        self[cache_key] = cached
+        self._touched.add(cache_key)
+        return cached
+
+    def put(self, cache_key: str, footprint: List[Interval],
+            nodata: List[Interval], rule_id: str = "") -> None:
+        """Store a fresh acquisition in memory and queue it for disk."""
+        self[cache_key] = (footprint, nodata)
+        text = encode_acquisition(footprint, nodata)
+        now = schema.utc_now_iso()
+        self._pending[cache_key] = {
+            "cache_key": cache_key,
+            "rule_id": rule_id or "",
+            "input_fingerprint": self._fingerprints.get(cache_key, ""),
+            "intervals_json": text,
+            "size_bytes": len(text),
+            "created_utc": now,
+            "used_utc": now,
+        }
+        self._touched.discard(cache_key)
+
+    def flush(self) -> bool:
+        """Write queued rows and recency updates; False if the store failed.
+
+        The queue is kept on failure so a later flush can retry.
+        """
+        if not self._pending and not self._touched:
+            return True
+        store = self._store_fn()
+        if store is None:
+            return False
+        try:
+            store.save_acquisitions(list(self._pending.values()),
+                                    sorted(self._touched), self.max_bytes)
+        except Exception:
+            return False
+        self._pending.clear()
+        self._touched.clear()
+        return True
+
+    def clear(self) -> None:
+        """Drop the memory tier and the write queue (plan switch).
+
+        Persisted rows stay; call :meth:`flush` first to keep queued ones —
+        anything still queued would otherwise reach the next plan's store.
+        """
+        super().clear()
+        self._fingerprints.clear()
+        self._pending.clear()
+        self._touched.clear()
@@ -11,11 +11,13 @@ back as plain interval data; store/layer writes happen in ``finished()`` on
 the main thread (wired by the dock).
 
 Caching (spec §14.4): each rule's acquisition (footprint + no-data +
-0.1 m-refined boundaries) is cached in memory per open plan, keyed over the
+0.1 m-refined boundaries) is cached per open plan, keyed over the
 canonicalised config, resolved input fingerprints, scope, step, RPL
 fingerprint, boundary-refinement tolerance and (for direction-aware conditions)
 direction. Editing one rule re-acquires one rule; a cancelled run leaves the
-cache warm and resumes.
+cache warm and resumes. The cache is also persisted in the plan GeoPackage
+(``acq_cache.py``), so reopening a project re-acquires only rules whose
+inputs changed.
 """
 
 from __future__ import annotations
@@ -23,6 +25,10 @@ from __future__ import annotations
 import bisect
 import json
 import math
+import os
+import queue
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from typing import Callable, Dict, List, Optional, Tuple
 
@@ -42,6 +48,9 @@ from qgis.PyQt.QtCore import pyqtSignal
 
 from ..kp_geo_utils import RouteFrame
 from ..kp_range_utils import make_distance_area
+from ..processing.raster_blocks import (
+    RasterBlockSampler, first_valid, to_optional_list,
+)
 from ..workbench import rules_engine as eng
 from ..workbench import rules_inputs as ri
 from ..workbench import schema as wb_schema
@@ -80,6 +89,13 @@ def _task_flag(name: str, default: int = 0):
 
 _CAN_CANCEL = _task_flag("CanCancel")
 
+# Stations per vectorised raster read in profile sampling; also the
+# cancel/progress granularity of those loops.
+_RASTER_CHUNK = 2048
+# Upper bound on rule-acquisition worker threads when ``AnalysisWork.workers``
+# is 0 (auto). Rules beyond this queue on the pool.
+_MAX_RULE_WORKERS = 8
+
 
 # ---------------------------------------------------------------------------
 # Thread-safe depth snapshot
@@ -92,7 +108,9 @@ class DepthSnapshot:
     Built on the main thread from a ``DepthSourceConfig``: raster providers
     are cloned (``provider.clone()``) and contour feature-source snapshots are
     captured. Contours are materialised in the worker thread.
-    ``sample(lat, lon)`` mirrors DepthService.
+    ``sample(lat, lon)`` mirrors DepthService. Parallel rules share one
+    snapshot, so raster reads (the block cache's LRU and the cloned
+    provider) are serialised under ``_raster_lock``.
     """
 
     def __init__(self, config: DepthSourceConfig, project: Optional[QgsProject] = None):
@@ -100,10 +118,12 @@ class DepthSnapshot:
         self.mode = int(config.mode)
         self.band = max(1, int(config.raster_band or 1))
         self.search_radius_m = float(config.contour_search_radius_m or 0.0)
-        # (provider, transform, cell) — cell = (x_min, y_max, upp_x, upp_y)
-        # enables the per-cell memo in _sample_rasters.
+        # (provider, transform, blocks) — blocks is the tile-cached sampler
+        # over the cloned provider; stations finer than the raster grid hit
+        # the same cached tile instead of one GDAL round trip each.
         self._rasters: List[Tuple[object, Optional[QgsCoordinateTransform],
-                                  Optional[Tuple[float, float, float, float]]]] = []
+                                  Optional[RasterBlockSampler]]] = []
+        self._raster_lock = threading.Lock()
         for layer_id in config.raster_layer_ids:
             layer = project.mapLayer(layer_id)
             if not isinstance(layer, QgsRasterLayer) or not layer.isValid():
@@ -118,24 +138,8 @@ class DepthSnapshot:
                     transform = QgsCoordinateTransform(WGS84, layer.crs(), project)
                 except Exception:
                     continue
-            cell = None
-            try:
-                extent = provider.extent()
-                x_size, y_size = int(provider.xSize()), int(provider.ySize())
-                if x_size > 0 and y_size > 0 and extent.width() > 0 \
-                        and extent.height() > 0:
-                    cell = (extent.xMinimum(), extent.yMaximum(),
-                            extent.width() / x_size, extent.height() / y_size)
-            except Exception:
-                cell = None
-            self._rasters.append((provider, transform, cell))
-        # Last sampled cell per raster: consecutive stations finer than the
-        # raster grid re-read the same cell, so memoising the previous cell
-        # removes up to ~95% of the GDAL round-trips at fine profile steps.
-        # Results are bit-identical: the key is the exact integer cell.
-        self._raster_last: List[Optional[Tuple[Tuple[int, int], object]]] = \
-            [None] * len(self._rasters)
-        self._raster_miss = object()
+            self._rasters.append(
+                (provider, transform, RasterBlockSampler.from_provider(provider)))
 
         self._contours: List[Tuple[QgsGeometry, float]] = []
         self._contour_scaled_cache: Dict = {}
@@ -240,64 +244,93 @@ class DepthSnapshot:
             if value is not None:
                 return value
         if want_contours and self._contours:
-            # 0 = unlimited (DepthService semantics): scan every contour.
-            if self.search_radius_m > 0 and self._contour_index is not None:
-                rect = ri.search_rect(point, self.search_radius_m)
-                candidates = self._contour_index.intersects(rect)
-            else:
-                candidates = range(len(self._contours))
-            best = None
-            best_dist = None
-            for i in candidates:
-                geom, value = self._contours[i]
-                try:
-                    # Isotropic-frame nearest point: the raw lon/lat
-                    # minimisation overstated distances by cos(latitude),
-                    # skewing which contour wins and the radius filter.
-                    nearest = ri.isotropic_nearest(
-                        point, geom, self._contour_scaled_cache)
-                    dist = float(self._distance.measureLine(point, nearest))
-                except Exception:
-                    continue
-                if self.search_radius_m > 0 and dist > self.search_radius_m:
-                    continue
-                if best_dist is None or dist < best_dist:
-                    best_dist = dist
-                    best = value
-            return best
+            return self._nearest_contour(point)
         return None
 
+    def sample_many(self, coords: List[Tuple[float, float]]
+                    ) -> List[Optional[float]]:
+        """``sample`` over many ``(lat, lon)`` pairs; rasters read in one pass."""
+        if not coords:
+            return []
+        if not self._contours_prepared and not self.prepare():
+            return [None] * len(coords)
+        points = [QgsPointXY(lon, lat) for lat, lon in coords]
+        out: List[Optional[float]] = [None] * len(points)
+        if self.mode in (0, 1) and self._rasters:
+            out = self._sample_rasters_many(points)
+        if self.mode in (0, 2) and self._contours:
+            for i, point in enumerate(points):
+                if out[i] is None:
+                    out[i] = self._nearest_contour(point)
+        return out
+
+    def _nearest_contour(self, point: QgsPointXY) -> Optional[float]:
+        """Value of the nearest contour within the search radius."""
+        # 0 = unlimited (DepthService semantics): scan every contour.
+        if self.search_radius_m > 0 and self._contour_index is not None:
+            rect = ri.search_rect(point, self.search_radius_m)
+            candidates = self._contour_index.intersects(rect)
+        else:
+            candidates = range(len(self._contours))
+        best = None
+        best_dist = None
+        for i in candidates:
+            geom, value = self._contours[i]
+            try:
+                # Isotropic-frame nearest point: the raw lon/lat
+                # minimisation overstated distances by cos(latitude),
+                # skewing which contour wins and the radius filter.
+                nearest = ri.isotropic_nearest(
+                    point, geom, self._contour_scaled_cache)
+                dist = float(self._distance.measureLine(point, nearest))
+            except Exception:
+                continue
+            if self.search_radius_m > 0 and dist > self.search_radius_m:
+                continue
+            if best_dist is None or dist < best_dist:
+                best_dist = dist
+                best = value
+        return best
+
     def _sample_rasters(self, point: QgsPointXY) -> Optional[float]:
-        for idx, (provider, transform, cell) in enumerate(self._rasters):
+        with self._raster_lock:
+            return self._sample_rasters_locked(point)
+
+    def _sample_rasters_locked(self, point: QgsPointXY) -> Optional[float]:
+        for provider, transform, blocks in self._rasters:
             sample_pt = point
             if transform is not None:
                 try:
                     sample_pt = transform.transform(point)
                 except Exception:
                     continue
-            key = None
-            if cell is not None:
-                x_min, y_max, upp_x, upp_y = cell
-                key = (int(math.floor((sample_pt.x() - x_min) / upp_x)),
-                       int(math.floor((y_max - sample_pt.y()) / upp_y)))
-                last = self._raster_last[idx]
-                if last is not None and last[0] == key:
-                    cached = last[1]
-                    if cached is self._raster_miss:
-                        continue
-                    return cached
+            if blocks is not None:
+                value = blocks.value_at(sample_pt.x(), sample_pt.y(), self.band)
+                if value is not None:
+                    return value
+                continue
             try:
                 value, ok = provider.sample(sample_pt, self.band)
             except Exception:
                 continue
-            good = ok and value is not None and value == value
-            if key is not None:
-                self._raster_last[idx] = (
-                    key, float(value) if good else self._raster_miss)
-            if good:
+            if ok and value is not None and value == value:
                 return float(value)
         return None
 
+    def _sample_rasters_many(self, points: List[Optional[QgsPointXY]]
+                             ) -> List[Optional[float]]:
+        """First-valid raster value per point, one vectorised pass per raster."""
+        if not points:
+            return []
+        with self._raster_lock:
+            if any(blocks is None for _p, _t, blocks in self._rasters):
+                return [None if pt is None else self._sample_rasters_locked(pt)
+                        for pt in points]
+            values, _source = first_valid(
+                [(blocks, transform) for _p, transform, blocks in self._rasters],
+                points, self.band)
+        return to_optional_list(values)
+
     def contour_crossings(
             self, route: RouteFrame,
             cancel: Optional[Callable[[], bool]] = None,
@@ -548,15 +581,12 @@ class DepthSnapshot:
                                        (3, stbd_pts, stbd)):
             if self.mode in (0, 1) and self._rasters:
                 base = (share - 1) * n
-                for i, pt in enumerate(offset_pts):
-                    if i % 500 == 0:
-                        # These two loops used to run up to 1M provider
-                        # samples with no cancel check and no progress.
-                        if cancel is not None and cancel():
-                            raise ri.AcquisitionCancelled()
-                        tick(base + i)
-                    if pt is not None:
-                        out[i] = self._sample_rasters(pt)
+                for lo in range(0, n, _RASTER_CHUNK):
+                    if cancel is not None and cancel():
+                        raise ri.AcquisitionCancelled()
+                    tick(base + lo)
+                    hi = min(lo + _RASTER_CHUNK, n)
+                    out[lo:hi] = self._sample_rasters_many(offset_pts[lo:hi])
             if self.mode in (0, 2) and self._contours:
                 crossings = self._polyline_crossings(
                     stations_km, offset_pts, cancel)
@@ -614,15 +644,30 @@ class DepthSnapshot:
             marks = [round(float(kp), 12) for kp in marks]
         out: List[Tuple[float, Optional[float]]] = []
         total = max(len(marks), 1)
-        for index, kp in enumerate(marks):
-            if cancel is not None and index % 100 == 0 and cancel():
+        want_raster = self.mode in (0, 1) and bool(self._rasters)
+        want_contours = self.mode in (0, 2)
+        # Stations are sampled in chunks: one vectorised raster read per
+        # chunk, with cancel/progress between chunks.
+        for lo in range(0, len(marks), _RASTER_CHUNK):
+            if cancel is not None and cancel():
                 raise ri.AcquisitionCancelled()
-            out.append((kp, self.sample_route(route, kp)))
-            if progress is not None and (index % 100 == 0 or index + 1 == total):
+            chunk = marks[lo:lo + _RASTER_CHUNK]
+            points = [route.point_at_kp(kp, clamp=True) for kp in chunk]
+            values: List[Optional[float]] = [None] * len(chunk)
+            if want_raster:
+                values = self._sample_rasters_many(points)
+            for i, kp in enumerate(chunk):
+                value = values[i]
+                if value is None and want_contours and points[i] is not None:
+                    value = self._interpolate_crossings(
+                        self._crossings, kp, self._crossing_kps)
+                out.append((kp, value))
+            if progress is not None:
+                done = lo + len(chunk)
                 if crossing_phase:
-                    progress(total + index + 1, 2 * total)
+                    progress(total + done, 2 * total)
                 else:
-                    progress(index + 1, total)
+                    progress(done, total)
         return out
 
 
@@ -672,6 +717,9 @@ class AnalysisWork:
     # slope criteria: {kps, depths, port, stbd, cross_offset_m} (plain lists —
     # copied on the main thread so the worker never shares live state).
     cross_profile: Optional[Dict] = None
+    # Rule-acquisition worker threads: 0 = auto (CPU count, capped at
+    # _MAX_RULE_WORKERS), 1 = evaluate rules one after another.
+    workers: int = 0
 
 
 @dataclass
@@ -858,8 +906,9 @@ def build_work(route: RouteFrame, distance, plan: Dict, rule_rows: List[Dict],
             row, input_fp, scope, params.coarse_step_m, rpl_fp, params.direction,
             profile_step_m=work.depth_step_m,
             refine_tol_m=params.refine_tol_m)
-        cached = cache.get(rule_work.cache_key)
-        if cached is not None and not rule_work.error:
+        cached = None if rule_work.error else \
+            _cached_acquisition(cache, rule_work.cache_key, input_fp)
+        if cached is not None:
             rule_work.cached = cached
         elif not rule_work.error and needs_layer and layer is not None:
             # Snapshot only (cheap): the feature read, reprojection and
@@ -890,6 +939,16 @@ def build_work(route: RouteFrame, distance, plan: Dict, rule_rows: List[Dict],
     return work, warnings
 
 
+def _cached_acquisition(cache, cache_key: str, input_fp: str
+                        ) -> Optional[Tuple[List[Interval], List[Interval]]]:
+    """Memory hit, or (``AcquisitionCache``) a persisted row whose input
+    fingerprint still matches; plain dicts are memory-only."""
+    lookup = getattr(cache, "lookup", None)
+    if lookup is not None:
+        return lookup(cache_key, input_fp)
+    return cache.get(cache_key)
+
+
 # ---------------------------------------------------------------------------
 # Predicates for 0.1 m boundary refinement (§14.3)
 # ---------------------------------------------------------------------------
@@ -1136,6 +1195,24 @@ class BurialAnalysisTask(QgsTask):
         # once for every distinct local/vehicle-footprint scale.
         self._signed_slope_cache: Dict[
             float, List[Tuple[float, float]]] = {}
+        # Guards the shared depth series / slope cache when rules are
+        # acquired on a pool; the first rule to need them builds them.
+        self._lock = threading.RLock()
+        # Pool workers queue progress text here; the task thread emits it.
+        self._messages: Optional["queue.SimpleQueue[str]"] = None
+
+    def _message(self, text: str) -> None:
+        messages = self._messages
+        if messages is not None:
+            messages.put(text)
+        else:
+            self.progressMessage.emit(text)
+
+    def _worker_count(self, pending: int) -> int:
+        requested = int(self.work.workers or 0)
+        if requested <= 0:
+            requested = min(os.cpu_count() or 1, _MAX_RULE_WORKERS)
+        return max(1, min(requested, pending))
 
     # -- worker thread -------------------------------------------------------
     def run(self) -> bool:  # noqa: C901 — one linear pipeline, clearer inline
@@ -1158,7 +1235,6 @@ class BurialAnalysisTask(QgsTask):
                 return component not in (profile_data.SLOPE_COMPONENT_CROSS,
                                          profile_data.SLOPE_COMPONENT_ABSOLUTE)
 
-            total = max(len(work.rules), 1)
             if (work.depth_samples is None and work.depth is not None
                     and work.depth.is_available()
                     and any(rule_needs_bathy(rw) for rw in work.rules)):
@@ -1181,46 +1257,154 @@ class BurialAnalysisTask(QgsTask):
             tol_km = max(work.refine_tol_m, 0.001) / 1000.0
             coarse_step_km = max(work.step_m, 1.0) / 1000.0
 
+            results: List[Optional[RuleResult]] = [None] * len(work.rules)
+            pending: List[int] = []
             for i, rule_work in enumerate(work.rules):
-                if self.isCanceled():
-                    self.cancelled = True
-                    return False
-                name = rule_work.rule_row.get("name") or rule_work.kind
-                self.progressMessage.emit(f"Evaluating rule: {name}")
-                result = RuleResult(rule_work.rule_row, rule_work.cache_key)
-                # Sub-progress inside the rule's slot, so long phases
-                # (bathymetry sampling) advance the bar instead of stalling it.
-                base = 10.0 + 90.0 * i / total
-                span = 90.0 / total
-
-                def sub_progress(fraction: float, _base=base, _span=span) -> None:
-                    self.setProgress(_base + _span * min(max(fraction, 0.0), 1.0))
-
                 if rule_work.error:
-                    result.error = rule_work.error
+                    results[i] = RuleResult(rule_work.rule_row,
+                                            rule_work.cache_key,
+                                            error=rule_work.error)
                 elif rule_work.cached is not None:
+                    result = RuleResult(rule_work.rule_row, rule_work.cache_key)
                     result.footprint, result.nodata = rule_work.cached
                     result.from_cache = True
+                    results[i] = result
                 else:
-                    try:
-                        result.footprint, result.nodata = self._acquire(
-                            sampler, rule_work, coarse_step_km, tol_km,
-                            progress=sub_progress)
-                    except ri.AcquisitionCancelled:
-                        self.cancelled = True
-                        return False
-                    except ri.RuleInputError as exc:
-                        result.error = str(exc)
-                    except Exception as exc:  # never let one rule crash the run
-                        result.error = f"unexpected error ({exc})"
-                self.results.append(result)
-                self.setProgress(10.0 + 90.0 * (i + 1) / total)
+                    pending.append(i)
+
+            workers = self._worker_count(len(pending))
+            if workers > 1:
+                completed = self._run_parallel(
+                    sampler, pending, results, workers, coarse_step_km, tol_km)
+            else:
+                completed = self._run_serial(
+                    sampler, pending, results, coarse_step_km, tol_km)
+            if not completed:
+                self.cancelled = True
+                return False
+            self.results = [result for result in results if result is not None]
             self.setProgress(100.0)
             return True
         except Exception as exc:  # pragma: no cover — task-level fail-safe
             self.error = str(exc)
             return False
 
+    def _evaluate_rule(self, sampler: ri.RouteSampler, rule_work: RuleWork,
+                       coarse_step_km: float, tol_km: float,
+                       progress: Callable[[float], None]) -> RuleResult:
+        """Acquire one rule; raises ``AcquisitionCancelled`` on cancel."""
+        name = rule_work.rule_row.get("name") or rule_work.kind
+        self._message(f"Evaluating rule: {name}")
+        result = RuleResult(rule_work.rule_row, rule_work.cache_key)
+        try:
+            result.footprint, result.nodata = self._acquire(
+                sampler, rule_work, coarse_step_km, tol_km, progress=progress)
+        except ri.AcquisitionCancelled:
+            raise
+        except ri.RuleInputError as exc:
+            result.error = str(exc)
+        except Exception as exc:  # never let one rule crash the run
+            result.error = f"unexpected error ({exc})"
+        return result
+
+    def _run_serial(self, sampler: ri.RouteSampler, pending: List[int],
+                    results: List[Optional[RuleResult]],
+                    coarse_step_km: float, tol_km: float) -> bool:
+        total = max(len(self.work.rules), 1)
+        finished = len(self.work.rules) - len(pending)
+        for i in pending:
+            if self.isCanceled():
+                return False
+            # Sub-progress inside the rule's slot, so long phases
+            # (bathymetry sampling) advance the bar instead of stalling it.
+            base = 10.0 + 90.0 * finished / total
+            span = 90.0 / total
+
+            def sub_progress(fraction: float, _base=base, _span=span) -> None:
+                self.setProgress(_base + _span * min(max(fraction, 0.0), 1.0))
+
+            try:
+                results[i] = self._evaluate_rule(
+                    sampler, self.work.rules[i], coarse_step_km, tol_km,
+                    sub_progress)
+            except ri.AcquisitionCancelled:
+                return False
+            finished += 1
+            self.setProgress(10.0 + 90.0 * finished / total)
+        return True
+
+    def _run_parallel(self, sampler: ri.RouteSampler, pending: List[int],
+                      results: List[Optional[RuleResult]], workers: int,
+                      coarse_step_km: float, tol_km: float) -> bool:
+        """Fan the pending rules out over a thread pool.
+
+        Rules only share read-only inputs (route, sampler stations, their own
+        feature-source snapshots) plus the depth series, which is built once
+        under ``_lock``, and the depth snapshot, whose raster reads take its
+        own lock. Workers never touch the QgsTask API beyond
+        ``isCanceled``: their progress fractions and messages are collected
+        here and published from the task thread.
+        """
+        total = max(len(self.work.rules), 1)
+        done_before = len(self.work.rules) - len(pending)
+        fractions = {i: 0.0 for i in pending}
+
+        def progress_for(i: int) -> Callable[[float], None]:
+            def sub_progress(fraction: float) -> None:
+                fractions[i] = min(max(fraction, 0.0), 1.0)
+            return sub_progress
+
+        # Build the chainage index before the threads race to do it.
+        self.work.route.point_at_kp(0.0, clamp=True)
+        self._messages = queue.SimpleQueue()
+        cancelled = False
+        pool = ThreadPoolExecutor(max_workers=workers,
+                                  thread_name_prefix="burial-rule")
+        try:
+            futures = {
+                pool.submit(self._evaluate_rule, sampler, self.work.rules[i],
+                            coarse_step_km, tol_km, progress_for(i)): i
+                for i in pending}
+            outstanding = set(futures)
+            while outstanding:
+                done, outstanding = wait(outstanding, timeout=0.1,
+                                         return_when=FIRST_COMPLETED)
+                for future in done:
+                    i = futures[future]
+                    try:
+                        results[i] = future.result()
+                    except ri.AcquisitionCancelled:
+                        cancelled = True
+                    fractions[i] = 1.0
+                self._drain_messages()
+                self.setProgress(10.0 + 90.0 * (
+                    done_before + sum(fractions.values())) / total)
+                if cancelled or self.isCanceled():
+                    cancelled = True
+                    for future in outstanding:
+                        future.cancel()
+                    break
+        finally:
+            # Running rules poll isCanceled and unwind promptly.
+            pool.shutdown(wait=True)
+            self._drain_messages()
+            self._messages = None
+        return not cancelled
+
+    def _drain_messages(self) -> None:
+        messages = self._messages
+        if messages is None:
+            return
+        last = None
+        while True:
+            try:
+                last = messages.get_nowait()
+            except queue.Empty:
+                break
+        if last is not None:
+            # Only the latest status line is visible anyway.
+            self.progressMessage.emit(last)
+
     def _ensure_depth_lookup(self, sampler: ri.RouteSampler,
                              sample_progress: Optional[Callable[[int, int], None]] = None
                              ) -> None:
@@ -1231,15 +1415,22 @@ class BurialAnalysisTask(QgsTask):
         """
         if self._depth_series is not None:
             return
+        with self._lock:
+            if self._depth_series is None:
+                self._build_depth_lookup(sampler, sample_progress)
+
+    def _build_depth_lookup(self, sampler: ri.RouteSampler,
+                            sample_progress: Optional[Callable[[int, int], None]]
+                            ) -> None:
         work = self.work
         if work.depth_samples is not None:
             # Reuse the persisted plan profile — no resampling.
-            self.progressMessage.emit("Using stored plan profile samples…")
+            self._message("Using stored plan profile samples…")
             samples = work.depth_samples
         else:
             if work.depth is None:
                 raise ri.RuleInputError("no bathymetry source configured")
-            self.progressMessage.emit("Sampling bathymetry along the scope…")
+            self._message("Sampling bathymetry along the scope…")
             # Threshold acquisition follows the persisted-profile
             # resolution even when no current stored profile was
             # available. The coarse sampler remains appropriate for
@@ -1258,13 +1449,17 @@ class BurialAnalysisTask(QgsTask):
             samples = work.depth.profile_samples(
                 work.route, marks, cancel=self.isCanceled,
                 progress=sample_progress)
-        self._depth_series = [
+        series = [
             (kp, abs(float(value))) for kp, value in samples
             if value is not None]
         flags = [(kp, value is None) for kp, value in samples]
-        self._depth_gaps = eng.intervals_from_bool_series(
-            flags, sampler.scope_domain)
-        self._sampled_depth_at = _profile_depth_lookup(samples)
+        gaps = eng.intervals_from_bool_series(flags, sampler.scope_domain)
+        lookup = _profile_depth_lookup(samples)
+        # _ensure_depth_lookup's unlocked fast path tests _depth_series, so
+        # it is published last, once the gaps and lookup are in place.
+        self._depth_gaps = gaps
+        self._sampled_depth_at = lookup
+        self._depth_series = series
 
     def _component_slope_acquire(self, sampler: ri.RouteSampler, config: Dict,
                                  component: str
@@ -1325,7 +1520,7 @@ class BurialAnalysisTask(QgsTask):
         snap = rule_work.layer_snapshot
         if snap is not None and rule_work.feats is None:
             name = rule_work.rule_row.get("name") or rule_work.kind
-            self.progressMessage.emit(f"Loading features: {name}")
+            self._message(f"Loading features: {name}")
             index, feats = ri.load_features_wgs84_from_source(
                 snap["source"], snap["crs"], snap["transform_context"],
                 cancel=self.isCanceled,
@@ -1385,11 +1580,12 @@ class BurialAnalysisTask(QgsTask):
                 half_km = ri.slope_half_window_km(config, slope_step_km)
                 half_km = max(float(half_km or slope_step_km), 1e-9)
                 cache_key = round(half_km, 12)
-                signed_series = self._signed_slope_cache.get(cache_key)
-                if signed_series is None:
-                    signed_series = eng.signed_slope_series(
-                        self._depth_series, half_km)
-                    self._signed_slope_cache[cache_key] = signed_series
+                with self._lock:
+                    signed_series = self._signed_slope_cache.get(cache_key)
+                    if signed_series is None:
+                        signed_series = eng.signed_slope_series(
+                            self._depth_series, half_km)
+                        self._signed_slope_cache[cache_key] = signed_series
                 prepared_slope = (signed_series if config.get("slope_signed")
                                   else [(kp, abs(value))
                                         for kp, value in signed_series])
@@ -1433,7 +1629,7 @@ class BurialAnalysisTask(QgsTask):
             intervals = eng.intersect_intervals(intervals, scope_ranges)
 
         if predicate is not None and intervals:
-            self.progressMessage.emit(
+            self._message(
                 f"Refining boundaries: {rule_work.rule_row.get('name') or kind}")
             try:
                 intervals = generation.refine_intervals(
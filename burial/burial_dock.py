@@ -827,7 +827,7 @@ class BurialPlannerDock(QDockWidget):
         cross_profile = None
         depth_step_m = self.model.resolve_profile_step_m(params)
         stored = self.model.bathy_profile
-        if (stored is not None and stored.kps
+        if (stored is not None and stored.sample_count
                 and self.model.profile_state() == "current"):
             if stored.step_m <= params.coarse_step_m + 1e-9:
                 depth_samples = stored.samples()
@@ -881,6 +881,7 @@ class BurialPlannerDock(QDockWidget):
                 "again with its plan selected.")
             return
         if task.cancelled:
+            self.model.acq_cache.flush()  # keep the recency of reused rules
             self.builder_tab.analysis_finished(
                 "Stopped — completed rules stay cached; run again to resume.")
             return
@@ -907,12 +908,16 @@ class BurialPlannerDock(QDockWidget):
         params = getattr(self, "_task_params", None) or self.model.gen_params()
         acquisitions: List[generation.RuleAcquisition] = []
         for result in task.results:
-            if not result.error and result.cache_key:
-                self.model.acq_cache[result.cache_key] = (result.footprint,
-                                                          result.nodata)
+            if not result.error and result.cache_key and not result.from_cache:
+                self.model.acq_cache.put(
+                    result.cache_key, result.footprint, result.nodata,
+                    rule_id=str(result.rule_row.get("rule_id") or ""))
             acquisitions.append(generation.RuleAcquisition(
                 result.rule_row, result.footprint, result.nodata, result.error))
 
+        # Derived data: a failed cache write only costs a re-acquisition.
+        self.model.acq_cache.flush()
+
         resolved, influence, nodata, warnings = generation.resolve_stack(
             params, acquisitions, depth_at=self.model.depth_at_kp)
         verdicts = resolved.per_method.get(params.method, [])
@@ -1037,7 +1042,7 @@ class BurialPlannerDock(QDockWidget):
             self.profile_status.setText("Set a non-zero scope to display the bathymetry profile.")
             return
         stored = self.model.bathy_profile
-        if stored is not None and stored.kps:
+        if stored is not None and stored.sample_count:
             self._display_stored_profile(
                 stored, params, stale=self.model.profile_state() != "current")
             return
@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
-"""Direct sqlite3 access to the Burial Planner's geometryless registry tables.
+"""Direct sqlite3 access to geometryless GeoPackage registry tables.
+
+Written for the Burial Planner and shared by the Workbench and Planner
+stores.
 
 A GeoPackage is a SQLite database; the registry tables (``bp_plan``,
 ``bp_event``, …) carry no geometry, so they can be read and written with
@@ -168,8 +171,11 @@ def transaction(conn: sqlite3.Connection):
 
 
 def read_rows(conn: sqlite3.Connection, table: str,
-              where: str = "", params: Sequence = ()) -> List[Dict]:
-    columns = table_columns(conn, table)
+              where: str = "", params: Sequence = (),
+              columns: Optional[Sequence[str]] = None) -> List[Dict]:
+    """Rows as dicts; ``columns`` limits the SELECT (default: all)."""
+    live = table_columns(conn, table)
+    columns = [c for c in columns if c in live] if columns else live
     if not columns:
         return []
     sql = "SELECT " + ", ".join(quote_ident(c) for c in columns) \
@@ -616,14 +616,17 @@ class InstallationPathTask(QgsTask):
                             return False
                     outside = str(work.layback_profile.get("outside_mode")
                                   or "error")
-                    for index, ((lon, lat), kp) in enumerate(
-                            zip(tool_wgs, tool_kps)):
+                    # Live-snapshot depths for every tool point in one
+                    # vectorised read rather than a sample per point.
+                    sampled = (None if work.depth_samples is not None
+                               else work.depth.sample_many(
+                                   [(lat, lon) for lon, lat in tool_wgs]))
+                    for index, kp in enumerate(tool_kps):
                         if index % 128 == 0:
                             self._check_cancel()
                             self.setProgress(80.0 + 10.0 * index / total)
                         depth = (_interpolated_depth(work.depth_samples, kp)
-                                 if work.depth_samples is not None
-                                 else work.depth.sample(lat, lon))
+                                 if sampled is None else sampled[index])
                         if depth is None:
                             raise path_geometry.PathGeometryError(
                                 f"No water depth is available at KP {kp:.3f}; "
@@ -30,6 +30,7 @@ from ..workbench import rules_engine as eng
 from ..workbench.rules_engine import Interval
 from . import (change_log, events as ev, generation, io_csv, map_layers,
                path_data, path_layers, risk, schema, tools)
+from .acq_cache import AcquisitionCache
 from .analysis_task import build_route_frame
 from .profile_data import PlanProfile
 from .store import BurialStore
@@ -86,7 +87,8 @@ class PlanModel(QObject):
         self.distance = None
         self.resolved_rpl_id = ""
         self.route_notice = ""
-        self.acq_cache: Dict[str, Tuple[List[Interval], List[Interval]]] = {}
+        # Memory tier per open plan, persisted in the (current) store.
+        self.acq_cache = AcquisitionCache(lambda: self.store)
         self.route_error = ""
         self.bathy_profile: Optional[PlanProfile] = None
         # Section route-slice WKT memo (cleared when the route changes) and
@@ -184,6 +186,7 @@ class PlanModel(QObject):
         self.risk_checks = self.store.list_risk_checks(plan_id)
         self.hazards = self.store.list_hazards(plan_id)
         self.path_result = self.store.get_path_result(plan_id)
+        self.acq_cache.flush()
         self.acq_cache.clear()
         self._load_profile(plan_id)
         self._load_context()
@@ -228,6 +231,7 @@ class PlanModel(QObject):
         self.route = None
         self.resolved_rpl_id = ""
         self.route_notice = ""
+        self.acq_cache.flush()
         self.acq_cache.clear()
         self.bathy_profile = None
         self._profile_cache_key = None
@@ -396,7 +400,7 @@ class PlanModel(QObject):
         the route position.
         """
         profile = self.bathy_profile
-        if profile is not None and profile.kps:
+        if profile is not None and profile.sample_count:
             value = profile.depth_at(kp)
             if value is not None:
                 return abs(float(value))
@@ -449,7 +453,7 @@ class PlanModel(QObject):
     def profile_state(self) -> str:
         """'missing' | 'current' | 'stale' for the persisted plan profile."""
         profile = self.bathy_profile
-        if profile is None or not profile.kps:
+        if profile is None or not profile.sample_count:
             return "missing"
         params = self.gen_params()
         scope = params.scope
@@ -18,8 +18,15 @@ Slope conventions (plugin-wide, see README "Slope methodology"):
 - absolute: magnitude of the combined gradient
   (``atan(sqrt(tan²long + tan²cross))``), never negative.
 
-Depths are stored as magnitudes (the Burial Planner convention); ``None``
-marks stations with no data.
+Depths are stored as magnitudes (the Burial Planner convention); NaN in
+the station arrays (``None`` in their list views) marks stations with no
+data.
+
+Persistence: the sample arrays go into ``samples_blob`` as little-endian
+columns (KP float64, depths float32 rounded back to the millimetre on read)
+with a packed no-data mask per column, zlib-compressed. Decoding is a
+``frombuffer`` per column instead of parsing millions of JSON numbers.
+Plans written before schema v9 keep ``samples_json``, which is still read.
 """
 
 from __future__ import annotations
@@ -27,7 +34,10 @@ from __future__ import annotations
 import bisect
 import json
 import math
-from dataclasses import dataclass, field
+import struct
+import sys
+import zlib
+from array import array
 from typing import Dict, List, Optional, Tuple
 
 try:  # NumPy ships with QGIS; the pure-python paths remain as fallback.
@@ -44,43 +54,301 @@ Sample = Tuple[float, Optional[float]]
 _MAX_SLOPE_CACHE_KEYS = 6
 
 
+# samples_blob layout: header, one descriptor per column, then the payload
+# (zlib-compressed when FLAG_ZLIB): per column an optional packed no-data
+# mask (1 bit per station, MSB first) followed by the little-endian values.
+_BLOB_MAGIC = b"BPRF"
+_BLOB_VERSION = 1
+_BLOB_FLAG_ZLIB = 0x01
+_BLOB_HEADER = struct.Struct("<4sBBBxI")    # magic, version, flags, ncols, count
+_BLOB_COLUMN = struct.Struct("<4scB")       # name, dtype ('d'|'f'), masked
+# (row key, blob name, dtype, decimals restored on read)
+_BLOB_COLUMNS = (
+    ("kps", b"kps\0", "d", 6),
+    ("depths", b"dep\0", "f", 3),
+    ("port", b"prt\0", "f", 3),
+    ("stbd", b"stb\0", "f", 3),
+)
+
+
+def encode_samples(columns: Dict[str, List[Optional[float]]],
+                   compress: bool = True) -> bytes:
+    """Pack the profile columns into a ``samples_blob``.
+
+    Columns are lists with None gaps or (NumPy path) float arrays with NaN
+    gaps; the gaps become a bitmask so the stored values stay dense.
+    """
+    count = len(columns.get("kps") if columns.get("kps") is not None else [])
+    descriptors = []
+    chunks = []
+    for key, name, dtype, _places in _BLOB_COLUMNS:
+        values = columns.get(key)
+        if _np is not None:
+            arr = values if isinstance(values, _np.ndarray) \
+                else _nan_array(list(values or []))
+            if len(arr) != count:
+                arr = _np.concatenate([arr, _np.full(count, _np.nan)])[:count]
+            gaps = _np.isnan(arr)
+            masked = bool(gaps.any())
+            if masked:
+                arr = _np.where(gaps, 0.0, arr)
+            packed = arr.astype("<f8" if dtype == "d" else "<f4").tobytes()
+            mask = _np.packbits(gaps).tobytes() if masked else b""
+        else:
+            values = (list(values or []) + [None] * count)[:count]
+            gaps = [v is None for v in values]
+            masked = any(gaps)
+            numbers = array(dtype, [0.0 if v is None else float(v) for v in values])
+            if sys.byteorder != "little":
+                numbers.byteswap()
+            packed = numbers.tobytes()
+            mask = _pack_mask(gaps) if masked else b""
+        descriptors.append(_BLOB_COLUMN.pack(name, dtype.encode("ascii"),
+                                             1 if masked else 0))
+        chunks.append(mask)
+        chunks.append(packed)
+    payload = b"".join(chunks)
+    flags = 0
+    if compress:
+        payload = zlib.compress(payload, 1)   # float bytes: level 1 packs as well as 6
+        flags |= _BLOB_FLAG_ZLIB
+    header = _BLOB_HEADER.pack(_BLOB_MAGIC, _BLOB_VERSION, flags,
+                               len(descriptors), count)
+    return header + b"".join(descriptors) + payload
+
+
+def decode_samples(blob) -> Optional[Dict[str, List[Optional[float]]]]:
+    """Inverse of :func:`encode_samples`; None when the blob is unreadable.
+
+    With NumPy each column comes back as a float64 array with NaN at the
+    masked stations (``frombuffer`` plus the mask, no per-value Python
+    work); the pure-python fallback returns lists with None gaps.
+    """
+    if blob is None:
+        return None
+    if not isinstance(blob, (bytes, bytearray, memoryview)):
+        data = getattr(blob, "data", None)  # QByteArray from the OGR path
+        blob = data() if callable(data) else bytes(blob)
+    blob = bytes(blob)
+    try:
+        return _decode_columns(blob)
+    except (struct.error, UnicodeDecodeError, ValueError, zlib.error):
+        # Truncated or corrupt blob: the caller falls back to samples_json.
+        return None
+
+
+def _decode_columns(blob: bytes):
+    if len(blob) < _BLOB_HEADER.size:
+        return None
+    magic, version, flags, ncols, count = _BLOB_HEADER.unpack_from(blob, 0)
+    if magic != _BLOB_MAGIC or version != _BLOB_VERSION:
+        return None
+    offset = _BLOB_HEADER.size
+    descriptors = []
+    for _i in range(ncols):
+        name, dtype, masked = _BLOB_COLUMN.unpack_from(blob, offset)
+        dtype = dtype.decode("ascii")
+        if dtype not in ("d", "f"):
+            return None
+        descriptors.append((name, dtype, bool(masked)))
+        offset += _BLOB_COLUMN.size
+    payload = blob[offset:]
+    if flags & _BLOB_FLAG_ZLIB:
+        payload = zlib.decompress(payload)
+    places_by_name = {name: (key, places)
+                      for key, name, _dtype, places in _BLOB_COLUMNS}
+    mask_bytes = (count + 7) // 8
+    out = {}
+    pos = 0
+    for name, dtype, masked in descriptors:
+        mask = None
+        if masked:
+            mask = payload[pos:pos + mask_bytes]
+            pos += mask_bytes
+            if len(mask) != mask_bytes:
+                return None
+        width = 8 if dtype == "d" else 4
+        raw = payload[pos:pos + width * count]
+        pos += width * count
+        if len(raw) != width * count:
+            return None
+        key, places = places_by_name.get(name, (name.rstrip(b"\0").decode(), None))
+        out[key] = _column_values(raw, dtype, count, mask, places)
+    return out
+
+
+def _pack_mask(gaps: List[bool]) -> bytes:
+    packed = bytearray((len(gaps) + 7) // 8)
+    for i, gap in enumerate(gaps):
+        if gap:
+            packed[i >> 3] |= 0x80 >> (i & 7)
+    return bytes(packed)
+
+
+def _column_values(raw: bytes, dtype: str, count: int, mask: Optional[bytes],
+                   places: Optional[int]):
+    """One decoded column: NaN-gapped array (NumPy) or list with None gaps."""
+    if _np is not None:
+        arr = _np.frombuffer(raw, dtype="<f8" if dtype == "d" else "<f4",
+                             count=count).astype(float)
+        if places is not None and dtype == "f":
+            # float32 carries ~7 digits: rounding restores the stored
+            # millimetre value exactly, as the JSON path wrote it.
+            arr = _np.round(arr, places)
+        if mask is not None:
+            gaps = _np.unpackbits(_np.frombuffer(mask, dtype=_np.uint8),
+                                  count=count).astype(bool)
+            arr[gaps] = _np.nan
+        return arr
+    unpacked = array(dtype)
+    unpacked.frombytes(raw)
+    if sys.byteorder != "little":
+        unpacked.byteswap()
+    values = unpacked.tolist()
+    if places is not None and dtype == "f":
+        values = [round(v, places) for v in values]
+    if mask is not None:
+        for i in range(count):
+            if mask[i >> 3] & (0x80 >> (i & 7)):
+                values[i] = None
+    return values
+
+
+def _optional_list(values) -> List[Optional[float]]:
+    """A decoded column as PlanProfile stores it (list, None at gaps)."""
+    if _np is None or not isinstance(values, _np.ndarray):
+        return values
+    out = values.tolist()
+    for i in _np.flatnonzero(_np.isnan(values)).tolist():
+        out[i] = None
+    return out
+
+
 def _nan_array(values: List[Optional[float]]):
     """values (None = gap) → float64 array with NaN gaps (NumPy path)."""
+    if isinstance(values, _np.ndarray):
+        return values.astype(float, copy=False)
     return _np.array([_np.nan if v is None else v for v in values],
                      dtype=float)
 
 
-@dataclass
+def _json_column(values, count: Optional[int] = None):
+    """One ``samples_json`` column, padded/cut to ``count`` stations.
+
+    NumPy path: straight into a float64 array (``None`` converts to NaN).
+    Otherwise a list with None gaps — json.loads already yields numbers, so
+    the per-element conversion only runs when a non-number sneaks in.
+    """
+    values = values or []
+    if count is not None:
+        values = values[:count]
+    if _np is not None:
+        try:
+            out = _np.array(values, dtype=float)
+        except (TypeError, ValueError):
+            out = _np.array([_np.nan if v is None else float(v) for v in values],
+                            dtype=float)
+        if count is not None and len(out) < count:
+            out = _np.concatenate([out, _np.full(count - len(out), _np.nan)])
+        return out
+    try:
+        out = [None if v is None else v + 0.0 for v in values]
+    except TypeError:
+        out = [None if v is None else float(v) for v in values]
+    if count is not None:
+        out.extend([None] * (count - len(out)))
+    return out
+
+
+def _column(values):
+    """A station column as PlanProfile holds it: NaN-gapped float64 array
+    (NumPy), else a list with None gaps."""
+    if values is None:
+        values = []
+    if _np is None:
+        return list(values)
+    return _nan_array(values)
+
+
+def _has_data(column) -> bool:
+    if _np is not None and isinstance(column, _np.ndarray):
+        return bool((~_np.isnan(column)).any())
+    return any(v is not None for v in column)
+
+
 class PlanProfile:
-    """One sampling pass over the plan scope (+ one-step margin)."""
-
-    step_m: float = 0.0
-    cross_offset_m: float = 0.0        # 0 = cross depths not sampled
-    scope_start_kp: float = 0.0
-    scope_end_kp: float = 0.0
-    route_fingerprint: str = ""
-    depth_fingerprint: str = ""
-    sampled_utc: str = ""
-    kps: List[float] = field(default_factory=list)
-    depths: List[Optional[float]] = field(default_factory=list)
-    port_depths: List[Optional[float]] = field(default_factory=list)
-    stbd_depths: List[Optional[float]] = field(default_factory=list)
-    # Memoised slope series per (half window, direction) — profiles can hold
-    # hundreds of thousands of stations, so recomputing per refresh would
-    # stall the UI. Not persisted.
-    _slope_cache: Dict = field(default_factory=dict, repr=False, compare=False)
+    """One sampling pass over the plan scope (+ one-step margin).
+
+    The station columns are ``kp_array``, ``depth_array``, ``port_array``
+    and ``stbd_array``: float64 arrays with NaN at no-data stations (lists
+    with None gaps when NumPy is missing). ``kps``, ``depths``,
+    ``port_depths`` and ``stbd_depths`` are read-only list views with None
+    gaps, built from the arrays on first access.
+    """
+
+    def __init__(self, step_m: float = 0.0, cross_offset_m: float = 0.0,
+                 scope_start_kp: float = 0.0, scope_end_kp: float = 0.0,
+                 route_fingerprint: str = "", depth_fingerprint: str = "",
+                 sampled_utc: str = "", kps=None, depths=None,
+                 port_depths=None, stbd_depths=None) -> None:
+        self.step_m = step_m
+        self.cross_offset_m = cross_offset_m   # 0 = cross depths not sampled
+        self.scope_start_kp = scope_start_kp
+        self.scope_end_kp = scope_end_kp
+        self.route_fingerprint = route_fingerprint
+        self.depth_fingerprint = depth_fingerprint
+        self.sampled_utc = sampled_utc
+        self.kp_array = _column(kps)
+        self.depth_array = _column(depths)
+        self.port_array = _column(port_depths)
+        self.stbd_array = _column(stbd_depths)
+        self._lists: Dict[str, List[Optional[float]]] = {}
+        # Memoised slope series per (half window, direction) — profiles can
+        # hold hundreds of thousands of stations, so recomputing per refresh
+        # would stall the UI. Not persisted.
+        self._slope_cache: Dict = {}
+
+    def __repr__(self) -> str:
+        return (f"PlanProfile(step_m={self.step_m!r}, "
+                f"cross_offset_m={self.cross_offset_m!r}, "
+                f"scope_start_kp={self.scope_start_kp!r}, "
+                f"scope_end_kp={self.scope_end_kp!r}, "
+                f"sample_count={self.sample_count})")
+
+    # -- list views -----------------------------------------------------------
+    def _list_view(self, key: str, column) -> List[Optional[float]]:
+        cached = self._lists.get(key)
+        if cached is None:
+            cached = self._lists[key] = _optional_list(column)
+        return cached
+
+    @property
+    def kps(self) -> List[float]:
+        return self._list_view("kps", self.kp_array)
+
+    @property
+    def depths(self) -> List[Optional[float]]:
+        return self._list_view("depths", self.depth_array)
+
+    @property
+    def port_depths(self) -> List[Optional[float]]:
+        return self._list_view("port", self.port_array)
+
+    @property
+    def stbd_depths(self) -> List[Optional[float]]:
+        return self._list_view("stbd", self.stbd_array)
 
     # -- content ------------------------------------------------------------
     @property
     def sample_count(self) -> int:
-        return len(self.kps)
+        return len(self.kp_array)
 
     def has_cross(self) -> bool:
         cached = self._slope_cache.get("_has_cross")
         if cached is None:
             cached = (self.cross_offset_m > 0
-                      and any(v is not None for v in self.port_depths)
-                      and any(v is not None for v in self.stbd_depths))
+                      and _has_data(self.port_array)
+                      and _has_data(self.stbd_array))
             self._slope_cache["_has_cross"] = cached
         return cached
 
@@ -92,8 +360,8 @@ class PlanProfile:
         """
         cached = self._slope_cache.get("_series")
         if cached is None:
-            cached = [(kp, d) for kp, d in zip(self.kps, self.depths)
-                      if d is not None]
+            xs, ys = self._depth_pairs()
+            cached = list(zip(xs, ys))
             self._slope_cache["_series"] = cached
         return cached
 
@@ -117,11 +385,17 @@ class PlanProfile:
         """
         cached = self._slope_cache.get("_depth_xy")
         if cached is None:
-            cached = _valid_pairs(self.kps, self.depths)
+            cached = self._depth_pairs()
             self._slope_cache["_depth_xy"] = cached
         xs, ys = cached
         return _interp(xs, ys, float(kp))
 
+    def _depth_pairs(self) -> Tuple[List[float], List[float]]:
+        if _np is None:
+            return _valid_pairs(self.kp_array, self.depth_array)
+        valid = ~_np.isnan(self.depth_array)
+        return self.kp_array[valid].tolist(), self.depth_array[valid].tolist()
+
     def slope_series(self, half_window_km: float, direction: int
                      ) -> Tuple[List[Sample], List[Sample], List[Sample]]:
         """(longitudinal, cross, absolute) slope series, memoised."""
@@ -130,9 +404,10 @@ class PlanProfile:
         cached = self._slope_cache.get(key)
         if cached is not None:
             return cached
-        long_series = long_slope_series(self.kps, self.depths, half_window_km)
+        long_series = long_slope_series(
+            self.kps, self.depth_array, half_window_km)
         cross_series = cross_slope_series(
-            self.kps, self.port_depths, self.stbd_depths,
+            self.kps, self.port_array, self.stbd_array,
             self.cross_offset_m, direction) if self.has_cross() else []
         abs_series = absolute_slope_series(long_series, cross_series)
         result = (long_series, cross_series, abs_series)
@@ -149,7 +424,7 @@ class PlanProfile:
     def is_current(self, route_fingerprint: str, depth_fingerprint: str,
                    scope_start_kp: float, scope_end_kp: float,
                    cross_offset_m: float) -> bool:
-        return (bool(self.kps)
+        return (self.sample_count > 0
                 and self.route_fingerprint == (route_fingerprint or "")
                 and self.depth_fingerprint == (depth_fingerprint or "")
                 and abs(self.scope_start_kp - float(scope_start_kp)) < 1e-6
@@ -168,26 +443,27 @@ class PlanProfile:
             "sampled_utc": self.sampled_utc,
         }
 
-        def compact(values: List[Optional[float]], places: int) -> List:
-            if _np is not None and values:
-                rounded = _np.round(_nan_array(values), places)
-                return [None if v != v else v for v in rounded.tolist()]
+        def compact(values: List[Optional[float]], places: int):
+            if _np is not None:
+                # NaN-gapped arrays go straight into the blob encoder.
+                return _np.round(_nan_array(values), places)
             return [None if v is None else round(float(v), places)
                     for v in values]
 
         samples = {
-            "kps": compact(self.kps, 6),
-            "depths": compact(self.depths, 3),
-            "port": compact(self.port_depths, 3),
-            "stbd": compact(self.stbd_depths, 3),
+            "kps": compact(self.kp_array, 6),
+            "depths": compact(self.depth_array, 3),
+            "port": compact(self.port_array, 3),
+            "stbd": compact(self.stbd_array, 3),
         }
         return {
             "profile_id": profile_id or schema.new_id(),
             "plan_id": plan_id,
             "created_utc": self.sampled_utc or schema.utc_now_iso(),
             "params_json": json.dumps(params, separators=(",", ":")),
-            "samples_json": json.dumps(samples, separators=(",", ":")),
-            "sample_count": len(self.kps),
+            "samples_json": "",
+            "samples_blob": encode_samples(samples),
+            "sample_count": self.sample_count,
         }
 
     @classmethod
@@ -196,29 +472,33 @@ class PlanProfile:
             return None
         try:
             params = json.loads(row.get("params_json") or "{}")
-            samples = json.loads(row.get("samples_json") or "{}")
         except (ValueError, TypeError):
             return None
-        if not isinstance(params, dict) or not isinstance(samples, dict):
+        samples = decode_samples(row.get("samples_blob")) \
+            if row.get("samples_blob") else None
+        if not isinstance(params, dict):
             return None
-        # json.loads already yields numbers — the defensive per-element
-        # float() conversion over 4 × 500k values cost seconds per plan
-        # open. Convert lazily only when a non-number sneaks in.
-        raw_kps = samples.get("kps") or []
+        if samples is not None and all(column[0] in samples
+                                       for column in _BLOB_COLUMNS):
+            return cls._from_params(params, samples["kps"], samples["depths"],
+                                    samples["port"], samples["stbd"])
+        # Pre-v9 rows (or an unreadable blob): the JSON arrays.
         try:
-            kps = [v + 0.0 for v in raw_kps]
-        except TypeError:
-            kps = [float(v) for v in raw_kps]
-
-        def floats(key: str) -> List[Optional[float]]:
-            values = samples.get(key) or []
-            try:
-                out = [None if v is None else v + 0.0 for v in values]
-            except TypeError:
-                out = [None if v is None else float(v) for v in values]
-            out.extend([None] * (len(kps) - len(out)))
-            return out[:len(kps)]
+            samples = json.loads(row.get("samples_json") or "{}")
+        except (ValueError, TypeError):
+            return None
+        if not isinstance(samples, dict):
+            return None
+        kps = _json_column(samples.get("kps"))
+        count = len(kps)
+        return cls._from_params(params, kps,
+                                _json_column(samples.get("depths"), count),
+                                _json_column(samples.get("port"), count),
+                                _json_column(samples.get("stbd"), count))
 
+    @classmethod
+    def _from_params(cls, params: Dict, kps, depths, port_depths,
+                     stbd_depths) -> "PlanProfile":
         return cls(
             step_m=float(params.get("step_m") or 0.0),
             cross_offset_m=float(params.get("cross_offset_m") or 0.0),
@@ -228,9 +508,9 @@ class PlanProfile:
             depth_fingerprint=str(params.get("depth_fingerprint") or ""),
             sampled_utc=str(params.get("sampled_utc") or ""),
             kps=kps,
-            depths=floats("depths"),
-            port_depths=floats("port"),
-            stbd_depths=floats("stbd"),
+            depths=depths,
+            port_depths=port_depths,
+            stbd_depths=stbd_depths,
         )
 
 
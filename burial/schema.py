@@ -19,6 +19,8 @@ Table overview:
 - bp_change_log  append-only change log with before/after JSON
 - bp_tool        project-scoped Burial Tools registry (ploughs, trenchers…)
                  with per-tool configurations and an optional DXF footprint
+- bp_acq_cache   persisted rule acquisitions keyed by rule cache key
+                 (derived data, size-bounded LRU — see ``acq_cache.py``)
 
 No engineering values are shipped here: criteria values, buffers and limits
 are user-entered, each with a source-reference field.
@@ -37,7 +39,7 @@ from ..workbench.schema import (  # noqa: F401  (re-exported for the package)
     utc_now_iso,
 )
 
-SCHEMA_VERSION = 8
+SCHEMA_VERSION = 10
 
 # Registry table names ------------------------------------------------------
 TABLE_META = "bp_meta"
@@ -55,6 +57,7 @@ TABLE_TOOL = "bp_tool"
 TABLE_PATH_RESULT = "bp_path_result"
 TABLE_LAYBACK_PROFILE = "bp_layback_profile"
 TABLE_VESSEL = "bp_vessel"
+TABLE_ACQ_CACHE = "bp_acq_cache"
 
 FieldSpec = Tuple[str, str]
 
@@ -600,8 +603,22 @@ PROFILE_FIELDS: List[FieldSpec] = [
     ("plan_id", "str"),
     ("created_utc", "str"),
     ("params_json", "str"),          # step/cross offset/scope/fingerprints
-    ("samples_json", "str"),         # kps/depths/port/stbd arrays
+    ("samples_json", "str"),         # kps/depths/port/stbd arrays (pre-v9)
     ("sample_count", "int"),
+    ("samples_blob", "blob"),        # binary columns (profile_data.encode_samples)
+]
+
+# Rule acquisitions (footprint + no-data intervals) keyed by
+# generation.rule_cache_key: content-addressed, so plans in one GeoPackage
+# share identical acquisitions. Derived data — never change-logged.
+ACQ_CACHE_FIELDS: List[FieldSpec] = [
+    ("cache_key", "str"),
+    ("rule_id", "str"),              # rule that last produced it (info only)
+    ("input_fingerprint", "str"),    # layer/bathymetry fingerprint used
+    ("intervals_json", "str"),       # {"footprint": [[a, b]…], "nodata": …}
+    ("size_bytes", "int"),
+    ("created_utc", "str"),
+    ("used_utc", "str"),             # LRU recency
 ]
 
 CHANGE_LOG_FIELDS: List[FieldSpec] = [
@@ -633,6 +650,7 @@ REGISTRY_TABLES: Dict[str, List[FieldSpec]] = {
     TABLE_PATH_RESULT: PATH_RESULT_FIELDS,
     TABLE_LAYBACK_PROFILE: LAYBACK_PROFILE_FIELDS,
     TABLE_VESSEL: VESSEL_FIELDS,
+    TABLE_ACQ_CACHE: ACQ_CACHE_FIELDS,
 }
 
 TABLE_KEYS: Dict[str, str] = {
@@ -652,6 +670,8 @@ TABLE_KEYS: Dict[str, str] = {
     TABLE_PATH_RESULT: "path_id",
     TABLE_LAYBACK_PROFILE: "layback_id",
     TABLE_VESSEL: "vessel_id",
+    # Not plan-scoped either: shared by every plan in the GeoPackage.
+    TABLE_ACQ_CACHE: "cache_key",
 }
 
 # Per-plan spatial layer schemas -------------------------------------------
@@ -27,7 +27,7 @@ from ..processing.cable_lay_parsers import (
     write_layer_to_gpkg,
 )
 from ..qgis_compat import WKB_NO_GEOMETRY
-from . import change_log, gpkg_sql, schema
+from . import acq_cache, change_log, gpkg_sql, schema
 
 PROJECT_SCOPE = "SubseaCableTools"
 PROJECT_KEY_GPKG = "burial_gpkg"
@@ -706,6 +706,42 @@ class BurialStore:
                                 str(row.get("plan_id") or ""), [row])
         return row["profile_id"]
 
+    # -- rule acquisition cache ---------------------------------------------
+    def get_acquisition(self, cache_key: str) -> Optional[Dict]:
+        return self._get_by_key(schema.TABLE_ACQ_CACHE, "cache_key", cache_key)
+
+    def save_acquisitions(self, rows: Sequence[Dict],
+                          touched_keys: Sequence[str],
+                          max_bytes: int) -> List[str]:
+        """Persist fresh acquisitions, refresh the recency of reused ones
+        and evict least-recently-used rows beyond ``max_bytes`` — one
+        transaction in SQL mode. Returns the evicted cache keys."""
+        rows = [dict(r) for r in rows]
+        fresh = {str(r.get("cache_key")) for r in rows}
+        touched = [str(k) for k in touched_keys if str(k) not in fresh]
+        with self.transaction():
+            now = schema.utc_now_iso()
+            for key in touched:
+                row = self.get_acquisition(key)
+                if row is not None:
+                    row["used_utc"] = now
+                    rows.append(row)
+            if rows:
+                self.upsert_rows(schema.TABLE_ACQ_CACHE, rows)
+            columns = ("cache_key", "size_bytes", "used_utc")
+            conn = self._sql()
+            if conn is not None:
+                # Sizes and recency only — never the interval payloads.
+                entries = gpkg_sql.read_rows(conn, schema.TABLE_ACQ_CACHE,
+                                             columns=columns)
+            else:
+                entries = self.read_table(schema.TABLE_ACQ_CACHE)
+            drop = acq_cache.lru_evictions(
+                [tuple(e.get(c) for c in columns) for e in entries], max_bytes)
+            if drop:
+                self.delete_rows(schema.TABLE_ACQ_CACHE, drop)
+        return drop
+
     # -- change log ----------------------------------------------------------
     def list_change_log(self, plan_id: str) -> List[Dict]:
         rows = self.read_plan_table(schema.TABLE_CHANGE_LOG, plan_id)
@@ -873,9 +909,34 @@ def _migrate_v6_to_v7(store: BurialStore) -> None:
                                 rule_rows)
 
 
+def _migrate_v8_to_v9(store: BurialStore) -> None:
+    """Re-encode stored plan profiles from JSON text into ``samples_blob``.
+
+    The table is rewritten with the new column; rows whose JSON cannot be
+    read are kept as they were (``from_row`` still falls back to JSON).
+    """
+    from .profile_data import PlanProfile
+
+    rows = store.read_table(schema.TABLE_PROFILE)
+    migrated = []
+    for row in rows:
+        profile = None if row.get("samples_blob") else PlanProfile.from_row(row)
+        if profile is not None:
+            encoded = profile.to_row(str(row.get("plan_id") or ""),
+                                     str(row.get("profile_id") or ""))
+            encoded["created_utc"] = row.get("created_utc") or encoded["created_utc"]
+            # Keep the stored params verbatim (fingerprints decide currency).
+            encoded["params_json"] = row.get("params_json") or encoded["params_json"]
+            row = encoded
+        migrated.append(row)
+    store._write_table_rows(schema.TABLE_PROFILE, schema.PROFILE_FIELDS,
+                            migrated)
+
+
 # Maps a starting schema version to the function upgrading it one step.
 MIGRATIONS: Dict[int, object] = {1: _migrate_v1_to_v2, 3: _migrate_v3_to_v4,
-                                 5: _migrate_v5_to_v6, 6: _migrate_v6_to_v7}
+                                 5: _migrate_v5_to_v6, 6: _migrate_v6_to_v7,
+                                 8: _migrate_v8_to_v9}
 
 
 def _normalise_row(row: Dict) -> Dict:
@@ -314,6 +314,55 @@ def _resolve_seabed(cfg: dict):
     return FlatSeabed(float(cfg["water_depth_m"]))
 
 
+def _catenary_piece(H_N: float, V0: float, q: float, L):
+    """Exact advance along a constant-weight catenary piece.
+
+    Starting with vertical force ``V0`` (N) under horizontal tension ``H_N``
+    and weight ``q`` (N/m), returns ``(dx, dy, V)`` after arc lengths ``L``
+    (array). The forms avoid the ``1/q`` cancellation of the textbook
+    expressions, so near-weightless (and buoyant) pieces stay exact.
+    """
+    L = np.asarray(L, dtype=float)
+    V1 = V0 + q * L
+    T0 = math.hypot(H_N, V0)
+    T1 = np.hypot(H_N, V1)
+    dy = L * (V0 + V1) / (T0 + T1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # asinh(b) - asinh(a) = asinh((b^2 - a^2) / (b*sqrt(1+a^2) + a*sqrt(1+b^2)))
+        # for same-sign a, b; r = that argument / q.
+        den = V1 * T0 + V0 * T1
+        r = np.where(den != 0.0, L * (V0 + V1) / np.where(den != 0.0, den, 1.0), L / H_N)
+        z = q * r
+        ratio = np.where(np.abs(z) > 1e-8, np.arcsinh(z) / np.where(z != 0.0, z, 1.0), 1.0)
+        dx = H_N * r * ratio
+        opposite = V0 * V1 < 0.0
+        if np.any(opposite):
+            dx_opp = (H_N / q) * (np.arcsinh(V1 / H_N) - math.asinh(V0 / H_N))
+            dx = np.where(opposite, dx_opp, dx)
+    return dx, dy, V1
+
+
+def _surface_crossing(H_N: float, V0: float, y0: float, q: float, span: float) -> Optional[float]:
+    """Arc length into a constant-weight catenary piece starting at height
+    ``y0`` at which it first reaches sea level (y = 0), or None within
+    ``span``."""
+    T0 = math.hypot(H_N, V0)
+    L_min = 1e-9 * max(1.0, span)
+    if abs(q) * span < 1e-9 * T0:
+        # Effectively straight.
+        if V0 == 0.0:
+            return None
+        L = -y0 * T0 / V0
+        return L if L_min < L <= span else None
+    # y - y0 = (T - T0) / q, so the piece is at y = 0 where T = T0 - q*y0.
+    T_at = T0 - q * y0
+    if T_at < H_N:
+        return None
+    W = math.sqrt(max(0.0, T_at * T_at - H_N * H_N))
+    roots = [L for L in ((W - V0) / q, (-W - V0) / q) if L_min < L <= span]
+    return min(roots) if roots else None
+
+
 class CatenarySystemCalculator:
     """
     Numerical integration of a suspended cable with:
@@ -447,6 +496,90 @@ class CatenarySystemCalculator:
     # V). There is intentionally no separate point-load helper — a second
     # implementation of load placement would risk drifting from the integrator.
 
+    def _split_events(
+        self,
+        S_free_m: float,
+        L_chute_contact: float,
+        ds_eff: float,
+        assembly: List[AssemblyItem],
+        comps: List[Component],
+    ) -> List[Tuple[float, float]]:
+        """Arc lengths from the TDP where the free span must be split, with the
+        point load (N) applied there: body point loads, assembly segment
+        boundaries and legacy component ends. Events closer than a quarter
+        step are merged."""
+        split_events: List[Tuple[float, float]] = []
+
+        if assembly:
+            d_cursor = 0.0
+            for it in assembly:
+                if it.kind == "segment":
+                    d_cursor += max(0.0, it.length_m)
+                    continue
+                if it.kind != "body":
+                    continue
+                if abs(it.point_load_kN) < 1e-12:
+                    continue
+
+                d_body = d_cursor
+                if d_body < L_chute_contact:
+                    continue
+                if d_body > (L_chute_contact + S_free_m):
+                    continue
+
+                s_body = S_free_m - (d_body - L_chute_contact)
+                if 0.0 < s_body < S_free_m:
+                    split_events.append((float(s_body), float(it.point_load_kN) * 1000.0))
+        else:
+            for c in comps:
+                if not c.is_point:
+                    continue
+                sp = float(c.position_m)
+                if 0.0 < sp < S_free_m:
+                    split_events.append((sp, float(c.point_load_kN) * 1000.0))
+
+        if assembly:
+            d_cursor = 0.0
+            for it in assembly:
+                if it.kind != "segment":
+                    continue
+                d_cursor += max(0.0, it.length_m)
+                d_b = d_cursor
+                if d_b <= L_chute_contact:
+                    continue
+                if d_b >= (L_chute_contact + S_free_m):
+                    continue
+                s_b = S_free_m - (d_b - L_chute_contact)
+                if 0.0 < s_b < S_free_m:
+                    split_events.append((float(s_b), 0.0))
+
+        if not assembly and comps:
+            for c in comps:
+                if c.length_m <= 0:
+                    continue
+                s0 = float(c.position_m)
+                s1 = float(c.position_m + c.length_m)
+                if 0.0 < s0 < S_free_m:
+                    split_events.append((s0, 0.0))
+                if 0.0 < s1 < S_free_m:
+                    split_events.append((s1, 0.0))
+
+        if split_events:
+            split_events.sort(key=lambda t: t[0])
+            merged: List[Tuple[float, float]] = []
+            tol_s = max(1e-9, 0.25 * ds_eff)
+            cur_s, cur_load = split_events[0]
+            for se, load in split_events[1:]:
+                if abs(se - cur_s) <= tol_s:
+                    cur_load += load
+                else:
+                    merged.append((cur_s, cur_load))
+                    cur_s, cur_load = se, load
+            merged.append((cur_s, cur_load))
+            split_events = merged
+
+        return split_events
+
     def integrate(self, H_N: float, S_free_m: float, ds: float) -> Tuple[float, float, float, float, float, np.ndarray, np.ndarray, np.ndarray]:
         D = float(self.seabed.depth_at(self._tdp_x_world))
         alpha_tdp = float(self.seabed.slope_at(self._tdp_x_world))
@@ -454,6 +587,7 @@ class CatenarySystemCalculator:
         comps = self.cfg.get("components", [])
         assembly = self.cfg.get("assembly", [])
         R = float(self.cfg.get("chute_radius_m", 0.0))
+        engine = str(self.cfg.get("integrator", "closed_form"))
 
         def integrate_once(L_chute_contact: float):
             s = 0.0
@@ -478,75 +612,13 @@ class CatenarySystemCalculator:
                 )
             ds_eff = S_free_m / n_steps
 
-            split_events: List[Tuple[float, float]] = []
-
-            if assembly:
-                d_cursor = 0.0
-                for it in assembly:
-                    if it.kind == "segment":
-                        d_cursor += max(0.0, it.length_m)
-                        continue
-                    if it.kind != "body":
-                        continue
-                    if abs(it.point_load_kN) < 1e-12:
-                        continue
-
-                    d_body = d_cursor
-                    if d_body < L_chute_contact:
-                        continue
-                    if d_body > (L_chute_contact + S_free_m):
-                        continue
-
-                    s_body = S_free_m - (d_body - L_chute_contact)
-                    if 0.0 < s_body < S_free_m:
-                        split_events.append((float(s_body), float(it.point_load_kN) * 1000.0))
-            else:
-                for c in comps:
-                    if not c.is_point:
-                        continue
-                    sp = float(c.position_m)
-                    if 0.0 < sp < S_free_m:
-                        split_events.append((sp, float(c.point_load_kN) * 1000.0))
-
-            if assembly:
-                d_cursor = 0.0
-                for it in assembly:
-                    if it.kind != "segment":
-                        continue
-                    d_cursor += max(0.0, it.length_m)
-                    d_b = d_cursor
-                    if d_b <= L_chute_contact:
-                        continue
-                    if d_b >= (L_chute_contact + S_free_m):
-                        continue
-                    s_b = S_free_m - (d_b - L_chute_contact)
-                    if 0.0 < s_b < S_free_m:
-                        split_events.append((float(s_b), 0.0))
+            split_events = self._split_events(S_free_m, L_chute_contact, ds_eff, assembly, comps)
 
-            if not assembly and comps:
-                for c in comps:
-                    if c.length_m <= 0:
-                        continue
-                    s0 = float(c.position_m)
-                    s1 = float(c.position_m + c.length_m)
-                    if 0.0 < s0 < S_free_m:
-                        split_events.append((s0, 0.0))
-                    if 0.0 < s1 < S_free_m:
-                        split_events.append((s1, 0.0))
-
-            if split_events:
-                split_events.sort(key=lambda t: t[0])
-                merged: List[Tuple[float, float]] = []
-                tol_s = max(1e-9, 0.25 * ds_eff)
-                cur_s, cur_load = split_events[0]
-                for se, load in split_events[1:]:
-                    if abs(se - cur_s) <= tol_s:
-                        cur_load += load
-                    else:
-                        merged.append((cur_s, cur_load))
-                        cur_s, cur_load = se, load
-                merged.append((cur_s, cur_load))
-                split_events = merged
+            if engine == "closed_form":
+                return self._closed_form_free_span(
+                    H_N, S_free_m, L_chute_contact, -D, V_init, n_steps, ds_eff,
+                    split_events, assembly, comps,
+                )
 
             ev_idx = 0
 
@@ -672,6 +744,85 @@ class CatenarySystemCalculator:
 
         return x_end, y_end, V_end, theta_end, top_T, s_arr, x_arr, y_arr
 
+    def _closed_form_free_span(
+        self,
+        H_N: float,
+        S_free_m: float,
+        L_chute_contact: float,
+        y0: float,
+        V_init: float,
+        n_steps: int,
+        ds_eff: float,
+        split_events: List[Tuple[float, float]],
+        assembly: List[AssemblyItem],
+        comps: List[Component],
+    ):
+        """Free span from exact catenary pieces between split events.
+
+        The weight is constant between consecutive split events and sea-level
+        crossings, so each piece has a closed form; the output arrays are
+        sampled on the same ``ds_eff`` grid as the stepping integrator,
+        vectorised per piece. Unlike stepping, the geometry does not depend
+        on ``ds``. Returns the same tuple as the stepping loop.
+        """
+        s_grid = ds_eff * np.arange(n_steps + 1, dtype=float)
+        s_grid[-1] = S_free_m
+        x_out = np.empty(n_steps + 1)
+        y_out = np.empty(n_steps + 1)
+        v_out = np.empty(n_steps + 1)
+        s, x, y, V = 0.0, 0.0, float(y0), float(V_init)
+        x_out[0], y_out[0], v_out[0] = x, y, V
+        water = y < 0
+        sea_cross_s = None
+        k = 1
+        for s_end, load_N in list(split_events) + [(S_free_m, 0.0)]:
+            for _ in range(8):   # a piece crosses sea level at most twice
+                if s_end - s <= 0:
+                    break
+                q = self._q_effective(
+                    -1.0 if water else 1.0, 0.5 * (s + s_end), S_free_m,
+                    L_chute_contact, assembly, comps,
+                )
+                L_cross = _surface_crossing(H_N, V, y, q, s_end - s)
+                s_stop = s_end if L_cross is None else s + L_cross
+                k_hi = int(np.searchsorted(s_grid, s_stop - 1e-12, side="left"))
+                if k_hi > k:
+                    dx, dy, Vs = _catenary_piece(H_N, V, q, s_grid[k:k_hi] - s)
+                    x_out[k:k_hi] = x + dx
+                    y_out[k:k_hi] = y + dy
+                    v_out[k:k_hi] = Vs
+                    k = k_hi
+                dx, dy, Vs = _catenary_piece(H_N, V, q, [s_stop - s])
+                x, y, V, s = x + float(dx[0]), y + float(dy[0]), float(Vs[0]), s_stop
+                if L_cross is None:
+                    break
+                y = 0.0
+                if sea_cross_s is None:
+                    sea_cross_s = s
+                water = not water
+            s = s_end
+            if abs(load_N) > 1e-12:
+                V += float(load_N)
+            while k <= n_steps and s_grid[k] <= s + 1e-12:
+                x_out[k], y_out[k], v_out[k] = x, y, V
+                k += 1
+
+        theta = math.atan2(V, H_N)
+        top_T = math.sqrt(H_N * H_N + V * V)
+        return (
+            x,
+            y,
+            V,
+            theta,
+            top_T,
+            s_grid,
+            x_out,
+            y_out,
+            v_out,
+            np.hypot(H_N, v_out) / 1000.0,
+            sea_cross_s,
+        )
+
     @staticmethod
     def _bracket_root(func, x0: float, step: float, max_expand: int = 60) -> Tuple[float, float]:
         a = max(1e-12, x0 - step)
@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+"""Headless parametric sweeps over the V2 catenary solver.
+
+Pure Python + NumPy (openpyxl only for .xlsx export); no QGIS imports.
+
+A sweep is a list of config overrides applied to one base config (the dict
+``CatenaryCalculatorV2Dialog.get_config`` builds). :func:`sweep_grid` makes
+the full factorial of a few parameter axes; :func:`run_sweep` solves every
+case, optionally across a process pool, and returns a :class:`SweepTable`
+with one NumPy column per parameter and result.
+
+Neighbouring cases have nearly the same solution, so each case is seeded
+with the horizontal tension, length and TDP position of the nearest case
+already solved in its batch instead of the base config's guesses.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+import csv
+from dataclasses import dataclass, field
+import itertools
+import math
+import multiprocessing
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .catenary_solver import CatenarySystemCalculator
+
+# Result columns: (column name, unit, calculator attribute).
+RESULT_COLUMNS: Tuple[Tuple[str, str, str], ...] = (
+    ("top_tension_kN", "kN", "top_tension_kN"),
+    ("bottom_tension_kN", "kN", "bottom_tension_kN"),
+    ("horizontal_tension_kN", "kN", "H_N"),
+    ("layback_m", "m", "layback"),
+    ("catenary_length_m", "m", "S_total"),
+    ("exit_angle_deg", "deg", "exit_angle_deg_from_h"),
+    ("min_radius_m", "m", "min_radius_m"),
+    ("tdp_x_m", "m", "tdp_x_world"),
+)
+
+
+@dataclass
+class SweepCase:
+    """One sweep case: config overrides plus their display values.
+
+    ``labels`` holds what the table shows for each override — the value
+    itself for numbers, a name for anything else (an assembly variant).
+    """
+
+    overrides: Dict[str, object]
+    labels: Dict[str, object] = field(default_factory=dict)
+
+
+def sweep_grid(**axes) -> List[SweepCase]:
+    """Full-factorial cases over the given config keys.
+
+    Each axis is a sequence of values, or a ``{label: value}`` dict for
+    non-numeric variants (e.g. ``assembly={"LW": items_lw, "SA": items_sa}``).
+    The last axis varies fastest, so consecutive cases are neighbours.
+    """
+    names = list(axes)
+    choices = []
+    for name in names:
+        values = axes[name]
+        if isinstance(values, dict):
+            choices.append([(label, value) for label, value in values.items()])
+        else:
+            choices.append([(value, value) for value in values])
+    cases = []
+    for combo in itertools.product(*choices):
+        cases.append(SweepCase(
+            overrides={n: value for n, (_label, value) in zip(names, combo)},
+            labels={n: label for n, (label, _value) in zip(names, combo)},
+        ))
+    return cases
+
+
+@dataclass
+class SweepTable:
+    """Sweep results, one row per case.
+
+    ``columns`` maps each parameter and result name to a NumPy array
+    (float for numbers, object for variant labels); failed cases hold NaN
+    results and their message in ``errors``.
+    """
+
+    params: List[str]
+    columns: Dict[str, np.ndarray]
+    converged: np.ndarray
+    errors: List[str]
+
+    def __len__(self) -> int:
+        return len(self.errors)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    @property
+    def headers(self) -> List[str]:
+        units = {name: unit for name, unit, _attr in RESULT_COLUMNS}
+        out = list(self.params)
+        out += [f"{name} ({units[name]})" if name in units else name
+                for name in self.columns if name not in self.params]
+        return out + ["converged", "error"]
+
+    def rows(self) -> List[List[object]]:
+        names = list(self.params) + [n for n in self.columns if n not in self.params]
+        rows = []
+        for i in range(len(self)):
+            row = []
+            for name in names:
+                v = self.columns[name][i]
+                row.append(v.item() if isinstance(v, np.generic) else v)
+            row += [bool(self.converged[i]), self.errors[i]]
+            rows.append(row)
+        return rows
+
+    def to_csv(self, path: str) -> None:
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.headers)
+            for row in self.rows():
+                writer.writerow(["" if isinstance(v, float) and math.isnan(v) else v
+                                 for v in row])
+
+    def to_xlsx(self, path: str, title: str = "Catenary sweep") -> None:
+        """Write an .xlsx workbook. Raises ImportError without openpyxl."""
+        from openpyxl import Workbook
+        from openpyxl.styles import Font
+
+        wb = Workbook()
+        ws = wb.active
+        ws.title = title[:31]
+        ws.append(self.headers)
+        for cell in ws[1]:
+            cell.font = Font(bold=True)
+        for row in self.rows():
+            ws.append([None if isinstance(v, float) and math.isnan(v) else v
+                       for v in row])
+        ws.freeze_panes = "A2"
+        wb.save(path)
+
+
+def _case_coords(cases: Sequence[SweepCase]) -> np.ndarray:
+    """Cases as points in a unit cube (numeric overrides only) for the
+    nearest-neighbour warm start; variants count as different when unequal."""
+    keys = sorted({k for c in cases for k in c.overrides})
+    cols = []
+    for k in keys:
+        vals = [c.labels.get(k, c.overrides.get(k)) for c in cases]
+        try:
+            col = np.array([float(v) for v in vals])
+        except (TypeError, ValueError):
+            index: Dict[object, int] = {}
+            col = np.array([float(index.setdefault(str(v), len(index))) for v in vals])
+            col = col * 1e3   # different variants are never near each other
+        else:
+            span = float(np.ptp(col)) if col.size else 0.0
+            col = (col - col.min()) / span if span > 0 else np.zeros_like(col)
+        cols.append(col)
+    if not cols:
+        return np.zeros((len(cases), 1))
+    return np.column_stack(cols)
+
+
+def _solve_batch(base_cfg: dict, cases: Sequence[SweepCase],
+                 coords: np.ndarray) -> List[Tuple[Optional[Dict[str, float]], bool, str]]:
+    """Solve ``cases`` in order, seeding each from the nearest solved case.
+
+    Worker-process entry point: everything it receives must pickle.
+    Returns ``(results, converged, error)`` per case.
+    """
+    out: List[Tuple[Optional[Dict[str, float]], bool, str]] = []
+    solved: List[int] = []
+    seeds: Dict[int, Tuple[float, float, float]] = {}
+    for i, case in enumerate(cases):
+        cfg = dict(base_cfg)
+        cfg.update(case.overrides)
+        tdp_seed = 0.0
+        if solved:
+            d = np.linalg.norm(coords[solved] - coords[i], axis=1)
+            H, S, tdp_seed = seeds[solved[int(np.argmin(d))]]
+            cfg["H_guess_N"] = H
+            cfg["S_guess_m"] = S
+        calc = CatenarySystemCalculator(cfg)
+        calc._tdp_x_world = tdp_seed
+        try:
+            calc.solve()
+        except Exception as exc:
+            out.append((None, False, str(exc).strip() or type(exc).__name__))
+            continue
+        values = {}
+        for name, _unit, attr in RESULT_COLUMNS:
+            v = getattr(calc, attr, None)
+            values[name] = float(v) if v is not None else float("nan")
+        values["horizontal_tension_kN"] /= 1000.0
+        out.append((values, bool(calc.diagnostics.converged), ""))
+        if calc.H_N and calc.S_total and math.isfinite(calc.H_N) and math.isfinite(calc.S_total):
+            seeds[i] = (float(calc.H_N), float(calc.S_total),
+                        float(calc.tdp_x_world or 0.0))
+            solved.append(i)
+    return out
+
+
+def _pool_context():
+    # Inside QGIS sys.executable is the QGIS binary, not a Python
+    # interpreter; spawn the workers with the bundled one. None when there
+    # is no interpreter to spawn: the sweep then solves in process.
+    ctx = multiprocessing.get_context("spawn")
+    try:
+        from ..qgis_compat import python_executable
+    except ImportError:  # outside QGIS sys.executable is Python
+        return ctx
+    python_exe = python_executable()
+    if python_exe is None:
+        return None
+    ctx.set_executable(python_exe)
+    return ctx
+
+
+def run_sweep(
+    base_cfg: dict,
+    cases: Sequence[SweepCase],
+    *,
+    workers: int = 1,
+    batch_size: int = 0,
+    mp_context=None,
+    progress: Optional[Callable[[float], bool]] = None,
+) -> SweepTable:
+    """Solve every case of a sweep and tabulate the results.
+
+    ``workers > 1`` solves contiguous batches of cases in a process pool
+    (``mp_context``, default spawn); the base config must then pickle (it
+    does for every seabed and assembly type in :mod:`catenary_solver`).
+    ``batch_size`` defaults to an even split over about four batches per
+    worker. ``progress(fraction) -> continue?`` is called after each batch;
+    returning False stops the sweep, leaving the unsolved cases as errors.
+    Falls back to solving in this process if the pool cannot start, and
+    finishes the remaining batches in process if it breaks mid-sweep.
+    """
+    cases = list(cases)
+    n = len(cases)
+    coords = _case_coords(cases)
+    workers = max(1, int(workers))
+    if batch_size <= 0:
+        batch_size = max(1, math.ceil(n / (4 * workers))) if workers > 1 else max(1, n)
+    batches = [(lo, min(n, lo + batch_size)) for lo in range(0, n, batch_size)]
+    results: List[Optional[Tuple[Optional[Dict[str, float]], bool, str]]] = [None] * n
+
+    pool = None
+    if workers > 1 and len(batches) > 1:
+        ctx = mp_context or _pool_context()
+        try:
+            if ctx is not None:
+                pool = ProcessPoolExecutor(max_workers=workers, mp_context=ctx)
+        except Exception:  # restricted environment: solve in process
+            pool = None
+    next_batch = 0
+    stopped = False
+    try:
+        if pool is not None:
+            try:
+                futures = [pool.submit(_solve_batch, base_cfg, cases[lo:hi], coords[lo:hi])
+                           for lo, hi in batches]
+                for k, ((lo, hi), future) in enumerate(zip(batches, futures)):
+                    results[lo:hi] = future.result()
+                    next_batch = k + 1
+                    if progress is not None and not progress((k + 1) / len(batches)):
+                        stopped = True
+                        break
+            except Exception:  # broken pool / unpicklable config
+                pool.shutdown(wait=False, cancel_futures=True)
+                pool = None
+        if not stopped:
+            for k in range(next_batch, len(batches)):
+                lo, hi = batches[k]
+                results[lo:hi] = _solve_batch(base_cfg, cases[lo:hi], coords[lo:hi])
+                if progress is not None and not progress((k + 1) / len(batches)):
+                    break
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    params = list(dict.fromkeys(k for c in cases for k in c.labels))
+    columns: Dict[str, np.ndarray] = {}
+    for name in params:
+        vals = [c.labels.get(name) for c in cases]
+        try:
+            columns[name] = np.array([float(v) for v in vals])
+        except (TypeError, ValueError):
+            columns[name] = np.array(vals, dtype=object)
+    for name, _unit, _attr in RESULT_COLUMNS:
+        columns[name] = np.full(n, np.nan)
+    converged = np.zeros(n, dtype=bool)
+    errors = ["not solved (cancelled)"] * n
+    for i, r in enumerate(results):
+        if r is None:
+            continue
+        values, ok, err = r
+        errors[i] = err
+        converged[i] = ok
+        if values:
+            for name, v in values.items():
+                columns[name][i] = v
+    return SweepTable(params=params, columns=columns, converged=converged, errors=errors)
@@ -88,6 +88,18 @@ class ManualCommand:
         )
 
 
+@dataclass
+class ManualCheckpoint:
+    """Controller + simulator state after the first ``n_cmds`` commands."""
+
+    n_cmds: int
+    sim_state: dict
+    overboarded: bool
+    transferred: bool
+    length0: Dict[str, float]
+    snap: Snapshot
+
+
 class ManualBUController:
     """Drive an :class:`OperationSimulator` interactively.
 
@@ -98,12 +110,24 @@ class ManualBUController:
     then clears them, so nothing runs automatically. ``nominal_speed_mps`` sets
     the timescale a move/payout command is stepped over (only its ratio to the
     distance matters — it controls sub-stepping, not physics).
+
+    Every ``checkpoint_every`` commands the complete simulator state is
+    checkpointed, so undo / replay / branching restore the nearest
+    checkpoint and re-solve only the commands after it. At most
+    ``checkpoint_budget`` checkpoints are kept besides the settled start;
+    beyond that the most closely spaced one is dropped, so memory stays
+    bounded while the checkpoints spread over the whole history.
     """
 
     def __init__(self, sim: OperationSimulator, *,
                  nominal_speed_mps: float = 0.5,
-                 target_xy: Optional[Tuple[float, float]] = None):
+                 target_xy: Optional[Tuple[float, float]] = None,
+                 checkpoint_every: int = 5,
+                 checkpoint_budget: int = 8):
         self.sim = sim
+        self.checkpoint_every = max(1, int(checkpoint_every))
+        self.checkpoint_budget = max(1, int(checkpoint_budget))
+        self._checkpoints: Dict[int, ManualCheckpoint] = {}
         self.nominal_speed_mps = max(float(nominal_speed_mps), 1e-3)
         self.target_xy = tuple(target_xy) if target_xy is not None else None
         # Discover the scripted event bundles, then disarm the schedule.
@@ -154,6 +178,8 @@ class ManualBUController:
         snap = self.sim.settle()
         self._settle_snap = snap
         self._capture_baselines()
+        self._checkpoints = {}
+        self._save_checkpoint(snap)
         return snap
 
     def _capture_baselines(self):
@@ -238,6 +264,8 @@ class ManualBUController:
             self._transferred = True
         self.history.append(cmd)
         self._capture_baselines()
+        if len(self.history) % self.checkpoint_every == 0:
+            self._save_checkpoint(snap)
         return snap
 
     def move_range_bearing(self, range_m: float, bearing_math_deg: float,
@@ -264,13 +292,71 @@ class ManualBUController:
         return self.settle()
 
     def replay(self, cmds: List[ManualCommand]) -> Snapshot:
-        snap = self.settle()
-        for c in cmds:
+        """Drive the run through ``cmds`` from the settled start.
+
+        Commands shared with the current history are not re-solved: the
+        nearest checkpoint within that common prefix is restored and only
+        the remaining commands are applied. Checkpoints past the point
+        where ``cmds`` diverges are discarded."""
+        cmds = list(cmds)
+        common = 0
+        for old, new in zip(self.history, cmds):
+            if old.to_dict() != new.to_dict():
+                break
+            common += 1
+        cp = self._nearest_checkpoint(common)
+        if cp is None:
+            snap = self.settle()
+        else:
+            snap = self._restore_checkpoint(cp)
+        for c in cmds[len(self.history):]:
             snap = self.apply(c)
         return snap
 
+    def replay_to(self, n_cmds: int) -> Snapshot:
+        """Return to the state after the first ``n_cmds`` commands."""
+        n = max(0, min(int(n_cmds), len(self.history)))
+        return self.replay(self.history[:n])
+
+    def branch_from(self, n_cmds: int) -> Snapshot:
+        """Start a new branch after the first ``n_cmds`` commands: the later
+        commands are dropped and the next :meth:`apply` continues from
+        there."""
+        return self.replay_to(n_cmds)
+
     # -- internals ----------------------------------------------------------
 
+    def _save_checkpoint(self, snap: Snapshot):
+        n = len(self.history)
+        self._checkpoints[n] = ManualCheckpoint(
+            n_cmds=n,
+            sim_state=self.sim.checkpoint(),
+            overboarded=self._overboarded,
+            transferred=self._transferred,
+            length0=dict(self._length0),
+            snap=snap,
+        )
+        # Over budget: drop the checkpoint closest to its predecessor. The
+        # settled start and the newest checkpoint are always kept.
+        while len(self._checkpoints) > self.checkpoint_budget + 1:
+            keys = sorted(self._checkpoints)
+            drop = min(keys[1:-1], key=lambda k: k - keys[keys.index(k) - 1])
+            del self._checkpoints[drop]
+
+    def _nearest_checkpoint(self, n_cmds: int) -> Optional[ManualCheckpoint]:
+        keys = [k for k in self._checkpoints if k <= n_cmds]
+        return self._checkpoints[max(keys)] if keys else None
+
+    def _restore_checkpoint(self, cp: ManualCheckpoint) -> Snapshot:
+        """Rewind to ``cp``; later history and checkpoints are dropped."""
+        self.sim.restore(cp.sim_state)
+        self._overboarded = cp.overboarded
+        self._transferred = cp.transferred
+        self._length0 = dict(cp.length0)
+        self.history = self.history[:cp.n_cmds]
+        self._checkpoints = {k: v for k, v in self._checkpoints.items() if k <= cp.n_cmds}
+        return cp.snap
+
     def _world_disp(self, cmd: ManualCommand) -> Tuple[float, float]:
         h = math.radians(self.heading_deg())
         ch, sh = math.cos(h), math.sin(h)
@@ -13,6 +13,10 @@ Strategy (pragmatic, engineering-grade):
   error vector and shifting the start (and the pre-laid leg ends, which are
   defined relative to the jointing position) by minus that error. One or
   two rounds land within tolerance.
+* With ``workers > 1`` each round instead previews a small stencil of
+  start positions around the current estimate concurrently in worker
+  processes; the best landing is kept and the stencil's fitted landing
+  Jacobian corrects for the non-translation part of real bathymetry.
 * Tension / bend-radius limits are checked over the preview snapshots and
   reported as warnings on the result — the final ops run should always be
   re-simulated at full quality.
@@ -20,9 +24,15 @@ Strategy (pragmatic, engineering-grade):
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field, replace
+from functools import partial
 import math
+import multiprocessing
+import os
+import tempfile
 from typing import Dict, List, Optional, Tuple
+import uuid
 
 import numpy as np
 
@@ -127,6 +137,85 @@ def _check_limits(res: SimResult, limits: DeploymentLimits, warnings: List[str])
         )
 
 
+def _not_cancelled(cancel_path: str, *_args) -> bool:
+    return not os.path.exists(cancel_path)
+
+
+def _run_preview(job: Dict) -> Tuple[Optional[Tuple[float, float]], SimResult]:
+    """Worker-process entry point: one preview run from a pickled job.
+
+    The parent's cancel hook cannot cross the process boundary, so the run
+    polls for the job's ``cancel_path`` sentinel file instead.
+    """
+    opts = replace(job["options"], cancel=partial(os.path.exists, job["cancel_path"]))
+    make_sim = job["sim_factory"] or OperationSimulator
+    res = make_sim(job["scenario"], job["bathy"], opts).run(
+        partial(_not_cancelled, job["cancel_path"]))
+    return _landing_xy(res), res
+
+
+def _run_parallel(pool, setups, bathy, sim_factory, cancel_path: str, progress):
+    """Run one preview per ``(scenario, rows, options)`` setup in ``pool``.
+
+    Returns ``[(landing_xy, SimResult)]`` in setup order, or None when the
+    options' ``cancel`` hook (or ``progress``) stops the round — running
+    workers then see the sentinel file and wind down their runs.
+    """
+    futures = {
+        pool.submit(_run_preview, {
+            "scenario": scn, "bathy": bathy,
+            "options": replace(opts, cancel=None, solver_progress=None),
+            "sim_factory": sim_factory, "cancel_path": cancel_path,
+        }): i
+        for i, (scn, _rows, opts) in enumerate(setups)
+    }
+    cancel = setups[0][2].cancel
+    results: List = [None] * len(setups)
+    pending = set(futures)
+    while pending:
+        done, pending = wait(pending, timeout=0.25, return_when=FIRST_COMPLETED)
+        for future in done:
+            results[futures[future]] = future.result()
+        n_done = len(setups) - len(pending)
+        stop = cancel is not None and cancel()
+        if progress is not None and done:
+            stop = not progress(n_done / len(setups),
+                                f"{n_done}/{len(setups)} candidates") or stop
+        if stop:
+            with open(cancel_path, "w"):
+                pass  # running workers poll for this file
+            for future in pending:
+                future.cancel()
+            return None
+    return results
+
+
+def _stencil(centre: np.ndarray, radius_m: float, n: int) -> List[np.ndarray]:
+    """``centre`` plus ``n`` points evenly spread on a ring around it."""
+    pts = [centre]
+    for k in range(n):
+        a = 2.0 * math.pi * k / n
+        pts.append(centre + radius_m * np.array([math.cos(a), math.sin(a)]))
+    return pts
+
+
+def _stencil_step(starts: List[np.ndarray], landings: List[np.ndarray],
+                  err_vec: np.ndarray) -> np.ndarray:
+    """Start-position correction that cancels ``err_vec``.
+
+    Fits ``landing = b + J @ start`` over the stencil and inverts ``J``.
+    Falls back to the pure translation (``J = I``) when the stencil is too
+    small or the fit is implausible (noisy previews, degenerate stencil).
+    """
+    if len(starts) >= 3:
+        A = np.column_stack([np.ones(len(starts)), np.asarray(starts)])
+        coef, _res, rank, _sv = np.linalg.lstsq(A, np.asarray(landings), rcond=None)
+        J = coef[1:].T
+        if rank == 3 and 0.25 < np.linalg.det(J) < 4.0 and np.linalg.cond(J) < 10.0:
+            return -np.linalg.solve(J, err_vec)
+    return -err_vec
+
+
 def optimize_bu_schedule(
     bathy,
     params: Dict,
@@ -141,6 +230,9 @@ def optimize_bu_schedule(
     preview_options: Optional[SimOptions] = None,
     progress=None,
     sim_factory=None,
+    workers: int = 1,
+    stencil_m: Optional[float] = None,
+    mp_context=None,
 ) -> OptimizeResult:
     """Place the operation so the BU lands on ``target_landing_xy``.
 
@@ -162,6 +254,13 @@ def optimize_bu_schedule(
     ``sim_factory`` substitutes the simulator class for the preview runs
     (e.g. ``quick_bu.QuickOperationSimulator``); default is the full
     :class:`OperationSimulator` at preview options.
+
+    ``workers > 1`` previews ``workers`` start positions per round in a
+    process pool (``mp_context``, default spawn): the current estimate and
+    a ring of ``stencil_m`` (default ``2 * tol_m``) around it. The scenario,
+    bathymetry, options and ``sim_factory`` must pickle; the options'
+    ``cancel`` hook is polled in this process between results. If the pool
+    cannot start the rounds run sequentially.
     """
     limits = limits or DeploymentLimits()
     p = dict(params)
@@ -175,16 +274,13 @@ def optimize_bu_schedule(
     end2 = np.asarray(p.pop("laid_end_2_xy"), dtype=float)
     target = np.asarray(target_landing_xy, dtype=float)
 
-    warnings: List[str] = []
-    res = None
-    landing = None
-    err = float("inf")
-    rounds = 0
-    for rounds in range(1, int(max_rounds) + 1):
+    off1, off2 = end1 - start_xy, end2 - start_xy
+
+    def preview_setup(xy: np.ndarray):
         rows = schedule
         if rows is None:
             rows = default_bu_schedule(
-                depth_m=float(bathy.depth_at(*start_xy)),
+                depth_m=float(bathy.depth_at(*xy)),
                 tail_length_m=float(p.get("tail_length_m", 90.0)),
                 tail_leg1_m=p.get("tail_leg1_m"),
                 tail_leg2_m=p.get("tail_leg2_m"),
@@ -193,11 +289,12 @@ def optimize_bu_schedule(
                 lay_speed_mps=float(p.get("lay_speed_mps", 0.3)),
                 course_deg=float(p.get("vessel_heading_deg", 0.0)),
             )
+        e1, e2 = xy + off1, xy + off2
         scn = bu_full_deployment(
             bathy, leg1_asm, leg2_asm, trunk_asm, defaults,
-            vessel_xy=(float(start_xy[0]), float(start_xy[1])),
-            laid_end_1_xy=(float(end1[0]), float(end1[1])),
-            laid_end_2_xy=(float(end2[0]), float(end2[1])),
+            vessel_xy=(float(xy[0]), float(xy[1])),
+            laid_end_1_xy=(float(e1[0]), float(e1[1])),
+            laid_end_2_xy=(float(e2[0]), float(e2[1])),
             schedule=rows,
             **p,
         )
@@ -213,28 +310,86 @@ def optimize_bu_schedule(
                 opts.controller = ctrls[0]
             elif ctrls:
                 opts.controller = CompositeController(ctrls)
-        sub_progress = None
-        if progress is not None:
+        return scn, rows, opts
+
+    warnings: List[str] = []
+    pool = None
+    if int(workers) > 1:
+        try:
+            pool = ProcessPoolExecutor(
+                max_workers=int(workers),
+                mp_context=mp_context or multiprocessing.get_context("spawn"))
+        except Exception as exc:  # restricted environment
+            warnings.append(f"Parallel previews unavailable ({exc}); ran them "
+                            "one at a time.")
+    cancel_path = os.path.join(tempfile.gettempdir(),
+                               f"sct_preview_cancel_{uuid.uuid4().hex[:8]}")
+
+    res = None
+    rows = None
+    landing = None
+    err = float("inf")
+    rounds = 0
+    try:
+        for rounds in range(1, int(max_rounds) + 1):
             base = (rounds - 1) / float(max_rounds)
             span = 1.0 / float(max_rounds)
-            sub_progress = (lambda f, lbl, _b=base, _s=span:
-                            progress(_b + _s * f, f"preview {rounds}: {lbl}"))
-        make_sim = sim_factory or OperationSimulator
-        res = make_sim(scn, bathy, opts).run(sub_progress)
-        landing = _landing_xy(res)
-        if landing is None:
-            warnings.append(
-                "Preview run never overboarded the BU — check the schedule "
-                "(no 'overboard_bu' phase?)."
-            )
-            break
-        err_vec = np.asarray(landing) - target
-        err = float(np.hypot(err_vec[0], err_vec[1]))
-        if err <= tol_m:
-            break
-        start_xy = start_xy - err_vec
-        end1 = end1 - err_vec
-        end2 = end2 - err_vec
+            round_progress = None
+            if progress is not None:
+                round_progress = (lambda f, lbl, _b=base, _s=span, _r=rounds:
+                                  progress(_b + _s * f, f"preview {_r}: {lbl}"))
+            starts = [start_xy]
+            results = None
+            if pool is not None:
+                starts = _stencil(start_xy, float(stencil_m or max(2.0 * tol_m, 1.0)),
+                                  int(workers) - 1)
+                setups = [preview_setup(xy) for xy in starts]
+                try:
+                    results = _run_parallel(pool, setups, bathy, sim_factory,
+                                            cancel_path, round_progress)
+                except Exception as exc:  # unpicklable inputs / broken pool
+                    warnings.append(f"Parallel previews failed ({exc}); ran "
+                                    "them one at a time.")
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    pool = None
+                    starts = [start_xy]
+                    results = None
+                else:
+                    if results is None:     # cancelled
+                        break
+            if results is None:
+                scn, rows_i, opts = preview_setup(start_xy)
+                make_sim = sim_factory or OperationSimulator
+                res_i = make_sim(scn, bathy, opts).run(round_progress)
+                setups = [(scn, rows_i, opts)]
+                results = [(_landing_xy(res_i), res_i)]
+            landed = [i for i, (lxy, _r) in enumerate(results) if lxy is not None]
+            if not landed:
+                res, rows, landing = results[0][1], setups[0][1], None
+                warnings.append(
+                    "Preview run never overboarded the BU — check the schedule "
+                    "(no 'overboard_bu' phase?)."
+                )
+                break
+            errs = [float(np.hypot(*(np.asarray(results[i][0]) - target))) for i in landed]
+            i_best = landed[int(np.argmin(errs))]
+            res, rows = results[i_best][1], setups[i_best][1]
+            landing, err = results[i_best][0], min(errs)
+            start_xy = starts[i_best]
+            if err <= tol_m:
+                break
+            start_xy = start_xy + _stencil_step(
+                [starts[i] for i in landed],
+                [np.asarray(results[i][0]) for i in landed],
+                np.asarray(landing) - target)
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+        try:
+            os.remove(cancel_path)
+        except OSError:
+            pass
+    end1, end2 = start_xy + off1, start_xy + off2
     if landing is not None and err > tol_m:
         warnings.append(
             f"Landing error {err:.1f} m still exceeds the {tol_m:.0f} m "
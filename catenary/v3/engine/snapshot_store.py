@@ -0,0 +1,367 @@
+# -*- coding: utf-8 -*-
+"""Compact columnar storage for operation-simulation snapshots.
+
+Pure Python + NumPy; no Qt/QGIS imports.
+
+:class:`SnapshotStore` is what :class:`timeline.SimResult` keeps its
+snapshots in. It behaves as a read-only sequence of
+:class:`timeline.Snapshot` — ``len``, indexing, slicing, iteration and
+``reversed`` all work, so consumers written against a snapshot list need no
+change — but it holds no ``Snapshot`` objects: a snapshot is rebuilt only
+when it is indexed.
+
+Per-node results are appended to one typed column per quantity and chain
+name (float32 geometry and tension, uint8 contact, int32 segment ids), with
+per-snapshot offsets into them; time, step index and vessel pose are shared
+scalar columns. Node positions are stored relative to the snapshot's vessel
+position, so float32 keeps millimetre resolution however far the operation
+runs from the frame origin. With ``spill=True`` the node columns live in
+anonymous temporary files and are read back through ``numpy.memmap``, so
+resident memory stays flat however many substeps a run has.
+
+Whole-run series (top tension per chain, BU depth, ...) are read straight
+from the scalar columns (:meth:`SnapshotStore.chain_series` and friends)
+without rebuilding any snapshot.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+import math
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class _Column:
+    """Append-only typed array of ``width``-wide rows, in RAM or spilled to
+    an anonymous temporary file."""
+
+    def __init__(self, dtype, width: int = 0, spill: bool = False,
+                 spill_dir: Optional[str] = None):
+        self.dtype = np.dtype(dtype)
+        self.width = int(width)          # 0 = one scalar per row
+        self.n = 0
+        self._file = tempfile.TemporaryFile(dir=spill_dir) if spill else None
+        self._buf = None if spill else np.empty(self._shape(64), dtype=self.dtype)
+        self._map = None
+
+    def _shape(self, n: int):
+        return (n, self.width) if self.width else (n,)
+
+    def append(self, values) -> int:
+        """Append rows; returns the index of the first one."""
+        a = np.ascontiguousarray(values, dtype=self.dtype).reshape(self._shape(-1))
+        lo = self.n
+        if self._file is not None:
+            self._file.seek(0, 2)
+            self._file.write(a.tobytes())
+            self._map = None
+        else:
+            if lo + len(a) > len(self._buf):
+                grown = np.empty(self._shape(max(2 * len(self._buf), lo + len(a))),
+                                 dtype=self.dtype)
+                grown[:lo] = self._buf[:lo]
+                self._buf = grown
+            self._buf[lo:lo + len(a)] = a
+        self.n = lo + len(a)
+        return lo
+
+    def view(self) -> "np.ndarray":
+        """Read-only view of all rows (memory-mapped when spilled)."""
+        if self._file is None:
+            v = self._buf[:self.n]
+            v.flags.writeable = False
+            return v
+        if self.n == 0:
+            return np.empty(self._shape(0), dtype=self.dtype)
+        if self._map is None:
+            self._file.flush()
+            self._map = np.memmap(self._file, dtype=self.dtype, mode="r",
+                                  shape=self._shape(self.n))
+        return self._map
+
+    def close(self):
+        self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._buf = np.empty(self._shape(0), dtype=self.dtype)
+            self.n = 0
+
+
+# Per-chain scalar results kept as float64 columns (NaN = not available).
+_CHAIN_SCALARS = (
+    "top_tension_kN", "end_tension_kN", "min_radius_m", "length_m",
+    "tdp_tension_kN", "count_top_m",
+)
+
+
+class _ChainTable:
+    """All stored rows of one chain name: scalars plus ragged node arrays."""
+
+    def __init__(self, spill: bool, spill_dir: Optional[str]):
+        self.snap_idx = _Column(np.int64)
+        self.node_lo = _Column(np.int64)
+        self.n_nodes = _Column(np.int64)
+        self.seg_lo = _Column(np.int64)        # seg_id is per element
+        self.n_seg = _Column(np.int64)
+        self.scalars = {k: _Column(np.float64) for k in _CHAIN_SCALARS}
+        self.joint_xyz: List[Optional[Tuple[float, float, float]]] = []
+        self.joints_xyz: List[list] = []
+        self.xyz = _Column(np.float32, 3, spill, spill_dir)
+        self.s = _Column(np.float32, 0, spill, spill_dir)
+        self.tension_kN = _Column(np.float32, 0, spill, spill_dir)
+        self.contact = _Column(np.uint8, 0, spill, spill_dir)
+        self.seg_id = _Column(np.int32, 0, spill, spill_dir)
+
+    def columns(self):
+        yield from (self.snap_idx, self.node_lo, self.n_nodes, self.seg_lo,
+                    self.n_seg, self.xyz, self.s, self.tension_kN, self.contact,
+                    self.seg_id)
+        yield from self.scalars.values()
+
+
+def _opt_float(v) -> float:
+    return float("nan") if v is None else float(v)
+
+
+def _tdp_tension(tension: "np.ndarray", contact: "np.ndarray") -> float:
+    """Tension at the first bed-contact node (NaN while fully suspended)."""
+    if contact.size == 0 or not contact.any():
+        return float("nan")
+    k = int(np.argmax(contact))
+    return float(tension[min(k, tension.size - 1)]) if tension.size else float("nan")
+
+
+class SnapshotStore(Sequence):
+    """Columnar, optionally disk-backed sequence of simulation snapshots.
+
+    ``spill`` keeps the per-node columns in temporary files under
+    ``spill_dir`` (the system temp directory by default); they are removed
+    by :meth:`close` or when the store is garbage collected.
+    """
+
+    def __init__(self, spill: bool = False, spill_dir: Optional[str] = None):
+        self.spill = bool(spill)
+        self.spill_dir = spill_dir
+        self._reset()
+
+    def _reset(self):
+        self._t = _Column(np.float64)
+        self._step = _Column(np.int64)
+        self._vessel = _Column(np.float64, 3)          # x, y, heading
+        self._converged = _Column(np.bool_)
+        self._residual = _Column(np.float64)
+        # Small per-snapshot metadata stays as Python objects.
+        self._members: List[List[Tuple[str, int]]] = []   # (chain, row) in order
+        self._junctions: List[Dict[str, Tuple[float, float, float]]] = []
+        self._warnings: List[List[str]] = []
+        self._labels: List[str] = []
+        self._payout: List[Dict[str, float]] = []
+        self._chains: Dict[str, _ChainTable] = {}
+
+    # -- writing ------------------------------------------------------------
+
+    def append(self, snap, step_index: int = -1) -> None:
+        """Store ``snap`` (a :class:`timeline.Snapshot`). Later changes to
+        the snapshot object are not seen by the store."""
+        i = len(self._labels)
+        vx, vy = float(snap.vessel_xy[0]), float(snap.vessel_xy[1])
+        origin = np.array([vx, vy, 0.0])
+        members: List[Tuple[str, int]] = []
+        for c in snap.chains:
+            tab = self._chains.get(c.name)
+            if tab is None:
+                tab = self._chains[c.name] = _ChainTable(self.spill, self.spill_dir)
+            xyz = np.asarray(c.xyz, dtype=float)
+            tension = np.asarray(c.tension_kN, dtype=float)
+            contact = np.asarray(c.contact, dtype=bool)
+            row = tab.snap_idx.append([i])
+            tab.node_lo.append([tab.xyz.append(xyz - origin)])
+            tab.n_nodes.append([len(xyz)])
+            tab.s.append(c.s)
+            tab.tension_kN.append(tension)
+            tab.contact.append(contact)
+            seg_id = np.asarray(c.seg_id)
+            tab.seg_lo.append([tab.seg_id.append(seg_id)])
+            tab.n_seg.append([len(seg_id)])
+            values = {
+                "top_tension_kN": float(c.top_tension_kN),
+                "end_tension_kN": float(c.end_tension_kN),
+                "min_radius_m": float(c.min_radius_m),
+                "length_m": float(c.length_m),
+                "tdp_tension_kN": _tdp_tension(tension, contact),
+                "count_top_m": _opt_float(getattr(c, "count_top_m", None)),
+            }
+            for k, col in tab.scalars.items():
+                col.append([values[k]])
+            tab.joint_xyz.append(getattr(c, "joint_xyz", None))
+            tab.joints_xyz.append(list(getattr(c, "joints_xyz", None) or []))
+            members.append((c.name, row))
+        self._t.append([float(snap.t_s)])
+        self._step.append([int(step_index)])
+        self._vessel.append([[vx, vy, float(snap.vessel_heading_deg)]])
+        self._converged.append([bool(snap.converged)])
+        self._residual.append([float(snap.residual_ratio)])
+        self._members.append(members)
+        self._junctions.append(dict(snap.junction_xyz))
+        self._warnings.append(list(snap.warnings))
+        self._labels.append(snap.label)
+        self._payout.append(dict(snap.payout_mps or {}))
+
+    def close(self) -> None:
+        """Release the spill files (the store is empty afterwards)."""
+        for tab in self._chains.values():
+            for col in tab.columns():
+                col.close()
+        self._reset()
+
+    # -- sequence protocol ---------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._snapshot(k) for k in range(*i.indices(len(self)))]
+        n = len(self)
+        k = int(i) + n if int(i) < 0 else int(i)
+        if not 0 <= k < n:
+            raise IndexError("snapshot index out of range")
+        return self._snapshot(k)
+
+    def _snapshot(self, i: int):
+        from .timeline import ChainSnapshot, Snapshot
+
+        vx, vy, heading = (float(v) for v in self._vessel.view()[i])
+        origin = np.array([vx, vy, 0.0])
+        chains = []
+        for name, row in self._members[i]:
+            tab = self._chains[name]
+            lo = int(tab.node_lo.view()[row])
+            hi = lo + int(tab.n_nodes.view()[row])
+            s_lo = int(tab.seg_lo.view()[row])
+            s_hi = s_lo + int(tab.n_seg.view()[row])
+            sc = {k: float(col.view()[row]) for k, col in tab.scalars.items()}
+            count = sc["count_top_m"]
+            chains.append(ChainSnapshot(
+                name=name,
+                xyz=tab.xyz.view()[lo:hi].astype(float) + origin,
+                s=tab.s.view()[lo:hi].astype(float),
+                tension_kN=tab.tension_kN.view()[lo:hi].astype(float),
+                contact=tab.contact.view()[lo:hi].astype(bool),
+                seg_id=tab.seg_id.view()[s_lo:s_hi].astype(int),
+                top_tension_kN=sc["top_tension_kN"],
+                end_tension_kN=sc["end_tension_kN"],
+                min_radius_m=sc["min_radius_m"],
+                length_m=sc["length_m"],
+                joint_xyz=tab.joint_xyz[row],
+                joints_xyz=list(tab.joints_xyz[row]),
+                count_top_m=None if math.isnan(count) else count,
+            ))
+        return Snapshot(
+            t_s=float(self._t.view()[i]),
+            vessel_xy=(vx, vy),
+            vessel_heading_deg=heading,
+            chains=chains,
+            junction_xyz=dict(self._junctions[i]),
+            converged=bool(self._converged.view()[i]),
+            residual_ratio=float(self._residual.view()[i]),
+            warnings=list(self._warnings[i]),
+            label=self._labels[i],
+            payout_mps=dict(self._payout[i]),
+        )
+
+    # -- whole-run columns ----------------------------------------------------
+
+    @property
+    def t_s(self) -> "np.ndarray":
+        """Snapshot times (s)."""
+        return np.array(self._t.view())
+
+    @property
+    def step_index(self) -> "np.ndarray":
+        """Script step each snapshot belongs to (-1 for the settle)."""
+        return np.array(self._step.view())
+
+    @property
+    def vessel_xy(self) -> "np.ndarray":
+        """(n, 2) vessel track."""
+        return np.array(self._vessel.view()[:, :2])
+
+    def bounds(self) -> "np.ndarray":
+        """(2, 3) lower / upper corner over every stored node and vessel
+        position, read from the columns without rebuilding any snapshot
+        ((0, 3) when the store is empty)."""
+        n = len(self)
+        if n == 0:
+            return np.empty((0, 3))
+        vessel = np.zeros((n, 3))
+        vessel[:, :2] = self._vessel.view()[:, :2]
+        lo, hi = vessel.min(axis=0), vessel.max(axis=0)
+        for tab in self._chains.values():
+            rows = np.flatnonzero(tab.n_nodes.view() > 0)
+            if rows.size == 0:
+                continue
+            # Rows own contiguous node ranges, so one reduceat per chain
+            # gives every row's relative corners in a streaming pass.
+            starts = tab.node_lo.view()[rows]
+            xyz = tab.xyz.view()
+            origin = vessel[tab.snap_idx.view()[rows]]
+            lo = np.minimum(lo, (np.minimum.reduceat(xyz, starts, axis=0)
+                                 + origin).min(axis=0))
+            hi = np.maximum(hi, (np.maximum.reduceat(xyz, starts, axis=0)
+                                 + origin).max(axis=0))
+        return np.vstack([lo, hi])
+
+    @property
+    def labels(self) -> List[str]:
+        return list(self._labels)
+
+    def chain_names(self) -> List[str]:
+        """Every chain name seen, in first-seen order."""
+        return list(self._chains)
+
+    def junction_names(self) -> List[str]:
+        names: List[str] = []
+        for j in self._junctions:
+            for name in j:
+                if name not in names:
+                    names.append(name)
+        return names
+
+    def joint_keys(self) -> List[Tuple[str, str]]:
+        """(chain, joint label) pairs across the run, first-seen order."""
+        keys: List[Tuple[str, str]] = []
+        for members in self._members:
+            for name, row in members:
+                for label, _xyz in self._chains[name].joints_xyz[row]:
+                    key = (name, str(label))
+                    if key not in keys:
+                        keys.append(key)
+        return keys
+
+    def chain_series(self, name: str, quantity: str) -> "np.ndarray":
+        """Per-snapshot chain scalar (one of ``top_tension_kN``,
+        ``end_tension_kN``, ``min_radius_m``, ``length_m``,
+        ``tdp_tension_kN``, ``count_top_m``); NaN where the chain is absent."""
+        out = np.full(len(self), np.nan)
+        tab = self._chains.get(name)
+        if tab is not None:
+            out[tab.snap_idx.view()] = tab.scalars[quantity].view()
+        return out
+
+    def junction_series(self, name: str) -> "np.ndarray":
+        """(n, 3) junction position; NaN rows where it does not exist."""
+        out = np.full((len(self), 3), np.nan)
+        for i, j in enumerate(self._junctions):
+            xyz = j.get(name)
+            if xyz is not None:
+                out[i] = xyz
+        return out
+
+    def payout_series(self, name: str) -> "np.ndarray":
+        """Applied payout rate (m/s) per snapshot; NaN where not applied."""
+        return np.array([p.get(name, np.nan) for p in self._payout], dtype=float)
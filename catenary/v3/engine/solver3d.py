@@ -91,6 +91,10 @@ class SolveResult:
         return None
 
 
+# Nodal mass per unit of local stiffness (dt = 1); see solve_system.
+_M_FACTOR = 1.0
+
+
 def _three_point_radius_3d(P: "np.ndarray", i: int) -> float:
     if i <= 0 or i >= len(P) - 1:
         return float("inf")
@@ -241,19 +245,58 @@ def solve_system(
         k_bend_e = 32.0 * ch.EI / (ch.L0 ** 3)
         np.add.at(k_node, ch.idx[:-1], k_ax + k_bend_e)
         np.add.at(k_node, ch.idx[1:], k_ax + k_bend_e)
-    m_node = (dt * dt / 2.0) * k_node * 2.0
-
-    # --- Per-chain preallocation ------------------------------------------
-    # Rest lengths per chain (mutated by the outer correction).
-    L0_rest = [ch.L0.copy() for ch in chains]
+    # Adaptive step: the nodal mass sets the effective pseudo-time step.
+    # Gershgorin bounds the highest frequency of the assembled stiffness by
+    # 2 * k_node / m_node, so _M_FACTOR = 1.0 keeps omega * dt <= sqrt(2),
+    # inside the central-difference limit of 2. A blow-up quadruples the
+    # mass for the rest of the pass; each new outer pass halves it again,
+    # back toward the base value, instead of running slow for good.
+    m_base = _M_FACTOR * dt * dt * k_node
+    m_node = m_base.copy()
+
+    # --- Global element / joint arrays ---------------------------------------
+    # Every chain's elements and bending joints are concatenated into flat
+    # arrays, so one iteration is a fixed number of whole-system NumPy calls
+    # whatever the number of chains, and all nodal contributions are
+    # scattered with a single bincount.
+    k = _assemble(system, chains, v_node, rho_water)
+    e_i, e_j = k["e_i"], k["e_j"]
+    n_el = len(e_i)
+    L0_all = k["L0"]
+    L0_rest = L0_all.copy()          # mutated by the outer correction
+    half_L0 = 0.5 * L0_all
+    w_sub, w_air = k["w_sub"], k["w_air"]
+    kdn, kdt, L0_col = k["kdn"], k["kdt"], L0_all[:, None]
+    v_cab0, transport = k["v_cab0"], k["transport"]
+    has_transport = bool(np.any(transport))
+    j_a, j_b, j_c = k["j_a"], k["j_b"], k["j_c"]
+    j_e1 = k["j_e1"]
+    j_e2 = j_e1 + 1
+    n_jt = len(j_a)
+    inv_EIl, inv_EIr, ei_ok = k["inv_EIl"], k["inv_EIr"], k["ei_ok"]
+    # Scatter target for every nodal contribution: element ends (i, j),
+    # then joint nodes (a, b, c); flattened with the xyz component so the
+    # whole force vector is one bincount.
+    rows = np.concatenate([e_i, e_j, j_a, j_b, j_c])
+    scatter = (rows[:, None] * 3 + np.arange(3)).ravel()
+    W = np.zeros((len(rows), 3))
+    Wi = W[:n_el]
+    Wj = W[n_el:2 * n_el]
+    Wa = W[2 * n_el:2 * n_el + n_jt]
+    Wb = W[2 * n_el + n_jt:2 * n_el + 2 * n_jt]
+    Wc = W[2 * n_el + 2 * n_jt:]
+    n3 = 3 * n_pts
 
     v = np.zeros((n_pts, 3))
-    F = np.zeros((n_pts, 3))
     fric_anchor = X[:, :2].copy()
     has_anchor = np.zeros(n_pts, dtype=bool)
     mu_node = _mu_per_node(system)
     mu_max = float(np.max(mu_node)) if len(mu_node) else 0.0
     cda = system.body_cda_m2
+    body_sel = cda > 0.0
+    has_body_drag = has_flow and bool(np.any(body_sel))
+    point_force = system.point_force_N
+    step_acc = (dt / m_node)[:, None]   # velocity increment per unit force
 
     iters_done = 0
     residual_ratio = float("inf")
@@ -273,40 +316,6 @@ def solve_system(
     diverged = False
     cancelled = False
     converged = False
-    T_seg_store: List["np.ndarray"] = [np.zeros(ch.n_elems) for ch in chains]
-
-    # Scatter fast path: interior chain nodes are contiguous in the global
-    # pool (SystemBuilder allocates sequentially; only shared junction end
-    # nodes break the run), so slice-adds replace np.add.at where possible.
-    scatter_plans = []
-    for ch in chains:
-        inner = ch.idx[1:-1]
-        if len(inner) and np.all(np.diff(inner) == 1):
-            scatter_plans.append((int(inner[0]), int(inner[-1]) + 1, int(ch.idx[0]), int(ch.idx[-1])))
-        else:
-            scatter_plans.append(None)
-
-    # Loop-invariant per-chain quantities, hoisted out of the iteration loop.
-    inv = []
-    for ci, ch in enumerate(chains):
-        qa_eff = np.where(ch.qa != 0.0, ch.qa, ch.qw)
-        d = {
-            "w_sub": ch.qw * ch.L0,
-            "w_air": qa_eff * ch.L0,
-            "kdn": 0.5 * rho_water * ch.cdn * ch.dia,
-            "kdt": 0.5 * rho_water * ch.cdt * math.pi * ch.dia,
-            "L0_col": ch.L0[:, None],
-            "Floc": np.zeros((len(ch.idx), 3)),
-            "has_EI": float(np.max(ch.EI)) > 0.0 and len(ch.idx) >= 3,
-            "v_cab0": 0.5 * (v_node[ch.idx[:-1]] + v_node[ch.idx[1:]]),
-        }
-        if d["has_EI"]:
-            EIl = ch.EI[:-1]
-            EIr = ch.EI[1:]
-            d["EIl"] = EIl
-            d["EIr"] = EIr
-            d["ei_ok"] = (EIl > 0.0) & (EIr > 0.0)
-        inv.append(d)
     free = ~fixed
 
     for outer in range(int(n_outer)):
@@ -314,113 +323,89 @@ def solve_system(
         ke_prev = 0.0
         converged = False
         next_check = first_check
+        k_ax = EA / L0_rest
+        if blowups:
+            m_node = np.maximum(m_base, 0.5 * m_node)
+            step_acc = (dt / m_node)[:, None]
 
         for it in range(int(max_iters)):
             iters_done += 1
-            F[:] = 0.0
-
-            for ci, ch in enumerate(chains):
-                cinv = inv[ci]
-                idx = ch.idx
-                P = X[idx]
-                d = np.diff(P, axis=0)
-                seg_len = np.linalg.norm(d, axis=1)
-                seg_len = np.maximum(seg_len, 1e-12)
-                u = d / seg_len[:, None]
-                strain = (seg_len - L0_rest[ci]) / L0_rest[ci]
-                T = np.maximum(0.0, EA * strain)
-                T_seg_store[ci] = T
-
-                Floc = cinv["Floc"]
-                Floc[:] = 0.0
-                Tu = T[:, None] * u
-                Floc[:-1] += Tu
-                Floc[1:] -= Tu
-
-                # Bending: discrete three-node moments, 3D form. Joint angle
-                # theta between adjacent tangents; restoring moment in the
-                # plane of the two segments (axis = u1 x u2).
-                if cinv["has_EI"]:
-                    u1 = u[:-1]
-                    u2 = u[1:]
-                    L1 = np.maximum(seg_len[:-1], 0.5 * ch.L0[:-1])
-                    L2 = np.maximum(seg_len[1:], 0.5 * ch.L0[1:])
-                    EIl = cinv["EIl"]
-                    EIr = cinv["EIr"]
-                    with np.errstate(divide="ignore", invalid="ignore"):
-                        EIj = np.where(
-                            cinv["ei_ok"],
-                            (L1 + L2) / (L1 / EIl + L2 / EIr),
-                            0.0,
-                        )
-                    cr = np.cross(u1, u2)
-                    sin_t = np.linalg.norm(cr, axis=1)
-                    cos_t = np.einsum("ij,ij->i", u1, u2)
-                    theta = np.arctan2(sin_t, cos_t)
-                    with np.errstate(divide="ignore", invalid="ignore"):
-                        b_hat = np.where(sin_t[:, None] > 1e-12, cr / np.maximum(sin_t, 1e-12)[:, None], 0.0)
-                    M_b = EIj * 2.0 * theta / (L1 + L2)
-                    n1 = np.cross(b_hat, u1)
-                    n2 = np.cross(b_hat, u2)
-                    a1 = (M_b / L1)[:, None]
-                    a2 = (M_b / L2)[:, None]
-                    Floc[:-2] += -a1 * n1
-                    Floc[2:] += -a2 * n2
-                    Floc[1:-1] += a1 * n1 + a2 * n2
-
-                # Weight per element by mid-depth medium; physical length L0.
-                z_mid = 0.5 * (P[:-1, 2] + P[1:, 2])
-                w_elem = np.where(z_mid < 0.0, cinv["w_sub"], cinv["w_air"])
-                Floc[:-1, 2] -= 0.5 * w_elem
-                Floc[1:, 2] -= 0.5 * w_elem
-
-                # Hydrodynamic drag per element (submerged elements only).
-                if has_flow:
-                    if current_at is not None:
-                        u_w = current_at(z_mid) + app_flow
-                    else:
-                        u_w = app_flow
-                    v_cab = cinv["v_cab0"]
-                    if ch.transport_speed_mps:
-                        # Material transport toward node 0 (bottom -> pay-out
-                        # convention is set by callers via the sign).
-                        v_cab = v_cab + ch.transport_speed_mps * u
-                    u_rel = u_w - v_cab
-                    ut_mag = np.einsum("ij,ij->i", u_rel, u)
-                    u_t = ut_mag[:, None] * u
-                    u_n = u_rel - u_t
-                    un_mag = np.linalg.norm(u_n, axis=1)
-                    subm = z_mid < 0.0
-                    f_n = (cinv["kdn"] * un_mag)[:, None] * u_n
-                    f_t = (cinv["kdt"] * np.abs(ut_mag) * ut_mag)[:, None] * u
-                    f_drag = np.where(subm[:, None], (f_n + f_t) * cinv["L0_col"], 0.0)
-                    Floc[:-1] += 0.5 * f_drag
-                    Floc[1:] += 0.5 * f_drag
-
-                plan = scatter_plans[ci]
-                if plan is not None:
-                    lo, hi, i0, i1 = plan
-                    F[lo:hi] += Floc[1:-1]
-                    F[i0] += Floc[0]
-                    F[i1] += Floc[-1]
+
+            Pi = X[e_i]
+            d = X[e_j] - Pi
+            seg_len = np.sqrt(np.einsum("ij,ij->i", d, d))
+            np.maximum(seg_len, 1e-12, out=seg_len)
+            u = d / seg_len[:, None]
+            T = np.maximum(0.0, k_ax * (seg_len - L0_rest))
+            Tu = T[:, None] * u
+
+            # Weight per element by mid-depth medium; physical length L0.
+            z_mid = 0.5 * (Pi[:, 2] + X[e_j, 2])
+            subm = z_mid < 0.0
+            half_w = 0.5 * np.where(subm, w_sub, w_air)
+
+            np.copyto(Wi, Tu)
+            np.negative(Tu, out=Wj)
+            Wi[:, 2] -= half_w
+            Wj[:, 2] -= half_w
+
+            # Hydrodynamic drag per element (submerged elements only).
+            if has_flow:
+                if current_at is not None:
+                    u_w = current_at(z_mid) + app_flow
                 else:
-                    np.add.at(F, idx, Floc)
+                    u_w = app_flow
+                v_cab = v_cab0
+                if has_transport:
+                    # Material transport toward node 0 (bottom -> pay-out
+                    # convention is set by callers via the sign).
+                    v_cab = v_cab + transport[:, None] * u
+                u_rel = u_w - v_cab
+                ut_mag = np.einsum("ij,ij->i", u_rel, u)
+                u_n = u_rel - ut_mag[:, None] * u
+                un_mag = np.sqrt(np.einsum("ij,ij->i", u_n, u_n))
+                f_drag = (kdn * un_mag)[:, None] * u_n + (kdt * np.abs(ut_mag) * ut_mag)[:, None] * u
+                f_drag *= np.where(subm, 0.5, 0.0)[:, None] * L0_col
+                Wi += f_drag
+                Wj += f_drag
+
+            # Bending: discrete three-node moments, 3D form. Joint angle
+            # theta between adjacent tangents; restoring moment in the
+            # plane of the two segments (axis = u1 x u2).
+            if n_jt:
+                u1 = u[j_e1]
+                u2 = u[j_e2]
+                L1 = np.maximum(seg_len[j_e1], half_L0[j_e1])
+                L2 = np.maximum(seg_len[j_e2], half_L0[j_e2])
+                EIj = np.where(ei_ok, (L1 + L2) / (L1 * inv_EIl + L2 * inv_EIr), 0.0)
+                cr = np.cross(u1, u2)
+                sin_t = np.sqrt(np.einsum("ij,ij->i", cr, cr))
+                cos_t = np.einsum("ij,ij->i", u1, u2)
+                theta = np.arctan2(sin_t, cos_t)
+                b_hat = cr * np.where(sin_t > 1e-12, 1.0 / np.maximum(sin_t, 1e-12), 0.0)[:, None]
+                M_b = EIj * 2.0 * theta / (L1 + L2)
+                f1 = (M_b / L1)[:, None] * np.cross(b_hat, u1)
+                f2 = (M_b / L2)[:, None] * np.cross(b_hat, u2)
+                np.negative(f1, out=Wa)
+                np.negative(f2, out=Wc)
+                np.add(f1, f2, out=Wb)
+
+            F = np.bincount(scatter, weights=W.ravel(), minlength=n3).reshape(n_pts, 3)
 
             # Static point loads (body weights etc.).
-            F += system.point_force_N
+            F += point_force
 
             # Lumped body drag at nodes.
-            if has_flow and np.any(cda > 0.0):
-                sel = cda > 0.0
-                u_w = np.zeros((int(np.sum(sel)), 3))
+            if has_body_drag:
+                u_w = np.zeros((int(np.sum(body_sel)), 3))
                 if current_at is not None:
-                    u_w += current_at(X[sel, 2])
+                    u_w += current_at(X[body_sel, 2])
                 u_w += app_flow
-                u_rel = u_w - v_node[sel]
+                u_rel = u_w - v_node[body_sel]
                 mag = np.linalg.norm(u_rel, axis=1)
-                subm = X[sel, 2] < 0.0
-                Fd = 0.5 * rho_water * (cda[sel] * mag)[:, None] * u_rel
-                F[sel] += np.where(subm[:, None], Fd, 0.0)
+                subm_b = X[body_sel, 2] < 0.0
+                Fd = 0.5 * rho_water * (cda[body_sel] * mag)[:, None] * u_rel
+                F[body_sel] += np.where(subm_b[:, None], Fd, 0.0)
 
             # Seabed contact + friction. Gradients and the friction cone are
             # evaluated only on the contact subset — non-contact rows were
@@ -469,13 +454,14 @@ def solve_system(
             F[fixed] = 0.0
 
             # Kinetic damping.
-            v += (F / m_node[:, None]) * dt
-            ke = float(np.sum(v * v))
+            v += F * step_acc
+            ke = float(np.vdot(v, v))
             if ke < ke_prev:
                 v[:] = 0.0
                 ke = 0.0
+            else:
+                X += v * dt
             ke_prev = ke
-            X += v * dt
 
             if (it + 1) >= next_check:
                 residual_ratio = float(np.max(np.abs(F[free]))) / max(w_ref, 1e-9)
@@ -489,6 +475,7 @@ def solve_system(
                     v[:] = 0.0
                     ke_prev = 0.0
                     m_node *= 4.0
+                    step_acc = (dt / m_node)[:, None]
                     residual_ratio = float("inf")
                     next_check = (it + 1) + check_far
                     continue
@@ -514,13 +501,10 @@ def solve_system(
             break
 
         # Outer rest-length correction toward the inextensible limit.
-        max_corr = 0.0
-        for ci, ch in enumerate(chains):
-            P = X[ch.idx]
-            seg_len = np.maximum(np.linalg.norm(np.diff(P, axis=0), axis=1), 1e-12)
-            strain_now = np.maximum(0.0, (seg_len - L0_rest[ci]) / L0_rest[ci])
-            max_corr = max(max_corr, float(np.max(strain_now)))
-            L0_rest[ci] = ch.L0 / (1.0 + strain_now)
+        seg_len = np.maximum(np.linalg.norm(X[e_j] - X[e_i], axis=1), 1e-12)
+        strain_now = np.maximum(0.0, (seg_len - L0_rest) / L0_rest)
+        max_corr = float(np.max(strain_now)) if n_el else 0.0
+        L0_rest = L0_all / (1.0 + strain_now)
         if max_corr < 2e-5:
             break
 
@@ -551,8 +535,9 @@ def solve_system(
     for ci, ch in enumerate(chains):
         idx = ch.idx
         P = X[idx]
+        rest = L0_rest[k["e_start"][ci]:k["e_start"][ci] + ch.n_elems]
         seg_len = np.maximum(np.linalg.norm(np.diff(P, axis=0), axis=1), 1e-12)
-        T_seg = np.maximum(0.0, EA * (seg_len - L0_rest[ci]) / L0_rest[ci])
+        T_seg = np.maximum(0.0, EA * (seg_len - rest) / rest)
         T_node = np.empty(len(idx))
         T_node[0] = T_seg[0]
         T_node[-1] = T_seg[-1]
@@ -636,6 +621,70 @@ def solve_system(
     )
 
 
+def _assemble(system: CableSystem, chains: Sequence[Chain],
+              v_node: "np.ndarray", rho_water: float) -> dict:
+    """Flat per-element and per-joint arrays for the vectorised kernel.
+
+    Elements are concatenated chain by chain (``e_start`` gives each
+    chain's first element); bending joints — the inner nodes of chains with
+    bending stiffness — carry their three global nodes and the index of
+    their left element (the right one follows it).
+    """
+    e_i, e_j, L0, w_sub, w_air, kdn, kdt, transport = [], [], [], [], [], [], [], []
+    j_a, j_b, j_c, j_e1, EIl, EIr = [], [], [], [], [], []
+    e_start = []
+    offset = 0
+    for ch in chains:
+        idx = ch.idx
+        e_start.append(offset)
+        e_i.append(idx[:-1])
+        e_j.append(idx[1:])
+        L0.append(ch.L0)
+        qa_eff = np.where(ch.qa != 0.0, ch.qa, ch.qw)
+        w_sub.append(ch.qw * ch.L0)
+        w_air.append(qa_eff * ch.L0)
+        kdn.append(0.5 * rho_water * ch.cdn * ch.dia)
+        kdt.append(0.5 * rho_water * ch.cdt * math.pi * ch.dia)
+        transport.append(np.full(ch.n_elems, float(ch.transport_speed_mps or 0.0)))
+        if float(np.max(ch.EI)) > 0.0 and len(idx) >= 3:
+            j_a.append(idx[:-2])
+            j_b.append(idx[1:-1])
+            j_c.append(idx[2:])
+            j_e1.append(offset + np.arange(ch.n_elems - 1))
+            EIl.append(ch.EI[:-1])
+            EIr.append(ch.EI[1:])
+        offset += ch.n_elems
+
+    def cat(parts, dtype=float):
+        return np.concatenate(parts).astype(dtype) if parts else np.zeros(0, dtype=dtype)
+
+    e_i_a = cat(e_i, np.int64)
+    e_j_a = cat(e_j, np.int64)
+    EIl_a = cat(EIl)
+    EIr_a = cat(EIr)
+    ei_ok = (EIl_a > 0.0) & (EIr_a > 0.0)
+    return {
+        "e_i": e_i_a,
+        "e_j": e_j_a,
+        "e_start": e_start,
+        "L0": cat(L0),
+        "w_sub": cat(w_sub),
+        "w_air": cat(w_air),
+        "kdn": cat(kdn),
+        "kdt": cat(kdt),
+        "transport": cat(transport),
+        "v_cab0": 0.5 * (v_node[e_i_a] + v_node[e_j_a]),
+        "j_a": cat(j_a, np.int64),
+        "j_b": cat(j_b, np.int64),
+        "j_c": cat(j_c, np.int64),
+        "j_e1": cat(j_e1, np.int64),
+        # Placeholder 1.0 where a side has no stiffness (masked by ei_ok).
+        "inv_EIl": 1.0 / np.where(ei_ok, EIl_a, 1.0),
+        "inv_EIr": 1.0 / np.where(ei_ok, EIr_a, 1.0),
+        "ei_ok": ei_ok,
+    }
+
+
 def _mu_per_node(system: CableSystem) -> "np.ndarray":
     """Friction coefficient per global node (max over adjoining elements)."""
     mu = np.zeros(system.n_nodes)
@@ -21,9 +21,10 @@ the point of stepping).
 
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass, field
 import math
-from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
 import numpy as np
 
@@ -36,8 +37,12 @@ from .cable_system import (
     resample_polyline,
     sagged_shape,
 )
+from .snapshot_store import SnapshotStore
 from .solver3d import SolveResult, solve_system
 
+# Warm-start extrapolation leaves chains within this height of the bed alone.
+_BED_CLEAR_M = 0.5
+
 
 @dataclass
 class Attachment:
@@ -281,6 +286,15 @@ class SimOptions:
     # reports within-solve progress.
     cancel: Optional[Callable[[], bool]] = None
     solver_progress: Optional[Callable[[int, float], None]] = None
+    # Keep the run's per-node snapshot columns in memory-mapped temporary
+    # files instead of RAM (long runs; see snapshot_store.SnapshotStore).
+    spill_snapshots: bool = False
+    # Seed each substep's solve from a linear extrapolation of the previous
+    # two solved shapes instead of the last one alone: fewer relaxation
+    # iterations while the cable moves steadily. Off for final results —
+    # a different seed shifts where cable lands on the bed, and friction
+    # equilibria are lay-history dependent (see ``preview``).
+    warm_extrapolate: bool = False
 
     @classmethod
     def preview(cls, **over) -> "SimOptions":
@@ -289,7 +303,7 @@ class SimOptions:
         kw = dict(
             max_move_m=20.0, tol=5e-3, max_iters=20000,
             settle_tol=4e-3, settle_max_iters=60000,
-            rate_drag_min_v=0.15, mesh_scale=3.0,
+            rate_drag_min_v=0.15, mesh_scale=3.0, warm_extrapolate=True,
         )
         kw.update(over)
         return cls(**kw)
@@ -411,7 +425,8 @@ class Snapshot:
 
 @dataclass
 class SimResult:
-    snapshots: List[Snapshot] = field(default_factory=list)
+    # A SnapshotStore from ``run``; any Snapshot sequence is accepted.
+    snapshots: Sequence[Snapshot] = field(default_factory=SnapshotStore)
     aborted: bool = False
     warnings: List[str] = field(default_factory=list)
 
@@ -436,6 +451,33 @@ class OperationSimulator:
         # assembly is rebuilt every substep, so warn on the worst fit seen.
         self._asm_warned: Dict[str, float] = {}
         self.assembly_warnings: List[str] = []
+        # Solved chain shapes from one substep back, and that substep's dt,
+        # for the warm-start extrapolation (cleared on topology events).
+        self._shape_hist: Dict[str, "np.ndarray"] = {}
+        self._hist_dt = 0.0
+
+    # -- checkpoints --------------------------------------------------------
+
+    # Attributes that configure the simulator rather than describe where the
+    # operation has got to; a checkpoint shares them instead of copying.
+    _CHECKPOINT_SHARED = ("bathy", "opt")
+
+    def checkpoint(self) -> dict:
+        """Deep copy of the complete stepping state.
+
+        Covers the scenario (chain shapes, lengths, attachments, junctions,
+        vessel pose), the released set, clock, transfer progress and any
+        state a subclass keeps (e.g. frozen lay paths). :meth:`restore`
+        puts it back so stepping continues exactly as from the original.
+        """
+        return copy.deepcopy({
+            k: v for k, v in self.__dict__.items()
+            if k not in self._CHECKPOINT_SHARED
+        })
+
+    def restore(self, state: dict) -> None:
+        """Return to a :meth:`checkpoint`; the checkpoint stays reusable."""
+        self.__dict__.update(copy.deepcopy(state))
 
     # -- system assembly ----------------------------------------------------
 
@@ -604,11 +646,45 @@ class OperationSimulator:
 
     def run(self, progress: Optional[Callable[[float, str], bool]] = None) -> SimResult:
         """Run the full script. ``progress(frac, label) -> continue?``."""
-        out = SimResult()
-        out.snapshots.append(self.settle())
+        out = SimResult(snapshots=SnapshotStore(spill=self.opt.spill_snapshots))
+        for _snap in self.iter_progress(out, progress):
+            pass
+        return out
+
+    def iter_progress(self, out: SimResult,
+                      progress: Optional[Callable[[float, str], bool]] = None
+                      ) -> Iterator[Snapshot]:
+        """``iter_run`` yielding bare snapshots, stopped by ``progress``.
+
+        ``progress(frac, label)`` is asked after each substep has been
+        consumed (the settle is not reported); a False return abandons the
+        run and marks ``out.aborted``.
+        """
+        steps = self.iter_run(out)
+        for i, (snap, frac, label) in enumerate(steps):
+            yield snap
+            if i > 0 and progress is not None and not progress(frac, label):
+                steps.close()
+                out.aborted = True
+                out.warnings.extend(self.assembly_warnings)
+                return
+
+    def iter_run(self, out: SimResult) -> Iterator[Tuple[Snapshot, float, str]]:
+        """Run the full script incrementally.
+
+        Yields ``(snapshot, fraction done, step label)`` as each equilibrium
+        is solved — the settle first (fraction 0), then every substep — after
+        appending it to ``out.snapshots``, so a caller can show results while
+        the run is still computing. Stop iterating (or ``close()`` the
+        generator) to abandon the run; ``out.warnings`` are complete only once
+        the generator is exhausted.
+        """
+        snap = self.settle()
+        out.snapshots.append(snap)
+        yield snap, 0.0, "settle"
         total_t = sum(s.duration_s for s in self.sc.steps) or 1.0
         done_t = 0.0
-        for step in self.sc.steps:
+        for i_step, step in enumerate(self.sc.steps):
             self._apply_events(step, out)
             for name in step.release_chains:
                 self._released.add(name)
@@ -618,7 +694,6 @@ class OperationSimulator:
             for k in range(n_sub):
                 self._transfer_frac = (k + 1) / n_sub
                 snap = self._advance(step, dt)
-                out.snapshots.append(snap)
                 done_t += dt
                 # Auto-release: cast off named chains once the load at their
                 # *attached* (bottom) end drops below the threshold. Max
@@ -636,11 +711,9 @@ class OperationSimulator:
                         )
                         snap.warnings.append(msg)
                         out.warnings.append(msg)
-                if progress is not None:
-                    if not progress(min(1.0, done_t / total_t), step.label or ""):
-                        out.aborted = True
-                        out.warnings.extend(self.assembly_warnings)
-                        return out
+                # Stored once complete: the store copies, it keeps no object.
+                out.snapshots.append(snap, step_index=i_step)
+                yield snap, min(1.0, done_t / total_t), step.label or ""
             if step.transfer is not None:
                 # Transfer complete: the chain now lives on the destination
                 # sheave (the lerp already walked its top there).
@@ -649,10 +722,12 @@ class OperationSimulator:
                     st.top = Attachment("sheave", sheave=step.transfer.to_sheave)
                 self._transfer = None
         out.warnings.extend(self.assembly_warnings)
-        return out
 
     def _apply_events(self, step: Step, out: SimResult):
         """Apply the step's discrete topology changes to the scenario."""
+        if step.events:
+            # Shapes from before a topology change are no trend to follow.
+            self._shape_hist = {}
         for ev in step.events:
             if ev.kind == "release":
                 self._released.add(ev.chain)
@@ -747,6 +822,8 @@ class OperationSimulator:
             if n not in self._released
         }
         snap = self._equilibrate(step, dt, prev_shapes)
+        self._shape_hist = {n: shape for n, (shape, _len) in prev_shapes.items()}
+        self._hist_dt = dt
         for name in ignored:
             snap.warnings.append(
                 f"Payout for '{name}' ignored from t={self._t:.0f} s — its "
@@ -764,6 +841,7 @@ class OperationSimulator:
             sysm, self.bathy,
             rho_water=self.opt.rho_water, current_at=self.opt.current_at,
             tol=self.opt.tol, max_iters=self.opt.max_iters,
+            warm_X=self._extrapolated_seed(sysm, dt),
             cancel=self.opt.cancel, progress=self.opt.solver_progress,
         )
         if self.opt.rate_drag and dt > 0:
@@ -781,6 +859,41 @@ class OperationSimulator:
         self._last_snap = snap
         return snap
 
+    def _extrapolated_seed(self, sysm: CableSystem, dt: float) -> Optional["np.ndarray"]:
+        """Warm start ``X_n + f * (X_n - X_{n-1})`` for the coming solve.
+
+        ``X_n`` is the built seed (the last solved shape, resampled) and
+        ``X_{n-1}`` the shape one substep earlier, resampled to the same
+        node count; ``f`` is the substep ratio, capped at 1. Only free inner
+        chain nodes move — ends and junctions keep their built positions —
+        and only on chains clear of the seabed before and after the step.
+        None (plain seed) when there is no history to extrapolate from.
+        """
+        if not self.opt.warm_extrapolate or not self._shape_hist or self._hist_dt <= 0:
+            return None
+        f = min(1.0, dt / self._hist_dt)
+        X = sysm.X.copy()
+        moved = False
+        for ch in sysm.chains:
+            prev = self._shape_hist.get(ch.name)
+            if prev is None or len(prev) < 2:
+                continue
+            keep = ~sysm.fixed[ch.idx[1:-1]]
+            inner = ch.idx[1:-1][keep]
+            back = resample_polyline(prev, len(ch.idx) - 1)[1:-1][keep]
+            step_X = sysm.X[inner] + f * (sysm.X[inner] - back)
+            if self.bathy is not None and len(inner):
+                # A chain touching the bed keeps its frictional lay history
+                # (equilibria with friction are path dependent): only fully
+                # suspended chains, before and after the step, follow the trend.
+                lo = np.concatenate([sysm.X[inner], step_X])
+                bed_z = -np.asarray(self.bathy.depth_at(lo[:, 0], lo[:, 1]), dtype=float)
+                if float(np.min(lo[:, 2] - bed_z)) <= _BED_CLEAR_M:
+                    continue
+            X[inner] = step_X
+            moved = moved or bool(len(inner))
+        return X if moved else None
+
     def _payout_rates(self, step: Step) -> Dict[str, float]:
         """Effective payout rates for this substep: the step's base rates,
         optionally redistributed by the balance controller."""
@@ -174,6 +174,7 @@ class LaySimulatorDialog(QDialog):
         self._collapsibles: Dict[str, Tuple[QToolButton, QWidget]] = {}
         self._initializing = True
         self._worker: Optional[SolveWorker] = None
+        self._live_count = 0
         self._pending: bool = False
         self._last_out: Optional[RunOutput] = None
         self._grid_bathy: Optional[dict] = None       # sampled raster grid cfg
@@ -2730,6 +2731,8 @@ class LaySimulatorDialog(QDialog):
         self._worker = SolveWorker(cfg, self)
         self._worker.finishedWith.connect(self._on_solved)
         self._worker.progressed.connect(self._on_progress)
+        self._worker.snapshotsReady.connect(self._on_live_snapshots)
+        self._live_count = 0
         self.cancel_btn.setEnabled(True)
         self.run_btn.setEnabled(False)
         if cfg.mode in ("operation", "optimize"):
@@ -2760,9 +2763,36 @@ class LaySimulatorDialog(QDialog):
         if label:
             self.scrub_label.setText(label)
 
+    def _on_live_snapshots(self, snaps, scene):
+        """Show an operation's snapshots as they are solved.
+
+        The time series grow and the 3D / 2D views follow the newest
+        snapshot; scrubbing waits for the finished run.
+        """
+        first = self._live_count == 0
+        self._live_count += len(snaps)
+        if first:
+            self._scene_origin = self._solve_origin
+            self.play_btn.setChecked(False)
+            self.scrubber.setEnabled(False)
+            self.play_btn.setEnabled(False)
+            self.scrub_widget.setVisible(True)
+            self.timeseries_view.set_snapshots(snaps)
+        else:
+            self.timeseries_view.append_snapshots(snaps)
+        self.scrubber.blockSignals(True)
+        self.scrubber.setMaximum(self._live_count - 1)
+        self.scrubber.setValue(self._live_count - 1)
+        self.scrubber.blockSignals(False)
+        self.timeseries_view.set_time(float(snaps[-1].t_s))
+        self.scrub_label.setText(f"t = {snaps[-1].t_s:.0f} s (running)")
+        self._show_scene(scene, preserve=not first)
+
     def _on_solved(self, out: RunOutput):
         self.run_btn.setEnabled(True)
         self.cancel_btn.setEnabled(False)
+        self.scrubber.setEnabled(True)
+        self.play_btn.setEnabled(True)
         if self.op_progress.maximum() == 0:
             self.op_progress.setRange(0, 100)
             self.op_progress.setValue(0)
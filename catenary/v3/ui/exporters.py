@@ -97,6 +97,34 @@ def snapshot_csv_rows(snapshot) -> Tuple[List[str], List[List]]:
     return header, rows
 
 
+def _chain_names(snapshots: Sequence) -> List[str]:
+    """Chain names across a run, first-seen order (read from the columns of
+    a SnapshotStore instead of rebuilding every snapshot)."""
+    if hasattr(snapshots, "chain_names"):
+        return snapshots.chain_names()
+    names: List[str] = []
+    seen = set()
+    for snap in snapshots:
+        for c in snap.chains:
+            if c.name not in seen:
+                seen.add(c.name)
+                names.append(c.name)
+    return names
+
+
+def _junction_names(snapshots: Sequence) -> List[str]:
+    if hasattr(snapshots, "junction_names"):
+        return snapshots.junction_names()
+    names: List[str] = []
+    seen = set()
+    for snap in snapshots:
+        for name in getattr(snap, "junction_xyz", {}) or {}:
+            if name not in seen:
+                seen.add(name)
+                names.append(name)
+    return names
+
+
 def timeline_csv_rows(snapshots: Sequence) -> Tuple[List[str], List[List]]:
     """Header + rows summarising a run: one row per snapshot per chain.
 
@@ -104,13 +132,7 @@ def timeline_csv_rows(snapshots: Sequence) -> Tuple[List[str], List[List]]:
     (union of junction names across all snapshots; blank when a junction is
     absent from a snapshot).
     """
-    junction_names: List[str] = []
-    seen = set()
-    for snap in snapshots:
-        for name in getattr(snap, "junction_xyz", {}) or {}:
-            if name not in seen:
-                seen.add(name)
-                junction_names.append(name)
+    junction_names = _junction_names(snapshots)
 
     header = [
         "t_s", "label", "chain", "length_m", "top_tension_kN",
@@ -157,28 +179,27 @@ def schedule_csv_rows(snapshots: Sequence) -> Tuple[List[str], List[List]]:
     first snapshot (the jointing position for a BU deployment) — the
     operator-facing progress measure the schedule is planned against.
     Speeds and payout rates are given in km/h."""
-    chain_names: List[str] = []
-    seen = set()
-    for snap in snapshots:
-        for c in snap.chains:
-            if c.name not in seen:
-                seen.add(c.name)
-                chain_names.append(c.name)
+    chain_names = _chain_names(snapshots)
 
     # Optional columns, present only when any snapshot carries the data:
     # cable counts (chains with a count reference) and joint positions.
-    count_chains = [n for n in chain_names if any(
-        getattr(c, "count_top_m", None) is not None
-        for s in snapshots for c in s.chains if c.name == n)]
-    joint_keys: List[Tuple[str, str]] = []       # (chain, joint label)
-    seen_j = set()
-    for snap in snapshots:
-        for c in snap.chains:
-            for label, _xyz in (getattr(c, "joints_xyz", None) or []):
-                key = (c.name, str(label))
-                if key not in seen_j:
-                    seen_j.add(key)
-                    joint_keys.append(key)
+    if hasattr(snapshots, "joint_keys"):
+        count_chains = [n for n in chain_names if np.any(np.isfinite(
+            snapshots.chain_series(n, "count_top_m")))]
+        joint_keys = snapshots.joint_keys()
+    else:
+        count_chains = [n for n in chain_names if any(
+            getattr(c, "count_top_m", None) is not None
+            for s in snapshots for c in s.chains if c.name == n)]
+        joint_keys = []                          # (chain, joint label)
+        seen_j = set()
+        for snap in snapshots:
+            for c in snap.chains:
+                for label, _xyz in (getattr(c, "joints_xyz", None) or []):
+                    key = (c.name, str(label))
+                    if key not in seen_j:
+                        seen_j.add(key)
+                        joint_keys.append(key)
 
     header = ["dist_from_start_m", "t_s", "phase", "vessel_x_m", "vessel_y_m",
               "heading_degN", "ship_speed_kmh"]
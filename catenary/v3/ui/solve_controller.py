@@ -12,6 +12,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 import math
+import multiprocessing
+import os
+import time
 import traceback
 from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
@@ -618,6 +621,8 @@ def run_optimize(cfg: V3Config, progress: Optional[Callable[[float, str], bool]]
             bathy, params, target, schedule=schedule, limits=limits,
             preview_options=popts, progress=progress,
             sim_factory=sim_factory,
+            workers=_preview_workers() if _PREVIEW_MP_CONTEXT is not None else 1,
+            mp_context=_PREVIEW_MP_CONTEXT,
         )
     except (ValueError, KeyError) as exc:
         return RunOutput(mode="optimize", error=str(exc))
@@ -632,6 +637,9 @@ def run_optimize(cfg: V3Config, progress: Optional[Callable[[float, str], bool]]
         "laid_end_2_x": res.laid_end_2_xy[0], "laid_end_2_y": res.laid_end_2_xy[1],
     }
     out.warnings = list(res.warnings)
+    if _PREVIEW_MP_ERROR and _preview_workers() > 1:
+        out.warnings.append(f"Parallel previews unavailable ({_PREVIEW_MP_ERROR}); "
+                            "ran them one at a time.")
     out.facts = {
         "Predicted BU landing": f"({res.predicted_landing_xy[0]:.1f}, {res.predicted_landing_xy[1]:.1f}) m",
         "Landing error vs target": f"{res.landing_error_m:.1f} m",
@@ -645,7 +653,7 @@ def run_optimize(cfg: V3Config, progress: Optional[Callable[[float, str], bool]]
     if res.preview is not None and res.preview.snapshots:
         out.snapshots = res.preview.snapshots
         bed = _bed_grid_for_snapshots(cfg, bathy, res.preview.snapshots)
-        track = np.array([s.vessel_xy for s in res.preview.snapshots], dtype=float)
+        track = _vessel_track(res.preview.snapshots)
 
         def build_scene(i: int) -> SceneData:
             return snapshot_scene(res.preview.snapshots[i], bed,
@@ -657,6 +665,37 @@ def run_optimize(cfg: V3Config, progress: Optional[Callable[[float, str], bool]]
     return out
 
 
+def _preview_workers() -> int:
+    """Worker processes for the optimiser's preview stencil: CPU count - 1,
+    capped at 8 (1 = the sequential search)."""
+    return max(1, min(8, (os.cpu_count() or 1) - 1))
+
+
+def _preview_mp_context():
+    """Spawn context for the preview pool and why it is missing, if it is.
+
+    Inside QGIS sys.executable is the QGIS binary, not a Python
+    interpreter; spawn the workers with the bundled one. ``set_executable``
+    is process-wide, so this runs once, at import.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    try:
+        from ....qgis_compat import python_executable
+    except ImportError:  # outside QGIS sys.executable is Python
+        return ctx, ""
+    python_exe = python_executable()
+    if python_exe is None:
+        return None, "no Python interpreter found for worker processes"
+    try:
+        ctx.set_executable(python_exe)
+    except (OSError, TypeError, ValueError) as exc:
+        return None, f"cannot spawn {python_exe}: {exc}"
+    return ctx, ""
+
+
+_PREVIEW_MP_CONTEXT, _PREVIEW_MP_ERROR = _preview_mp_context()
+
+
 def _mean_weight_npm(items: Sequence[cs.AssemblyItem], defaults: cs.Defaults) -> float:
     """Length-weighted mean submerged weight of an assembly (planner input)."""
     total_w = total_l = 0.0
@@ -806,7 +845,7 @@ def run_plan(cfg: V3Config, progress: Optional[Callable[[float, str], bool]] = N
     if result is not None and result.snapshots:
         out.snapshots = result.snapshots
         bed = _bed_grid_for_snapshots(cfg, bathy, result.snapshots)
-        track = np.array([s.vessel_xy for s in result.snapshots], dtype=float)
+        track = _vessel_track(result.snapshots)
 
         def build_scene(i: int) -> SceneData:
             return snapshot_scene(result.snapshots[i], bed,
@@ -1075,7 +1114,15 @@ def _operation_controller(cfg: V3Config):
 
 
 def run_operation(cfg: V3Config, progress: Optional[Callable[[float, str], bool]] = None,
-                  cancel: Optional[Callable[[], bool]] = None) -> RunOutput:
+                  cancel: Optional[Callable[[], bool]] = None,
+                  on_snapshot: Optional[Callable[[object, Callable[[], SceneData]], None]] = None,
+                  ) -> RunOutput:
+    """Run an operation simulation.
+
+    ``on_snapshot(snap, build_scene)`` is called with every snapshot as soon
+    as it is solved; ``build_scene()`` renders it (against a bed grid sized
+    from the settle) and is only worth calling for the ones actually shown.
+    """
     bathy = build_bathymetry(cfg)
     # Planned lowering: solve the vessel track + trunk payout that hold the
     # leg touchdown-tension targets, and run that schedule instead of the
@@ -1127,7 +1174,13 @@ def run_operation(cfg: V3Config, progress: Optional[Callable[[float, str], bool]
         sim = QuickOperationSimulator(scn, bathy, opts)
     else:
         sim = tl.OperationSimulator(scn, bathy, opts)
-    result = sim.run(progress)
+    # Long runs keep their per-node snapshot columns on disk (memory-mapped)
+    # so resident memory does not grow with the number of substeps.
+    opts.spill_snapshots = sum(sim._substeps(st) for st in scn.steps) > _SPILL_SUBSTEPS
+    if on_snapshot is None:
+        result = sim.run(progress)
+    else:
+        result = _run_streaming(cfg, bathy, sim, progress, on_snapshot)
 
     out = RunOutput(mode="operation", snapshots=result.snapshots)
     out.warnings = plan_warnings + list(result.warnings)
@@ -1144,7 +1197,7 @@ def run_operation(cfg: V3Config, progress: Optional[Callable[[float, str], bool]
     if result.aborted:
         out.warnings.append("Simulation cancelled — snapshots up to the stop are shown.")
     bed = _bed_grid_for_snapshots(cfg, bathy, result.snapshots)
-    track = np.array([s.vessel_xy for s in result.snapshots], dtype=float)
+    track = _vessel_track(result.snapshots)
 
     def build_scene(i: int) -> SceneData:
         return snapshot_scene(result.snapshots[i], bed,
@@ -1179,10 +1232,37 @@ def run_operation(cfg: V3Config, progress: Optional[Callable[[float, str], bool]
     return out
 
 
+def _run_streaming(cfg: V3Config, bathy, sim, progress, on_snapshot) -> tl.SimResult:
+    """``sim.run(progress)``, handing each snapshot to ``on_snapshot`` as it lands."""
+    result = tl.SimResult(snapshots=tl.SnapshotStore(spill=sim.opt.spill_snapshots))
+    bed = None
+    trail = np.empty((64, 2))
+    for i, snap in enumerate(sim.iter_progress(result, progress)):
+        if bed is None:
+            # The final bed grid is sized from the whole run; live frames
+            # use the settle's extent (padded), which is all there is yet.
+            bed = _bed_grid_for_snapshots(cfg, bathy, [snap])
+        if i == len(trail):
+            trail = np.concatenate([trail, np.empty_like(trail)])
+        trail[i] = snap.vessel_xy
+
+        # A view: later substeps only write past its end, and a regrow
+        # leaves it on the old buffer.
+        def build_scene(snap=snap, trail=trail[:i + 1]) -> SceneData:
+            return snapshot_scene(snap, bed, title=f"t = {snap.t_s:.0f} s",
+                                  cfg=cfg, trail=trail)
+
+        on_snapshot(snap, build_scene)
+    return result
+
+
 # ---------------------------------------------------------------------------
 # Scene builders and helpers
 # ---------------------------------------------------------------------------
 
+# Operation runs with more substeps than this spill their snapshots to disk.
+_SPILL_SUBSTEPS = 500
+
 _CHAIN_COLORS = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b"]
 
 
@@ -1257,12 +1337,26 @@ def _bed_grid(cfg: V3Config, bathy, xyz: "np.ndarray") -> BedGrid:
     return BedGrid(x=gx, y=gy, z=Z)
 
 
+def _vessel_track(snapshots) -> "np.ndarray":
+    """(n, 2) vessel track; a SnapshotStore hands over its column."""
+    if isinstance(snapshots, tl.SnapshotStore):
+        return snapshots.vessel_xy
+    return np.array([s.vessel_xy for s in snapshots], dtype=float).reshape(-1, 2)
+
+
 def _bed_grid_for_snapshots(cfg: V3Config, bathy, snapshots) -> BedGrid:
+    # A SnapshotStore reports its extent from the columns; plain lists keep
+    # only each snapshot's bounding corners.
     xyz_list = []
+    if isinstance(snapshots, tl.SnapshotStore):
+        if len(snapshots):
+            xyz_list.append(snapshots.bounds())
+        snapshots = ()
     for s in snapshots:
-        for c in s.chains:
-            xyz_list.append(c.xyz)
-        xyz_list.append(np.array([[s.vessel_xy[0], s.vessel_xy[1], 0.0]]))
+        pts = [c.xyz for c in s.chains]
+        pts.append(np.array([[s.vessel_xy[0], s.vessel_xy[1], 0.0]]))
+        pts = np.concatenate(pts)
+        xyz_list.append(np.vstack([pts.min(axis=0), pts.max(axis=0)]))
     (x0, x1), (y0, y1) = _bed_extent(xyz_list)
     gx, gy, Z = bathy_mod.sample_grid(bathy, (x0, x1), (y0, y1), n=70)
     return BedGrid(x=gx, y=gy, z=Z)
@@ -1470,16 +1564,28 @@ def _quick_facts(inp: sl.SteadyLayInput, H_c: float, V: float, depth: float) ->
 # Worker thread
 # ---------------------------------------------------------------------------
 
+# Live snapshots are batched so a fast run does not flood the UI thread.
+_LIVE_EMIT_S = 0.25
+
+
 class SolveWorker(QThread):
-    """Runs one solve; emits ``finishedWith(RunOutput)``."""
+    """Runs one solve; emits ``finishedWith(RunOutput)``.
+
+    Operation runs also emit ``snapshotsReady(snapshots, scene)`` while
+    solving: the snapshots solved since the last emit, and the scene of the
+    newest one.
+    """
 
     finishedWith = pyqtSignal(object)
     progressed = pyqtSignal(float, str)
+    snapshotsReady = pyqtSignal(object, object)
 
     def __init__(self, cfg: V3Config, parent=None):
         super().__init__(parent)
         self.cfg = cfg
         self._cancel = False
+        self._live: List[object] = []
+        self._live_t = -math.inf
 
     def cancel(self):
         self._cancel = True
@@ -1488,6 +1594,15 @@ class SolveWorker(QThread):
         self.progressed.emit(float(frac), str(label))
         return not self._cancel
 
+    def _snapshot(self, snap, build_scene):
+        self._live.append(snap)
+        now = time.monotonic()
+        if now - self._live_t < _LIVE_EMIT_S:
+            return  # the rest arrive with the next batch, or the final result
+        self._live_t = now
+        batch, self._live = self._live, []
+        self.snapshotsReady.emit(batch, build_scene())
+
     def run(self):  # noqa: D102 - QThread entry point
         try:
             # The solver detects and recovers from numerical blow-ups itself
@@ -1498,7 +1613,8 @@ class SolveWorker(QThread):
                     out = run_steady(self.cfg, cancel=lambda: self._cancel)
                 elif self.cfg.mode == "operation":
                     out = run_operation(self.cfg, progress=self._progress,
-                                        cancel=lambda: self._cancel)
+                                        cancel=lambda: self._cancel,
+                                        on_snapshot=self._snapshot)
                 elif self.cfg.mode == "optimize":
                     out = run_optimize(self.cfg, progress=self._progress,
                                        cancel=lambda: self._cancel)
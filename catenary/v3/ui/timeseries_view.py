@@ -2,7 +2,8 @@
 """Time-series plots for operation runs (tensions, balance, BU descent).
 
 Consumes ``timeline.Snapshot`` lists via the pure helper
-:func:`snapshots_to_series` (unit-testable without Qt); renders through the
+:func:`snapshots_to_series` (unit-testable without Qt), growing them with
+:func:`extend_series` while a run is still streaming in; renders through the
 plugin's pyqtgraph-backed plot shim like the other 2D views.
 
 The stacked panels share one x axis (pan/zoom on any panel moves them all),
@@ -56,7 +57,12 @@ def snapshots_to_series(snapshots) -> dict:
     fully suspended), plus ``leg_imbalance`` (leg1 - leg2 top tension),
     ``bu_z`` (BU elevation) and ``layback_bu`` (horizontal vessel-BU
     distance) where applicable.
+
+    A :class:`engine.snapshot_store.SnapshotStore` is read column-wise,
+    without rebuilding any snapshot.
     """
+    if hasattr(snapshots, "chain_series"):
+        return _store_to_series(snapshots)
     n = len(snapshots)
     t = np.array([s.t_s for s in snapshots], dtype=float)
     names: List[str] = []
@@ -101,6 +107,61 @@ def snapshots_to_series(snapshots) -> dict:
     }
 
 
+def _store_to_series(store) -> dict:
+    """:func:`snapshots_to_series` over a SnapshotStore's columns."""
+    names = store.chain_names()
+    top = {name: store.chain_series(name, "top_tension_kN") for name in names}
+    tdp = {name: store.chain_series(name, "tdp_tension_kN") for name in names}
+    payout = {name: store.payout_series(name) for name in names}
+    if "leg1" in top and "leg2" in top:
+        imbalance = top["leg1"] - top["leg2"]
+    else:
+        imbalance = np.full(len(store), np.nan)
+    bu = store.junction_series("BU")
+    track = store.vessel_xy
+    return {
+        "t": store.t_s,
+        "names": names,
+        "top_tension": top,
+        "tdp_tension": tdp,
+        "payout": payout,
+        "leg_imbalance": imbalance,
+        "bu_z": bu[:, 2],
+        "layback_bu": np.hypot(bu[:, 0] - track[:, 0], bu[:, 1] - track[:, 1]),
+        "labels": store.labels,
+    }
+
+
+def extend_series(series: Optional[dict], snapshots) -> Optional[dict]:
+    """Append newly solved snapshots to a :func:`snapshots_to_series` dict.
+
+    Used while an operation is still running: only the new snapshots are
+    flattened. Chains first seen in them get NaN for the earlier samples.
+    """
+    if not snapshots:
+        return series
+    new = snapshots_to_series(snapshots)
+    if series is None:
+        return new
+    n_old, n_new = len(series["t"]), len(new["t"])
+    names = list(series["names"]) + [n for n in new["names"] if n not in series["names"]]
+
+    def cat(old, add):
+        return np.concatenate([
+            old if old is not None else np.full(n_old, np.nan),
+            add if add is not None else np.full(n_new, np.nan),
+        ])
+
+    out = {"t": cat(series["t"], new["t"]), "names": names,
+           "labels": list(series["labels"]) + list(new["labels"])}
+    for key in ("top_tension", "tdp_tension", "payout"):
+        out[key] = {name: cat(series[key].get(name), new[key].get(name))
+                    for name in names}
+    for key in ("leg_imbalance", "bu_z", "layback_bu"):
+        out[key] = cat(series[key], new[key])
+    return out
+
+
 def build_panels(series: Optional[dict]) -> List[dict]:
     """Describe the stacked panels for a series dict (pure, no Qt).
 
@@ -290,6 +351,14 @@ class TimeSeriesView:
 
     def set_snapshots(self, snapshots) -> None:
         self._series = snapshots_to_series(snapshots) if snapshots else None
+        self._show_series()
+
+    def append_snapshots(self, snapshots) -> None:
+        """Add snapshots that arrived while the run is still computing."""
+        self._series = extend_series(self._series, snapshots)
+        self._show_series()
+
+    def _show_series(self) -> None:
         panels = build_panels(self._series)
         signature = panels_signature(panels)
         if panels and signature == self._signature and self._plots:
@@ -13,6 +13,7 @@ from .qgis_compat import SIZE_POLICY_EXPANDING, GEOMETRY_POINT, GEOMETRY_LINE
 from qgis.gui import QgsVertexMarker, QgsRubberBand
 from .maptools.temp_line_maptool import TempLineMapTool  # new temporary line drawing tool
 from .kp_range_utils import make_distance_area
+from .processing.raster_blocks import RasterBlockSampler
 
 # Added standard library & third-party imports
 import math
@@ -1312,16 +1313,22 @@ class DepthProfileDockWidget(QDockWidget):
                 return None
         except Exception:
             pass
-        try:
-            sample, ok = provider.sample(sample_pt, 1)
-        except Exception:
-            return None
-        if not ok:
-            return None
-        try:
-            val = float(sample)
-        except Exception:
-            return None
+        blocks = src.get('blocks')
+        if blocks is not None:
+            val = blocks.value_at(sample_pt.x(), sample_pt.y())
+            if val is None:
+                return None
+        else:
+            try:
+                sample, ok = provider.sample(sample_pt, 1)
+            except Exception:
+                return None
+            if not ok:
+                return None
+            try:
+                val = float(sample)
+            except Exception:
+                return None
         try:
             if nodata is not None and float(nodata) == val:
                 return None
@@ -1373,7 +1380,7 @@ class DepthProfileDockWidget(QDockWidget):
         return layers
 
     def _prepare_raster_sources(self, line_crs, raster_layers):
-        """Prepare per-raster provider/extent/transform/nodata for fast repeated sampling."""
+        """Prepare per-raster provider/extent/transform/nodata/tile cache for fast repeated sampling."""
         sources = []
         for raster_layer in (raster_layers or []):
             if not raster_layer or not isinstance(raster_layer, QgsRasterLayer):
@@ -1431,6 +1438,9 @@ class DepthProfileDockWidget(QDockWidget):
                 'transform': transform,
                 'nodata': nodata,
                 'pixel_area_m2': pixel_area_m2,
+                # Tile-cached block reads: profile stations a few metres
+                # apart share raster blocks instead of one GDAL read each.
+                'blocks': RasterBlockSampler.from_provider(provider),
             })
 
         # Prefer higher resolution rasters first (smaller pixel area).
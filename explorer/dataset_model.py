@@ -14,6 +14,8 @@ import numpy as np
 
 from qgis.PyQt.QtCore import QAbstractTableModel, QModelIndex, Qt
 
+from ..laydata.dataset import epoch_seconds
+
 
 class LayDatasetTableModel(QAbstractTableModel):
     def __init__(self, dataset=None, parent=None):
@@ -44,8 +46,9 @@ class LayDatasetTableModel(QAbstractTableModel):
         if not source:
             self._visible = np.arange(self._dataset.row_count, dtype=np.int64)
         else:
-            arr = self._dataset.source_array
-            mask = np.array([("" if s is None else str(s)) == source for s in arr], dtype=bool)
+            sources = self._dataset.sources()
+            code = sources.index(source) if source in sources else -1
+            mask = self._dataset.source_codes() == code
             self._visible = np.nonzero(mask)[0]
         if 0 <= self._sort_column < len(self._fields):
             self._sort_visible(self._sort_column, self._sort_order)
@@ -66,8 +69,12 @@ class LayDatasetTableModel(QAbstractTableModel):
         name = self._fields[column]
         source_rows = self._visible
         descending = order == getattr(getattr(Qt, "SortOrder", Qt), "DescendingOrder")
-        if self._dataset.is_numeric_field(name):
-            values = self._dataset.numeric(name)[source_rows]
+        raw = self._dataset.raw(name)
+        if raw.dtype.kind == "M" or self._dataset.is_numeric_field(name):
+            if raw.dtype.kind == "M":
+                values = epoch_seconds(raw[source_rows])
+            else:
+                values = self._dataset.numeric(name)[source_rows]
             # Use +/-inf sentinels so NaN values sort to the end in both orders.
             sentinel = -np.inf if descending else np.inf
             keys = np.where(np.isfinite(values), values, sentinel)
@@ -75,8 +82,8 @@ class LayDatasetTableModel(QAbstractTableModel):
             if descending:
                 idx = idx[::-1]
         else:
-            raw = self._dataset.raw(name)[source_rows]
-            keys = np.array(["" if v is None else str(v).lower() for v in raw], dtype=object)
+            keys = np.array(["" if v is None else str(v).lower() for v in raw[source_rows]],
+                            dtype=object)
             idx = np.argsort(keys, kind="stable")
             if descending:
                 idx = idx[::-1]
@@ -95,8 +102,7 @@ class LayDatasetTableModel(QAbstractTableModel):
         if role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
             return None
         source_row = int(self._visible[index.row()])
-        value = self._dataset.raw(self._fields[index.column()])[source_row]
-        return "" if value is None else str(value)
+        return self._dataset.value_text(self._fields[index.column()], source_row)
 
     def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
         if role != Qt.ItemDataRole.DisplayRole:
@@ -422,8 +422,7 @@ class CableLayExplorerWindow(QMainWindow):
                 if not np.isfinite(t):
                     continue
                 if label_field is not None:
-                    raw = dataset.columns[label_field][row]
-                    label = "" if raw is None else str(raw)
+                    label = dataset.value_text(label_field, row)
                 else:
                     label = dataset.iso_time_at(row) or ""
                 records.append(
@@ -16,6 +16,7 @@ from typing import Dict, List, Optional
 from qgis.core import QgsProject, QgsTask, QgsVectorLayerFeatureSource
 
 from ..laydata import LayDataset
+from ..laydata.dataset import field_kinds
 
 
 def _task_flag(name: str, default: int = 0):
@@ -28,12 +29,18 @@ _CAN_CANCEL = _task_flag("CanCancel")
 
 
 def build_spec(layer) -> dict:
-    """Snapshot everything a worker thread needs to read ``layer`` (main thread)."""
+    """Snapshot everything a worker thread needs to read ``layer`` (main thread).
+
+    ``kinds`` records how each field decodes (real / integer / time / text) so
+    the worker fills typed columns directly.
+    """
+    fields = layer.fields()
     return {
         "layer_id": layer.id(),
         "name": layer.name(),
         "source": QgsVectorLayerFeatureSource(layer),
-        "field_names": [field.name() for field in layer.fields()],
+        "field_names": [field.name() for field in fields],
+        "kinds": field_kinds(fields),
         "crs": layer.crs(),
         "is_spatial": layer.isSpatial(),
         "feature_count": max(int(layer.featureCount()), 0),
@@ -70,6 +77,7 @@ class LayerLoadTask(QgsTask):
                     feature_count=spec["feature_count"],
                     progress=_progress,
                     is_canceled=self.isCanceled,
+                    kinds=spec.get("kinds"),
                 )
                 if dataset is None or self.isCanceled():
                     return False
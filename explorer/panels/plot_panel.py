@@ -9,6 +9,8 @@ cable-lay analysis / investigation work:
   (matched *by record*, so it lines up even when panels use different X axes),
 * live statistics for the visible X range (n / min / max / mean / std / slope),
 * optional dY/dX slope series on a secondary axis,
+* min/max decimation re-chosen from the visible X range on every zoom / pan,
+  so single-sample spikes stay visible on series of millions of points,
 * QC-findings overlay (vertical markers coloured by severity),
 * per-source filtering,
 * X-range selection that selects the underlying records on the map + table,
@@ -35,6 +37,7 @@ from qgis.PyQt.QtWidgets import (
     QWidget,
 )
 
+from ...plot_decimation import MinMaxPyramid
 from ...plot_widget import Figure, FigureCanvas, NavigationToolbar, get_tab10_color
 
 _MAX_PLOT_POINTS = 40000
@@ -74,6 +77,10 @@ class PlotPanel(QWidget):
         self._x_at_t: Optional[np.ndarray] = None
         self._x_label = ""
         self._drawn: List[dict] = []  # per-series render info (may span layers)
+        self._decimated: List[tuple] = []  # (plot item, MinMaxPyramid) redrawn on zoom
+        # Pyramids survive replots (legend / QC toggles, series added); keyed by
+        # (dataset id, field, kind, X key, source filter), dropped on new data.
+        self._pyramids: Dict[tuple, MinMaxPyramid] = {}
         self._vline = None
         self._label = None
         self._region = None
@@ -178,6 +185,7 @@ class PlotPanel(QWidget):
 
     def set_dataset(self, dataset) -> None:
         self._dataset = dataset
+        self._pyramids.clear()
         numeric = self._numeric_fields()
 
         self.x_combo.blockSignals(True)
@@ -210,6 +218,7 @@ class PlotPanel(QWidget):
 
     def refresh_sources(self) -> None:
         """Rebuild the multi-layer series menu after plot layers change."""
+        self._pyramids.clear()
         self._rebuild_series_menu()
         self.replot()
 
@@ -401,6 +410,7 @@ class PlotPanel(QWidget):
         self._t_sorted = None
         self._x_at_t = None
         self._drawn = []
+        self._decimated = []
         self._vline = None
         self._label = None
         self._region = None
@@ -458,8 +468,10 @@ class PlotPanel(QWidget):
             target = twin if (series.get("axis") == "right" and twin is not None) else axis
             finite = np.isfinite(ex) & np.isfinite(ey)
             if np.any(finite):
-                px, py = self._decimate(ex[finite], ey[finite])
-                target.plot(px, py, color=color)
+                pyramid = self._pyramid(ds, field, "y", ex[finite], ey[finite])
+                px, py = pyramid.view(max_points=_MAX_PLOT_POINTS)
+                line = target.plot(px, py, color=color)[0]
+                self._decimated.append((line.item, pyramid))
             dot = pg.ScatterPlotItem(size=11, pen=pg.mkPen("w", width=1), brush=pg.mkBrush(*self._rgb(color)))
             dot.setZValue(21)
             dot.setVisible(False)
@@ -473,7 +485,7 @@ class PlotPanel(QWidget):
             legend_entries.append((label + ("  (R)" if target is twin else ""), color))
 
             if self._show_derivative and twin is not None:
-                self._plot_derivative(twin, ex, ey, color, field, legend_entries)
+                self._plot_derivative(twin, ds, ex, ey, color, field, legend_entries)
 
         axis.set_xlabel(x_label)
         axis.set_time_axis(self._x_key == _X_TIME)
@@ -621,10 +633,11 @@ class PlotPanel(QWidget):
         dataset = self._dataset
         if not self._source_filter:
             return np.ones(dataset.row_count, dtype=bool)
-        source = dataset.source_array
-        return np.array([str(s) == self._source_filter for s in source], dtype=bool)
+        sources = dataset.sources()
+        code = sources.index(self._source_filter) if self._source_filter in sources else -1
+        return dataset.source_codes() == code
 
-    def _plot_derivative(self, twin, x, y, color, field, legend_entries) -> None:
+    def _plot_derivative(self, twin, ds, x, y, color, field, legend_entries) -> None:
         finite = np.isfinite(x) & np.isfinite(y)
         if np.count_nonzero(finite) < 2:
             return
@@ -637,8 +650,10 @@ class PlotPanel(QWidget):
         good = np.isfinite(slope)
         if not np.any(good):
             return
-        px, py = self._decimate(xs[good], slope[good])
-        twin.plot(px, py, color=color, linestyle="--")
+        pyramid = self._pyramid(ds, field, "dydx", xs[good], slope[good])
+        px, py = pyramid.view(max_points=_MAX_PLOT_POINTS)
+        line = twin.plot(px, py, color=color, linestyle="--")[0]
+        self._decimated.append((line.item, pyramid))
         legend_entries.append((f"d({field})/dX", color))
 
     def _install_overlays(self, axis, legend_entries) -> None:
@@ -691,7 +706,7 @@ class PlotPanel(QWidget):
 
     def _connect_range_signal(self, axis) -> None:
         try:
-            axis.plot_item.vb.sigXRangeChanged.connect(self._update_stats)
+            axis.plot_item.vb.sigXRangeChanged.connect(self._on_x_range_changed)
         except Exception:
             pass
 
@@ -700,12 +715,35 @@ class PlotPanel(QWidget):
         qcolor = pg.mkColor(color)
         return qcolor.red(), qcolor.green(), qcolor.blue()
 
-    @staticmethod
-    def _decimate(x: np.ndarray, y: np.ndarray):
-        if x.size <= _MAX_PLOT_POINTS:
-            return x, y
-        step = int(np.ceil(x.size / _MAX_PLOT_POINTS))
-        return x[::step], y[::step]
+    def _pyramid(self, ds, field, kind, x, y) -> MinMaxPyramid:
+        key = (id(ds), field, kind, self._x_key, self._source_filter)
+        pyramid = self._pyramids.get(key)
+        if pyramid is None or len(pyramid) != x.size:
+            pyramid = MinMaxPyramid(x, y)
+            self._pyramids[key] = pyramid
+        return pyramid
+
+    def _on_x_range_changed(self, *_a) -> None:
+        self._update_stats()
+        self._redecimate()
+
+    def _redecimate(self) -> None:
+        """Re-pick each long series' decimation level for the visible X range."""
+        vb = self.view_box()
+        if vb is None or not self._decimated:
+            return
+        try:
+            x0, x1 = vb.viewRange()[0]
+        except Exception:
+            return
+        for item, pyramid in self._decimated:
+            if len(pyramid) <= _MAX_PLOT_POINTS:
+                continue
+            px, py = pyramid.view(x0, x1, _MAX_PLOT_POINTS)
+            try:
+                item.setData(px, py)
+            except Exception:
+                pass
 
     # -- statistics --------------------------------------------------------
     def _update_stats(self, *_a) -> None:
@@ -39,6 +39,7 @@ from qgis.core import (
     QgsGeometry,
     QgsPointXY,
     QgsProject,
+    QgsRectangle,
 )
 
 
@@ -572,6 +573,18 @@ def reproject_geoms_to(
 # ---------------------------------------------------------------------------
 
 
+def _project_on_segment(qx: float, qy: float, p1, p2) -> tuple:
+    """Planar closest point to (qx, qy) on segment p1–p2."""
+    x1, y1 = float(p1.x()), float(p1.y())
+    x2, y2 = float(p2.x()), float(p2.y())
+    dx, dy = x2 - x1, y2 - y1
+    planar_sq = dx * dx + dy * dy
+    if planar_sq <= 0.0:
+        return x1, y1
+    t = max(0.0, min(1.0, ((qx - x1) * dx + (qy - y1) * dy) / planar_sq))
+    return x1 + t * dx, y1 + t * dy
+
+
 class RouteFrame:
     """A cached view of a multi-feature line layer for KP lookups.
 
@@ -654,6 +667,16 @@ class RouteFrame:
         lengths = [measure_total_length_m(g, distance) for g in geoms]
         return cls(geoms, lengths, distance, follow_stored_geometry)
 
+    def build_index(self) -> "RouteFrame":
+        """Build the chainage and nearest-KP indexes now instead of lazily.
+
+        For interactive callers that would otherwise pay for the full route
+        walk on their first query (e.g. the first mouse move). Returns
+        ``self``.
+        """
+        self._ensure_kp_index()
+        return self
+
     # ----- properties -----
 
     @property
@@ -777,6 +800,85 @@ class RouteFrame:
                 index.addFeature(feat)
             self._kp_index = index
 
+    def segments(self) -> List[tuple]:
+        """Route segments in chainage order.
+
+        Each entry is ``(p1, p2, seg_len_m, cumulative_at_p1_m,
+        feature_index)``; zero-length segments are omitted, exactly as in
+        the chainage walk.
+        """
+        self._ensure_chainage()
+        return [seg + (self._seg_feature[i],) for i, seg in enumerate(self._segs)]
+
+    def segments_near(self, point_xy: QgsPointXY) -> List[int]:
+        """Indices (ascending) of every segment that can be nearest to a point.
+
+        ``kp_at_point`` trusts the 12 planar-nearest segments, which is fine
+        for a cursor readout but not for a tool that must match the full
+        walk. Here the seed segment's measured distance bounds the answer:
+        a segment can only beat it if its planar distance is within that
+        distance divided by the smallest metres-per-map-unit rate around the
+        point (probed along the axes and diagonals, 5% margin for the rate
+        varying across the window). Everything whose box meets that window
+        is returned, so the search is exact for projected and geographic
+        CRSs alike. Falls back to all segments if the probe fails.
+        """
+        self._ensure_kp_index()
+        count = len(self._segs)
+        if not count or point_xy is None:
+            return []
+        qx, qy = float(point_xy.x()), float(point_xy.y())
+        try:
+            seed_ids = self._kp_index.nearestNeighbor(QgsPointXY(qx, qy), 1)
+        except Exception:
+            seed_ids = []
+        best_m = float("inf")
+        step = float("inf")
+        for seg_id in seed_ids:
+            if 0 <= seg_id < count:
+                p1, p2 = self._segs[seg_id][0], self._segs[seg_id][1]
+                sx, sy = _project_on_segment(qx, qy, p1, p2)
+                try:
+                    dist_m = float(self._distance.measureLine(
+                        QgsPointXY(qx, qy), QgsPointXY(sx, sy)))
+                except Exception:
+                    continue
+                if dist_m < best_m:
+                    best_m = dist_m
+                    step = ((sx - qx) ** 2 + (sy - qy) ** 2) ** 0.5
+        if not best_m < float("inf"):
+            return list(range(count))
+        if best_m <= 0.0 or step <= 0.0:
+            radius = 0.0
+        else:
+            rate = self._min_metric_rate(qx, qy, step)
+            if rate is None:
+                return list(range(count))
+            radius = 1.05 * best_m / rate
+        radius += 1e-9 * (1.0 + abs(qx) + abs(qy))
+        try:
+            ids = self._kp_index.intersects(
+                QgsRectangle(qx - radius, qy - radius, qx + radius, qy + radius))
+        except Exception:
+            return list(range(count))
+        return sorted(i for i in ids if 0 <= i < count)
+
+    def _min_metric_rate(self, x: float, y: float, step: float) -> Optional[float]:
+        """Smallest metres per map unit over four directions from (x, y)."""
+        origin = QgsPointXY(x, y)
+        diag = step * 0.7071067811865476
+        rates = []
+        for dx, dy in ((step, 0.0), (0.0, step), (diag, diag), (diag, -diag)):
+            try:
+                metres = float(self._distance.measureLine(
+                    origin, QgsPointXY(x + dx, y + dy)))
+            except Exception:
+                return None
+            if not metres > 0.0 or metres == float("inf"):
+                return None
+            rates.append(metres / step)
+        return min(rates)
+
     def kp_at_point(self, point_xy: QgsPointXY) -> KPHit:
         """Nearest KP on the route (indexed; same chainage as point_at_kp).
 
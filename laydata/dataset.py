@@ -14,6 +14,12 @@ Design notes
   lay data can run to hundreds of thousands of rows.
 * Time is stored as float "seconds since 1970-01-01" (naive, DST-free) so that
   gap deltas are exact; the absolute base is irrelevant for QC.
+* Layers read through :meth:`LayDataset.from_feature_source` are decoded once
+  into typed columns: float64 for real fields, int64 plus a null mask for
+  integer fields, ``datetime64`` (NaT for missing) for time fields, and
+  deduplicated strings for text. Datasets built from plain lists keep the
+  original ``object`` columns and decode lazily through the same vectorised
+  converters.
 * The per-record *source reference* (``source_file`` / ``event_file`` /
   ``slack_file`` / ``body_file``) is auto-detected so gap/duplicate checks can
   run independently per logging source.
@@ -21,8 +27,9 @@ Design notes
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import warnings
 
 import numpy as np
 
@@ -40,6 +47,15 @@ TIME_FIELD_CANDIDATES: Tuple[str, ...] = ("ISO_Time",)
 
 _EPOCH = datetime(1970, 1, 1)
 
+# Column kinds for typed loading (see ``field_kinds``).
+KIND_REAL = "real"
+KIND_INTEGER = "integer"
+KIND_TIME = "time"
+KIND_TEXT = "text"
+
+# Rows per flush of pending time strings into the datetime64 buffer.
+_TIME_CHUNK = 65536
+
 
 def parse_iso_epoch(value) -> float:
     """Parse an ISO-8601 timestamp to seconds since 1970-01-01 (naive).
@@ -65,12 +81,117 @@ def parse_iso_epoch(value) -> float:
     return (dt - _EPOCH).total_seconds()
 
 
+def datetime64_array(values: Sequence) -> np.ndarray:
+    """ISO-8601 values as a ``datetime64[us]`` array (NaT when missing).
+
+    Parses the whole array in numpy when every value is a plain ISO string;
+    anything numpy rejects or would shift by a UTC offset (``Z``, ``+01:00``)
+    falls back to :func:`parse_iso_epoch`, which keeps the wall-clock time.
+    """
+    if isinstance(values, np.ndarray) and values.dtype.kind == "M":
+        return values.astype("datetime64[us]")
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            return np.asarray(values, dtype="datetime64[us]")
+    except (TypeError, ValueError, Warning):
+        pass
+    epoch = np.array([parse_iso_epoch(v) for v in values], dtype=float)
+    out = np.full(len(epoch), np.datetime64("NaT"), dtype="datetime64[us]")
+    ok = ~np.isnan(epoch)
+    out[ok] = np.round(epoch[ok] * 1e6).astype(np.int64).astype("datetime64[us]")
+    return out
+
+
+def epoch_seconds(times: np.ndarray) -> np.ndarray:
+    """``datetime64`` array -> float seconds since 1970-01-01 (nan for NaT)."""
+    micros = times.astype("datetime64[us]").astype(np.int64)
+    out = micros / 1e6
+    out[np.isnat(times)] = np.nan
+    return out
+
+
 def epoch_array(values: Sequence) -> np.ndarray:
     """Vectorise :func:`parse_iso_epoch` over an iterable of ISO strings."""
-    out = np.full(len(values), np.nan, dtype=float)
-    for i, value in enumerate(values):
-        out[i] = parse_iso_epoch(value)
-    return out
+    return epoch_seconds(datetime64_array(values))
+
+
+def numeric_array(values: Sequence) -> np.ndarray:
+    """Vectorise :func:`to_float`: one numpy conversion when every value is
+    numeric, ``None`` or a plain number string; per value otherwise."""
+    try:
+        return np.asarray(values, dtype=float)
+    except (TypeError, ValueError):
+        return np.array([to_float(v) for v in values], dtype=float)
+
+
+def _trim_time_unit(times: np.ndarray) -> np.ndarray:
+    """Coarsest of s / ms / us that keeps every timestamp exact, so ISO text
+    formatted back from the column matches what was logged."""
+    micros = times.view(np.int64)[~np.isnat(times)]
+    if not np.any(micros % 1000):
+        if not np.any(micros % 1_000_000):
+            return times.astype("datetime64[s]")
+        return times.astype("datetime64[ms]")
+    return times
+
+
+def _plain(value):
+    """Python value of a feature attribute (QGIS NULL variants -> None)."""
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    if type(value).__name__ == "QVariant":
+        return None if not value.isValid() or value.isNull() else value.value()
+    is_null = getattr(value, "isNull", None)
+    if is_null is not None:
+        try:
+            if is_null():
+                return None
+        except TypeError:
+            pass
+    # QDateTime / QDate / QTime -> datetime / date / time.
+    for name in ("toPyDateTime", "toPyDate", "toPyTime"):
+        to_py = getattr(value, name, None)
+        if to_py is not None:
+            return to_py()
+    return value
+
+
+def _time_text(value):
+    value = _plain(value)
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None).isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def field_kinds(fields) -> Dict[str, str]:
+    """Typed-loading kind per field of a ``QgsFields`` (name -> ``KIND_*``).
+
+    Integer and real fields decode to numeric arrays, date and datetime
+    fields and the ISO time columns the importers write to ``datetime64``;
+    everything else stays text, including time-of-day fields (no date to
+    place them on).
+    """
+    from ..qgis_compat import FIELD_TYPE_INT, FIELD_TYPE_LONG_LONG, FIELD_TYPE_TIME
+
+    kinds: Dict[str, str] = {}
+    for field in fields:
+        name = field.name()
+        is_time = getattr(field, "isDateOrTime", None)
+        dated = is_time is not None and is_time() and field.type() != FIELD_TYPE_TIME
+        if name in TIME_FIELD_CANDIDATES or dated:
+            kinds[name] = KIND_TIME
+        elif field.type() in (FIELD_TYPE_INT, FIELD_TYPE_LONG_LONG):
+            kinds[name] = KIND_INTEGER
+        elif field.isNumeric():
+            kinds[name] = KIND_REAL
+        else:
+            kinds[name] = KIND_TEXT
+    return kinds
 
 
 def to_float(value) -> float:
@@ -92,6 +213,14 @@ def to_float(value) -> float:
         return np.nan
 
 
+def _coords(values) -> Optional[np.ndarray]:
+    if values is None:
+        return None
+    if isinstance(values, np.ndarray) and values.dtype.kind == "f":
+        return values.astype(float, copy=False)
+    return np.asarray([to_float(v) for v in values], dtype=float)
+
+
 def haversine_m(lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray) -> np.ndarray:
     """Great-circle distance in metres between paired coordinate arrays."""
     radius = 6371000.0
@@ -115,25 +244,34 @@ class LayDataset:
         layer_name: str = "",
         source_field: Optional[str] = None,
         time_field: Optional[str] = None,
+        null_masks: Optional[Dict[str, np.ndarray]] = None,
     ):
+        """``columns`` values may be plain sequences (kept as ``object``
+        arrays) or already-typed numpy arrays (numeric / ``datetime64``,
+        kept as they are); ``null_masks`` flags the missing entries of
+        integer columns."""
         self.layer_name = layer_name
         self.columns: Dict[str, np.ndarray] = {
-            name: np.asarray(list(values), dtype=object) for name, values in columns.items()
+            name: (values if isinstance(values, np.ndarray) and values.dtype != object
+                   else np.asarray(list(values), dtype=object))
+            for name, values in columns.items()
         }
         self.row_count = len(next(iter(self.columns.values()))) if self.columns else 0
+        self._null_masks: Dict[str, np.ndarray] = dict(null_masks or {})
 
         self._numeric_cache: Dict[str, np.ndarray] = {}
         self._is_numeric_cache: Dict[str, bool] = {}
         self._sources_cache: Optional[List[str]] = None
+        self._source_codes: Optional[np.ndarray] = None
         self._time_epoch: Optional[np.ndarray] = None
 
         self.fids = (
-            np.asarray(list(fids), dtype=np.int64)
+            np.asarray(fids if isinstance(fids, np.ndarray) else list(fids), dtype=np.int64)
             if fids is not None
             else np.arange(self.row_count, dtype=np.int64)
         )
-        self._lat = np.asarray([to_float(v) for v in lat], dtype=float) if lat is not None else None
-        self._lon = np.asarray([to_float(v) for v in lon], dtype=float) if lon is not None else None
+        self._lat = _coords(lat)
+        self._lon = _coords(lon)
 
         # Fall back to Lat_dd / Lon_dd columns for geometry when not supplied.
         if self._lat is None and self.has_field("Lat_dd"):
@@ -161,12 +299,39 @@ class LayDataset:
     def raw(self, name: str) -> np.ndarray:
         return self.columns[name]
 
+    def value_text(self, name: str, index: int) -> str:
+        """Display text of one cell ("" when missing)."""
+        values = self.columns[name]
+        kind = values.dtype.kind
+        if kind == "M":
+            value = values[index]
+            return "" if np.isnat(value) else str(np.datetime_as_string(value))
+        if kind == "f":
+            value = float(values[index])
+            return "" if np.isnan(value) else repr(value)
+        if kind in "iu":
+            mask = self._null_masks.get(name)
+            return "" if mask is not None and mask[index] else str(int(values[index]))
+        value = values[index]
+        return "" if value is None else str(value)
+
     def numeric(self, name: str) -> np.ndarray:
         """Return a cached float array for ``name`` (nan where non-numeric)."""
         cached = self._numeric_cache.get(name)
         if cached is None:
             values = self.columns[name]
-            cached = np.array([to_float(v) for v in values], dtype=float)
+            kind = values.dtype.kind
+            if kind == "f":
+                cached = values.astype(float, copy=False)
+            elif kind in "iub":
+                cached = values.astype(float)
+                mask = self._null_masks.get(name)
+                if mask is not None:
+                    cached[mask] = np.nan
+            elif kind == "M":
+                cached = np.full(values.shape, np.nan)   # times are not values
+            else:
+                cached = numeric_array(values)
             self._numeric_cache[name] = cached
         return cached
 
@@ -182,6 +347,11 @@ class LayDataset:
         cached = self._is_numeric_cache.get(name)
         if cached is not None:
             return cached
+        kind = self.columns[name].dtype.kind
+        if kind != "O":
+            result = kind in "fiub" and bool(np.any(~np.isnan(self.numeric(name))))
+            self._is_numeric_cache[name] = result
+            return result
         non_empty = 0
         for v in self.columns[name]:
             if v is None:
@@ -216,7 +386,9 @@ class LayDataset:
         if self.time_field is None:
             return None
         if self._time_epoch is None:
-            self._time_epoch = epoch_array(self.columns[self.time_field])
+            values = self.columns[self.time_field]
+            self._time_epoch = (epoch_seconds(values) if values.dtype.kind == "M"
+                                else epoch_array(values))
         return self._time_epoch
 
     @property
@@ -228,6 +400,8 @@ class LayDataset:
         if self.time_field is None:
             return None
         value = self.columns[self.time_field][index]
+        if isinstance(value, np.datetime64):
+            return None if np.isnat(value) else str(np.datetime_as_string(value))
         return None if value is None else str(value)
 
     @property
@@ -238,16 +412,29 @@ class LayDataset:
 
     def sources(self) -> List[str]:
         if self._sources_cache is None:
-            seen: List[str] = []
-            known = set()
-            for value in self.source_array:
-                text = "" if value is None else str(value)
-                if text not in known:
-                    known.add(text)
-                    seen.append(text)
-            self._sources_cache = seen
+            self._index_sources()
         return list(self._sources_cache)
 
+    def source_codes(self) -> np.ndarray:
+        """Per-row index into :meth:`sources` (int32), for vectorised grouping."""
+        if self._source_codes is None:
+            self._index_sources()
+        return self._source_codes
+
+    def _index_sources(self) -> None:
+        # One pass over the column; a text column loaded typed shares one
+        # string object per distinct value, so the dict lookups stay cheap.
+        codes = np.empty(self.row_count, dtype=np.int32)
+        index: Dict[str, int] = {}
+        for i, value in enumerate(self.source_array):
+            text = "" if value is None else str(value)
+            code = index.get(text)
+            if code is None:
+                code = index[text] = len(index)
+            codes[i] = code
+        self._sources_cache = list(index)
+        self._source_codes = codes
+
     def source_at(self, index: int) -> Optional[str]:
         if self.source_field is None:
             return None
@@ -261,15 +448,10 @@ class LayDataset:
         indices within each group are ordered by ascending timestamp (records
         with an unparseable time are dropped from that ordering).
         """
-        sources = self.source_array
+        codes = self.source_codes()
         epoch = self.time_epoch if order_by_time else None
-        for value in self.sources():
-            target = "" if value == "" else value
-            mask = np.array(
-                [("" if s is None else str(s)) == target for s in sources],
-                dtype=bool,
-            )
-            indices = np.nonzero(mask)[0]
+        for code, value in enumerate(self.sources()):
+            indices = np.nonzero(codes == code)[0]
             if epoch is not None:
                 group_epoch = epoch[indices]
                 valid = ~np.isnan(group_epoch)
@@ -301,6 +483,7 @@ class LayDataset:
             transform_context=QgsProject.instance().transformContext(),
             layer_name=layer.name(),
             feature_count=max(int(layer.featureCount()), 0),
+            kinds=field_kinds(layer.fields()),
         )
 
     @classmethod
@@ -315,6 +498,7 @@ class LayDataset:
         feature_count: int = 0,
         progress=None,
         is_canceled=None,
+        kinds: Optional[Dict[str, str]] = None,
     ) -> Optional["LayDataset"]:
         """Build a dataset from a QGIS feature source.
 
@@ -323,51 +507,169 @@ class LayDataset:
         (called with the running feature index) and ``is_canceled`` (returning
         ``True`` to abort) are optional hooks used by the background loader;
         returns ``None`` when cancelled.
+
+        ``field_names`` is the full field list of the source, in order.
+        ``kinds`` (see :func:`field_kinds`) decodes each field straight into
+        a typed column as features stream in; fields without a kind are text.
+        Geometry is not fetched for non-spatial sources.
         """
-        from qgis.core import QgsCoordinateReferenceSystem, QgsCoordinateTransform
+        from qgis.core import (
+            QgsCoordinateReferenceSystem,
+            QgsCoordinateTransform,
+            QgsFeatureRequest,
+        )
 
-        columns: Dict[str, List] = {name: [] for name in field_names}
-        # Append via a positional list of the column buffers so the hot loop
-        # avoids a field-name lookup per attribute (feature[name]) on every row.
-        col_lists = [columns[name] for name in field_names]
-        n_fields = len(field_names)
-        lats: List[float] = []
-        lons: List[float] = []
-        fids: List[int] = []
+        kinds = kinds or {}
+        request = QgsFeatureRequest()
+        if not is_spatial:
+            no_geometry = getattr(QgsFeatureRequest, "NoGeometry", None)
+            if no_geometry is None:
+                no_geometry = getattr(QgsFeatureRequest, "Flag").NoGeometry
+            request.setFlags(no_geometry)
 
         wgs84 = QgsCoordinateReferenceSystem("EPSG:4326")
         transform = None
         if layer_crs.isValid() and layer_crs != wgs84:
             transform = QgsCoordinateTransform(layer_crs, wgs84, transform_context)
 
-        for idx, feature in enumerate(source.getFeatures()):
+        builder = _ColumnBuilder(
+            [(i, name, kinds.get(name, KIND_TEXT))
+             for i, name in enumerate(field_names)],
+            capacity=max(int(feature_count), 1),
+        )
+        lats = builder.lat
+        lons = builder.lon
+        for idx, feature in enumerate(source.getFeatures(request)):
             if is_canceled is not None and idx % 2000 == 0 and is_canceled():
                 return None
-            attrs = feature.attributes()
-            for i in range(n_fields):
-                col_lists[i].append(attrs[i])
-            fids.append(int(feature.id()))
-            if not is_spatial:
-                lats.append(np.nan)
-                lons.append(np.nan)
-            else:
+            if idx == builder.capacity:
+                builder.grow()
+                lats, lons = builder.lat, builder.lon
+            builder.add(idx, feature.attributes(), int(feature.id()))
+            if is_spatial:
                 geom = feature.geometry()
-                if geom is None or geom.isEmpty():
-                    lats.append(np.nan)
-                    lons.append(np.nan)
-                else:
+                if geom is not None and not geom.isEmpty():
                     point = geom.centroid().asPoint()
                     if transform is not None:
                         point = transform.transform(point)
-                    lons.append(float(point.x()))
-                    lats.append(float(point.y()))
+                    lons[idx] = point.x()
+                    lats[idx] = point.y()
             if progress is not None and idx % 2000 == 0:
                 progress(idx)
 
-        return cls(
+        return builder.dataset(layer_name)
+
+
+class _ColumnBuilder:
+    """Preallocated typed buffers filled row by row by the feature loader.
+
+    Real fields go straight into float64 and integer fields into int64 with a
+    null mask; time fields are parsed into ``datetime64`` in chunks of
+    ``_TIME_CHUNK`` rows; text fields keep one string object per distinct
+    value, stored as int32 codes into a category list until the end.
+    """
+
+    def __init__(self, fields: Sequence[Tuple[int, str, str]], capacity: int):
+        self.fields = list(fields)
+        self.capacity = capacity
+        self.rows = 0
+        self.lat = np.full(capacity, np.nan)
+        self.lon = np.full(capacity, np.nan)
+        self.fids = np.zeros(capacity, dtype=np.int64)
+        self.buffers: List[np.ndarray] = []
+        self.masks: Dict[int, np.ndarray] = {}
+        self.categories: Dict[int, Dict] = {}
+        self.pending: Dict[int, List] = {}
+        for k, (_index, _name, kind) in enumerate(self.fields):
+            if kind == KIND_REAL:
+                self.buffers.append(np.full(capacity, np.nan))
+            elif kind == KIND_INTEGER:
+                self.buffers.append(np.zeros(capacity, dtype=np.int64))
+                self.masks[k] = np.zeros(capacity, dtype=bool)
+            elif kind == KIND_TIME:
+                self.buffers.append(np.full(capacity, np.datetime64("NaT"), dtype="datetime64[us]"))
+                self.pending[k] = []
+            else:
+                self.buffers.append(np.zeros(capacity, dtype=np.int32))
+                self.categories[k] = {}
+
+    def grow(self) -> None:
+        extra = self.capacity
+        self.lat = np.concatenate([self.lat, np.full(extra, np.nan)])
+        self.lon = np.concatenate([self.lon, np.full(extra, np.nan)])
+        self.fids = np.concatenate([self.fids, np.zeros(extra, dtype=np.int64)])
+        for k, buf in enumerate(self.buffers):
+            fill = np.full(extra, np.nan) if buf.dtype.kind == "f" else np.zeros(extra, dtype=buf.dtype)
+            if buf.dtype.kind == "M":
+                fill[:] = np.datetime64("NaT")
+            self.buffers[k] = np.concatenate([buf, fill])
+        for k, mask in self.masks.items():
+            self.masks[k] = np.concatenate([mask, np.zeros(extra, dtype=bool)])
+        self.capacity += extra
+
+    def add(self, row: int, attrs, fid: int) -> None:
+        self.fids[row] = fid
+        for k, (index, _name, kind) in enumerate(self.fields):
+            value = attrs[index]
+            if kind == KIND_REAL:
+                try:
+                    self.buffers[k][row] = value
+                except (TypeError, ValueError):
+                    self.buffers[k][row] = to_float(_plain(value))
+            elif kind == KIND_INTEGER:
+                value = _plain(value)
+                if value is None:
+                    self.masks[k][row] = True
+                else:
+                    try:
+                        self.buffers[k][row] = value
+                    except (TypeError, ValueError, OverflowError):
+                        self.masks[k][row] = True
+            elif kind == KIND_TIME:
+                pending = self.pending[k]
+                pending.append(_time_text(value))
+                if len(pending) == _TIME_CHUNK:
+                    self._flush_time(k, row + 1)
+            else:
+                value = _plain(value)
+                if value is not None and not isinstance(value, str):
+                    value = str(value)
+                cats = self.categories[k]
+                code = cats.get(value)
+                if code is None:
+                    code = cats[value] = len(cats)
+                self.buffers[k][row] = code
+        self.rows = row + 1
+
+    def _flush_time(self, k: int, end: int) -> None:
+        pending = self.pending[k]
+        if pending:
+            self.buffers[k][end - len(pending):end] = datetime64_array(pending)
+            pending.clear()
+
+    def dataset(self, layer_name: str) -> "LayDataset":
+        n = self.rows
+        columns: Dict[str, np.ndarray] = {}
+        null_masks: Dict[str, np.ndarray] = {}
+        for k, (_index, name, kind) in enumerate(self.fields):
+            buf = self.buffers[k][:n]
+            if kind == KIND_TIME:
+                self._flush_time(k, n)
+                columns[name] = _trim_time_unit(self.buffers[k][:n])
+            elif kind == KIND_TEXT:
+                labels = np.empty(len(self.categories[k]), dtype=object)
+                labels[:] = list(self.categories[k])
+                columns[name] = labels[buf]
+            else:
+                columns[name] = buf.copy()
+                mask = self.masks.get(k)
+                if mask is not None and mask[:n].any():
+                    null_masks[name] = mask[:n].copy()
+        return LayDataset(
             columns=columns,
-            lat=lats,
-            lon=lons,
-            fids=fids,
+            lat=self.lat[:n].copy(),
+            lon=self.lon[:n].copy(),
+            fids=self.fids[:n].copy(),
             layer_name=layer_name,
+            null_masks=null_masks,
         )
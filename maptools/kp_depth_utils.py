@@ -20,6 +20,9 @@ from qgis.core import (
 )
 
 from ..kp_range_utils import make_distance_area
+from ..processing.raster_blocks import (
+    RasterBlockSampler, to_optional_list, transform_points,
+)
 from ..qgis_compat import GEOMETRY_LINE, LAYER_RASTER, LAYER_VECTOR
 
 
@@ -103,6 +106,7 @@ class DepthSampler:
             "name": layer.name(), "provider": provider,
             "extent": layer.extent(), "transform": self._transform_to(layer.crs()),
             "nodata": nodata, "pixel_area": pixel_area,
+            "blocks": RasterBlockSampler.from_provider(provider),
         })
         # Prefer higher resolution rasters (smaller pixels) for first-valid wins.
         self._rasters.sort(key=lambda src: (
@@ -137,16 +141,22 @@ class DepthSampler:
                 return None
         except Exception:
             pass
-        try:
-            value, ok = src["provider"].sample(sample_point, 1)
-        except Exception:
-            return None
-        if not ok:
-            return None
-        try:
-            value = float(value)
-        except (TypeError, ValueError):
-            return None
+        blocks = src.get("blocks")
+        if blocks is not None:
+            value = blocks.value_at(sample_point.x(), sample_point.y())
+            if value is None:
+                return None
+        else:
+            try:
+                value, ok = src["provider"].sample(sample_point, 1)
+            except Exception:
+                return None
+            if not ok:
+                return None
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                return None
         nodata = src.get("nodata")
         if nodata is not None and value == float(nodata):
             return None
@@ -154,6 +164,21 @@ class DepthSampler:
             return None
         return value
 
+    def _sample_raster_many(self, src, points: List[QgsPointXY]) -> List[Optional[float]]:
+        """``_sample_raster`` over many points in one tile-cached read."""
+        blocks = src.get("blocks")
+        if blocks is None:
+            return [self._sample_raster(src, point) for point in points]
+        xs, ys = transform_points(points, src.get("transform"))
+        values = blocks.sample_xy(xs, ys)
+        nodata = src.get("nodata")
+        if nodata is not None:
+            try:
+                values[values == float(nodata)] = float("nan")
+            except (TypeError, ValueError):
+                pass
+        return to_optional_list(values)
+
     def _contour_value(self, src, feature_id) -> Optional[float]:
         try:
             feature = src["layer"].getFeature(feature_id)
@@ -214,7 +239,7 @@ class DepthSampler:
                 start.x() + fraction * (end.x() - start.x()),
                 start.y() + fraction * (end.y() - start.y()))))
         for src in self._rasters:
-            values = [self._sample_raster(src, point) for _dist, point in stations]
+            values = self._sample_raster_many(src, [point for _dist, point in stations])
             if any(value is not None for value in values):
                 result["rasters"].append({
                     "name": src["name"],
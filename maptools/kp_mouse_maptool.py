@@ -11,19 +11,20 @@ Right-clicking can copy KP info to the clipboard (configurable in tool settings)
 from typing import Optional, Tuple
 
 from qgis.PyQt.QtCore import Qt, QSettings, QTimer
-from qgis.PyQt.QtGui import QIcon, QColor, QCursor
+from qgis.PyQt.QtGui import QColor, QCursor
 from qgis.PyQt.QtWidgets import (QMessageBox, QToolTip,
                                  QApplication, QDialog, QVBoxLayout,
                                  QComboBox, QLabel, QDialogButtonBox,
-                                 QToolButton, QMenu, QCheckBox, QLineEdit, QHBoxLayout, QPushButton,
+                                 QMenu, QCheckBox, QLineEdit, QHBoxLayout, QPushButton,
                                  QTableWidget, QTableWidgetItem)
 from qgis.core import (QgsWkbTypes, QgsGeometry, QgsProject, QgsDistanceArea,
                        QgsPointXY, QgsCoordinateReferenceSystem, QgsCoordinateTransform,
                        Qgis, QgsVectorLayer, QgsField, QgsFeature)
 from qgis.gui import QgsMapTool, QgsRubberBand, QgsVertexMarker
-from ..qgis_compat import QAction, DIALOG_ACCEPTED, qt_exec, DISTANCE_METERS, FIELD_TYPE_DOUBLE, FIELD_TYPE_INT, FIELD_TYPE_LONG_LONG, FIELD_TYPE_STRING, GEOMETRY_LINE, GEOMETRY_POINT, GEOMETRY_POLYGON, LAYER_RASTER, LAYER_VECTOR, MESSAGE_CRITICAL, MESSAGE_INFO, MESSAGE_SUCCESS, MESSAGE_WARNING, TOOLBUTTON_POPUP_MODE_MENU_BUTTON, BUTTON_BOX_OK, BUTTON_BOX_CANCEL, BUTTON_BOX_CLOSE, BUTTON_BOX_ACCEPT_ROLE, get_event_global_pos, ITEM_DATA_USER_ROLE, ITEM_FLAG_EDITABLE, ITEM_FLAG_USER_CHECKABLE, CHECK_STATE_CHECKED, CHECK_STATE_UNCHECKED, SELECTION_MODE_NONE, HEADER_RESIZE_MODE_STRETCH
+from ..qgis_compat import DIALOG_ACCEPTED, qt_exec, DISTANCE_METERS, FIELD_TYPE_DOUBLE, FIELD_TYPE_INT, FIELD_TYPE_LONG_LONG, FIELD_TYPE_STRING, GEOMETRY_LINE, GEOMETRY_POINT, GEOMETRY_POLYGON, LAYER_RASTER, LAYER_VECTOR, MESSAGE_CRITICAL, MESSAGE_INFO, MESSAGE_SUCCESS, MESSAGE_WARNING, BUTTON_BOX_OK, BUTTON_BOX_CANCEL, BUTTON_BOX_CLOSE, BUTTON_BOX_ACCEPT_ROLE, get_event_global_pos, ITEM_DATA_USER_ROLE, ITEM_FLAG_EDITABLE, ITEM_FLAG_USER_CHECKABLE, CHECK_STATE_CHECKED, CHECK_STATE_UNCHECKED, SELECTION_MODE_NONE, HEADER_RESIZE_MODE_STRETCH
 import math
 
+from ..kp_geo_utils import RouteFrame
 from ..kp_range_utils import make_distance_area
 try:  # sip is available in QGIS Python env; guard for static analysis
     from qgis.PyQt import sip  # type: ignore
@@ -108,24 +109,17 @@ class KPMouseMapTool(QgsMapTool):
             mode="cartesian" if self.useCartesian else "ellipsoidal",
         )
 
-        # Cache line geometries
+        # Cache line geometries plus the indexed RouteFrame that answers the
+        # live KP/rKP/DCC readout; rebuilt only when the layer's geometry
+        # changes (see _connect_layer_signals).
         self.features_geoms = []
         self.segment_lengths = []
-        total_length = 0.0
-        if self.layer is not None:
-            layer_crs = self.layer.crs()
-            transform = None
-            if layer_crs != project_crs:
-                transform = QgsCoordinateTransform(layer_crs, project_crs, QgsProject.instance())
-            for f in self.layer.getFeatures():
-                g = QgsGeometry(f.geometry())
-                if transform:
-                    g.transform(transform)
-                self.features_geoms.append(g)
-                seg_len = self.distanceArea.measureLength(g)
-                self.segment_lengths.append(seg_len)
-                total_length += seg_len
-        self.total_length_meters = total_length
+        self.total_length_meters = 0.0
+        self.route_frame = None
+        self._route_dirty = False
+        self._signal_layer = None
+        self.recalculate_geometries()
+        self._connect_layer_signals()
 
         # Visual helpers
         self.rubberBand = QgsRubberBand(self.canvas, GEOMETRY_LINE)
@@ -176,15 +170,57 @@ class KPMouseMapTool(QgsMapTool):
 
     def set_layer(self, layer):
         """Set the layer and recalculate geometries for the tool."""
+        self._disconnect_layer_signals()
         self.layer = layer
         self.recalculate_geometries()
+        self._connect_layer_signals()
+
+    # Layer signals after which the cached route no longer matches the layer.
+    _GEOMETRY_SIGNALS = (
+        "geometryChanged", "featureAdded", "featuresDeleted",
+        "afterRollBack", "dataSourceChanged", "dataChanged",
+    )
+
+    def _connect_layer_signals(self):
+        layer = self.layer
+        if layer is None:
+            return
+        for name in self._GEOMETRY_SIGNALS:
+            signal = getattr(layer, name, None)
+            if signal is None:
+                continue
+            try:
+                signal.connect(self._mark_route_dirty)
+            except Exception:
+                pass
+        self._signal_layer = layer
+
+    def _disconnect_layer_signals(self):
+        layer = getattr(self, "_signal_layer", None)
+        self._signal_layer = None
+        if layer is None or _sip_isdeleted(layer):
+            return
+        for name in self._GEOMETRY_SIGNALS:
+            signal = getattr(layer, name, None)
+            if signal is None:
+                continue
+            try:
+                signal.disconnect(self._mark_route_dirty)
+            except Exception:
+                pass
+
+    def _mark_route_dirty(self, *_args):
+        """Layer geometry changed: rebuild the route on the next mouse move."""
+        self._route_dirty = True
 
     def recalculate_geometries(self):
-        """Recalculate the cached geometries and segment lengths for the current layer."""
+        """Recalculate the cached geometries, lengths and RouteFrame for the current layer."""
+        self._route_dirty = False
         if not self.layer:
             self.features_geoms = []
             self.segment_lengths = []
             self.total_length_meters = 0
+            self.route_frame = None
             return
 
         # Set up distance measurements (ellipsoidal or planar).
@@ -204,7 +240,6 @@ class KPMouseMapTool(QgsMapTool):
         self.features_geoms = []
         self.segment_lengths = []
         layer_crs = self.layer.crs()
-        project_crs = self.canvas.mapSettings().destinationCrs()
         transform = None
         if layer_crs != project_crs:
             transform = QgsCoordinateTransform(layer_crs, project_crs, QgsProject.instance())
@@ -221,6 +256,10 @@ class KPMouseMapTool(QgsMapTool):
             total_length += segment_length
         
         self.total_length_meters = total_length
+        # Segment index + cumulative chainage, built once up front so the
+        # first mouse move doesn't pay for it.
+        self.route_frame = RouteFrame(self.features_geoms, self.segment_lengths,
+                                      self.distanceArea).build_index()
 
     def activate(self):
         super().activate()
@@ -254,34 +293,16 @@ class KPMouseMapTool(QgsMapTool):
 
         # Convert the mouse event position to map coordinates.
         mousePoint = self.toMapCoordinates(event.pos())
-        mouse_geom = QgsGeometry.fromPointXY(mousePoint)
 
-        if not self.features_geoms:
+        if self._route_dirty:
+            self.recalculate_geometries()
+        if not self.features_geoms or self.route_frame is None:
             return
 
-        min_dist = float('inf')
-        closest_point_on_line = None
-        closest_feature_idx = -1
-
-        # Find the closest feature and point on that feature
-        for i, feature_geom in enumerate(self.features_geoms):
-            if feature_geom.isEmpty():
-                continue
-
-            # Use a robust method to find the closest point.
-            # nearestPoint is used for broader QGIS version compatibility.
-            closest_pt_geom = feature_geom.nearestPoint(mouse_geom)
-            if closest_pt_geom.isEmpty():
-                continue
-            
-            closest_pt = closest_pt_geom.asPoint()
-            dist = self.distanceArea.measureLine(mousePoint, closest_pt)
-
-            if dist < min_dist:
-                min_dist = dist
-                closest_point_on_line = closest_pt
-                closest_feature_idx = i
-
+        # Indexed nearest-segment lookup: KP, DCC and the snapped point in
+        # constant per-event cost, whatever the route's vertex count.
+        hit = self.route_frame.kp_at_point(mousePoint)
+        closest_point_on_line = hit.snapped_xy
         if closest_point_on_line is None:
             return
 
@@ -293,66 +314,9 @@ class KPMouseMapTool(QgsMapTool):
         self.last_closest_point = QgsPointXY(closest_point_on_line)
 
         # Calculate distance between the mouse and the closest point.
-        distance_meters = min_dist
-        if self.measurementUnit == "m":
-            converted_distance = distance_meters
-        elif self.measurementUnit == "km":
-            converted_distance = distance_meters / 1000.0
-        elif self.measurementUnit == "nautical miles":
-            converted_distance = distance_meters / 1852.0
-        elif self.measurementUnit == "miles":
-            converted_distance = distance_meters / 1609.34
-        else:
-            converted_distance = distance_meters
+        converted_distance = self._convert_distance(hit.dcc_m)
 
-        # Calculate KP (chainage) along the line.
-        chainage_meters = 0
-        # Sum lengths of previous features (if the line is split into multiple features)
-        if closest_feature_idx > 0:
-            chainage_meters = sum(self.segment_lengths[:closest_feature_idx])
-
-        # Add distance along the current feature by finding the nearest segment
-        closest_feature_geom = self.features_geoms[closest_feature_idx]
-        
-        # Handle multi-part geometries by getting all points
-        all_parts = []
-        if closest_feature_geom.isMultipart():
-            all_parts = closest_feature_geom.asMultiPolyline()
-        else:
-            all_parts = [closest_feature_geom.asPolyline()]
-
-        min_dist_to_segment = float('inf')
-        dist_along_feature = 0
-        
-        temp_dist_along_feature = 0
-        final_dist_along_segment = 0
-
-        for part in all_parts:
-            part_dist_along = 0
-            for i in range(len(part) - 1):
-                p1 = QgsPointXY(part[i])
-                p2 = QgsPointXY(part[i+1])
-                
-                segment_geom = QgsGeometry.fromPolylineXY([p1, p2])
-                
-                # Use distance() which is more reliable than nearestPoint() for this check
-                dist_to_mouse = segment_geom.distance(mouse_geom)
-
-                if dist_to_mouse < min_dist_to_segment:
-                    min_dist_to_segment = dist_to_mouse
-                    
-                    # Project the closest point on the line onto the current segment
-                    # to find the distance along it.
-                    projected_point = segment_geom.interpolate(segment_geom.lineLocatePoint(QgsGeometry.fromPointXY(closest_point_on_line)))
-                    dist_along_segment = self.distanceArea.measureLine(p1, projected_point.asPoint())
-                    
-                    # This is the cumulative length of segments before the closest one in this feature
-                    dist_along_feature = temp_dist_along_feature + dist_along_segment
-
-                temp_dist_along_feature += self.distanceArea.measureLine(p1, p2)
-
-        chainage_meters += dist_along_feature
-        chainage_km = chainage_meters / 1000.0
+        chainage_km = hit.kp_km
 
         # Save these values for use in the right-click copy functionality.
         self.last_mouse_point = mousePoint
@@ -537,55 +501,17 @@ class KPMouseMapTool(QgsMapTool):
 
     def _point_at_kp_km(self, kp_km: float) -> Optional[QgsPointXY]:
         """Return the point on the cached reference line at the provided KP (km)."""
+        if self._route_dirty:
+            self.recalculate_geometries()
+        if self.route_frame is None:
+            return None
         try:
-            target_m = float(kp_km) * 1000.0
+            if float(kp_km) < 0:
+                return None
         except Exception:
             return None
-
-        if target_m < 0:
-            return None
-
-        cumulative = 0.0
-        last_point = None
-
-        for geom in self.features_geoms:
-            if geom is None or geom.isEmpty():
-                continue
-
-            try:
-                if geom.isMultipart():
-                    parts = list(geom.asMultiPolyline())
-                else:
-                    parts = [geom.asPolyline()]
-            except Exception:
-                continue
-
-            for part in parts:
-                if not part or len(part) < 2:
-                    continue
-
-                for i in range(len(part) - 1):
-                    p1 = part[i]
-                    p2 = part[i + 1]
-                    try:
-                        seg_len = float(self.distanceArea.measureLine(p1, p2))
-                    except Exception:
-                        continue
-                    if seg_len <= 0:
-                        continue
-
-                    next_cum = cumulative + seg_len
-                    last_point = QgsPointXY(p2)
-
-                    if next_cum >= target_m:
-                        ratio = (target_m - cumulative) / seg_len
-                        x = float(p1.x()) + ratio * (float(p2.x()) - float(p1.x()))
-                        y = float(p1.y()) + ratio * (float(p2.y()) - float(p1.y()))
-                        return QgsPointXY(x, y)
-
-                    cumulative = next_cum
-
-        return last_point
+        # Beyond the end the walk used to return the last vertex.
+        return self.route_frame.point_at_kp(kp_km, clamp=True)
 
     def _copy_kp_to_clipboard(self):
         """Copy KP info to clipboard using user-configured content."""
@@ -1358,9 +1284,11 @@ class KPMouseMapTool(QgsMapTool):
                         pass
             finally:
                 self.closestPointMarker = None
+        self._disconnect_layer_signals()
         self.features_geoms = []
         self.segment_lengths = []
         self.total_length_meters = 0
+        self.route_frame = None
         try:
             if hasattr(self, 'rangeBearingLine') and self.rangeBearingLine:
                 self.rangeBearingLine.hide()
@@ -1978,36 +1906,23 @@ class KPMouseTool:
 
     def initGui(self):
         """Initialize the UI elements for the KP Mouse Tool."""
-        import os
-        self.toolButton = QToolButton(self.iface.mainWindow())
-        # Prefer dedicated kp_mouse_tool_icon.png if present; fallback to main plugin icon resource
-        try:
-            plugin_dir = os.path.dirname(os.path.dirname(__file__))  # maptools/ -> plugin root
-            custom_icon_path = os.path.join(plugin_dir, 'kp_mouse_tool_icon.png')
-            if os.path.exists(custom_icon_path):
-                self.toolButton.setIcon(QIcon(custom_icon_path))
-            else:
-                self.toolButton.setIcon(QIcon(":/plugins/subsea_cable_tools/icon.png"))
-        except Exception:
-            # Last-resort fallback
-            self.toolButton.setIcon(QIcon(":/plugins/subsea_cable_tools/icon.png"))
-        self.toolButton.setCheckable(True)
+        from .kp_mouse_toolbar import MENU_TITLE, build_kp_mouse_widgets
+
+        tool_button, action_config, action_go_to_kp = build_kp_mouse_widgets(self.iface)
+        tool_button_action = self.iface.addToolBarWidget(tool_button)
+        self.iface.addPluginToMenu(MENU_TITLE, action_config)
+        self.adopt_gui(tool_button, tool_button_action, action_config, action_go_to_kp)
+
+    def adopt_gui(self, tool_button, tool_button_action, action_config, action_go_to_kp):
+        """Wire up widgets already registered with QGIS (by ``initGui`` or the
+        start-up stub in ``kp_mouse_toolbar``)."""
+        self.toolButton = tool_button
+        self.toolButtonAction = tool_button_action
+        self.actionConfig = action_config
+        self.actionGoToKP = action_go_to_kp
         self.toolButton.toggled.connect(self.toggle_tool)
-        self.toolButton.setToolTip("Enable/Disable KP Mouse Tool")
-        self.toolButton.setPopupMode(TOOLBUTTON_POPUP_MODE_MENU_BUTTON)
-
-        menu = QMenu(self.toolButton)
-        self.actionConfig = QAction("Configure...", self.iface.mainWindow())
         self.actionConfig.triggered.connect(self.show_config_dialog)
-        menu.addAction(self.actionConfig)
-
-        self.actionGoToKP = QAction("Go to KP...", self.iface.mainWindow())
         self.actionGoToKP.triggered.connect(self.show_go_to_kp_dialog)
-        menu.addAction(self.actionGoToKP)
-
-        self.toolButton.setMenu(menu)
-
-        self.toolButtonAction = self.iface.addToolBarWidget(self.toolButton)
         self._update_go_to_kp_enabled()
 
         try:
@@ -2015,8 +1930,6 @@ class KPMouseTool:
         except Exception:
             pass
 
-        self.iface.addPluginToMenu("&Subsea Cable Tools", self.actionConfig)
-
     def unload(self):
         """Remove UI elements, disconnect signals, and clean up resources when the plugin is unloaded."""
         # Deactivate the map tool if it's active
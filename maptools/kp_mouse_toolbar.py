@@ -0,0 +1,146 @@
+# kp_mouse_toolbar.py
+# -*- coding: utf-8 -*-
+"""
+Toolbar button and menu entries for the KP Mouse Tool, without the tool.
+
+``kp_mouse_maptool`` (map tool, dialogs, depth profile window) is only
+imported when the button is first toggled or its menu first opened, so
+plugin start-up registers a plain button. ``KPMouseTool.initGui`` builds the
+same widgets through :func:`build_kp_mouse_widgets`.
+"""
+
+import os
+
+from qgis.PyQt.QtGui import QIcon
+from qgis.PyQt.QtWidgets import QMenu, QToolButton
+
+from ..qgis_compat import QAction, TOOLBUTTON_POPUP_MODE_MENU_BUTTON
+
+MENU_TITLE = "&Subsea Cable Tools"
+
+
+def build_kp_mouse_widgets(iface):
+    """Create the KP Mouse tool button with its Configure / Go to KP menu.
+
+    Returns ``(tool_button, action_config, action_go_to_kp)``; nothing is
+    connected or added to the QGIS interface yet.
+    """
+    parent = iface.mainWindow()
+    plugin_dir = os.path.dirname(os.path.dirname(__file__))  # maptools/ -> plugin root
+    icon_path = os.path.join(plugin_dir, 'kp_mouse_tool_icon.png')
+    if not os.path.exists(icon_path):
+        icon_path = os.path.join(plugin_dir, 'icon.png')
+
+    tool_button = QToolButton(parent)
+    tool_button.setIcon(QIcon(icon_path))
+    tool_button.setCheckable(True)
+    tool_button.setToolTip("Enable/Disable KP Mouse Tool")
+    tool_button.setPopupMode(TOOLBUTTON_POPUP_MODE_MENU_BUTTON)
+
+    menu = QMenu(tool_button)
+    action_config = QAction("Configure...", parent)
+    menu.addAction(action_config)
+    action_go_to_kp = QAction("Go to KP...", parent)
+    menu.addAction(action_go_to_kp)
+    tool_button.setMenu(menu)
+    return tool_button, action_config, action_go_to_kp
+
+
+class LazyKPMouseTool:
+    """Stand-in for ``KPMouseTool`` until the user first reaches for it.
+
+    Registers the toolbar button and menu entry; the first toggle, menu
+    open or menu action imports the real tool, hands it the widgets and
+    forwards the triggering action.
+    """
+
+    def __init__(self, iface):
+        self.iface = iface
+        self.tool = None
+        self.toolButton = None
+        self.toolButtonAction = None
+        self.actionConfig = None
+        self.actionGoToKP = None
+
+    @property
+    def mapTool(self):
+        return getattr(self.tool, 'mapTool', None)
+
+    def initGui(self):
+        self.toolButton, self.actionConfig, self.actionGoToKP = build_kp_mouse_widgets(self.iface)
+        self.toolButton.toggled.connect(self._on_toggled)
+        self.toolButton.menu().aboutToShow.connect(self._materialize)
+        self.actionConfig.triggered.connect(self._on_configure)
+        self.actionGoToKP.triggered.connect(self._on_go_to_kp)
+        self.toolButtonAction = self.iface.addToolBarWidget(self.toolButton)
+        self.iface.addPluginToMenu(MENU_TITLE, self.actionConfig)
+
+    def _materialize(self):
+        """Import and attach the real tool (once). Returns None on failure."""
+        if self.tool is not None:
+            return self.tool
+        try:
+            from .kp_mouse_maptool import KPMouseTool
+            tool = KPMouseTool(self.iface)
+        except Exception as e:
+            from qgis.PyQt.QtWidgets import QMessageBox
+
+            QMessageBox.critical(
+                self.iface.mainWindow(),
+                "Subsea Cable Tools",
+                "KP Mouse Tool could not be loaded.\n\n"
+                f"Details: {e}",
+            )
+            return None
+        for signal, slot in ((self.toolButton.toggled, self._on_toggled),
+                             (self.toolButton.menu().aboutToShow, self._materialize),
+                             (self.actionConfig.triggered, self._on_configure),
+                             (self.actionGoToKP.triggered, self._on_go_to_kp)):
+            try:
+                signal.disconnect(slot)
+            except Exception:
+                pass
+        tool.adopt_gui(self.toolButton, self.toolButtonAction,
+                       self.actionConfig, self.actionGoToKP)
+        self.tool = tool
+        return tool
+
+    def _on_toggled(self, checked):
+        tool = self._materialize()
+        if tool is not None:
+            tool.toggle_tool(checked)
+        elif checked:
+            self.toolButton.blockSignals(True)
+            self.toolButton.setChecked(False)
+            self.toolButton.blockSignals(False)
+
+    def _on_configure(self, *_args):
+        tool = self._materialize()
+        if tool is not None:
+            tool.show_config_dialog()
+
+    def _on_go_to_kp(self, *_args):
+        tool = self._materialize()
+        if tool is not None:
+            tool.show_go_to_kp_dialog()
+
+    def unload(self):
+        if self.tool is not None:
+            self.tool.unload()
+            self.tool = None
+        else:
+            if self.toolButtonAction is not None:
+                try:
+                    self.iface.removeToolBarIcon(self.toolButtonAction)
+                except Exception:
+                    pass
+            if self.actionConfig is not None:
+                try:
+                    self.iface.removePluginMenu(MENU_TITLE, self.actionConfig)
+                except Exception:
+                    pass
+        self.toolButton = None
+        self.toolButtonAction = None
+        self.actionConfig = None
+        self.actionGoToKP = None
+        self.iface = None
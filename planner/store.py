@@ -1,11 +1,18 @@
 # -*- coding: utf-8 -*-
-"""GeoPackage persistence for planning scenarios, resources, and tasks."""
+"""GeoPackage persistence for planning scenarios, resources, and tasks.
+
+Registry rows are written through targeted SQL transactions
+(``burial/gpkg_sql.py``); the whole-table writer remains for table creation,
+migrations and files that refuse direct SQL.
+"""
 
 from __future__ import annotations
 
 import json
 import os
 import shutil
+import sqlite3
+from contextlib import contextmanager
 from typing import Dict, List, Optional, Sequence
 
 from qgis.core import (
@@ -13,6 +20,7 @@ from qgis.core import (
     QgsFeature, QgsGeometry, QgsProject, QgsVectorFileWriter, QgsVectorLayer,
 )
 
+from ..burial import gpkg_sql
 from ..processing.cable_lay_parsers import fields_from_specs, open_gpkg_layer, write_layer_to_gpkg
 from ..qgis_compat import (
     VECTOR_WRITER_NO_ERROR, VECTOR_WRITER_OVERWRITE_FILE,
@@ -45,6 +53,59 @@ class PlannerStore:
                  transform_context: Optional[QgsCoordinateTransformContext] = None):
         self.gpkg_path = gpkg_path
         self.transform_context = transform_context or QgsProject.instance().transformContext()
+        # None = not probed yet; False = this file refused the direct-SQL
+        # fast path, use the legacy whole-table writer for everything.
+        self._sql_mode: Optional[bool] = None
+
+    # -- direct-SQL fast path -------------------------------------------------
+    def _sql(self) -> Optional[sqlite3.Connection]:
+        """The cached sqlite connection, or None when in legacy mode.
+
+        Same contract as ``BurialStore._sql``: probed once per store, reset
+        by ``ensure_created``/``migrate`` after they rewrite tables.
+        """
+        if self._sql_mode is False:
+            return None
+        if not os.path.exists(self.gpkg_path):
+            return None
+        try:
+            conn = gpkg_sql.connect(self.gpkg_path)
+            if self._sql_mode is None:
+                if not gpkg_sql.table_exists(conn, schema.TABLE_META):
+                    return None  # registry not created yet; re-probe later
+                self._sql_mode = True
+            return conn
+        except sqlite3.Error:
+            self._log_sql_fallback("open")
+            self._sql_mode = False
+            return None
+
+    def _log_sql_fallback(self, action: str) -> None:
+        try:
+            from qgis.core import QgsMessageLog
+
+            from ..qgis_compat import MESSAGE_INFO
+
+            QgsMessageLog.logMessage(
+                "Direct-SQL access failed (%s); using the legacy writer for %s."
+                % (action, os.path.basename(self.gpkg_path)),
+                "Planner", MESSAGE_INFO)
+        except Exception:
+            pass
+
+    @contextmanager
+    def transaction(self):
+        """Group several writes into one atomic commit (SQL mode only)."""
+        conn = self._sql()
+        if conn is None:
+            yield
+            return
+        with gpkg_sql.transaction(conn):
+            yield
+
+    def close(self) -> None:
+        """Checkpoint and release the cached SQL connection (if any)."""
+        gpkg_sql.close(self.gpkg_path)
 
     def exists(self) -> bool:
         return os.path.exists(self.gpkg_path) and self._table_exists(schema.TABLE_META)
@@ -53,13 +114,18 @@ class PlannerStore:
         folder = os.path.dirname(os.path.abspath(self.gpkg_path))
         if folder and not os.path.isdir(folder):
             os.makedirs(folder)
+        created = False
         for table, specs in schema.REGISTRY_TABLES.items():
             if not self._table_exists(table):
                 self._write_table_rows(table, specs, [])
+                created = True
         for table, specs in schema.SPATIAL_TABLES.items():
             if not self._table_exists(table):
                 wkb_type = WKB_POINT if table == schema.TABLE_TASK_POINT else WKB_LINESTRING
                 self._create_spatial_table(table, specs, wkb_type)
+                created = True
+        if created and self._sql_mode is not False:
+            self._sql_mode = None  # tables changed under us — re-probe
         meta = self.read_meta()
         if "schema_version" not in meta:
             self.write_meta("schema_version", str(schema.SCHEMA_VERSION))
@@ -75,12 +141,18 @@ class PlannerStore:
                 migrator(self)
             current += 1
             self.write_meta("schema_version", str(current))
+        if self._sql_mode is not False:
+            self._sql_mode = None  # migrations rewrite tables — re-probe
 
     def backup_before(self, label: str) -> Optional[str]:
         if not os.path.exists(self.gpkg_path):
             return None
+        # Fold the WAL first so the copy is complete without its sidecars.
+        complete = gpkg_sql.checkpoint(self.gpkg_path, truncate=True)
         stem, ext = os.path.splitext(self.gpkg_path)
         target = "%s.%s.bak%s" % (stem, schema.sanitize_slug(label), ext)
+        if not complete and gpkg_sql.backup_to(self.gpkg_path, target):
+            return target
         try:
             shutil.copy2(self.gpkg_path, target)
             return target
@@ -88,9 +160,20 @@ class PlannerStore:
             return None
 
     def _table_exists(self, table: str) -> bool:
-        return os.path.exists(self.gpkg_path) and open_gpkg_layer(self.gpkg_path, table) is not None
+        if not os.path.exists(self.gpkg_path):
+            return False
+        conn = self._sql()
+        if conn is not None:
+            try:
+                return gpkg_sql.table_exists(conn, table)
+            except sqlite3.Error:
+                pass
+        return open_gpkg_layer(self.gpkg_path, table) is not None
 
     def read_table(self, table: str) -> List[Dict]:
+        conn = self._sql()
+        if conn is not None:
+            return [_normalise_row(row) for row in gpkg_sql.read_rows(conn, table)]
         layer = open_gpkg_layer(self.gpkg_path, table)
         if layer is None:
             return []
@@ -107,9 +190,21 @@ class PlannerStore:
             rows, self.transform_context,
         )
 
+    def _read_matching(self, table: str, field_name: str, value: str) -> List[Dict]:
+        """Rows whose ``field_name`` equals ``value`` (filtered in SQL)."""
+        conn = self._sql()
+        if conn is not None:
+            return [_normalise_row(row) for row in gpkg_sql.read_rows(
+                conn, table, gpkg_sql.quote_ident(field_name) + " = ?", (value,))]
+        return [row for row in self.read_table(table) if row.get(field_name) == value]
+
     def upsert_rows(self, table: str, rows: Sequence[Dict]) -> None:
         key = schema.TABLE_KEYS[table]
         incoming = {str(row[key]): dict(row) for row in rows}
+        conn = self._sql()
+        if conn is not None:
+            gpkg_sql.upsert_rows(conn, table, key, list(incoming.values()))
+            return
         merged = [row for row in self.read_table(table)
                   if str(row.get(key)) not in incoming]
         merged.extend(incoming.values())
@@ -118,6 +213,10 @@ class PlannerStore:
     def delete_rows(self, table: str, keys: Sequence[str]) -> None:
         key = schema.TABLE_KEYS[table]
         dropped = {str(value) for value in keys}
+        conn = self._sql()
+        if conn is not None:
+            gpkg_sql.delete_keys(conn, table, key, list(dropped))
+            return
         self.write_table(table, [row for row in self.read_table(table)
                                  if str(row.get(key)) not in dropped])
 
@@ -126,6 +225,11 @@ class PlannerStore:
                 if row.get("key")}
 
     def write_meta(self, key: str, value: str) -> None:
+        conn = self._sql()
+        if conn is not None:
+            gpkg_sql.upsert_rows(conn, schema.TABLE_META, "key",
+                                 [{"key": key, "value": value}])
+            return
         rows = [row for row in self.read_table(schema.TABLE_META) if row.get("key") != key]
         rows.append({"key": key, "value": value})
         self._write_table_rows(schema.TABLE_META, schema.META_FIELDS, rows)
@@ -135,8 +239,8 @@ class PlannerStore:
                       key=lambda row: ((row.get("name") or "").lower(), row.get("created_utc") or ""))
 
     def get_scenario(self, scenario_id: str) -> Optional[Dict]:
-        return next((row for row in self.read_table(schema.TABLE_SCENARIO)
-                     if row.get("scenario_id") == scenario_id), None)
+        rows = self._read_matching(schema.TABLE_SCENARIO, "scenario_id", scenario_id)
+        return rows[0] if rows else None
 
     def create_scenario(self, name: str, start_datetime: str,
                         description: str = "", notes: str = "") -> str:
@@ -173,8 +277,10 @@ class PlannerStore:
         task_ids = [row["task_id"] for row in self.list_tasks(scenario_id)]
         if task_ids:
             self.delete_task_geometries(task_ids)
-            self.delete_rows(schema.TABLE_TASK, task_ids)
-        self.delete_rows(schema.TABLE_SCENARIO, [scenario_id])
+        with self.transaction():
+            if task_ids:
+                self.delete_rows(schema.TABLE_TASK, task_ids)
+            self.delete_rows(schema.TABLE_SCENARIO, [scenario_id])
 
     def list_resources(self) -> List[Dict]:
         rows = self.read_table(schema.TABLE_RESOURCE)
@@ -182,8 +288,6 @@ class PlannerStore:
 
     def save_resources(self, rows: Sequence[Dict]) -> None:
         old_ids = [row["resource_id"] for row in self.list_resources()]
-        if old_ids:
-            self.delete_rows(schema.TABLE_RESOURCE, old_ids)
         saved = []
         for seq, row in enumerate(rows):
             item = dict(row)
@@ -191,26 +295,27 @@ class PlannerStore:
             item["scenario_id"] = ""
             item["seq"] = seq
             saved.append(item)
-        if saved:
-            self.upsert_rows(schema.TABLE_RESOURCE, saved)
+        with self.transaction():
+            if old_ids:
+                self.delete_rows(schema.TABLE_RESOURCE, old_ids)
+            if saved:
+                self.upsert_rows(schema.TABLE_RESOURCE, saved)
 
     def remap_task_resources(self, valid_ids, default_id: str) -> bool:
         """Point tasks in every scenario at a surviving resource."""
         valid = {str(value) for value in valid_ids}
-        tasks = self.read_table(schema.TABLE_TASK)
-        changed = False
-        for task in tasks:
+        changed = []
+        for task in self.read_table(schema.TABLE_TASK):
             if str(task.get("resource_id") or "") not in valid:
                 task["resource_id"] = default_id
-                changed = True
+                changed.append(task)
         if changed:
-            self._write_table_rows(schema.TABLE_TASK, schema.TASK_FIELDS, tasks)
-            self.sync_geometry_attributes(tasks)
-        return changed
+            self.upsert_rows(schema.TABLE_TASK, changed)
+            self.sync_geometry_attributes(changed)
+        return bool(changed)
 
     def list_tasks(self, scenario_id: str) -> List[Dict]:
-        rows = [row for row in self.read_table(schema.TABLE_TASK)
-                if row.get("scenario_id") == scenario_id]
+        rows = self._read_matching(schema.TABLE_TASK, "scenario_id", scenario_id)
         return sorted(rows, key=lambda row: (int(row.get("seq") or 0), row.get("name") or ""))
 
     def save_tasks(self, scenario_id: str, rows: Sequence[Dict]) -> Dict[str, Dict]:
@@ -222,26 +327,32 @@ class PlannerStore:
         sharer instead of being dropped). The caller should mirror those
         repairs into its in-memory rows.
         """
-        old_ids = [row["task_id"] for row in self.list_tasks(scenario_id)]
+        existing = {str(row["task_id"]): row for row in self.list_tasks(scenario_id)}
         retained = {str(row.get("task_id")) for row in rows if row.get("task_id")}
-        removed = [task_id for task_id in old_ids if str(task_id) not in retained]
+        removed = [task_id for task_id in existing if task_id not in retained]
         repaired: Dict[str, Dict] = {}
         if removed:
             repaired = self._adopt_orphaned_shared_geometries(removed, rows)
             self.delete_task_geometries(removed)
-        if old_ids:
-            self.delete_rows(schema.TABLE_TASK, old_ids)
         now = schema.utc_now_iso()
-        saved = []
+        changed = []
         for seq, row in enumerate(rows):
             item = dict(row)
             item.setdefault("task_id", schema.new_id())
             item.setdefault("created_utc", now)
-            item.update({"scenario_id": scenario_id, "seq": seq, "modified_utc": now})
-            saved.append(item)
-        if saved:
-            self.upsert_rows(schema.TABLE_TASK, saved)
-            self.sync_geometry_attributes(saved)
+            item.update({"scenario_id": scenario_id, "seq": seq})
+            # Only rows that actually differ are written (and re-stamped):
+            # editing one task in a large scenario touches one row.
+            if _task_row_changed(existing.get(str(item["task_id"])), item):
+                item["modified_utc"] = now
+                changed.append(item)
+        with self.transaction():
+            if removed:
+                self.delete_rows(schema.TABLE_TASK, removed)
+            if changed:
+                self.upsert_rows(schema.TABLE_TASK, changed)
+        if changed:
+            self.sync_geometry_attributes(changed)
         return repaired
 
     def _adopt_orphaned_shared_geometries(self, removed_ids, rows) -> Dict[str, Dict]:
@@ -550,6 +661,18 @@ class PlannerStore:
                 layer.triggerRepaint()
 
 
+def _task_row_changed(stored: Optional[Dict], row: Dict) -> bool:
+    """True when ``row`` differs from its stored copy (ignoring the stamp)."""
+    if stored is None:
+        return True
+    for key in set(stored) | set(row):
+        if key == "modified_utc":
+            continue
+        if stored.get(key) != row.get(key):
+            return True
+    return False
+
+
 def _attribute_str(feature, name: str) -> str:
     """Feature attribute as a plain string; "" for NULL/missing values."""
     try:
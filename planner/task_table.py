@@ -25,8 +25,8 @@ from ..qgis_compat import (
 from . import operation_types, schema
 from .feature_ref import shared_owner_task_id, shared_reference
 from .timeline_engine import (
-    KNOT_M_PER_HOUR, TaskSpec, compute_cable, compute_fuel, compute_schedule,
-    parse_speed_profile, profile_duration_hours, resolve_speed_profile,
+    KNOT_M_PER_HOUR, IncrementalScheduler, TaskSpec, compute_cable, compute_fuel,
+    compute_schedule, parse_speed_profile, profile_duration_hours, resolve_speed_profile,
 )
 
 LINK_KEYS = ("layer_id", "layer_source", "layer_name", "feature_id",
@@ -170,6 +170,9 @@ class TaskTableWidget(QTableWidget):
         self.schedule_mode = "forward"
         self.resource_start_datetimes = {}
         self.schedule = compute_schedule(self.anchor, [])
+        # Keeps the last plan so a single-cell edit only re-places the tasks
+        # it reaches instead of the whole campaign.
+        self._scheduler = IncrementalScheduler()
         self.fuel = compute_fuel(self.schedule, {}, [])
         self.cable = compute_cable(self.schedule, {})
         self._muted = False
@@ -1534,7 +1537,7 @@ class TaskTableWidget(QTableWidget):
             row.get("resource_id") or "": _float(row.get("start_offset_hours"))
             for row in self.resources
         }
-        self.schedule = compute_schedule(
+        self.schedule = self._scheduler.schedule(
             self.anchor, specs, resource_offsets, self.schedule_mode,
             self.resource_start_datetimes)
         specs_by_id = {spec.task_id: spec for spec in specs}
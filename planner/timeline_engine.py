@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
 import heapq
 import json
@@ -299,6 +299,86 @@ def _warning_text(existing, message):
     return ((existing + " ") if existing else "") + message
 
 
+_UNASSIGNED_LANE = "__unassigned__"
+
+# Editing any of these changes the dependency graph, the resource lanes, the
+# linked-location groups or the outline, so IncrementalScheduler rebuilds its
+# plan instead of propagating.
+_STRUCTURAL_FIELDS = ("seq", "predecessor_task_id", "resource_id", "location_key",
+                      "is_phase", "outline_level")
+
+
+def _plan_order(tasks):
+    return sorted(list(tasks), key=lambda item: (int(item.seq), item.task_id))
+
+
+def _resource_start_datetimes(values):
+    return {
+        str(key): parsed for key, value in dict(values or {}).items()
+        for parsed in [_as_datetime(value)] if parsed is not None
+    }
+
+
+def _constraint(spec):
+    return _as_datetime(spec.constraint_datetime), str(spec.constraint_type or "").lower()
+
+
+def _place_forward(hours, warning, start, lane_finish, missing, constraint, constraint_type):
+    """Forward-pass ``(start, finish, warning)`` once the dependency start is known."""
+    if lane_finish is not None:
+        start = max(start, lane_finish)
+    if missing:
+        warning = ((warning + " ") if warning else "") + (
+            "Missing predecessor; anchored normally.")
+    if constraint is not None and constraint_type == "snet":
+        start = max(start, constraint)
+    elif constraint is not None and constraint_type == "mso":
+        if start > constraint:
+            warning = _warning_text(
+                warning, "Must-start constraint conflicts with a predecessor/resource.")
+        start = constraint
+    finish = start + timedelta(hours=hours)
+    if constraint is not None and constraint_type == "mfo":
+        target_start = constraint - timedelta(hours=hours)
+        if start > target_start:
+            warning = _warning_text(
+                warning, "Must-finish constraint conflicts with a predecessor/resource.")
+        start, finish = target_start, constraint
+    elif constraint is not None and constraint_type == "fnlt" and finish > constraint:
+        warning = _warning_text(
+            warning, "Finish-no-later constraint is missed by the calculated schedule.")
+    return start, finish, warning
+
+
+def _place_backward(hours, warning, finish, lane_start, missing, constraint, constraint_type):
+    """Backward-pass ``(start, finish, warning)`` once the successor finish is known."""
+    if lane_start is not None:
+        finish = min(finish, lane_start)
+    if missing:
+        warning = ((warning + " ") if warning else "") + (
+            "Missing predecessor; scheduled to the required finish normally.")
+    if constraint is not None and constraint_type == "fnlt":
+        finish = min(finish, constraint)
+    elif constraint is not None and constraint_type == "mfo":
+        if finish < constraint:
+            warning = _warning_text(
+                warning, "Must-finish constraint conflicts with a successor/deadline.")
+        finish = constraint
+    start = finish - timedelta(hours=hours)
+    if constraint is not None and constraint_type == "snet" and start < constraint:
+        warning = _warning_text(
+            warning, "Start-no-earlier constraint conflicts with a successor/deadline.")
+        start = constraint
+        finish = start + timedelta(hours=hours)
+    elif constraint is not None and constraint_type == "mso":
+        if start != constraint:
+            warning = _warning_text(
+                warning, "Must-start constraint overrides the calculated late start.")
+        start = constraint
+        finish = start + timedelta(hours=hours)
+    return start, finish, warning
+
+
 def compute_schedule(anchor: datetime, tasks: Sequence[TaskSpec],
                      resource_start_offsets: Optional[Dict[str, float]] = None,
                      schedule_mode: str = "forward",
@@ -311,298 +391,597 @@ def compute_schedule(anchor: datetime, tasks: Sequence[TaskSpec],
     resource-lane and finish-to-start constraints allow.  Resource start
     offsets only apply to forward schedules.
     """
-    specs = sorted(list(tasks), key=lambda item: (int(item.seq), item.task_id))
-    result = TimelineResult(span_start=anchor, span_end=anchor)
-    if not specs:
-        return result
-    work_specs = [item for item in specs if not item.is_phase]
-    by_id = {item.task_id: item for item in work_specs}
-    indegree = {item.task_id: 0 for item in work_specs}
-    children = {item.task_id: [] for item in work_specs}
-    missing = set()
-    for item in work_specs:
-        predecessor = item.predecessor_task_id
-        if predecessor and predecessor in by_id:
-            indegree[item.task_id] += 1
-            children[predecessor].append(item.task_id)
-        elif predecessor:
-            missing.add(item.task_id)
-            result.errors.append("Task '%s' has a missing predecessor." % (item.name or item.task_id))
-    heap = [(int(item.seq), item.task_id) for item in work_specs if indegree[item.task_id] == 0]
-    heapq.heapify(heap)
-    ordered = []
-    while heap:
-        _, task_id = heapq.heappop(heap)
-        ordered.append(by_id[task_id])
-        for child in children[task_id]:
-            indegree[child] -= 1
-            if indegree[child] == 0:
-                heapq.heappush(heap, (int(by_id[child].seq), child))
-    cycle = len(ordered) != len(work_specs)
-    if cycle:
-        result.errors.append("Predecessor cycle detected; tasks were chained in plan order.")
-        ordered = work_specs
-
-    scheduled = {}
-    resource_start_offsets = dict(resource_start_offsets or {})
-    resource_start_datetimes = {
-        str(key): parsed for key, value in dict(resource_start_datetimes or {}).items()
-        for parsed in [_as_datetime(value)] if parsed is not None
-    }
-    durations = {item.task_id: _duration(item)[0] for item in work_specs}
-    row_by_id = {item.task_id: index + 1 for index, item in enumerate(specs)}
-    if str(schedule_mode or "forward").lower() == "backward":
+    return _SchedulePlan(anchor, tasks, resource_start_offsets, schedule_mode,
+                         resource_start_datetimes).result
+
+
+class IncrementalScheduler:
+    """:func:`compute_schedule` that keeps its plan between calls.
+
+    Pass the full task list on every call, as for ``compute_schedule``; the
+    result is always the same.  When only non-structural fields of some tasks
+    changed (durations, speeds, distances, lags, link types, constraints,
+    names) the scheduler re-places just their downstream cone — explicit
+    successors (predecessors when scheduling backward) and later work in the
+    same resource lane, stopping wherever a task lands where it already was —
+    and re-derives total float over the upstream cone of what moved.  Adding,
+    removing, re-sequencing, re-linking, re-assigning or re-outlining tasks,
+    or a new anchor, mode or resource start, rebuilds the plan.
+
+    Specs are compared by value, so pass fresh ``TaskSpec`` objects rather than
+    mutating the ones passed last time.
+    """
+
+    def __init__(self):
+        self._plan = None
+        # Tasks placed by the last schedule() call (all of them on a rebuild).
+        self.placed_count = 0
+
+    def reset(self):
+        self._plan = None
+
+    def schedule(self, anchor: datetime, tasks: Sequence[TaskSpec],
+                 resource_start_offsets: Optional[Dict[str, float]] = None,
+                 schedule_mode: str = "forward",
+                 resource_start_datetimes: Optional[Dict[str, object]] = None) -> TimelineResult:
+        plan = self._plan
+        edits = None
+        if plan is not None:
+            edits = plan.edits(anchor, tasks, resource_start_offsets, schedule_mode,
+                               resource_start_datetimes)
+        if edits is None:
+            plan = self._plan = _SchedulePlan(
+                anchor, tasks, resource_start_offsets, schedule_mode, resource_start_datetimes)
+            self.placed_count = plan.placed_count
+        else:
+            self.placed_count = plan.update(edits) if edits else 0
+        return plan.result
+
+
+class _SchedulePlan:
+    """Dependency graph, pass output and total float behind one schedule.
+
+    ``compute_schedule`` builds one and returns :attr:`result`;
+    :class:`IncrementalScheduler` keeps it and calls :meth:`update` for edits.
+    Published :class:`ScheduledTask` objects are never changed afterwards:
+    a task whose figures change gets a new object, so earlier results stay
+    as they were returned.
+    """
+
+    def __init__(self, anchor, tasks, resource_start_offsets=None,
+                 schedule_mode="forward", resource_start_datetimes=None):
+        self.anchor = anchor
+        self.schedule_mode = str(schedule_mode or "forward").lower()
+        self.backward = self.schedule_mode == "backward"
+        self.resource_start_offsets = dict(resource_start_offsets or {})
+        self.resource_start_datetimes = _resource_start_datetimes(resource_start_datetimes)
+        self.specs = _plan_order(tasks)
+        self.errors = []
+        self.cycle = False
+        self.missing = set()
+        self.placed_count = 0
+        self.result = TimelineResult(span_start=anchor, span_end=anchor)
+        if not self.specs:
+            return
+        self._build_graph()
+        # Pass output per task (warning before the resource-availability check)
+        # and the lane cursor after it: latest finish in the lane so far going
+        # forward, earliest start going backward.
+        self.placed = {}
+        self.lane_mark = {}
+        for task_id in self.sequence:
+            self.placed[task_id], self.lane_mark[task_id] = self._place(task_id)
+        self.placed_count = len(self.sequence)
+        self._publish(None, None)
+
+    def _build_graph(self):
+        specs = self.specs
+        self.index = {item.task_id: index for index, item in enumerate(specs)}
+        self.rows = {item.task_id: index + 1 for index, item in enumerate(specs)}
+        work_specs = [item for item in specs if not item.is_phase]
+        by_id = self.by_id = {item.task_id: item for item in work_specs}
+        indegree = {item.task_id: 0 for item in work_specs}
+        children = self.children = {item.task_id: [] for item in work_specs}
+        for item in work_specs:
+            predecessor = item.predecessor_task_id
+            if predecessor and predecessor in by_id:
+                indegree[item.task_id] += 1
+                children[predecessor].append(item.task_id)
+            elif predecessor:
+                self.missing.add(item.task_id)
+                self.errors.append(
+                    "Task '%s' has a missing predecessor." % (item.name or item.task_id))
+        heap = [(int(item.seq), item.task_id) for item in work_specs if indegree[item.task_id] == 0]
+        heapq.heapify(heap)
+        ordered = []
+        while heap:
+            _, task_id = heapq.heappop(heap)
+            ordered.append(task_id)
+            for child in children[task_id]:
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    heapq.heappush(heap, (int(by_id[child].seq), child))
+        self.cycle = len(ordered) != len(work_specs)
+        if self.cycle:
+            self.errors.append("Predecessor cycle detected; tasks were chained in plan order.")
+            ordered = [item.task_id for item in work_specs]
         # Reverse topological order makes every explicit successor available
-        # before its predecessor is positioned.  The lane cursor supplies the
-        # same implicit resource sequencing used by the forward pass.
-        lane_start = {}
-        successor_ids = {item.task_id: [] for item in work_specs}
-        for successor in work_specs:
-            if successor.predecessor_task_id in successor_ids:
-                successor_ids[successor.predecessor_task_id].append(successor.task_id)
-        next_scheduled = None
-        for item in reversed(ordered):
-            hours, warning = _duration(item)
-            lane_key = item.resource_id or "__unassigned__"
-            finish = anchor
-            if cycle and next_scheduled is not None:
-                finish = min(finish, next_scheduled.start)
+        # before its predecessor is positioned in a backward pass.
+        self.sequence = ordered[::-1] if self.backward else ordered
+        self.step = {task_id: index for index, task_id in enumerate(self.sequence)}
+        # Each task's lane neighbours in pass order; the lane cursor supplies
+        # the implicit resource sequencing in both directions.
+        self.lane_prev = {}
+        self.lane_next = {}
+        self.lane_members = {}
+        for task_id in self.sequence:
+            lane_key = by_id[task_id].resource_id or _UNASSIGNED_LANE
+            members = self.lane_members.setdefault(lane_key, [])
+            self.lane_prev[task_id] = members[-1] if members else None
+            if members:
+                self.lane_next[members[-1]] = task_id
+            members.append(task_id)
+        self.location_members = {}
+        for item in work_specs:
+            if item.location_key:
+                self.location_members.setdefault(item.location_key, []).append(item.task_id)
+        self.durations = {}
+        self.duration_warnings = {}
+        self.constraints = {}
+        for item in work_specs:
+            self._read_spec(item)
+        # Operational rows beneath each summary row, and the summaries over each.
+        self.phase_members = {}
+        self.phases_of = {}
+        for index, summary in enumerate(specs):
+            if not summary.is_phase:
+                continue
+            members = []
+            level = int(summary.outline_level or 0)
+            for candidate in specs[index + 1:]:
+                if int(candidate.outline_level or 0) <= level:
+                    break
+                if not candidate.is_phase:
+                    members.append(candidate.task_id)
+                    self.phases_of.setdefault(candidate.task_id, []).append(summary.task_id)
+            self.phase_members[summary.task_id] = members
+
+    def _read_spec(self, item):
+        self.durations[item.task_id], self.duration_warnings[item.task_id] = _duration(item)
+        self.constraints[item.task_id] = _constraint(item)
+
+    def _place(self, task_id):
+        """``(ScheduledTask, lane cursor)`` for one task from its placed neighbours."""
+        item = self.by_id[task_id]
+        hours = self.durations[task_id]
+        step = self.step[task_id]
+        previous = self.placed[self.sequence[step - 1]] if step else None
+        lane_prev = self.lane_prev[task_id]
+        lane_value = self.lane_mark[lane_prev] if lane_prev is not None else None
+        missing = task_id in self.missing
+        if self.backward:
+            finish = self.anchor
+            if self.cycle and previous is not None:
+                finish = min(finish, previous.start)
             else:
-                for successor_id in successor_ids.get(item.task_id, []):
-                    successor = scheduled.get(successor_id)
-                    if successor is None:
-                        continue
-                    successor_spec = by_id[successor_id]
-                    finish = min(
-                        finish,
-                        _predecessor_finish(successor_spec, hours, successor),
-                    )
-            if lane_key in lane_start:
-                finish = min(finish, lane_start[lane_key])
-            if item.task_id in missing:
-                warning = ((warning + " ") if warning else "") + (
-                    "Missing predecessor; scheduled to the required finish normally.")
-            constraint = _as_datetime(item.constraint_datetime)
-            constraint_type = str(item.constraint_type or "").lower()
-            if constraint is not None and constraint_type == "fnlt":
-                finish = min(finish, constraint)
-            elif constraint is not None and constraint_type == "mfo":
-                if finish < constraint:
-                    warning = _warning_text(
-                        warning, "Must-finish constraint conflicts with a successor/deadline.")
-                finish = constraint
-            start = finish - timedelta(hours=hours)
-            if constraint is not None and constraint_type == "snet" and start < constraint:
-                warning = _warning_text(
-                    warning, "Start-no-earlier constraint conflicts with a successor/deadline.")
-                start = constraint
-                finish = start + timedelta(hours=hours)
-            elif constraint is not None and constraint_type == "mso":
-                if start != constraint:
-                    warning = _warning_text(
-                        warning, "Must-start constraint overrides the calculated late start.")
-                start = constraint
-                finish = start + timedelta(hours=hours)
-            scheduled_task = ScheduledTask(
-                item.task_id, row_by_id[item.task_id], start, finish, hours,
-                item.resource_id, warning,
-            )
-            scheduled[item.task_id] = scheduled_task
-            lane_start[lane_key] = min(start, lane_start.get(lane_key, start))
-            next_scheduled = scheduled_task
-    else:
-        lane_finish = {}
-        previous = None
-        for item in ordered:
-            hours, warning = _duration(item)
-            lane_key = item.resource_id or "__unassigned__"
-            start = resource_start_datetimes.get(str(item.resource_id or ""))
+                for successor_id in self.children[task_id]:
+                    if self.step[successor_id] < step:
+                        finish = min(finish, _predecessor_finish(
+                            self.by_id[successor_id], hours, self.placed[successor_id]))
+            start, finish, warning = _place_backward(
+                hours, self.duration_warnings[task_id], finish, lane_value, missing,
+                *self.constraints[task_id])
+            mark = start if lane_value is None else min(start, lane_value)
+        else:
+            start = self.resource_start_datetimes.get(str(item.resource_id or ""))
             if start is None:
-                start = anchor + timedelta(hours=max(
-                    0.0, _number(resource_start_offsets.get(item.resource_id, 0.0))))
-            if cycle and previous is not None:
+                start = self.anchor + timedelta(hours=max(
+                    0.0, _number(self.resource_start_offsets.get(item.resource_id, 0.0))))
+            predecessor = item.predecessor_task_id
+            if self.cycle and previous is not None:
                 start = max(start, previous.finish)
-            elif item.predecessor_task_id in scheduled:
-                start = max(start, _dependency_start(
-                    item, hours, scheduled[item.predecessor_task_id]))
-            if lane_key in lane_finish:
-                start = max(start, lane_finish[lane_key])
-            if item.task_id in missing:
-                warning = ((warning + " ") if warning else "") + (
-                    "Missing predecessor; anchored normally.")
-            constraint = _as_datetime(item.constraint_datetime)
-            constraint_type = str(item.constraint_type or "").lower()
-            if constraint is not None and constraint_type == "snet":
-                start = max(start, constraint)
-            elif constraint is not None and constraint_type == "mso":
-                if start > constraint:
-                    warning = _warning_text(
-                        warning, "Must-start constraint conflicts with a predecessor/resource.")
-                start = constraint
-            finish = start + timedelta(hours=hours)
-            if constraint is not None and constraint_type == "mfo":
-                target_start = constraint - timedelta(hours=hours)
-                if start > target_start:
-                    warning = _warning_text(
-                        warning, "Must-finish constraint conflicts with a predecessor/resource.")
-                start, finish = target_start, constraint
-            elif constraint is not None and constraint_type == "fnlt" and finish > constraint:
+            elif predecessor in self.step and self.step[predecessor] < step:
+                start = max(start, _dependency_start(item, hours, self.placed[predecessor]))
+            start, finish, warning = _place_forward(
+                hours, self.duration_warnings[task_id], start, lane_value, missing,
+                *self.constraints[task_id])
+            mark = finish if lane_value is None else max(finish, lane_value)
+        return ScheduledTask(task_id, self.rows[task_id], start, finish, hours,
+                             item.resource_id, warning), mark
+
+    def edits(self, anchor, tasks, resource_start_offsets, schedule_mode,
+              resource_start_datetimes):
+        """``{task_id: spec}`` for the specs that changed since this plan, or
+        ``None`` when the change is structural and the plan must be rebuilt."""
+        if (self.cycle or anchor != self.anchor
+                or str(schedule_mode or "forward").lower() != self.schedule_mode
+                or dict(resource_start_offsets or {}) != self.resource_start_offsets
+                or _resource_start_datetimes(resource_start_datetimes)
+                != self.resource_start_datetimes):
+            return None
+        specs = _plan_order(tasks)
+        if len(specs) != len(self.specs) or (specs and len(self.index) != len(specs)):
+            return None
+        changed = {}
+        for old, new in zip(self.specs, specs):
+            if new.task_id != old.task_id:
+                return None
+            if new is old or new == old:
+                continue
+            if any(getattr(new, name) != getattr(old, name) for name in _STRUCTURAL_FIELDS):
+                return None
+            if new.task_id in self.missing and new.name != old.name:
+                return None  # the name is part of the missing-predecessor error
+            changed[new.task_id] = new
+        return changed
+
+    def update(self, changed):
+        """Apply non-structural spec edits; returns the number of tasks re-placed.
+
+        Tasks are re-placed in pass order from a heap seeded with the edited
+        ones.  A task that moves queues its explicit dependants; a changed
+        lane cursor queues the next task in the lane.
+        """
+        edited = set()
+        for task_id, spec in changed.items():
+            self.specs[self.index[task_id]] = spec
+            if task_id in self.by_id:
+                self.by_id[task_id] = spec
+                self._read_spec(spec)
+                edited.add(task_id)
+        if not edited:
+            return 0
+        queued = set(edited)
+        if self.backward:
+            # The edited link type and lag bound the predecessor's finish.
+            queued.update(self.by_id[task_id].predecessor_task_id for task_id in edited
+                          if self.by_id[task_id].predecessor_task_id in self.by_id)
+        heap = [(self.step[task_id], task_id) for task_id in queued]
+        heapq.heapify(heap)
+        moved = set()
+        count = 0
+        while heap:
+            _, task_id = heapq.heappop(heap)
+            queued.discard(task_id)
+            task, mark = self._place(task_id)
+            count += 1
+            old = self.placed[task_id]
+            reached = []
+            if ((task.start, task.finish, task.duration_hours, task.warning)
+                    != (old.start, old.finish, old.duration_hours, old.warning)):
+                self.placed[task_id] = task
+                moved.add(task_id)
+                if self.backward:
+                    predecessor = self.by_id[task_id].predecessor_task_id
+                    if predecessor in self.by_id:
+                        reached.append(predecessor)
+                else:
+                    reached.extend(self.children[task_id])
+            if mark != self.lane_mark[task_id]:
+                self.lane_mark[task_id] = mark
+                if task_id in self.lane_next:
+                    reached.append(self.lane_next[task_id])
+            for dependant in reached:
+                if dependant not in queued:
+                    queued.add(dependant)
+                    heapq.heappush(heap, (self.step[dependant], dependant))
+        self.placed_count = count
+        self._publish(moved, edited)
+        return count
+
+    def _publish(self, moved, edited):
+        """Summaries, warnings and float from the pass output into a new result.
+
+        ``moved`` and ``edited`` are the tasks whose placement and spec
+        changed; ``None`` means all of them (a new plan).
+        """
+        full = moved is None
+        if full:
+            self.summary_spans = {}
+            self.warnings = {}
+            self.scheduled = {}
+            self.summaries = {}
+            self.resource_lanes = {}
+            self.lane_overlaps = {}
+            self.location_overlaps = {}
+            for task_id in self.sequence:
+                resource_id = self.placed[task_id].resource_id
+                self.resource_lanes.setdefault(resource_id, []).append(task_id)
+        result = TimelineResult(span_start=self.anchor, span_end=self.anchor,
+                                errors=list(self.errors))
+
+        spanned = (self.phase_members if full else
+                   {phase_id for task_id in moved for phase_id in self.phases_of.get(task_id, ())})
+        for phase_id in spanned:
+            descendants = [self.placed[task_id] for task_id in self.phase_members[phase_id]]
+            if descendants:
+                self.summary_spans[phase_id] = (
+                    min(item.start for item in descendants),
+                    max(item.finish for item in descendants), "")
+            else:
+                self.summary_spans[phase_id] = (
+                    self.anchor, self.anchor, "Summary row has no operational tasks.")
+        result.span_start = min([self.anchor] + [item.start for item in self.placed.values()])
+        result.span_end = max([self.anchor] + [item.finish for item in self.placed.values()])
+
+        for task_id in (self.sequence if full else moved | edited):
+            task = self.placed[task_id]
+            warning = task.warning
+            available = self.resource_start_datetimes.get(str(task.resource_id or ""))
+            if self.backward and available is not None and task.start < available:
                 warning = _warning_text(
-                    warning, "Finish-no-later constraint is missed by the calculated schedule.")
-            scheduled_task = ScheduledTask(
-                item.task_id, row_by_id[item.task_id], start, finish, hours,
-                item.resource_id, warning,
-            )
-            scheduled[item.task_id] = scheduled_task
-            lane_finish[lane_key] = max(finish, lane_finish.get(lane_key, finish))
-            previous = scheduled_task
-
-    all_scheduled = dict(scheduled)
-    for index, summary in enumerate(specs):
-        if not summary.is_phase:
-            continue
-        descendants = []
-        summary_level = int(summary.outline_level or 0)
-        for candidate in specs[index + 1:]:
-            if int(candidate.outline_level or 0) <= summary_level:
-                break
-            if not candidate.is_phase and candidate.task_id in scheduled:
-                descendants.append(scheduled[candidate.task_id])
-        if descendants:
-            start = min(item.start for item in descendants)
-            finish = max(item.finish for item in descendants)
-            warning = ""
-        else:
-            start = finish = anchor
-            warning = "Summary row has no operational tasks."
-        all_scheduled[summary.task_id] = ScheduledTask(
-            summary.task_id, row_by_id[summary.task_id], start, finish,
-            (finish - start).total_seconds() / 3600.0, "", warning)
-
-    result.tasks = sorted(all_scheduled.values(), key=lambda item: item.row)
-    for task in sorted(scheduled.values(), key=lambda item: (item.start, item.row)):
-        result.by_resource.setdefault(task.resource_id, []).append(task)
-    result.span_start = min([anchor] + [item.start for item in result.tasks])
-    result.span_end = max([anchor] + [item.finish for item in result.tasks])
-    if str(schedule_mode or "forward").lower() == "backward":
-        for task in scheduled.values():
-            available = resource_start_datetimes.get(str(task.resource_id or ""))
-            if available is not None and task.start < available:
-                message = "Task '%s' starts before its resource is available." % (
-                    by_id[task.task_id].name or task.task_id)
-                task.warning = _warning_text(task.warning, message)
-    for task in scheduled.values():
-        if task.warning:
-            result.warnings.append("%s: %s" % (
-                by_id[task.task_id].name or task.task_id, task.warning))
-    _detect_schedule_conflicts(result, scheduled, by_id)
-    _apply_total_float(result, scheduled, by_id, durations)
-    for index, summary in enumerate(specs):
-        if not summary.is_phase:
-            continue
-        descendants = []
-        level = int(summary.outline_level or 0)
-        for candidate in specs[index + 1:]:
-            if int(candidate.outline_level or 0) <= level:
-                break
-            if not candidate.is_phase and candidate.task_id in scheduled:
-                descendants.append(scheduled[candidate.task_id])
-        target = all_scheduled.get(summary.task_id)
-        if target is not None and descendants:
-            target.total_float_hours = min(item.total_float_hours for item in descendants)
-            target.critical = any(item.critical for item in descendants)
-    return result
-
-
-def _apply_total_float(result, scheduled, specs_by_id, durations):
-    """Calculate CPM-style total float over explicit links and resource lanes."""
-    if not scheduled or result.span_end is None:
-        return
-    edges = []
-    explicit = set()
-    for successor in specs_by_id.values():
-        predecessor = successor.predecessor_task_id
-        if predecessor in scheduled and successor.task_id in scheduled:
-            edge = (predecessor, successor.task_id,
-                    str(successor.dependency_type or "FS").upper(),
-                    _number(successor.lag_hours))
-            edges.append(edge)
-            explicit.add((predecessor, successor.task_id))
-    lanes = {}
-    for task in scheduled.values():
-        lanes.setdefault(task.resource_id or "__unassigned__", []).append(task)
-    for lane in lanes.values():
-        lane.sort(key=lambda item: (item.start, item.row))
-        for predecessor, successor in zip(lane, lane[1:]):
-            if (predecessor.task_id, successor.task_id) not in explicit:
-                edges.append((predecessor.task_id, successor.task_id, "FS", 0.0))
-
-    latest = {
-        task_id: result.span_end - timedelta(hours=durations.get(task_id, 0.0))
-        for task_id in scheduled
-    }
-    for task_id, spec in specs_by_id.items():
-        constraint = _as_datetime(spec.constraint_datetime)
-        if constraint is None:
-            continue
-        kind = str(spec.constraint_type or "").lower()
-        if kind in ("fnlt", "mfo"):
-            latest[task_id] = min(
-                latest[task_id], constraint - timedelta(hours=durations.get(task_id, 0.0)))
-        elif kind == "mso":
-            latest[task_id] = min(latest[task_id], constraint)
-
-    for _pass in range(max(1, len(scheduled))):
-        changed = False
-        for predecessor_id, successor_id, relation, lag_hours in edges:
-            successor_start = latest[successor_id]
-            predecessor_hours = durations.get(predecessor_id, 0.0)
-            successor_hours = durations.get(successor_id, 0.0)
-            lag = timedelta(hours=lag_hours)
-            if relation == "SS":
-                allowed = successor_start - lag
-            elif relation == "FF":
-                allowed = (successor_start + timedelta(hours=successor_hours)
-                           - lag - timedelta(hours=predecessor_hours))
-            elif relation == "SF":
-                allowed = successor_start + timedelta(hours=successor_hours) - lag
+                    warning, "Task '%s' starts before its resource is available." % (
+                        self.by_id[task_id].name or task_id))
+            self.warnings[task_id] = warning
+
+        floated = self._update_float(result.span_end, None if full else moved, edited)
+        for task_id in (self.sequence if full else moved | edited | floated):
+            value = self.float_hours[task_id]
+            self.scheduled[task_id] = replace(
+                self.placed[task_id], warning=self.warnings[task_id],
+                total_float_hours=value, critical=value <= 1e-6)
+        for phase_id in (self.phase_members if full else set(spanned) | {
+                phase_id for task_id in floated for phase_id in self.phases_of.get(task_id, ())}):
+            start, finish, warning = self.summary_spans[phase_id]
+            summary = ScheduledTask(
+                phase_id, self.rows[phase_id], start, finish,
+                (finish - start).total_seconds() / 3600.0, "", warning)
+            descendants = [self.scheduled[task_id] for task_id in self.phase_members[phase_id]]
+            if descendants:
+                summary.total_float_hours = min(item.total_float_hours for item in descendants)
+                summary.critical = any(item.critical for item in descendants)
+            self.summaries[phase_id] = summary
+
+        result.tasks = [
+            self.summaries[item.task_id] if item.is_phase else self.scheduled[item.task_id]
+            for item in self.specs
+        ]
+        for resource_id in (list(self.resource_lanes) if full else
+                            {self.placed[task_id].resource_id for task_id in moved}):
+            lane = self.resource_lanes[resource_id]
+            lane.sort(key=self._start_row)
+            self.lane_overlaps[resource_id] = _overlapping_pairs(
+                [self.placed[task_id] for task_id in lane])
+        for resource_id, lane in sorted(self.resource_lanes.items(),
+                                        key=lambda entry: self._start_row(entry[1][0])):
+            result.by_resource[resource_id] = [self.scheduled[task_id] for task_id in lane]
+        for task_id, warning in self.warnings.items():
+            if warning:
+                result.warnings.append("%s: %s" % (self.by_id[task_id].name or task_id, warning))
+        result.warnings.extend(self._conflict_warnings(moved, full))
+        self.result = result
+
+    def _conflict_warnings(self, moved, full):
+        """Resource overlaps and simultaneous work at the same linked location.
+
+        Overlaps are found per resource lane and per location, re-swept only
+        where a task moved, and reported in plan time order.
+        """
+        for location in (list(self.location_members) if full else
+                         {self.by_id[task_id].location_key for task_id in moved} - {""}):
+            members = sorted(self.location_members[location], key=self._start_row)
+            self.location_overlaps[location] = [
+                (first, second) for first, second in
+                _overlapping_pairs([self.placed[task_id] for task_id in members])
+                if self.placed[first].resource_id != self.placed[second].resource_id
+            ]
+        pairs = [pair for overlaps in self.lane_overlaps.values() for pair in overlaps]
+        pairs.extend(pair for overlaps in self.location_overlaps.values() for pair in overlaps)
+        pairs.sort(key=lambda pair: (self._start_row(pair[0]), self._start_row(pair[1])))
+        warnings = []
+        for first, second in pairs:
+            names = (self.by_id[first].name or first, self.by_id[second].name or second)
+            if self.placed[first].resource_id == self.placed[second].resource_id:
+                warnings.append("Resource conflict: '%s' overlaps '%s'." % names)
             else:
-                allowed = successor_start - lag - timedelta(hours=predecessor_hours)
-            if allowed < latest[predecessor_id]:
-                latest[predecessor_id] = allowed
-                changed = True
-        if not changed:
-            break
-    for task_id, task in scheduled.items():
-        value = max(0.0, (latest[task_id] - task.start).total_seconds() / 3600.0)
-        task.total_float_hours = value
-        task.critical = value <= 1e-6
-
-
-def _detect_schedule_conflicts(result, scheduled, specs_by_id):
-    """Report resource overlaps and simultaneous work at the same location."""
-    tasks = sorted(scheduled.values(), key=lambda item: (item.start, item.row))
+                warnings.append(
+                    "SIMOPS review: '%s' and '%s' overlap at the same linked location." % names)
+        return warnings
+
+    def _start_row(self, task_id):
+        task = self.placed[task_id]
+        return task.start, task.row
+
+    def _update_float(self, span_end, moved, edited):
+        """Refresh ``float_hours``; returns the tasks whose float changed.
+
+        After an edit only the upstream cone of the tasks whose duration,
+        constraint, links or lane neighbours changed is re-derived, and only
+        as far as latest starts actually change.  The full pass runs for a new
+        plan, when the plan end moved (every bound moves with it), or when the
+        link graph has a cycle.
+        """
+        if moved is not None and span_end == self.float_end and self.float_acyclic:
+            floated = self._propagate_float(moved, edited)
+            if floated is not None:
+                return floated
+        return self._relax_float(span_end)
+
+    def _relax_float(self, span_end):
+        """CPM-style total float over explicit links and resource lanes."""
+        self.float_end = span_end
+        explicit = self.float_explicit = set()
+        links = self.float_links = {task_id: {} for task_id in self.placed}
+        parents = self.float_parents = {task_id: set() for task_id in self.placed}
+        edges = []
+        for successor in self.by_id.values():
+            predecessor = successor.predecessor_task_id
+            if predecessor in self.placed:
+                edges.append((predecessor, successor.task_id,
+                              str(successor.dependency_type or "FS").upper(),
+                              _number(successor.lag_hours)))
+                explicit.add((predecessor, successor.task_id))
+        self.lane_links = {}
+        for lane_key, members in self.lane_members.items():
+            pairs = self.lane_links[lane_key] = _lane_links(
+                [self.placed[task_id] for task_id in members], explicit)
+            edges.extend((predecessor, successor, "FS", 0.0) for predecessor, successor in pairs)
+        for predecessor, successor, relation, lag_hours in edges:
+            links[predecessor][successor] = (relation, lag_hours)
+            parents[successor].add(predecessor)
+
+        # Links ordered successors-first.  On an acyclic graph one sweep in
+        # that order gives every latest start exactly, and edits may re-derive
+        # any cone the same way; with a cycle the relaxation below decides.
+        waiting = {task_id: len(links[task_id]) for task_id in links}
+        ready = [task_id for task_id, count in waiting.items() if count == 0]
+        order = []
+        while ready:
+            task_id = ready.pop()
+            order.append(task_id)
+            for predecessor in parents[task_id]:
+                waiting[predecessor] -= 1
+                if waiting[predecessor] == 0:
+                    ready.append(predecessor)
+        self.float_acyclic = len(order) == len(links)
+        self.float_rank = {task_id: index for index, task_id in enumerate(order)}
+        latest = self.latest = {}
+        if self.float_acyclic:
+            for task_id in order:
+                latest[task_id] = self._latest_start(task_id)
+        else:
+            for task_id in self.placed:
+                latest[task_id] = _latest_start_bound(
+                    span_end, self.durations[task_id], *self.constraints[task_id])
+            for _pass in range(max(1, len(self.placed))):
+                changed = False
+                for predecessor_id, successor_id, relation, lag_hours in edges:
+                    allowed = _allowed_latest(relation, lag_hours, latest[successor_id],
+                                              self.durations[predecessor_id],
+                                              self.durations[successor_id])
+                    if allowed < latest[predecessor_id]:
+                        latest[predecessor_id] = allowed
+                        changed = True
+                if not changed:
+                    break
+        self.float_hours = {
+            task_id: _float_hours(latest[task_id], task.start)
+            for task_id, task in self.placed.items()
+        }
+        return set(self.placed)
+
+    def _propagate_float(self, moved, edited):
+        """Re-derive latest starts upstream of an edit.
+
+        Returns ``None`` when a new lane link breaks the successors-first
+        order; the caller then runs the full pass.
+        """
+        links, parents = self.float_links, self.float_parents
+        seeds = set()
+        added = []
+        for lane_key in {self.placed[task_id].resource_id or _UNASSIGNED_LANE for task_id in moved}:
+            pairs = _lane_links([self.placed[task_id] for task_id in self.lane_members[lane_key]],
+                                self.float_explicit)
+            old_pairs = set(self.lane_links[lane_key])
+            new_pairs = set(pairs)
+            for predecessor, successor in old_pairs - new_pairs:
+                del links[predecessor][successor]
+                parents[successor].discard(predecessor)
+                seeds.add(predecessor)
+            for predecessor, successor in new_pairs - old_pairs:
+                added.append((predecessor, successor))
+                links[predecessor][successor] = ("FS", 0.0)
+                parents[successor].add(predecessor)
+                seeds.add(predecessor)
+            self.lane_links[lane_key] = pairs
+        for task_id in edited:
+            spec = self.by_id[task_id]
+            if spec.predecessor_task_id in self.placed:
+                links[spec.predecessor_task_id][task_id] = (
+                    str(spec.dependency_type or "FS").upper(), _number(spec.lag_hours))
+            # Duration and constraint bound this task's own latest start and
+            # what its predecessors are allowed.
+            seeds.add(task_id)
+            seeds.update(parents[task_id])
+
+        # Successors-first rank from the last full sweep: re-deriving in rank
+        # order sees every successor settled.  A new lane link against that
+        # order (a task overtook another) needs a new sweep.
+        rank = self.float_rank
+        if any(rank[successor] > rank[predecessor] for predecessor, successor in added):
+            return None
+        heap = [(rank[task_id], task_id) for task_id in seeds]
+        heapq.heapify(heap)
+        queued = set(seeds)
+        changed = set()
+        while heap:
+            _, task_id = heapq.heappop(heap)
+            value = self._latest_start(task_id)
+            if value == self.latest[task_id]:
+                continue
+            self.latest[task_id] = value
+            changed.add(task_id)
+            for predecessor in parents[task_id]:
+                if predecessor not in queued:
+                    queued.add(predecessor)
+                    heapq.heappush(heap, (rank[predecessor], predecessor))
+
+        floated = set()
+        for task_id in changed | moved:
+            value = _float_hours(self.latest[task_id], self.placed[task_id].start)
+            if value != self.float_hours[task_id]:
+                self.float_hours[task_id] = value
+                floated.add(task_id)
+        return floated
+
+    def _latest_start(self, task_id):
+        hours = self.durations[task_id]
+        value = _latest_start_bound(self.float_end, hours, *self.constraints[task_id])
+        for successor_id, (relation, lag_hours) in self.float_links[task_id].items():
+            value = min(value, _allowed_latest(relation, lag_hours, self.latest[successor_id],
+                                               hours, self.durations[successor_id]))
+        return value
+
+
+def _lane_links(lane, explicit):
+    """Implied finish-to-start pairs between consecutive tasks of one lane."""
+    lane = sorted(lane, key=lambda item: (item.start, item.row))
+    return [(predecessor.task_id, successor.task_id)
+            for predecessor, successor in zip(lane, lane[1:])
+            if (predecessor.task_id, successor.task_id) not in explicit]
+
+
+def _latest_start_bound(span_end, hours, constraint, constraint_type):
+    """Latest start a task allows itself: the plan end or its constraint."""
+    latest = span_end - timedelta(hours=hours)
+    if constraint is not None and constraint_type in ("fnlt", "mfo"):
+        latest = min(latest, constraint - timedelta(hours=hours))
+    elif constraint is not None and constraint_type == "mso":
+        latest = min(latest, constraint)
+    return latest
+
+
+def _allowed_latest(relation, lag_hours, successor_start, predecessor_hours, successor_hours):
+    """Latest predecessor start one link allows given its successor's latest start."""
+    lag = timedelta(hours=lag_hours)
+    if relation == "SS":
+        return successor_start - lag
+    if relation == "FF":
+        return (successor_start + timedelta(hours=successor_hours)
+                - lag - timedelta(hours=predecessor_hours))
+    if relation == "SF":
+        return successor_start + timedelta(hours=successor_hours) - lag
+    return successor_start - lag - timedelta(hours=predecessor_hours)
+
+
+def _float_hours(latest, start):
+    return max(0.0, (latest - start).total_seconds() / 3600.0)
+
+
+def _overlapping_pairs(tasks):
+    """``(first, second)`` ids of overlapping non-empty tasks, sorted by ``(start, row)``."""
+    pairs = []
     for index, first in enumerate(tasks):
         if first.finish <= first.start:
             continue
-        for second in tasks[index + 1:]:
+        for later in range(index + 1, len(tasks)):
+            second = tasks[later]
             if second.start >= first.finish:
                 break
             if second.finish <= second.start:
                 continue
-            first_spec = specs_by_id[first.task_id]
-            second_spec = specs_by_id[second.task_id]
-            if first.resource_id == second.resource_id:
-                result.warnings.append(
-                    "Resource conflict: '%s' overlaps '%s'." % (
-                        first_spec.name or first.task_id,
-                        second_spec.name or second.task_id))
-            elif (first_spec.location_key and
-                  first_spec.location_key == second_spec.location_key):
-                result.warnings.append(
-                    "SIMOPS review: '%s' and '%s' overlap at the same linked location." % (
-                        first_spec.name or first.task_id,
-                        second_spec.name or second.task_id))
+            pairs.append((first.task_id, second.task_id))
+    return pairs
 
 
 def compute_fuel(result: TimelineResult, specs_by_id: Dict[str, TaskSpec],
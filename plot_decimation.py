@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""Peak-preserving decimation for long plotted series.
+
+Pure NumPy; no Qt or QGIS imports.
+
+A :class:`MinMaxPyramid` is built once per x-sorted series. Level *k* splits
+the samples into consecutive bins of ``factor**k`` and keeps the index of each
+bin's minimum and maximum, so drawing a level through those indices in order
+keeps every spike and trough visible however far the view is zoomed out.
+:meth:`MinMaxPyramid.indices` picks, for a visible x-range, the finest level
+that fits a point budget and draws the rest of the series from the coarsest
+level, so the plotted item still spans (and auto-ranges to) the whole series.
+"""
+
+from __future__ import annotations
+
+from typing import List, Tuple
+
+import numpy as np
+
+DEFAULT_MAX_POINTS = 40000
+_FACTOR = 4
+_OVERVIEW_BINS = 512
+
+
+class MinMaxPyramid:
+    """Min/max envelopes of one series at ``factor**k`` bin sizes."""
+
+    def __init__(self, x: np.ndarray, y: np.ndarray, factor: int = _FACTOR,
+                 overview_bins: int = _OVERVIEW_BINS):
+        """``x`` must be sorted ascending; ``x`` and ``y`` must be finite."""
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        self.factor = max(2, int(factor))
+        # (bin size, per-bin index of min, per-bin index of max), finest first.
+        self.levels: List[Tuple[int, np.ndarray, np.ndarray]] = []
+        n = self.y.size
+        imin = imax = np.arange(n, dtype=np.int64)
+        size = 1
+        while imin.size > overview_bins:
+            imin = self._reduce(imin, np.argmin)
+            imax = self._reduce(imax, np.argmax)
+            size *= self.factor
+            self.levels.append((size, imin, imax))
+
+    def __len__(self) -> int:
+        return int(self.y.size)
+
+    def _reduce(self, index: np.ndarray, pick) -> np.ndarray:
+        pad = (-index.size) % self.factor
+        if pad:
+            index = np.concatenate([index, np.repeat(index[-1], pad)])
+        groups = index.reshape(-1, self.factor)
+        choice = pick(self.y[groups], axis=1)
+        return groups[np.arange(groups.shape[0]), choice]
+
+    def _envelope(self, level: int, b0: int, b1: int) -> np.ndarray:
+        _size, imin, imax = self.levels[level]
+        lo = imin[b0:b1]
+        hi = imax[b0:b1]
+        out = np.empty(2 * lo.size, dtype=np.int64)
+        out[0::2] = np.minimum(lo, hi)
+        out[1::2] = np.maximum(lo, hi)
+        return out
+
+    def indices(self, x0: float = -np.inf, x1: float = np.inf,
+                max_points: int = DEFAULT_MAX_POINTS) -> np.ndarray:
+        """Sorted sample indices to draw for the x-range ``[x0, x1]``.
+
+        Samples inside the range come from the finest level whose envelope
+        fits ``max_points`` (all samples when they fit); samples outside it
+        come from the coarsest level.
+        """
+        n = self.y.size
+        if n <= max_points or not self.levels:
+            return np.arange(n, dtype=np.int64)
+        i0 = max(int(np.searchsorted(self.x, x0, side="left")) - 1, 0)
+        i1 = min(int(np.searchsorted(self.x, x1, side="right")) + 1, n)
+        if i1 - i0 <= max_points:
+            middle = np.arange(i0, i1, dtype=np.int64)
+        else:
+            level = len(self.levels) - 1
+            for k, (size, _imin, _imax) in enumerate(self.levels):
+                if 2 * -(-(i1 - i0) // size) <= max_points:
+                    level = k
+                    break
+            size = self.levels[level][0]
+            b0, b1 = i0 // size, -(-i1 // size)
+            middle = self._envelope(level, b0, b1)
+            i0, i1 = b0 * size, min(b1 * size, n)
+        top = len(self.levels) - 1
+        top_size, top_min, _top_max = self.levels[top]
+        left = self._envelope(top, 0, i0 // top_size)
+        right = self._envelope(top, -(-i1 // top_size), top_min.size)
+        ends = np.array([0, n - 1], dtype=np.int64)
+        return np.unique(np.concatenate([ends, left, middle, right]))
+
+    def view(self, x0: float = -np.inf, x1: float = np.inf,
+             max_points: int = DEFAULT_MAX_POINTS) -> Tuple[np.ndarray, np.ndarray]:
+        """``(x, y)`` to draw for the x-range ``[x0, x1]`` (see :meth:`indices`)."""
+        idx = self.indices(x0, x1, max_points)
+        return self.x[idx], self.y[idx]
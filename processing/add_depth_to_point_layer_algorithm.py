@@ -2,7 +2,7 @@
 """AddDepthToPointLayerAlgorithm
 
 Adds depth/elevation attributes to an input point layer by sampling:
-- one or more raster layers (via provider.sample), and/or
+- one or more raster layers (tile-cached block reads), and/or
 - one or more contour line layers (nearest feature, with optional search radius).
 
 Designed for KP point workflows.
@@ -86,7 +86,7 @@ class AddDepthToPointLayerAlgorithm(QgsProcessingAlgorithm):
     def _build_raster_samplers(
         rasters: Sequence[QgsRasterLayer],
         points_crs,
-    ) -> List[Tuple[QgsRasterLayer, Optional[QgsCoordinateTransform]]]:
+    ) -> List[depth_sampling.RasterSampler]:
         return depth_sampling.build_raster_samplers(rasters, points_crs)
 
     @staticmethod
@@ -100,7 +100,7 @@ class AddDepthToPointLayerAlgorithm(QgsProcessingAlgorithm):
     @staticmethod
     def _sample_rasters(
         point: QgsPointXY,
-        raster_samplers: Sequence[Tuple[QgsRasterLayer, Optional[QgsCoordinateTransform]]],
+        raster_samplers: Sequence[depth_sampling.RasterSampler],
         band: int,
     ) -> Tuple[Optional[float], Optional[str], List[Tuple[str, Optional[float]]]]:
         """Return (best_value, best_source_name, all_values)."""
@@ -283,12 +283,13 @@ class AddDepthToPointLayerAlgorithm(QgsProcessingAlgorithm):
         out_fields.append(QgsField('depth_source', FIELD_TYPE_STRING))
         out_fields.append(QgsField('depth_contour_dist_m', FIELD_TYPE_DOUBLE))
 
-        raster_field_map: List[Tuple[str, Tuple[QgsRasterLayer, Optional[QgsCoordinateTransform]]]] = []
+        raster_field_map: List[Tuple[str, depth_sampling.RasterSampler]] = []
         if output_mode == 1 and raster_samplers:
-            for raster, transform in raster_samplers:
+            for sampler in raster_samplers:
+                raster = sampler[0]
                 fld = self._safe_field_name(f"depth_{raster.name()}", used_field_names)
                 out_fields.append(QgsField(fld, FIELD_TYPE_DOUBLE))
-                raster_field_map.append((fld, (raster, transform)))
+                raster_field_map.append((fld, sampler))
 
         (sink, dest_id) = self.parameterAsSink(
             parameters,
@@ -388,7 +389,7 @@ class AddDepthToPointLayerAlgorithm(QgsProcessingAlgorithm):
             if output_mode == 1 and raster_field_map:
                 # Map raster names to values so we can fill per-raster fields.
                 raster_values_by_name = {name: val for name, val in raster_all}
-                for fld, (raster, _transform) in raster_field_map:
+                for fld, (raster, _transform, _blocks) in raster_field_map:
                     attrs.append(raster_values_by_name.get(raster.name()))
 
             out_feat.setAttributes(attrs)
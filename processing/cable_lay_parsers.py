@@ -37,7 +37,7 @@ from qgis.core import (
     QgsWkbTypes,
 )
 
-from ..qgis_compat import FIELD_TYPE_DOUBLE, FIELD_TYPE_LONG_LONG, FIELD_TYPE_STRING
+from ..qgis_compat import FIELD_TYPE_BINARY, FIELD_TYPE_DOUBLE, FIELD_TYPE_LONG_LONG, FIELD_TYPE_STRING
 
 WGS84 = "EPSG:4326"
 
@@ -264,6 +264,8 @@ def qgis_field_for(type_str: str, name: str) -> QgsField:
         return QgsField(name, FIELD_TYPE_LONG_LONG)
     if type_str == "float":
         return QgsField(name, FIELD_TYPE_DOUBLE)
+    if type_str == "blob":
+        return QgsField(name, FIELD_TYPE_BINARY)
     return QgsField(name, FIELD_TYPE_STRING)
 
 
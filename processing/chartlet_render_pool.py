@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""Bounded pool of map render jobs for chartlet export.
+
+Exporting a print layout per chartlet renders every map one after another on
+the algorithm thread. :class:`ChartletRenderPool` instead keeps up to
+``max_jobs`` ``QgsMapRendererParallelJob`` s in flight (each one also renders
+its layers in parallel) and writes the PNGs in submission order as the
+oldest job finishes, so output names, order and bytes do not depend on the
+concurrency.
+
+Everything that does not change between chartlets is prepared once and
+shared by every job: one ``QgsMapSettings`` template (layers, CRS, transform
+context, DPI, labeling engine settings, project expression scopes), and one
+decoration layout holding the scale bar and north arrow, which is drawn as a
+transparent overlay on top of each rendered map.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Deque, List, Optional, Sequence, Tuple
+
+from qgis.PyQt.QtCore import QSize, QThread
+from qgis.PyQt.QtGui import QColor, QImage, QPainter
+from qgis.core import (
+    QgsExpressionContext,
+    QgsExpressionContextUtils,
+    QgsFillSymbol,
+    QgsLayoutExporter,
+    QgsLayoutItemMap,
+    QgsLayoutItemPicture,
+    QgsLayoutItemScaleBar,
+    QgsLayoutPoint,
+    QgsLayoutSize,
+    QgsMapLayer,
+    QgsMapRendererParallelJob,
+    QgsMapSettings,
+    QgsPrintLayout,
+    QgsRectangle,
+    QgsUnitTypes,
+)
+
+from ..qgis_compat import MAP_SETTINGS_ANTIALIASING, MAP_SETTINGS_DRAW_SELECTION
+
+# Chartlets are laid out on a 200 mm wide page; symbol sizes in mm / points
+# scale with the resulting DPI exactly as they did in the layout export.
+PAGE_WIDTH_MM = 200.0
+NORTH_ARROW_SVG = ':/images/north_arrows/layout_default_north_arrow.svg'
+
+
+def default_max_jobs() -> int:
+    """Concurrent chartlet jobs: one per core, at most four."""
+    return max(1, min(4, QThread.idealThreadCount()))
+
+
+class ChartletRenderPool:
+    """Render map chartlets through at most ``max_jobs`` concurrent jobs."""
+
+    def __init__(self, project, layers: Sequence[QgsMapLayer], dest_crs, transform_context,
+                 width_px: int, height_px: int, add_scalebar: bool = True,
+                 add_north_arrow: bool = True, max_jobs: Optional[int] = None):
+        self.width_px = int(width_px)
+        self.height_px = int(height_px)
+        self.max_jobs = max(1, int(max_jobs or default_max_jobs()))
+        self.dpi = self.width_px * 25.4 / PAGE_WIDTH_MM
+        self._active: Deque[Tuple[QgsMapRendererParallelJob, str, Optional[QImage]]] = deque()
+        self._template = self._map_settings_template(project, layers, dest_crs, transform_context)
+        self._layout = None
+        self._overlay_map = None
+        if add_scalebar or add_north_arrow:
+            self._build_decorations(project, dest_crs, add_scalebar, add_north_arrow)
+
+    def _map_settings_template(self, project, layers, dest_crs, transform_context) -> QgsMapSettings:
+        settings = QgsMapSettings()
+        settings.setLayers(list(layers))
+        settings.setDestinationCrs(dest_crs)
+        settings.setTransformContext(transform_context)
+        settings.setEllipsoid(project.ellipsoid())
+        settings.setOutputSize(QSize(self.width_px, self.height_px))
+        settings.setOutputDpi(self.dpi)
+        settings.setBackgroundColor(QColor(255, 255, 255))
+        settings.setFlag(MAP_SETTINGS_ANTIALIASING, True)
+        settings.setFlag(MAP_SETTINGS_DRAW_SELECTION, False)
+        settings.setLabelingEngineSettings(project.labelingEngineSettings())
+        context = QgsExpressionContext()
+        context.appendScope(QgsExpressionContextUtils.globalScope())
+        context.appendScope(QgsExpressionContextUtils.projectScope(project))
+        settings.setExpressionContext(context)
+        return settings
+
+    def _build_decorations(self, project, dest_crs, add_scalebar, add_north_arrow):
+        """Scale bar / north arrow layout on a transparent page.
+
+        Its map item draws no layers; it only gives the scale bar the
+        chartlet's extent and scale.
+        """
+        width_mm = PAGE_WIDTH_MM
+        height_mm = width_mm * (float(self.height_px) / float(self.width_px))
+        layout = QgsPrintLayout(project)
+        layout.initializeDefaults()
+        pc = layout.pageCollection()
+        if pc.pageCount() > 0:
+            page = pc.page(0)
+            page.setPageSize(QgsLayoutSize(width_mm, height_mm, QgsUnitTypes.LayoutMillimeters))
+            page.setPageStyleSymbol(QgsFillSymbol.createSimple({'style': 'no', 'outline_style': 'no'}))
+
+        map_item = QgsLayoutItemMap(layout)
+        map_item.setCrs(dest_crs)
+        map_item.setLayers([])
+        map_item.setKeepLayerSet(True)
+        map_item.setBackgroundEnabled(False)
+        map_item.setFrameEnabled(False)
+        map_item.attemptResize(QgsLayoutSize(width_mm, height_mm, QgsUnitTypes.LayoutMillimeters))
+        map_item.attemptMove(QgsLayoutPoint(0, 0, QgsUnitTypes.LayoutMillimeters))
+        layout.addLayoutItem(map_item)
+
+        if add_scalebar:
+            scalebar_item = QgsLayoutItemScaleBar(layout)
+            scalebar_item.setLinkedMap(map_item)
+            scalebar_item.applyDefaultSize()
+            scalebar_item.attemptMove(QgsLayoutPoint(5, height_mm - 15, QgsUnitTypes.LayoutMillimeters))
+            layout.addLayoutItem(scalebar_item)
+
+        if add_north_arrow:
+            north_item = QgsLayoutItemPicture(layout)
+            north_item.setPicturePath(NORTH_ARROW_SVG)
+            north_item.attemptResize(QgsLayoutSize(15, 15, QgsUnitTypes.LayoutMillimeters))
+            north_item.attemptMove(QgsLayoutPoint(width_mm - 20, 5, QgsUnitTypes.LayoutMillimeters))
+            layout.addLayoutItem(north_item)
+
+        self._layout = layout
+        self._overlay_map = map_item
+
+    def _overlay(self, extent: QgsRectangle) -> Optional[QImage]:
+        if self._layout is None:
+            return None
+        # The linked scale bar follows extentChanged() and re-sizes itself.
+        self._overlay_map.setExtent(extent)
+        exporter = QgsLayoutExporter(self._layout)
+        return exporter.renderPageToImage(0, QSize(self.width_px, self.height_px), self.dpi)
+
+    def submit(self, extent: QgsRectangle, out_path: str) -> List[Tuple[str, bool]]:
+        """Queue one chartlet; returns ``(path, ok)`` for chartlets finished meanwhile.
+
+        Blocks on the oldest job while ``max_jobs`` are already rendering.
+        """
+        finished = []
+        while len(self._active) >= self.max_jobs:
+            finished.append(self._finish_oldest())
+
+        settings = QgsMapSettings(self._template)
+        settings.setExtent(extent)
+        context = QgsExpressionContext(self._template.expressionContext())
+        context.appendScope(QgsExpressionContextUtils.mapSettingsScope(settings))
+        settings.setExpressionContext(context)
+
+        job = QgsMapRendererParallelJob(settings)
+        job.start()
+        # Lay out the decorations on this thread while the job renders.
+        self._active.append((job, out_path, self._overlay(extent)))
+        return finished
+
+    def _finish_oldest(self) -> Tuple[str, bool]:
+        job, out_path, overlay = self._active.popleft()
+        job.waitForFinished()
+        image = job.renderedImage()
+        if image.isNull():
+            return out_path, False
+        if overlay is not None and not overlay.isNull():
+            painter = QPainter(image)
+            painter.drawImage(0, 0, overlay)
+            painter.end()
+        dots_per_metre = int(round(self.dpi / 0.0254))
+        image.setDotsPerMeterX(dots_per_metre)
+        image.setDotsPerMeterY(dots_per_metre)
+        return out_path, bool(image.save(out_path, 'PNG'))
+
+    def finish(self) -> List[Tuple[str, bool]]:
+        """Wait for every queued chartlet and write it; ``(path, ok)`` in order."""
+        finished = []
+        while self._active:
+            finished.append(self._finish_oldest())
+        return finished
+
+    def cancel(self) -> None:
+        """Stop every queued job without writing its file."""
+        while self._active:
+            job, _out_path, _overlay = self._active.popleft()
+            job.cancel()
@@ -2,9 +2,12 @@
 """Create rasters from XYZ (Easting, Northing, Depth) text files.
 
 One raster per input file, so each file keeps its own native resolution;
-grid size auto-detects per file (or one explicit override for all). The
-point cloud is bridged to GDAL through a temporary CSV + VRT pair, which
-avoids the format quirks of feeding XYZ text straight into GDAL tools.
+grid size auto-detects per file (or one explicit override for all). Direct
+rasterisation bins the points in process (``xyz_gridding``: streamed chunks,
+per-cell mean/min/max/count, GeoTIFF written through GDAL's Python API).
+IDW — and direct rasterisation when the in-process engine cannot run — bridge
+the point cloud to GDAL through a temporary CSV + VRT pair, which avoids the
+format quirks of feeding XYZ text straight into GDAL tools.
 """
 
 from qgis.PyQt.QtCore import QCoreApplication
@@ -24,20 +27,37 @@ from qgis.core import (
     QgsRectangle,
     QgsVectorLayer,
 )
-from ..qgis_compat import PROCESSING_NUMBER_DOUBLE, PROCESSING_SOURCE_FILE
+from ..qgis_compat import (
+    PROCESSING_NUMBER_DOUBLE, PROCESSING_SOURCE_FILE, python_executable,
+)
 from qgis import processing
 try:
     import numpy as np
 except Exception:  # pragma: no cover
     np = None
+import multiprocessing
 import os
 import uuid
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from . import xyz_gridding
+from .xyz_gridding import detect_grid_size  # noqa: F401 - public helper, re-exported
 
 # Refuse to build rasters beyond this many cells: a mis-detected grid size on
 # scattered (non-gridded) data would otherwise ask GDAL for a raster that
 # exhausts memory/disk. ~500M Float32 cells is already a 2 GB uncompressed file.
 MAX_RASTER_CELLS = 500_000_000
 
+# Parallel files: each worker streams its file, so memory per worker is a
+# few text chunks plus its share of the in-memory cell budget.
+MAX_XYZ_WORKERS = 8
+
+
+def native_worker_count(file_count):
+    """Worker processes for a run: one core left for QGIS, capped."""
+    cores = max(1, (os.cpu_count() or 1) - 1)
+    return max(1, min(file_count, cores, MAX_XYZ_WORKERS))
+
 
 def sniff_xyz_format(path, probe_lines=10):
     """(delimiter, skiprows) for an XYZ text file.
@@ -77,21 +97,6 @@ def sniff_xyz_format(path, probe_lines=10):
     return delimiter, skiprows
 
 
-def detect_grid_size(xs, ys):
-    """Median spacing between distinct sorted coordinates, per axis, averaged.
-
-    Exact for regularly gridded exports (the normal MBES deliverable) even
-    with missing cells, because the median of the unique-coordinate gaps is
-    the grid step. Scattered data can under-estimate; the raster-size guard
-    catches the pathological results.
-    """
-    dx = np.diff(np.unique(xs))
-    dy = np.diff(np.unique(ys))
-    grid_x = float(np.median(dx[dx > 1e-9])) if np.any(dx > 1e-9) else 1.0
-    grid_y = float(np.median(dy[dy > 1e-9])) if np.any(dy > 1e-9) else 1.0
-    return (grid_x + grid_y) / 2.0
-
-
 def cell_centred_extent(xs, ys, grid_size):
     """Extent padded by half a cell so every point sits at a cell centre.
 
@@ -116,6 +121,7 @@ class CreateMBESRasterFromXYZAlgorithm(QgsProcessingAlgorithm):
     METHOD = 'METHOD'
     OUTPUT = 'OUTPUT'
     COMPRESS = 'COMPRESS'
+    STATISTICS = 'STATISTICS'
 
     def initAlgorithm(self, config=None):
         self.addParameter(
@@ -176,6 +182,14 @@ class CreateMBESRasterFromXYZAlgorithm(QgsProcessingAlgorithm):
                 defaultValue=True
             )
         )
+        self.addParameter(
+            QgsProcessingParameterBoolean(
+                self.STATISTICS,
+                self.tr('Add min, max and point-count bands (direct rasterization)'),
+                defaultValue=False,
+                optional=True
+            )
+        )
 
     # -- input handling --------------------------------------------------------
     def _input_paths(self, parameters, context):
@@ -221,13 +235,15 @@ class CreateMBESRasterFromXYZAlgorithm(QgsProcessingAlgorithm):
         method_index = self.parameterAsInt(parameters, self.METHOD, context)
         output_folder = self.parameterAsString(parameters, self.OUTPUT, context)
         compress = self.parameterAsBool(parameters, self.COMPRESS, context)
+        statistics = self.parameterAsBool(parameters, self.STATISTICS, context)
 
         if output_folder == QgsProcessing.TEMPORARY_OUTPUT:
             output_folder = os.path.join(
                 QgsProcessingUtils.tempFolder(), 'xyz_rasters_' + uuid.uuid4().hex[:8])
         os.makedirs(output_folder, exist_ok=True)
 
-        if method_index == 0 and not alg_available('gdal:rasterize'):
+        native = method_index == 0 and xyz_gridding.gdal_available()
+        if method_index == 0 and not native and not alg_available('gdal:rasterize'):
             raise QgsProcessingException(
                 "Required Processing algorithm 'gdal:rasterize' is not available. "
                 'This usually means the GDAL Processing provider is not installed or not enabled.'
@@ -239,17 +255,25 @@ class CreateMBESRasterFromXYZAlgorithm(QgsProcessingAlgorithm):
         # --- 2. Each file individually (its own grid size, its own raster) ---
         output_paths = []
         failures = []
-        for idx, xyz_path in enumerate(xyz_paths):
+        remaining = list(xyz_paths)
+        workers = native_worker_count(len(xyz_paths)) if native else 1
+        if workers > 1:
+            # Independent files in parallel worker processes; whatever the
+            # pool hands back (too large to bin, pool failure) runs below.
+            remaining = self._run_native_pool(
+                xyz_paths, workers, target_crs, grid_size_param, output_folder,
+                compress, statistics, context, feedback, output_paths, failures)
+        for idx, xyz_path in enumerate(remaining):
             if feedback.isCanceled():
                 break
-            feedback.setProgress(int((idx / len(xyz_paths)) * 100))
+            feedback.setProgress(int((idx / len(remaining)) * 100))
             feedback.pushInfo(
-                f'--- File {idx + 1}/{len(xyz_paths)}: {os.path.basename(xyz_path)} ---')
+                f'--- File {idx + 1}/{len(remaining)}: {os.path.basename(xyz_path)} ---')
             try:
                 output_paths.append(self._process_one(
                     xyz_path, target_crs, grid_size_param, max_distance_param,
                     method_index, output_folder, compress, context, feedback,
-                    alg_available))
+                    alg_available, native=native, statistics=statistics))
             except QgsProcessingException as exc:
                 if len(xyz_paths) == 1:
                     raise
@@ -268,12 +292,7 @@ class CreateMBESRasterFromXYZAlgorithm(QgsProcessingAlgorithm):
         feedback.pushInfo(f'Created {len(output_paths)} raster(s) in {output_folder}.')
         return {self.OUTPUT: output_folder}
 
-    def _process_one(self, xyz_path, target_crs, grid_size_param,
-                     max_distance_param, method_index, output_folder, compress,
-                     context, feedback, alg_available):
-        base_name = os.path.splitext(os.path.basename(xyz_path))[0]
-
-        # --- read ---
+    def _sniff(self, xyz_path, feedback):
         try:
             delimiter, skiprows = sniff_xyz_format(xyz_path)
         except Exception as exc:
@@ -281,6 +300,35 @@ class CreateMBESRasterFromXYZAlgorithm(QgsProcessingAlgorithm):
                 f'Could not inspect {os.path.basename(xyz_path)}: {exc}')
         if skiprows:
             feedback.pushInfo(f'Skipping {skiprows} header line(s).')
+        return delimiter, skiprows
+
+    @staticmethod
+    def _check_raster_size(xyz_path, width, height, grid_size):
+        if width * height > MAX_RASTER_CELLS:
+            raise QgsProcessingException(
+                f'{os.path.basename(xyz_path)}: a {width} x {height} pixel raster at '
+                f'grid size {grid_size:.4f} is unreasonably large. The data is '
+                'probably not regularly gridded, so auto-detection produced a '
+                'too-small cell size — set an explicit Grid Size instead.')
+
+    def _process_one(self, xyz_path, target_crs, grid_size_param,
+                     max_distance_param, method_index, output_folder, compress,
+                     context, feedback, alg_available, native=False,
+                     statistics=False):
+        if native:
+            try:
+                return self._process_native(
+                    xyz_path, target_crs, grid_size_param, output_folder,
+                    compress, statistics, context, feedback)
+            except xyz_gridding.GriddingUnavailable as exc:
+                if not alg_available('gdal:rasterize'):
+                    raise QgsProcessingException(
+                        f'{os.path.basename(xyz_path)}: {exc}, and '
+                        "'gdal:rasterize' is not available.")
+        base_name = os.path.splitext(os.path.basename(xyz_path))[0]
+
+        # --- read ---
+        delimiter, skiprows = self._sniff(xyz_path, feedback)
         try:
             data = np.loadtxt(xyz_path, comments=['#', '//'],
                               delimiter=delimiter, skiprows=skiprows, ndmin=2)
@@ -306,12 +354,7 @@ class CreateMBESRasterFromXYZAlgorithm(QgsProcessingAlgorithm):
         extent = cell_centred_extent(xs, ys, grid_size)
         width = max(1, int(round(extent.width() / grid_size)))
         height = max(1, int(round(extent.height() / grid_size)))
-        if width * height > MAX_RASTER_CELLS:
-            raise QgsProcessingException(
-                f'{os.path.basename(xyz_path)}: a {width} x {height} pixel raster at '
-                f'grid size {grid_size:.4f} is unreasonably large. The data is '
-                'probably not regularly gridded, so auto-detection produced a '
-                'too-small cell size — set an explicit Grid Size instead.')
+        self._check_raster_size(xyz_path, width, height, grid_size)
         feedback.pushInfo(f'Output raster: {width} x {height} pixels at {grid_size:.4f}')
 
         max_distance = max_distance_param
@@ -406,6 +449,158 @@ class CreateMBESRasterFromXYZAlgorithm(QgsProcessingAlgorithm):
         context.addLayerToLoadOnCompletion(output_path, details)
         return output_path
 
+    def _native_job(self, xyz_path, delimiter, skiprows, target_crs,
+                    grid_size_param, output_folder, compress, statistics,
+                    max_cells=xyz_gridding.MAX_NATIVE_CELLS, cancel_path=''):
+        base_name = os.path.splitext(os.path.basename(xyz_path))[0]
+        return {
+            'path': xyz_path,
+            'delimiter': delimiter,
+            'skiprows': skiprows,
+            'grid_size': grid_size_param,
+            'output': os.path.join(output_folder, f'{base_name}.tif'),
+            'crs_wkt': target_crs.toWkt(),
+            'compress': compress,
+            'statistics': statistics,
+            'max_raster_cells': MAX_RASTER_CELLS,
+            'max_cells': max_cells,
+            'temp_dir': QgsProcessingUtils.tempFolder(),
+            'cancel_path': cancel_path,
+        }
+
+    def _finish_native(self, result, grid_size_param, context, feedback):
+        """Log one ``grid_file`` result and load its raster.
+
+        Returns the output path, or None when the file must take the GDAL
+        path instead; raises QgsProcessingException for a failed file.
+        """
+        xyz_path = result['path']
+        status = result['status']
+        if status == xyz_gridding.STATUS_CANCELLED:
+            raise QgsProcessingException('Canceled.')
+        if status == xyz_gridding.STATUS_ERROR:
+            raise QgsProcessingException(result['message'])
+        feedback.pushInfo(f'{os.path.basename(xyz_path)}: read {result["count"]} data points.')
+        if grid_size_param <= 0:
+            feedback.pushInfo(
+                f'Auto-detected grid size for this file: {result["grid_size"]:.4f}')
+        if status == xyz_gridding.STATUS_TOO_LARGE:
+            self._check_raster_size(xyz_path, result['width'], result['height'],
+                                    result['grid_size'])
+        if status == xyz_gridding.STATUS_FALLBACK:
+            feedback.pushInfo(f'{result["message"]} — using gdal:rasterize instead.')
+            return None
+        feedback.pushInfo(
+            f'Output raster: {result["width"]} x {result["height"]} pixels at '
+            f'{result["grid_size"]:.4f} (binned in process)')
+        output_path = result['output']
+        base_name = os.path.splitext(os.path.basename(xyz_path))[0]
+        details = QgsProcessingContext.LayerDetails(base_name, context.project())
+        context.addLayerToLoadOnCompletion(output_path, details)
+        return output_path
+
+    def _process_native(self, xyz_path, target_crs, grid_size_param,
+                        output_folder, compress, statistics, context, feedback):
+        """Stream, bin and write one file in process (no temp CSV/VRT)."""
+        delimiter, skiprows = self._sniff(xyz_path, feedback)
+        job = self._native_job(xyz_path, delimiter, skiprows, target_crs,
+                               grid_size_param, output_folder, compress,
+                               statistics)
+        result = xyz_gridding.grid_file(job, cancel=feedback.isCanceled)
+        output_path = self._finish_native(result, grid_size_param, context, feedback)
+        if output_path is None:
+            raise xyz_gridding.GriddingUnavailable(result['message'])
+        return output_path
+
+    def _run_native_pool(self, xyz_paths, workers, target_crs, grid_size_param,
+                         output_folder, compress, statistics, context, feedback,
+                         output_paths, failures):
+        """Grid files concurrently in worker processes.
+
+        Each worker gets an equal share of the in-memory cell budget, so
+        peak RAM stays that of one large file however many run at once.
+        Returns the files still to process in this process: those too
+        large for a worker's share, plus everything if the pool could not
+        start (restricted environments) or broke.
+        """
+        cancel_path = os.path.join(QgsProcessingUtils.tempFolder(),
+                                   f'xyz_cancel_{uuid.uuid4().hex[:8]}')
+        jobs = []
+        for xyz_path in xyz_paths:
+            try:
+                delimiter, skiprows = self._sniff(xyz_path, feedback)
+            except QgsProcessingException as exc:
+                failures.append(os.path.basename(xyz_path))
+                feedback.pushWarning(
+                    f'{os.path.basename(xyz_path)} failed and was skipped: {exc}')
+                continue
+            jobs.append(self._native_job(
+                xyz_path, delimiter, skiprows, target_crs, grid_size_param,
+                output_folder, compress, statistics,
+                max_cells=max(1, xyz_gridding.MAX_NATIVE_CELLS // workers),
+                cancel_path=cancel_path))
+        if not jobs:
+            return []
+        python_exe = python_executable()
+        if python_exe is None:
+            feedback.pushInfo('No Python interpreter found for worker processes; '
+                              'processing files one at a time.')
+            return [job['path'] for job in jobs]
+        try:
+            context_mp = multiprocessing.get_context('spawn')
+            context_mp.set_executable(python_exe)
+            executor = ProcessPoolExecutor(max_workers=min(workers, len(jobs)),
+                                           mp_context=context_mp)
+        except Exception as exc:
+            feedback.pushInfo(f'Parallel processing unavailable ({exc}); '
+                              'processing files one at a time.')
+            return [job['path'] for job in jobs]
+
+        feedback.pushInfo(f'Processing {len(jobs)} file(s) in {min(workers, len(jobs))} '
+                          'parallel worker process(es)...')
+        retry = []
+        futures = {executor.submit(xyz_gridding.grid_file, job): job for job in jobs}
+        pending = set(futures)
+        try:
+            while pending:
+                if feedback.isCanceled():
+                    with open(cancel_path, 'w'):
+                        pass  # running workers poll for this file
+                    for future in pending:
+                        future.cancel()
+                    break
+                done, pending = wait(pending, timeout=0.25,
+                                     return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = futures[future]
+                    name = os.path.basename(job['path'])
+                    try:
+                        result = future.result()
+                    except Exception as exc:  # worker died / pool broke
+                        feedback.pushInfo(f'{name}: worker process failed ({exc}); '
+                                          'retrying in process.')
+                        retry.append(job['path'])
+                        continue
+                    try:
+                        output_path = self._finish_native(
+                            result, grid_size_param, context, feedback)
+                    except QgsProcessingException as exc:
+                        failures.append(name)
+                        feedback.pushWarning(f'{name} failed and was skipped: {exc}')
+                        continue
+                    if output_path is None:
+                        retry.append(job['path'])
+                    else:
+                        output_paths.append(output_path)
+                feedback.setProgress(int(100 * (len(jobs) - len(pending)) / len(jobs)))
+        finally:
+            executor.shutdown(wait=True)
+            try:
+                os.remove(cancel_path)
+            except OSError:
+                pass
+        return [] if feedback.isCanceled() else retry
+
     def _run_idw(self, vrt_path, extent, width, height, grid_size, max_distance,
                  output_raster_path, context, feedback, alg_available):
         def native_idw():
@@ -477,6 +672,8 @@ class CreateMBESRasterFromXYZAlgorithm(QgsProcessingAlgorithm):
   <li><b>Cell registration:</b> XYZ coordinates are treated as cell centres, so output pixels align exactly with the source grid (no half-pixel shift).</li>
   <li><b>One CRS:</b> the chosen CRS applies to every file in the run.</li>
   <li><b>Methods:</b> <i>Direct rasterisation</i> burns the original values untouched (recommended for gridded MBES); <i>IDW interpolation</i> fills gaps but smooths.</li>
+  <li><b>Direct rasterisation engine:</b> files are streamed in chunks and binned in process (mean of the points in each cell), then written straight to GeoTIFF — no temporary CSV copy. Optional extra bands hold the per-cell minimum, maximum and point count. Very large grids fall back to <i>gdal:rasterize</i>.</li>
+  <li><b>Parallel files:</b> in a multi-file run, files are gridded side by side in separate worker processes (one fewer than the CPU count, at most 8). Each file is parsed once; cancelling stops all workers.</li>
   <li><b>Compression:</b> LZW is lossless; outputs are tiled for fast display.</li>
 </ul>
 
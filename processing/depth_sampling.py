@@ -7,7 +7,8 @@ to processing algorithms and to interactive tools (e.g. the Cable Route
 Workbench DepthService) without a QgsProcessingContext.
 
 Sampler tuples:
-- raster sampler:  (QgsRasterLayer, Optional[QgsCoordinateTransform])
+- raster sampler:  (QgsRasterLayer, Optional[QgsCoordinateTransform],
+                    Optional[RasterBlockSampler])
 - contour sampler: (QgsVectorLayer, depth_field_name, Optional[QgsCoordinateTransform])
 
 All query points are in the source CRS the samplers were built with; the
@@ -19,6 +20,8 @@ from __future__ import annotations
 import math
 from typing import List, Optional, Sequence, Tuple
 
+import numpy as np
+
 from qgis.core import (
     QgsCoordinateTransform,
     QgsFeatureRequest,
@@ -30,8 +33,10 @@ from qgis.core import (
 )
 
 from ..kp_range_utils import make_distance_area
+from .raster_blocks import RasterBlockSampler, first_valid, to_optional_list
 
-RasterSampler = Tuple[QgsRasterLayer, Optional[QgsCoordinateTransform]]
+RasterSampler = Tuple[QgsRasterLayer, Optional[QgsCoordinateTransform],
+                      Optional[RasterBlockSampler]]
 ContourSampler = Tuple[QgsVectorLayer, str, Optional[QgsCoordinateTransform]]
 
 
@@ -39,7 +44,11 @@ def build_raster_samplers(
     rasters: Sequence[QgsRasterLayer],
     source_crs,
 ) -> List[RasterSampler]:
-    """Pair each raster with a transform from ``source_crs`` into its CRS."""
+    """Pair each raster with a transform from ``source_crs`` into its CRS.
+
+    Each sampler carries a tile-cached ``RasterBlockSampler`` so repeated
+    queries read GDAL blocks once instead of one ``provider.sample()`` each.
+    """
     samplers: List[RasterSampler] = []
     for r in rasters:
         if not r:
@@ -50,7 +59,7 @@ def build_raster_samplers(
                 transform = QgsCoordinateTransform(source_crs, r.crs(), QgsProject.instance())
             except Exception:
                 transform = None
-        samplers.append((r, transform))
+        samplers.append((r, transform, RasterBlockSampler.from_layer(r)))
     return samplers
 
 
@@ -95,7 +104,7 @@ def sample_rasters(
 
     band = int(band) if band and int(band) > 0 else 1
 
-    for raster, transform in raster_samplers:
+    for raster, transform, blocks in raster_samplers:
         sample_pt = point
         if transform is not None:
             try:
@@ -104,19 +113,10 @@ def sample_rasters(
                 all_vals.append((raster.name(), None))
                 continue
 
-        try:
-            val, ok = raster.dataProvider().sample(sample_pt, band)
-        except Exception:
-            ok = False
-            val = None
-
-        if ok and val is not None:
-            try:
-                fval = float(val)
-            except Exception:
-                fval = None
+        if blocks is not None:
+            fval = blocks.value_at(sample_pt.x(), sample_pt.y(), band)
         else:
-            fval = None
+            fval = _provider_value(raster, sample_pt, band)
 
         all_vals.append((raster.name(), fval))
         if best_val is None and fval is not None:
@@ -126,6 +126,63 @@ def sample_rasters(
     return best_val, best_src, all_vals
 
 
+def _provider_value(raster, point: QgsPointXY, band: int) -> Optional[float]:
+    """``provider.sample`` for rasters without a block sampler."""
+    try:
+        val, ok = raster.dataProvider().sample(point, band)
+    except Exception:
+        return None
+    if not ok or val is None:
+        return None
+    try:
+        return float(val)
+    except Exception:
+        return None
+
+
+def sample_rasters_many(
+    points: Sequence[Optional[QgsPointXY]],
+    raster_samplers: Sequence[RasterSampler],
+    band: int = 1,
+) -> List[Optional[float]]:
+    """First-valid raster value for every point in one vectorised pass.
+
+    Equivalent to ``sample_rasters(p)[0]`` per point; ``None`` points and
+    points without coverage give ``None``. Rasters without a block sampler
+    are read point by point through the provider, as ``sample_rasters``
+    does, for the points the earlier rasters left empty.
+    """
+    if not points:
+        return []
+    band = int(band) if band and int(band) > 0 else 1
+    if all(blocks is not None for _raster, _transform, blocks in raster_samplers):
+        pairs = [(blocks, transform) for _raster, transform, blocks in raster_samplers]
+        values, _source = first_valid(pairs, points, band)
+        return to_optional_list(values)
+    values = np.full(len(points), np.nan)
+    for raster, transform, blocks in raster_samplers:
+        todo = [i for i in np.flatnonzero(np.isnan(values)).tolist()
+                if points[i] is not None]
+        if not todo:
+            break
+        if blocks is not None:
+            got, _source = first_valid([(blocks, transform)],
+                                       [points[i] for i in todo], band)
+            values[todo] = got
+            continue
+        for i in todo:
+            sample_pt = points[i]
+            if transform is not None:
+                try:
+                    sample_pt = transform.transform(sample_pt)
+                except Exception:
+                    continue
+            fval = _provider_value(raster, sample_pt, band)
+            if fval is not None:
+                values[i] = fval
+    return to_optional_list(values)
+
+
 def sample_contours(
     point: QgsPointXY,
     contour_samplers: Sequence[ContourSampler],
@@ -254,3 +311,37 @@ def sample_depth(
         return best
 
     return None
+
+
+def sample_depth_many(
+    points: Sequence[Optional[QgsPointXY]],
+    depth_source_mode: int,
+    raster_samplers: Sequence[RasterSampler],
+    contour_samplers: Sequence[ContourSampler],
+    contour_search_radius_m: float,
+    transform_context,
+    project=None,
+    band: int = 1,
+) -> List[Optional[float]]:
+    """``sample_depth`` over many points.
+
+    Rasters are read once, vectorised; only points the rasters leave empty
+    fall through to the (per-point) contour search.
+    """
+    want_raster = depth_source_mode in (0, 1)
+    want_contours = depth_source_mode in (0, 2)
+    out: List[Optional[float]] = [None] * len(points)
+
+    if want_raster and raster_samplers:
+        out = sample_rasters_many(points, raster_samplers, band)
+
+    if want_contours and contour_samplers:
+        for i, point in enumerate(points):
+            if out[i] is not None or point is None:
+                continue
+            best, _src, _dist = sample_contours(
+                point, contour_samplers, contour_search_radius_m, transform_context, project
+            )
+            out[i] = best
+
+    return out
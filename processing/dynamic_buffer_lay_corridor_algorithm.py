@@ -676,7 +676,7 @@ class DynamicBufferLayCorridorAlgorithm(QgsProcessingAlgorithm):
     def _build_raster_samplers(
         rasters: Sequence[QgsRasterLayer],
         line_crs,
-    ) -> List[Tuple[QgsRasterLayer, Optional[QgsCoordinateTransform]]]:
+    ) -> List[depth_sampling.RasterSampler]:
         return depth_sampling.build_raster_samplers(rasters, line_crs)
 
     @staticmethod
@@ -691,7 +691,7 @@ class DynamicBufferLayCorridorAlgorithm(QgsProcessingAlgorithm):
     def _sample_depth(
         point: QgsPointXY,
         depth_source_mode: int,
-        raster_samplers: Sequence[Tuple[QgsRasterLayer, Optional[QgsCoordinateTransform]]],
+        raster_samplers: Sequence[depth_sampling.RasterSampler],
         contour_samplers: Sequence[Tuple[QgsVectorLayer, str, Optional[QgsCoordinateTransform]]],
         contour_search_radius_m: float,
         context,
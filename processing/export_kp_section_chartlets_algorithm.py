@@ -16,7 +16,7 @@ import os
 import re
 from typing import List, Optional, Tuple
 
-from qgis.PyQt.QtCore import QCoreApplication, QSize
+from qgis.PyQt.QtCore import QCoreApplication
 from qgis.core import (
     QgsCoordinateTransform,
     QgsCoordinateReferenceSystem,
@@ -35,20 +35,13 @@ from qgis.core import (
     QgsProcessingParameterNumber,
     QgsProcessingParameterString,
     QgsRectangle,
-    QgsUnitTypes,
     QgsWkbTypes,
     QgsDistanceArea,
-    QgsPrintLayout,
-    QgsLayoutItemMap,
-    QgsLayoutItemScaleBar,
-    QgsLayoutItemPicture,
-    QgsLayoutPoint,
-    QgsLayoutSize,
-    QgsLayoutExporter,
 )
 from ..qgis_compat import PROCESSING_FIELD_NUMERIC, PROCESSING_NUMBER_DOUBLE, PROCESSING_NUMBER_INTEGER
 
 from ..kp_range_utils import extract_line_segment, make_distance_area, measure_total_length_m
+from .chartlet_render_pool import ChartletRenderPool
 
 
 def _safe_filename(value: str) -> str:
@@ -438,46 +431,27 @@ Output:
         exported = 0
         skipped = 0
 
-        # Build a layout template once; we will only update extent and export path per feature.
         project = context.project()
         if project is None:
             raise QgsProcessingException(self.tr('No active QGIS project found in processing context.'))
 
-        layout = QgsPrintLayout(project)
-        layout.initializeDefaults()
-
-        # Set a deterministic page size matching the requested aspect ratio.
-        width_mm = 200.0
-        height_mm = width_mm * (float(height_px) / float(width_px))
-        pc = layout.pageCollection()
-        if pc.pageCount() > 0:
-            pc.page(0).setPageSize(QgsLayoutSize(width_mm, height_mm, QgsUnitTypes.LayoutMillimeters))
-
-        map_item = QgsLayoutItemMap(layout)
-        map_item.setCrs(dest_crs)
-        map_item.setLayers(layers)
-        map_item.attemptResize(QgsLayoutSize(width_mm, height_mm, QgsUnitTypes.LayoutMillimeters))
-        map_item.attemptMove(QgsLayoutPoint(0, 0, QgsUnitTypes.LayoutMillimeters))
-        layout.addLayoutItem(map_item)
-
-        scalebar_item = None
-        if add_scalebar:
-            scalebar_item = QgsLayoutItemScaleBar(layout)
-            scalebar_item.setLinkedMap(map_item)
-            scalebar_item.applyDefaultSize()
-            scalebar_item.attemptMove(QgsLayoutPoint(5, height_mm - 15, QgsUnitTypes.LayoutMillimeters))
-            layout.addLayoutItem(scalebar_item)
-
-        north_item = None
-        if add_north_arrow:
-            north_item = QgsLayoutItemPicture(layout)
-            # QGIS built-in north arrow SVG (resource path)
-            north_item.setPicturePath(':/images/north_arrows/layout_default_north_arrow.svg')
-            north_item.attemptResize(QgsLayoutSize(15, 15, QgsUnitTypes.LayoutMillimeters))
-            north_item.attemptMove(QgsLayoutPoint(width_mm - 20, 5, QgsUnitTypes.LayoutMillimeters))
-            layout.addLayoutItem(north_item)
-
-        for i, feature in enumerate(features):
+        # Map settings and decorations are prepared once; each chartlet only
+        # sets its extent and renders through the bounded job pool.
+        pool = ChartletRenderPool(
+            project, layers, dest_crs, context.transformContext(),
+            width_px, height_px, add_scalebar=add_scalebar, add_north_arrow=add_north_arrow,
+        )
+
+        def record(results):
+            nonlocal exported, skipped
+            for _path, ok in results:
+                if ok:
+                    exported += 1
+                else:
+                    skipped += 1
+            feedback.setProgress(int((exported + skipped) * 100 / total))
+
+        for feature in features:
             if feedback.isCanceled():
                 break
 
@@ -526,22 +500,16 @@ Output:
 
             extent = _expand_extent_to_aspect(extent, width_px, height_px)
 
-            map_item.setExtent(extent)
-
             prefix = file_prefix or getattr(ranges_source, 'sourceName', lambda: '')() or 'kp_ranges'
             filename = self._make_output_name(prefix, feature, start_kp, end_kp)
             out_path = os.path.join(out_folder, filename)
 
-            exporter = QgsLayoutExporter(layout)
-            settings = QgsLayoutExporter.ImageExportSettings()
-            settings.imageSize = QSize(width_px, height_px)
-            result = exporter.exportToImage(out_path, settings)
-            if result == QgsLayoutExporter.Success:
-                exported += 1
-            else:
-                skipped += 1
+            record(pool.submit(extent, out_path))
 
-            feedback.setProgress(int((i + 1) * 100 / total))
+        if feedback.isCanceled():
+            pool.cancel()
+        else:
+            record(pool.finish())
 
         feedback.pushInfo(self.tr(f'Exported {exported} chartlets. Skipped {skipped}.'))
         return {}
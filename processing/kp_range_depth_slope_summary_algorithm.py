@@ -41,6 +41,7 @@ from qgis.core import (
     QgsWkbTypes,
 )
 from ..qgis_compat import FIELD_TYPE_DOUBLE, GEOMETRY_LINE, GEOMETRY_POINT, PROCESSING_FIELD_NUMERIC, PROCESSING_NUMBER_DOUBLE
+from .raster_blocks import RasterBlockSampler
 
 
 @dataclass(frozen=True)
@@ -50,6 +51,7 @@ class _RasterSource:
     transform: Optional[QgsCoordinateTransform]
     nodata: Optional[float]
     pixel_area_m2: Optional[float]
+    blocks: Optional[RasterBlockSampler] = None
 
 
 class KPRangeDepthSlopeSummaryAlgorithm(QgsProcessingAlgorithm):
@@ -580,6 +582,7 @@ class KPRangeDepthSlopeSummaryAlgorithm(QgsProcessingAlgorithm):
                     transform=transform,
                     nodata=nodata,
                     pixel_area_m2=pixel_area_m2,
+                    blocks=RasterBlockSampler.from_provider(provider),
                 )
             )
 
@@ -590,6 +593,22 @@ class KPRangeDepthSlopeSummaryAlgorithm(QgsProcessingAlgorithm):
             pass
         return sources
 
+    @staticmethod
+    def _raster_value(src: _RasterSource, sample_pt: QgsPointXY) -> Optional[float]:
+        """Band-1 value at a raster-CRS point via the tile cache when available."""
+        if src.blocks is not None:
+            return src.blocks.value_at(sample_pt.x(), sample_pt.y())
+        try:
+            sample, ok = src.provider.sample(sample_pt, 1)
+        except Exception:
+            return None
+        if not ok:
+            return None
+        try:
+            return float(sample)
+        except Exception:
+            return None
+
     @staticmethod
     def _sample_rasters_at_point(point_xy_line_crs: QgsPointXY, raster_sources: Sequence[_RasterSource]) -> Optional[float]:
         if not raster_sources:
@@ -615,16 +634,8 @@ class KPRangeDepthSlopeSummaryAlgorithm(QgsProcessingAlgorithm):
             except Exception:
                 pass
 
-            try:
-                sample, ok = src.provider.sample(sample_pt, 1)
-            except Exception:
-                continue
-            if not ok:
-                continue
-
-            try:
-                val = float(sample)
-            except Exception:
+            val = KPRangeDepthSlopeSummaryAlgorithm._raster_value(src, sample_pt)
+            if val is None:
                 continue
 
             try:
@@ -667,16 +678,8 @@ class KPRangeDepthSlopeSummaryAlgorithm(QgsProcessingAlgorithm):
             except Exception:
                 pass
 
-            try:
-                sample, ok = src.provider.sample(sample_pt, 1)
-            except Exception:
-                continue
-            if not ok:
-                continue
-
-            try:
-                val = float(sample)
-            except Exception:
+            val = KPRangeDepthSlopeSummaryAlgorithm._raster_value(src, sample_pt)
+            if val is None:
                 continue
 
             try:
@@ -0,0 +1,97 @@
+# lazy_algorithm.py
+# -*- coding: utf-8 -*-
+"""
+Toolbox entries for algorithms whose modules are imported on first use.
+
+The provider registers one :class:`LazyAlgorithm` per :class:`AlgorithmEntry`
+(id, display name, group, and the module / class that implements it). QGIS
+shows the entry in the Processing Toolbox and model designer from that
+metadata alone; opening its dialog, running it or adding it to a model goes
+through ``QgsProcessingAlgorithm.create()``, whose ``createInstance()``
+imports the module and returns the real algorithm, which then builds its own
+parameters. Registration therefore costs the same however many algorithms
+the provider lists.
+
+``QgsProcessingRegistry.algorithmById()`` returns the entry itself, which has
+no parameters; use ``createAlgorithmById()`` (as Processing does) to get one
+that can run.
+"""
+
+import importlib
+import traceback
+from dataclasses import dataclass
+
+from qgis.PyQt.QtCore import QCoreApplication
+from qgis.core import QgsMessageLog, QgsProcessingAlgorithm, QgsProcessingException
+
+from ..qgis_compat import MESSAGE_WARNING
+
+
+@dataclass(frozen=True)
+class AlgorithmEntry:
+    """Registration metadata for one algorithm (must match the class)."""
+
+    module: str          # module in this package, e.g. 'nearest_kp_algorithm'
+    class_name: str
+    name: str            # QgsProcessingAlgorithm.name()
+    display_name: str
+    group: str
+    group_id: str
+
+    def load_class(self):
+        module = importlib.import_module(f'.{self.module}', package=__package__)
+        return getattr(module, self.class_name)
+
+
+class LazyAlgorithm(QgsProcessingAlgorithm):
+    """Registered stand-in for an algorithm; ``createInstance()`` loads it."""
+
+    def __init__(self, entry: AlgorithmEntry):
+        super().__init__()
+        self._entry = entry
+
+    @property
+    def entry(self) -> AlgorithmEntry:
+        return self._entry
+
+    def tr(self, string):
+        # The algorithms translate under their class name or 'Processing'.
+        text = QCoreApplication.translate(self._entry.class_name, string)
+        return text if text != string else QCoreApplication.translate('Processing', string)
+
+    def name(self):
+        return self._entry.name
+
+    def displayName(self):
+        return self.tr(self._entry.display_name)
+
+    def group(self):
+        return self.tr(self._entry.group)
+
+    def groupId(self):
+        return self._entry.group_id
+
+    def shortHelpString(self):
+        algorithm = self.createInstance()
+        return algorithm.shortHelpString() if algorithm is not None else ''
+
+    def initAlgorithm(self, config=None):
+        # Parameters belong to the real algorithm (see createInstance).
+        pass
+
+    def createInstance(self):
+        try:
+            return self._entry.load_class()()
+        except Exception:
+            QgsMessageLog.logMessage(
+                f'Failed to load algorithm {self._entry.class_name} from {self._entry.module}.\n'
+                f'{traceback.format_exc()}',
+                'Subsea Cable Tools',
+                MESSAGE_WARNING,
+            )
+            return None
+
+    def processAlgorithm(self, parameters, context, feedback):
+        # run() and the dialogs execute a create()d copy, never the entry.
+        raise QgsProcessingException(
+            f'{self._entry.class_name} must be created with createAlgorithmById() before running.')
@@ -37,6 +37,7 @@ from qgis.core import (
     QgsFields,
     QgsVectorLayer
 )
+from ..kp_geo_utils import RouteFrame
 from ..qgis_compat import FIELD_TYPE_DOUBLE, FIELD_TYPE_INT, FIELD_TYPE_STRING
 
 import math
@@ -208,19 +209,24 @@ class NearestKPAlgorithm(QgsProcessingAlgorithm):
         # Cache path features/geometries once (avoids re-iterating provider for every point)
         # and compute cumulative offsets so KP is relative to the whole input RPL layer
         # (matching KP Mouse Map Tool behaviour for multi-feature RPLs).
-        path_features = list(paths_source.getFeatures())
         path_geoms = []
         path_ids = []
-        path_offsets_m = []
-        cumulative_m = 0.0
-        for path_feature in path_features:
+        path_lengths_m = []
+        for path_feature in paths_source.getFeatures():
             geom = path_feature.geometry()
             if geom is None or geom.isEmpty():
                 continue
             path_geoms.append(geom)
             path_ids.append(path_feature.id())
-            path_offsets_m.append(cumulative_m)
-            cumulative_m += float(distance_calculator.measureLength(geom))
+            path_lengths_m.append(float(distance_calculator.measureLength(geom)))
+
+        # One segment index over every path: each point only measures the
+        # segments that can be nearest instead of walking every vertex of
+        # every path. The index's segments are the ones the walk visits.
+        route = RouteFrame(path_geoms, path_lengths_m, distance_calculator)
+        path_offsets_m = route.feature_offsets_m
+        segments = route.segments()
+        segment_kp_m = self._segment_start_kps(segments, path_offsets_m)
 
         total_features = points_source.featureCount()
         processed_features = 0
@@ -249,31 +255,14 @@ class NearestKPAlgorithm(QgsProcessingAlgorithm):
                     continue
 
             point_xy = measure_point_geom.asPoint()
-            
-            nearest_dist = float('inf')
-            nearest_dist_signed = None
-            nearest_pt_geom = None
-            nearest_path_id = None
-            nearest_kp = None
-            nearest_path_geom = None
-
-            # Iterate through cached paths to find the nearest point
-            for idx, path_geom in enumerate(path_geoms):
-                # Improved segment-by-segment approach to find the truly nearest point
-                result = self.find_nearest_point_on_path(
-                    path_geom,
-                    QgsPointXY(point_xy),
-                    distance_calculator,
-                    base_distance_m=path_offsets_m[idx],
-                )
 
-                if result['distance'] < nearest_dist:
-                    nearest_dist = result['distance']
-                    nearest_dist_signed = result.get('distance_signed', result['distance'])
-                    nearest_pt_geom = result['point_geometry']
-                    nearest_path_id = path_ids[idx]
-                    nearest_kp = result['kp']
-                    nearest_path_geom = path_geom
+            result = self.find_nearest_point_on_route(
+                route, segments, segment_kp_m, QgsPointXY(point_xy), distance_calculator)
+            nearest_dist = result['distance']
+            nearest_dist_signed = result['distance_signed']
+            nearest_pt_geom = result['point_geometry']
+            nearest_kp = result['kp']
+            nearest_path_id = path_ids[result['path_index']] if nearest_pt_geom else None
 
             # If a nearest point is found, create new features in both output layers
             if nearest_pt_geom:
@@ -379,18 +368,21 @@ class NearestKPAlgorithm(QgsProcessingAlgorithm):
 
 <p><b>3. Run:</b> Execute the tool.</p>
 
-<p><b>Note:</b> The tool performs a segment-by-segment analysis to ensure it finds the true nearest point, even on complex, multi-part line geometries.</p>
+<p><b>Note:</b> The tool performs a segment-by-segment analysis to ensure it finds the true nearest point, even on complex, multi-part line geometries. A spatial index over the path segments limits that analysis to the segments that can be nearest, so large point layers against long multi-feature routes stay fast.</p>
 """)
 
     def find_nearest_point_on_path(self, path_geom, point_xy, distance_calculator, base_distance_m: float = 0.0):
         """
         Find the nearest point on a path to the given point using a segment-by-segment approach.
-        
+
+        Walks every segment of one path; ``find_nearest_point_on_route`` gives
+        the same answer from a segment index.
+
         Parameters:
             path_geom (QgsGeometry): The path geometry
             point_xy (QgsPointXY): The point to find the nearest point to
             distance_calculator (QgsDistanceArea): Distance calculator for accurate measurements
-            
+
         Returns:
             dict: A dictionary containing the nearest point geometry, the distance, and the KP value
         """
@@ -398,7 +390,7 @@ class NearestKPAlgorithm(QgsProcessingAlgorithm):
         nearest_point = None
         best_kp_m = float(base_distance_m) if base_distance_m is not None else 0.0
         best_signed_distance = None
-        
+
         # Get all the points that make up the path (handling multi-part geometries)
         all_points = []
         if path_geom.isMultipart():
@@ -407,7 +399,7 @@ class NearestKPAlgorithm(QgsProcessingAlgorithm):
                 all_points.append(line)
         else:
             all_points = [path_geom.asPolyline()]
-        
+
         # Walk segments once, tracking cumulative distance along the geometry.
         # This correctly handles multipart polylines and avoids the "part index" bug.
         cumulative_distance_m = 0.0
@@ -422,50 +414,17 @@ class NearestKPAlgorithm(QgsProcessingAlgorithm):
                 if segment_length <= 0:
                     continue
 
-                segment_geom = QgsGeometry.fromPolylineXY([segment_start, segment_end])
-                nearest_on_segment = segment_geom.nearestPoint(QgsGeometry.fromPointXY(point_xy))
-                if nearest_on_segment.isEmpty():
-                    cumulative_distance_m += segment_length
-                    continue
-
-                nearest_on_segment_xy = nearest_on_segment.asPoint()
-                distance = float(distance_calculator.measureLine(point_xy, nearest_on_segment_xy))
-
-                if distance < min_distance:
-                    min_distance = distance
-                    nearest_point = nearest_on_segment
-                    distance_along_segment = float(
-                        distance_calculator.measureLine(segment_start, nearest_on_segment_xy)
-                    )
-                    if distance_along_segment < 0:
-                        distance_along_segment = 0.0
-                    if distance_along_segment > segment_length:
-                        distance_along_segment = segment_length
-
+                hit = self._nearest_on_segment(
+                    segment_start, segment_end, segment_length, point_xy, distance_calculator)
+                if hit is not None and hit[0] < min_distance:
+                    min_distance, nearest_point, distance_along_segment, best_signed_distance = hit
                     best_kp_m = float(base_distance_m) + cumulative_distance_m + distance_along_segment
 
-                    # Signed distance (port/stbd) relative to the direction of ascending KP
-                    # Segment direction = segment_start -> segment_end.
-                    # Using 2D cross product: cross(v, w) > 0 means point is left of the segment.
-                    v_x = float(segment_end.x() - segment_start.x())
-                    v_y = float(segment_end.y() - segment_start.y())
-                    w_x = float(point_xy.x() - nearest_on_segment_xy.x())
-                    w_y = float(point_xy.y() - nearest_on_segment_xy.y())
-                    cross = (v_x * w_y) - (v_y * w_x)
-                    if abs(cross) < 1e-12:
-                        best_signed_distance = 0.0
-                    elif cross > 0:
-                        # Left/port side => negative
-                        best_signed_distance = -abs(min_distance)
-                    else:
-                        # Right/stbd side => positive
-                        best_signed_distance = abs(min_distance)
-
                 cumulative_distance_m += segment_length
 
         # Convert to kilometers
         kp = best_kp_m / 1000.0
-        
+
         return {
             'point_geometry': nearest_point,
             'distance': min_distance,
@@ -473,6 +432,107 @@ class NearestKPAlgorithm(QgsProcessingAlgorithm):
             'kp': kp
         }
 
+    def find_nearest_point_on_route(self, route, segments, segment_kp_m, point_xy, distance_calculator):
+        """
+        Find the nearest point over all paths of a ``RouteFrame``.
+
+        Measures only the segments ``route.segments_near`` returns, in route
+        order and with the same strict comparison as walking every path with
+        ``find_nearest_point_on_path``, so ties resolve to the same segment.
+
+        Parameters:
+            route (RouteFrame): Route built over the cached path geometries
+            segments (list): ``route.segments()``
+            segment_kp_m (list): KP (m) at the start of each segment, from ``_segment_start_kps``
+            point_xy (QgsPointXY): The point to find the nearest point to
+            distance_calculator (QgsDistanceArea): Distance calculator for accurate measurements
+
+        Returns:
+            dict: As ``find_nearest_point_on_path``, plus the ``path_index`` of the nearest path
+        """
+        min_distance = float('inf')
+        nearest_point = None
+        best_kp_m = 0.0
+        best_signed_distance = None
+        best_path = -1
+        for seg_id in route.segments_near(point_xy):
+            segment_start, segment_end, segment_length, _cumulative_m, path_index = segments[seg_id]
+            hit = self._nearest_on_segment(
+                segment_start, segment_end, segment_length, point_xy, distance_calculator)
+            if hit is not None and hit[0] < min_distance:
+                min_distance, nearest_point, distance_along_segment, best_signed_distance = hit
+                best_kp_m = segment_kp_m[seg_id] + distance_along_segment
+                best_path = path_index
+
+        return {
+            'point_geometry': nearest_point,
+            'distance': min_distance,
+            'distance_signed': best_signed_distance if best_signed_distance is not None else min_distance,
+            'kp': best_kp_m / 1000.0,
+            'path_index': best_path
+        }
+
+    @staticmethod
+    def _segment_start_kps(segments, path_offsets_m):
+        """
+        KP (m) at the start of each route segment.
+
+        Path offset plus the running length within the path, summed in the same
+        order as the segment walk so KPs match it to the last bit.
+        """
+        kps = []
+        current_path = None
+        running_m = 0.0
+        for _start, _end, segment_length, _cumulative_m, path_index in segments:
+            if path_index != current_path:
+                current_path = path_index
+                running_m = 0.0
+            kps.append(float(path_offsets_m[path_index]) + running_m)
+            running_m += segment_length
+        return kps
+
+    def _nearest_on_segment(self, segment_start, segment_end, segment_length, point_xy, distance_calculator):
+        """
+        Nearest point on one segment.
+
+        Returns:
+            tuple: (distance, point geometry, distance along segment, signed distance), or None
+        """
+        segment_geom = QgsGeometry.fromPolylineXY([segment_start, segment_end])
+        nearest_on_segment = segment_geom.nearestPoint(QgsGeometry.fromPointXY(point_xy))
+        if nearest_on_segment.isEmpty():
+            return None
+
+        nearest_on_segment_xy = nearest_on_segment.asPoint()
+        distance = float(distance_calculator.measureLine(point_xy, nearest_on_segment_xy))
+
+        distance_along_segment = float(
+            distance_calculator.measureLine(segment_start, nearest_on_segment_xy)
+        )
+        if distance_along_segment < 0:
+            distance_along_segment = 0.0
+        if distance_along_segment > segment_length:
+            distance_along_segment = segment_length
+
+        # Signed distance (port/stbd) relative to the direction of ascending KP
+        # Segment direction = segment_start -> segment_end.
+        # Using 2D cross product: cross(v, w) > 0 means point is left of the segment.
+        v_x = float(segment_end.x() - segment_start.x())
+        v_y = float(segment_end.y() - segment_start.y())
+        w_x = float(point_xy.x() - nearest_on_segment_xy.x())
+        w_y = float(point_xy.y() - nearest_on_segment_xy.y())
+        cross = (v_x * w_y) - (v_y * w_x)
+        if abs(cross) < 1e-12:
+            signed_distance = 0.0
+        elif cross > 0:
+            # Left/port side => negative
+            signed_distance = -abs(distance)
+        else:
+            # Right/stbd side => positive
+            signed_distance = abs(distance)
+
+        return distance, nearest_on_segment, distance_along_segment, signed_distance
+
     def calculate_kp(self, line_geom, nearest_pt_geom, distance_calculator):
         """
         Calculate the linear reference distance along the line geometry from the start to the nearest point.
@@ -18,6 +18,7 @@ from qgis.core import (
     QgsDistanceArea
 )
 from ..qgis_compat import FIELD_TYPE_DOUBLE, FIELD_TYPE_STRING, PROCESSING_NUMBER_DOUBLE
+from .raster_blocks import RasterBlockSampler
 from qgis.PyQt.QtCore import QCoreApplication
 from ..kp_range_utils import (
     make_distance_area,
@@ -138,7 +139,11 @@ class PlaceKpPointsAlgorithm(QgsProcessingAlgorithm):
             provider = raster_layer.dataProvider()
             if not provider.isValid():
                 raise QgsProcessingException(self.tr("Invalid raster data provider."))
-            raster_sampler = provider
+            # Tile-cached reads: KP points along a route revisit the same
+            # raster blocks, so one block read serves many points.
+            raster_sampler = RasterBlockSampler.from_provider(provider)
+            if raster_sampler is None:
+                raise QgsProcessingException(self.tr("Raster has no readable grid."))
 
         fields = QgsFields()
         fields.append(QgsField("source_line", FIELD_TYPE_STRING))
@@ -204,9 +209,9 @@ class PlaceKpPointsAlgorithm(QgsProcessingAlgorithm):
                 attributes.append(None)
                 null_depth_count += 1
             else:
-                depth_value, res = raster_sampler.sample(sample_point, 1)
-                if res:
-                    attributes.append(float(depth_value))
+                depth_value = raster_sampler.value_at(sample_point.x(), sample_point.y())
+                if depth_value is not None:
+                    attributes.append(depth_value)
                 else:
                     attributes.append(None)
                     null_depth_count += 1
@@ -252,9 +257,9 @@ class PlaceKpPointsAlgorithm(QgsProcessingAlgorithm):
                                 attributes.append(None)
                                 null_depth_count += 1
                             else:
-                                depth_value, res = raster_sampler.sample(point_xy, 1)
-                                if res:
-                                    attributes.append(float(depth_value))
+                                depth_value = raster_sampler.value_at(point_xy.x(), point_xy.y())
+                                if depth_value is not None:
+                                    attributes.append(depth_value)
                                 else:
                                     attributes.append(None)
                                     null_depth_count += 1
@@ -9,6 +9,7 @@ This algorithm:
 2. Samples depths along the route at configurable intervals
 3. Computes 3D length by summing distances between consecutive points
 4. Optionally performs sensitivity analysis with multiple intervals
+   (each spacing is taken from one dense profile sampled once per route)
 5. Outputs the seabed length and elongation ratio
 """
 
@@ -25,7 +26,8 @@ if lib_dir not in sys.path:
 
 from qgis.PyQt.QtCore import QCoreApplication
 from ..kp_range_utils import make_distance_area
-from ..kp_geo_utils import extract_line_segment
+from .raster_blocks import RasterBlockSampler, transform_points
+from .seabed_profile import SeabedProfile, profile_spacing, station_kps
 from qgis.core import (
     QgsProcessing,
     QgsProcessingAlgorithm,
@@ -56,7 +58,7 @@ from qgis.core import (
 )
 from ..qgis_compat import FIELD_TYPE_DOUBLE, FIELD_TYPE_INT, FIELD_TYPE_STRING, PROCESSING_NUMBER_INTEGER
 
-import math
+import numpy as np
 
 
 class SeabedLengthAlgorithm(QgsProcessingAlgorithm):
@@ -174,6 +176,8 @@ class SeabedLengthAlgorithm(QgsProcessingAlgorithm):
         )
 
     def processAlgorithm(self, parameters, context, feedback):
+        # Tile-cached raster samplers by layer id, shared by every route.
+        self._blocks_cache = {}
         line_layer = self.parameterAsVectorLayer(parameters, self.INPUT_LINE, context)
         if not line_layer:
             raise QgsProcessingException(self.tr('Invalid line layer'))
@@ -199,6 +203,7 @@ class SeabedLengthAlgorithm(QgsProcessingAlgorithm):
         if do_sensitivity:
             try:
                 sensitivity_intervals = [int(x.strip()) for x in sensitivity_intervals_str.split(',')]
+                sensitivity_intervals = [i for i in sensitivity_intervals if i > 0] or [1, 5, 10, 25, 50, 100]
             except (ValueError, AttributeError):
                 sensitivity_intervals = [1, 5, 10, 25, 50, 100]
 
@@ -254,16 +259,30 @@ class SeabedLengthAlgorithm(QgsProcessingAlgorithm):
             )
             plan_length = distance_area.measureLength(merged_geom)
 
-            # Calculate seabed length
-            seabed_length, sampled_points = self._calculate_seabed_length(
-                merged_geom, raster_layer, contour_layer, bathy_type, sampling_interval, line_layer.crs(), context, depth_field
+            # One dense profile per route; every spacing and KP interval is
+            # derived from it instead of re-reading the bathymetry. Sensitivity
+            # spacings only refine it when they are reported.
+            reported = sensitivity_intervals if do_sensitivity and not output_intervals else []
+            dense = self._sample_profile(
+                merged_geom, raster_layer, contour_layer, bathy_type,
+                profile_spacing([sampling_interval] + reported),
+                line_layer.crs(), context, depth_field,
             )
+            if dense.spacing and sampling_interval % dense.spacing:
+                # Coprime fallback: keep the headline length on its own
+                # stations rather than interpolated ones.
+                profile = self._sample_profile(
+                    merged_geom, raster_layer, contour_layer, bathy_type,
+                    sampling_interval, line_layer.crs(), context, depth_field,
+                )
+            else:
+                profile = dense.resample(sampling_interval)
+            seabed_length = profile.seabed_length()
 
             # Check coverage and warn if incomplete
-            valid_depths = [p for p in sampled_points if (p[1] if len(p) == 2 else p[1]) is not None]
-            total_samples = len(sampled_points)
-            valid_count = len(valid_depths)
-            
+            total_samples = len(profile)
+            valid_count = profile.valid_count
+
             if valid_count == 0:
                 feedback.pushWarning(f"Route '{route_id}': No bathymetry coverage. Seabed length falls back to plan (2D) length.")
                 seabed_length = plan_length
@@ -273,30 +292,21 @@ class SeabedLengthAlgorithm(QgsProcessingAlgorithm):
 
             if output_intervals:
                 # Output at regular KP intervals
-                kp_interval_m = kp_interval_km * 1000
-                current_kp = 0.0
-                while current_kp < plan_length:
-                    end_kp = min(current_kp + kp_interval_m, plan_length)
-                    
-                    # Extract segment geometry using straight line approximation
-                    segment_geom = self._extract_segment(merged_geom, current_kp, end_kp, distance_area)
-                    if segment_geom and not segment_geom.isEmpty():
-                        segment_plan_length = distance_area.measureLength(segment_geom)
-                        segment_seabed_length, _ = self._calculate_seabed_length(
-                            segment_geom, raster_layer, contour_layer, bathy_type, sampling_interval, line_layer.crs(), context, depth_field
-                        )
-                        segment_elongation = segment_seabed_length / segment_plan_length if segment_plan_length > 0 else 0
-                        
-                        out_feature = QgsFeature(fields)
-                        out_feature.setAttribute('route_id', route_id)
-                        out_feature.setAttribute('kp_start', current_kp / 1000)
-                        out_feature.setAttribute('kp_end', end_kp / 1000)
-                        out_feature.setAttribute('segment_length_m', segment_plan_length)
-                        out_feature.setAttribute('seabed_segment_length_m', segment_seabed_length)
-                        out_feature.setAttribute('elongation_ratio', segment_elongation)
-                        sink.addFeature(out_feature, QgsFeatureSink.FastInsert)
-                    
-                    current_kp = end_kp
+                edges = station_kps(plan_length, kp_interval_km * 1000)
+                segment_seabed_lengths = profile.interval_lengths(edges)
+                for start_kp, end_kp, segment_seabed_length in zip(
+                        edges[:-1], edges[1:], segment_seabed_lengths):
+                    segment_plan_length = float(end_kp - start_kp)
+                    segment_elongation = segment_seabed_length / segment_plan_length if segment_plan_length > 0 else 0
+
+                    out_feature = QgsFeature(fields)
+                    out_feature.setAttribute('route_id', route_id)
+                    out_feature.setAttribute('kp_start', float(start_kp) / 1000)
+                    out_feature.setAttribute('kp_end', float(end_kp) / 1000)
+                    out_feature.setAttribute('segment_length_m', segment_plan_length)
+                    out_feature.setAttribute('seabed_segment_length_m', float(segment_seabed_length))
+                    out_feature.setAttribute('elongation_ratio', float(segment_elongation))
+                    sink.addFeature(out_feature, QgsFeatureSink.FastInsert)
             else:
                 elongation_ratio = seabed_length / plan_length if plan_length > 0 else 0
 
@@ -304,10 +314,7 @@ class SeabedLengthAlgorithm(QgsProcessingAlgorithm):
                 sensitivity_results = {}
                 if do_sensitivity:
                     for interval in sensitivity_intervals:
-                        length, _ = self._calculate_seabed_length(
-                            merged_geom, raster_layer, contour_layer, bathy_type, interval, line_layer.crs(), context, depth_field
-                        )
-                        sensitivity_results[str(interval)] = length
+                        sensitivity_results[str(interval)] = dense.resample(interval).seabed_length()
 
                 # Create output feature
                 out_feature = QgsFeature(fields)
@@ -323,19 +330,20 @@ class SeabedLengthAlgorithm(QgsProcessingAlgorithm):
 
         return {self.OUTPUT: dest_id}
 
-    def _calculate_seabed_length(self, geom, raster_layer, contour_layer, bathy_type, interval_m, line_crs, context, depth_field):
-        """Calculate seabed length by sampling depths along the geometry.
+    def _sample_profile(self, geom, raster_layer, contour_layer, bathy_type, interval_m, line_crs, context, depth_field):
+        """Sample the depth profile along the geometry as a ``SeabedProfile``.
 
         Plan distances come from ``QgsDistanceArea`` configured for ellipsoidal
         measurement, so they are metres regardless of the line CRS units. The
         3D length is then ``sqrt(plan_m^2 + dz_m^2)``, which assumes ``z`` is
         also in metres (the standard for bathymetry rasters / contours).
+        Raster profiles have stations every ``interval_m`` from KP 0 plus the
+        route end; contour profiles have the route ends and every crossing.
         """
         distance_area = make_distance_area(
             line_crs, context.transformContext(), project=context.project()
         )
         total_length = distance_area.measureLength(geom)
-        sampled_points = []
 
         if bathy_type == 0:  # Raster
             # Get line vertices
@@ -349,36 +357,26 @@ class SeabedLengthAlgorithm(QgsProcessingAlgorithm):
                     points.extend([QgsPointXY(pt.x(), pt.y()) for pt in part.points()])
 
             if len(points) < 2:
-                return 0.0, []
-
-            # Sample points along the line
-            sampled_points = []
-            dist = 0.0
-            while dist <= total_length:
-                # Interpolate point at distance
-                point = self._interpolate_point_along_line(points, dist, distance_area)
-                if point:
-                    # Sample depth
-                    depth = self._sample_depth(point, raster_layer, contour_layer, bathy_type, line_crs, depth_field)
-                    sampled_points.append((point, depth))
-                dist += interval_m
-
-            # Ensure last point
-            if sampled_points and sampled_points[-1][0] != points[-1]:
-                depth = self._sample_depth(points[-1], raster_layer, contour_layer, bathy_type, line_crs, depth_field)
-                sampled_points.append((points[-1], depth))
-
-        elif bathy_type == 1:  # Contour
+                return SeabedProfile([], [], interval_m)
+
+            # Stations along the line, interpolated on the vertices' chainage
+            chainage = np.concatenate([[0.0], np.cumsum(
+                [distance_area.measureLine(p0, p1) for p0, p1 in zip(points, points[1:])])])
+            kps = station_kps(total_length, interval_m)
+            xs = np.interp(kps, chainage, [p.x() for p in points])
+            ys = np.interp(kps, chainage, [p.y() for p in points])
+            return SeabedProfile(kps, self._sample_raster_xy(xs, ys, raster_layer, line_crs), interval_m)
+
+        if bathy_type == 1:  # Contour
             # Find intersection points with contours
-            sampled_points = []
             points_with_distance = []
             start_point = self._get_first_point(geom)
             end_point = self._get_last_point(geom)
-            
+
             # Add start point
             start_depth = self._sample_depth(start_point, raster_layer, contour_layer, bathy_type, line_crs, depth_field)
-            points_with_distance.append((start_point, start_depth, 0.0))
-            
+            points_with_distance.append((start_depth, 0.0))
+
             # Add intersection points
             for contour_feat in contour_layer.getFeatures():
                 contour_geom = contour_feat.geometry()
@@ -394,41 +392,17 @@ class SeabedLengthAlgorithm(QgsProcessingAlgorithm):
                             if part.wkbType() == QgsWkbTypes.Point:
                                 pt = QgsPointXY(part.x(), part.y())
                                 dist_along = geom.lineLocatePoint(QgsGeometry.fromPointXY(pt))
-                                points_with_distance.append((pt, depth, dist_along))
-            
+                                points_with_distance.append((depth, dist_along))
+
             # Add end point
             end_depth = self._sample_depth(end_point, raster_layer, contour_layer, bathy_type, line_crs, depth_field)
-            points_with_distance.append((end_point, end_depth, total_length))
-            
-            # Sort by distance and extract just (point, depth)
-            points_with_distance.sort(key=lambda x: x[2])
-            sampled_points = [(p, z) for p, z, d in points_with_distance]
-
-        # Calculate 3D length using only valid consecutive samples
-        seabed_length = 0.0
-        valid_pts = [(p, z) for p, z in sampled_points if z is not None]
-        for i in range(1, len(valid_pts)):
-            p0, z0 = valid_pts[i-1]
-            p1, z1 = valid_pts[i]
-            plan_dist = distance_area.measureLine(p0, p1)
-            dz = z1 - z0
-            seabed_length += math.sqrt(plan_dist**2 + dz**2)
-
-        return seabed_length, sampled_points
-
-    def _extract_segment(self, geom, start_dist, end_dist, distance_area):
-        """Extract the route segment between two along-route distances (m).
-
-        Uses the shared linear-referencing primitive so the returned geometry
-        follows the actual route. The previous implementation joined the two
-        endpoints with a straight chord, which under-reported the segment plan
-        length and sampled bathymetry off-route on curved routes.
-        """
-        if start_dist >= end_dist:
-            return None
-        return extract_line_segment(
-            geom, start_dist / 1000.0, end_dist / 1000.0, distance_area
-        )
+            points_with_distance.append((end_depth, total_length))
+
+            points_with_distance.sort(key=lambda x: x[1])
+            return SeabedProfile([d for _z, d in points_with_distance],
+                                 [self._depth_value(z) for z, _d in points_with_distance])
+
+        return SeabedProfile([], [])
 
     def _get_first_point(self, geom):
         """Get the first point of the geometry."""
@@ -456,28 +430,35 @@ class SeabedLengthAlgorithm(QgsProcessingAlgorithm):
                     return QgsPointXY(last_part.pointN(last_part.numPoints() - 1))
         return None
 
-    def _interpolate_point_along_line(self, points, distance, distance_area):
-        """Interpolate a point along the line at given distance."""
-        if not points:
-            return None
-
-        cumulative_dist = 0.0
-        for i in range(len(points) - 1):
-            p0 = points[i]
-            p1 = points[i+1]
-            seg_dist = distance_area.measureLine(p0, p1)
-
-            if cumulative_dist + seg_dist >= distance:
-                # Interpolate within this segment
-                remaining = distance - cumulative_dist
-                ratio = remaining / seg_dist if seg_dist > 0 else 0
-                x = p0.x() + ratio * (p1.x() - p0.x())
-                y = p0.y() + ratio * (p1.y() - p0.y())
-                return QgsPointXY(x, y)
-
-            cumulative_dist += seg_dist
-
-        return points[-1]  # Return last point if distance exceeds total length
+    def _raster_blocks(self, raster_layer):
+        """Tile-cached sampler for ``raster_layer``, reused across the run."""
+        key = raster_layer.id()
+        if key not in self._blocks_cache:
+            self._blocks_cache[key] = RasterBlockSampler.from_layer(raster_layer)
+        return self._blocks_cache[key]
+
+    def _sample_raster_xy(self, xs, ys, raster_layer, line_crs):
+        """Band-1 raster depths at ``(xs, ys)`` (line CRS); NaN = no data."""
+        blocks = self._raster_blocks(raster_layer) if raster_layer else None
+        transform = None
+        if raster_layer is not None and raster_layer.crs() != line_crs:
+            transform = QgsCoordinateTransform(line_crs, raster_layer.crs(), QgsProject.instance())
+        if blocks is None or transform is not None:
+            points = [QgsPointXY(x, y) for x, y in zip(xs.tolist(), ys.tolist())]
+        if blocks is None:
+            return np.array([self._depth_value(self._sample_depth(p, raster_layer, None, 0, line_crs, None))
+                             for p in points], dtype=np.float64)
+        if transform is not None:
+            xs, ys = transform_points(points, transform)
+        return blocks.sample_xy(xs, ys)
+
+    @staticmethod
+    def _depth_value(value):
+        """Depth attribute / sample -> float, NaN for missing or non-numeric."""
+        try:
+            return float(value) if value is not None else np.nan
+        except (TypeError, ValueError):
+            return np.nan
 
     def _sample_depth(self, point, raster_layer, contour_layer, bathy_type, line_crs, depth_field):
         """Sample depth at a point from raster or contours."""
@@ -492,6 +473,9 @@ class SeabedLengthAlgorithm(QgsProcessingAlgorithm):
                     return None
 
             # Sample raster
+            blocks = self._raster_blocks(raster_layer)
+            if blocks is not None:
+                return blocks.value_at(sample_point.x(), sample_point.y())
             provider = raster_layer.dataProvider()
             sample, ok = provider.sample(sample_point, 1)
             return float(sample) if ok else None
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""Along-route depth profile arithmetic for the seabed (3D) length.
+
+Pure NumPy; no QGIS imports.
+
+A :class:`SeabedProfile` holds depths at stations every ``spacing`` metres
+from KP 0 plus the route end (NaN = no coverage). The Calculate Seabed Length
+algorithm samples one profile at the finest spacing it needs (normally the
+GCD of the sampling interval and every reported sensitivity interval, see
+:func:`profile_spacing`) and derives the rest from it: :meth:`SeabedProfile.resample` picks the coarser spacings' stations out of
+the dense array, and :meth:`SeabedProfile.interval_lengths` splits the 3D
+length at arbitrary KPs from one cumulative sum. The bathymetry is therefore
+read once per route, however many spacings and KP intervals are reported.
+
+Like the per-station loop it replaces, the 3D length joins consecutive
+*valid* samples, so a gap in coverage is bridged by one straight step.
+"""
+
+from __future__ import annotations
+
+import math
+from functools import reduce
+from typing import Iterable, Optional
+
+import numpy as np
+
+
+# A shared profile may sample at most this many times the stations the
+# separate per-spacing passes would; finer GCDs fall back to interpolation.
+_MAX_OVERSAMPLING = 2.0
+
+
+def profile_spacing(spacings: Iterable[int]) -> int:
+    """Spacing for one profile that serves every spacing in ``spacings``.
+
+    Normally the GCD, whose stations include every spacing's stations. When
+    the GCD would sample far more stations than separate passes (coprime
+    spacings such as 7 and 10 collapse to 1 m), the smallest spacing is
+    returned instead and :meth:`SeabedProfile.resample` interpolates the
+    others.
+    """
+    values = [int(s) for s in spacings if int(s) > 0]
+    if not values:
+        return 1
+    gcd = reduce(math.gcd, values)
+    separate = sum(1.0 / v for v in set(values))
+    if 1.0 / gcd > _MAX_OVERSAMPLING * separate:
+        return min(values)
+    return gcd
+
+
+def station_kps(total_m: float, spacing_m: float) -> np.ndarray:
+    """KPs (m) of ``0, s, 2s, ... <= total_m`` followed by ``total_m``."""
+    total_m = max(float(total_m), 0.0)
+    count = int(math.floor(total_m / spacing_m + 1e-9)) + 1
+    kps = np.arange(count, dtype=np.float64) * spacing_m
+    if kps[-1] < total_m:
+        kps = np.append(kps, total_m)
+    return kps
+
+
+class SeabedProfile:
+    """Depths (NaN = no data) at along-route stations ``kp`` (metres)."""
+
+    def __init__(self, kp, depth, spacing: Optional[float] = None):
+        """``spacing`` marks a regular profile (see :func:`station_kps`);
+        leave it ``None`` for irregular stations such as contour crossings."""
+        self.kp = np.asarray(kp, dtype=np.float64)
+        self.depth = np.asarray(depth, dtype=np.float64)
+        self.spacing = float(spacing) if spacing else None
+
+    def __len__(self) -> int:
+        return int(self.kp.size)
+
+    @property
+    def valid(self) -> np.ndarray:
+        return np.isfinite(self.depth)
+
+    @property
+    def valid_count(self) -> int:
+        return int(np.count_nonzero(self.valid))
+
+    def resample(self, spacing: float) -> "SeabedProfile":
+        """The profile at a coarser ``spacing`` (stations from KP 0 plus the end).
+
+        When ``spacing`` is a multiple of this profile's spacing the stations
+        are picked out unchanged; otherwise depths are interpolated between
+        valid samples and left NaN where the nearest sample has none.
+        Irregular profiles are returned as they are.
+        """
+        if self.spacing is None or self.kp.size == 0 or float(spacing) == self.spacing:
+            return self
+        total = float(self.kp[-1])
+        ratio = float(spacing) / self.spacing
+        step = int(round(ratio))
+        if step >= 1 and abs(ratio - step) < 1e-9:
+            regular = int(math.floor(total / self.spacing + 1e-9)) + 1
+            index = np.arange(0, min(regular, self.kp.size), step)
+            if index[-1] != self.kp.size - 1:
+                index = np.append(index, self.kp.size - 1)
+            return SeabedProfile(self.kp[index], self.depth[index], spacing)
+        kps = station_kps(total, float(spacing))
+        valid = self.valid
+        if not valid.any():
+            return SeabedProfile(kps, np.full(kps.size, np.nan), spacing)
+        depth = np.interp(kps, self.kp[valid], self.depth[valid])
+        right = np.clip(np.searchsorted(self.kp, kps), 0, self.kp.size - 1)
+        left = np.maximum(right - 1, 0)
+        nearest = np.where(np.abs(self.kp[left] - kps) <= np.abs(self.kp[right] - kps),
+                           left, right)
+        depth[~valid[nearest]] = np.nan
+        return SeabedProfile(kps, depth, spacing)
+
+    def cumulative_length(self):
+        """``(kp, cumulative 3D length)`` over the valid samples."""
+        valid = self.valid
+        kp = self.kp[valid]
+        steps = np.hypot(np.diff(kp), np.diff(self.depth[valid]))
+        return kp, np.concatenate([[0.0], np.cumsum(steps)])
+
+    def seabed_length(self) -> float:
+        """3D length through consecutive valid samples (0 without two)."""
+        _kp, cumulative = self.cumulative_length()
+        return float(cumulative[-1])
+
+    def interval_lengths(self, edges) -> np.ndarray:
+        """3D length between consecutive KPs in ``edges`` (metres, ascending).
+
+        Edges between samples take the linearly interpolated share of the
+        step they fall in, so the intervals sum to :meth:`seabed_length` when
+        ``edges`` spans the profile.
+        """
+        edges = np.asarray(edges, dtype=np.float64)
+        kp, cumulative = self.cumulative_length()
+        if kp.size < 2:
+            return np.zeros(max(edges.size - 1, 0))
+        return np.diff(np.interp(edges, kp, cumulative))
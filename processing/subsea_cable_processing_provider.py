@@ -2,14 +2,135 @@
 # -*- coding: utf-8 -*-
 """
 SubseaCableProcessingProvider
-This provider loads processing algorithms for Subsea Cable Tools.
-"""
+This provider registers the processing algorithms for Subsea Cable Tools.
 
-import importlib
-import traceback
+Algorithms are registered from the ``ALGORITHMS`` metadata table as
+:class:`~.lazy_algorithm.LazyAlgorithm` entries; each implementing module is
+imported only when its algorithm is first created (dialog, run, model).
+"""
 
-from qgis.core import QgsProcessingProvider, QgsMessageLog, Qgis
-from ..qgis_compat import MESSAGE_INFO, MESSAGE_WARNING
+from qgis.core import QgsProcessingProvider, QgsMessageLog
+from ..qgis_compat import MESSAGE_INFO
+from .lazy_algorithm import AlgorithmEntry, LazyAlgorithm
+
+# Toolbox groups: group id -> display name.
+_GROUPS = {
+    'kp_ranges': 'KP Ranges',
+    'kppoints': 'KP Points',
+    'rpl_tools': 'RPL Tools',
+    'cable_lay_data_import': 'Cable Lay Data Import',
+    'cable_lay_qc': 'Cable Lay QC & Analysis',
+    'mdb_tools': 'MDB Tools',
+    'mbestools': 'MBES Tools',
+    'other_tools': 'Other Tools',
+}
+
+
+def _entry(module, class_name, name, display_name, group_id):
+    return AlgorithmEntry(module, class_name, name, display_name, _GROUPS[group_id], group_id)
+
+
+# Algorithms are listed by toolbox group, then alphabetically by class name
+# within each group. Adding a new algorithm? Slot it into the right group
+# block to keep diffs small; name, display name and group must match the
+# class (the QGIS smoke runner checks them).
+ALGORITHMS = (
+    # --- KP Ranges ---
+    _entry('kp_range_csv_algorithm', 'KPRangeCSVAlgorithm',
+           'kp_range_csv_processor', 'KP Range Highlighter from CSV', 'kp_ranges'),
+    _entry('kp_range_depth_slope_summary_algorithm', 'KPRangeDepthSlopeSummaryAlgorithm',
+           'kp_range_depth_slope_summary', 'KP Range Depth + Slope Summary', 'kp_ranges'),
+    _entry('kp_range_extract_rule_based_algorithm', 'ExtractKPRangesRuleBasedAlgorithm',
+           'kp_range_extract_rule_based', 'Extract KP Ranges (Rule Based)', 'kp_ranges'),
+    _entry('kp_range_group_adjacent_algorithm', 'KPRangeGroupAdjacentAlgorithm',
+           'kp_range_group_adjacent', 'Group Adjacent KP Ranges by Field', 'kp_ranges'),
+    _entry('kp_range_highlighter_algorithm', 'KPRangeHighlighterAlgorithm',
+           'kp_range_highlighter', 'KP Range Highlighter', 'kp_ranges'),
+    _entry('kp_range_merge_tables_algorithm', 'KPRangeMergeTablesAlgorithm',
+           'kp_range_merge_tables', 'Merge KP Range Tables', 'kp_ranges'),
+
+    # --- KP Points ---
+    _entry('add_depth_to_point_layer_algorithm', 'AddDepthToPointLayerAlgorithm',
+           'add_depth_to_points', 'Add Depth to Point Layer', 'kppoints'),
+    _entry('nearest_kp_algorithm', 'NearestKPAlgorithm',
+           'nearest_kp', 'Nearest KP', 'kppoints'),
+    _entry('place_kp_points_algorithm', 'PlaceKpPointsAlgorithm',
+           'placekppointsalongroute', 'Place KP(Z) Points Along Route', 'kppoints'),
+    _entry('place_kp_points_from_csv_algorithm', 'PlaceKpPointsFromCsvAlgorithm',
+           'placekppointsfromcsv', 'Place KP Points from CSV', 'kppoints'),
+    _entry('place_single_kp_point_algorithm', 'PlaceSingleKpPointAlgorithm',
+           'placesinglekppoint', 'Place Single KP Point', 'kppoints'),
+
+    # --- RPL Tools ---
+    _entry('extract_ac_points_algorithm', 'ExtractACPointsAlgorithm',
+           'extract_ac_points', 'Extract A/C Points from RPL', 'rpl_tools'),
+    _entry('identify_rpl_area_listing_algorithm', 'IdentifyRPLAreaListingAlgorithm',
+           'identify_rpl_area_listing', 'Identify RPL Area Listing', 'rpl_tools'),
+    _entry('identify_rpl_crossing_points_algorithm', 'IdentifyRPLCrossingPointsAlgorithm',
+           'identify_rpl_crossing_points', 'Identify RPL Crossing Points', 'rpl_tools'),
+    _entry('identify_rpl_lay_corridor_proximity_listing_algorithm', 'IdentifyRPLLayCorridorProximityListingAlgorithm',
+           'identify_rpl_lay_corridor_proximity_listing', 'Identify Features Intersecting RPL', 'rpl_tools'),
+    _entry('import_excel_rpl_algorithm', 'ImportExcelRPLAlgorithm',
+           'importexcelrpl', 'Import Excel RPL', 'rpl_tools'),
+    _entry('import_rpl_algorithm', 'ImportRPLAlgorithm',
+           'import_rpl', 'Import RPL to Workbench (auto-detect)', 'rpl_tools'),
+    _entry('register_rpl_algorithm', 'RegisterRPLAlgorithm',
+           'register_rpl', 'Add RPL Layers to Workbench', 'rpl_tools'),
+    _entry('rpl_route_comparison_algorithm', 'RPLRouteComparisonAlgorithm',
+           'rplroutecomparison', 'Compare Design vs As-Laid Routes', 'rpl_tools'),
+    _entry('seabed_length_algorithm', 'SeabedLengthAlgorithm',
+           'seabedlength', 'Calculate Seabed Length', 'rpl_tools'),
+    _entry('translate_kp_from_rpl_to_rpl_algorithm', 'TranslateKPFromRPLToRPLAlgorithm',
+           'translatekpfromrpl', 'Translate KP Between RPLs (Points)', 'rpl_tools'),
+
+    # --- Cable Lay Data Import ---
+    _entry('create_cable_lay_geopackage_algorithm', 'CreateCableLayGeoPackageAlgorithm',
+           'create_cable_lay_geopackage', 'Create Cable Lay GeoPackage', 'cable_lay_data_import'),
+    _entry('import_cable_lay_algorithm', 'ImportCableLayAlgorithm',
+           'import_cable_lay', 'Import Cable Lay Data (CSV)', 'cable_lay_data_import'),
+    _entry('import_event_log_algorithm', 'ImportEventLogAlgorithm',
+           'import_event_log', 'Import Event Log', 'cable_lay_data_import'),
+    _entry('import_slack_log_algorithm', 'ImportSlackLogAlgorithm',
+           'import_slack_log', 'Import Slack Log', 'cable_lay_data_import'),
+    _entry('import_body_log_algorithm', 'ImportBodyLogAlgorithm',
+           'import_body_log', 'Import Body Log', 'cable_lay_data_import'),
+    _entry('import_3d_model_solutions_algorithm', 'Import3DModelSolutionsAlgorithm',
+           'import_3d_model_solutions', 'Import 3D Model Solutions', 'cable_lay_data_import'),
+    _entry('import_as_laid_algorithm', 'ImportAsLaidAlgorithm',
+           'import_as_laid', 'Import As-Laid', 'cable_lay_data_import'),
+    _entry('import_plough_data_algorithm', 'ImportPloughDataAlgorithm',
+           'import_plough_data', 'Import Plough Data', 'cable_lay_data_import'),
+
+    # --- Cable Lay QC & Analysis ---
+    _entry('run_cable_lay_qc_algorithm', 'RunCableLayQcAlgorithm',
+           'run_cable_lay_qc', 'Run Cable Lay QC', 'cable_lay_qc'),
+
+    # --- MDB Tools ---
+    _entry('import_mdb_algorithm', 'ImportMdbAlgorithm',
+           'import_mdb', 'Import MDB', 'mdb_tools'),
+
+    # --- MBES Tools ---
+    _entry('create_mbes_raster_from_xyz_algorithm', 'CreateMBESRasterFromXYZAlgorithm',
+           'optimised_creatembesrasterfromxyz', 'Create Raster from XYZ', 'mbestools'),
+    _entry('merge_mbes_rasters_algorithm', 'MergeMBESRastersAlgorithm',
+           'merge_mbes_rasters', 'Merge MBES Rasters', 'mbestools'),
+
+    # --- Other Tools ---
+    _entry('dynamic_buffer_lay_corridor_algorithm', 'DynamicBufferLayCorridorAlgorithm',
+           'dynamic_buffer_lay_corridor', 'Dynamic Buffer (Lay Corridor)', 'other_tools'),
+    _entry('export_kp_section_chartlets_algorithm', 'ExportKPSectionChartletsAlgorithm',
+           'export_kp_section_chartlets', 'Export KP section chartlets', 'other_tools'),
+    _entry('extract_lines_intersecting_polygons_algorithm', 'ExtractLinesIntersectingPolygonsAlgorithm',
+           'extract_lines_intersecting_polygons', 'Extract Lines Intersecting Polygons', 'other_tools'),
+    _entry('import_ship_outline_algorithm', 'ImportShipOutlineAlgorithm',
+           'import_ship_outline', 'Import Ship Outline (DXF)', 'other_tools'),
+    _entry('place_outline_along_route_algorithm', 'PlaceOutlineAlongRouteAlgorithm',
+           'place_outline_along_route', 'Place Outline Along Route (KP)', 'other_tools'),
+    _entry('place_ship_outlines_algorithm', 'PlaceShipOutlinesAlgorithm',
+           'place_ship_outlines', 'Place Ship Outlines at Points', 'other_tools'),
+    _entry('plot_line_segments_from_table_algorithm', 'PlotLineSegmentsFromTableAlgorithm',
+           'plotlinesegmentsfromtable', 'Plot Line Segments from Table', 'other_tools'),
+)
 
 
 class SubseaCableProcessingProvider(QgsProcessingProvider):
@@ -23,80 +144,9 @@ class SubseaCableProcessingProvider(QgsProcessingProvider):
         pass
 
     def loadAlgorithms(self):
-        def safe_add(module_name: str, class_name: str) -> None:
-            try:
-                module = importlib.import_module(f'.{module_name}', package=__package__)
-                algorithm_class = getattr(module, class_name)
-                self.addAlgorithm(algorithm_class())
-            except Exception:
-                QgsMessageLog.logMessage(
-                    f'Failed to register algorithm {class_name} from {module_name}.\n{traceback.format_exc()}',
-                    'Subsea Cable Tools',
-                    MESSAGE_WARNING,
-                )
-
         QgsMessageLog.logMessage('Loading Subsea Cable Tools algorithms...', 'Subsea Cable Tools', MESSAGE_INFO)
-
-        # Algorithms are listed by toolbox group, then alphabetically by class
-        # name within each group. Adding a new algorithm? Slot it into the right
-        # group block to keep diffs small.
-
-        # --- KP Ranges ---
-        safe_add('kp_range_csv_algorithm', 'KPRangeCSVAlgorithm')
-        safe_add('kp_range_depth_slope_summary_algorithm', 'KPRangeDepthSlopeSummaryAlgorithm')
-        safe_add('kp_range_extract_rule_based_algorithm', 'ExtractKPRangesRuleBasedAlgorithm')
-        safe_add('kp_range_group_adjacent_algorithm', 'KPRangeGroupAdjacentAlgorithm')
-        safe_add('kp_range_highlighter_algorithm', 'KPRangeHighlighterAlgorithm')
-        safe_add('kp_range_merge_tables_algorithm', 'KPRangeMergeTablesAlgorithm')
-
-        # --- KP Points ---
-        safe_add('add_depth_to_point_layer_algorithm', 'AddDepthToPointLayerAlgorithm')
-        safe_add('nearest_kp_algorithm', 'NearestKPAlgorithm')
-        safe_add('place_kp_points_algorithm', 'PlaceKpPointsAlgorithm')
-        safe_add('place_kp_points_from_csv_algorithm', 'PlaceKpPointsFromCsvAlgorithm')
-        safe_add('place_single_kp_point_algorithm', 'PlaceSingleKpPointAlgorithm')
-
-        # --- RPL Tools ---
-        safe_add('extract_ac_points_algorithm', 'ExtractACPointsAlgorithm')
-        safe_add('identify_rpl_area_listing_algorithm', 'IdentifyRPLAreaListingAlgorithm')
-        safe_add('identify_rpl_crossing_points_algorithm', 'IdentifyRPLCrossingPointsAlgorithm')
-        safe_add('identify_rpl_lay_corridor_proximity_listing_algorithm', 'IdentifyRPLLayCorridorProximityListingAlgorithm')
-        safe_add('import_excel_rpl_algorithm', 'ImportExcelRPLAlgorithm')
-        safe_add('import_rpl_algorithm', 'ImportRPLAlgorithm')
-        safe_add('register_rpl_algorithm', 'RegisterRPLAlgorithm')
-        safe_add('rpl_route_comparison_algorithm', 'RPLRouteComparisonAlgorithm')
-        safe_add('seabed_length_algorithm', 'SeabedLengthAlgorithm')
-        safe_add('translate_kp_from_rpl_to_rpl_algorithm', 'TranslateKPFromRPLToRPLAlgorithm')
-
-        # --- Cable Lay Data Import ---
-        safe_add('create_cable_lay_geopackage_algorithm', 'CreateCableLayGeoPackageAlgorithm')
-        safe_add('import_cable_lay_algorithm', 'ImportCableLayAlgorithm')
-        safe_add('import_event_log_algorithm', 'ImportEventLogAlgorithm')
-        safe_add('import_slack_log_algorithm', 'ImportSlackLogAlgorithm')
-        safe_add('import_body_log_algorithm', 'ImportBodyLogAlgorithm')
-        safe_add('import_3d_model_solutions_algorithm', 'Import3DModelSolutionsAlgorithm')
-        safe_add('import_as_laid_algorithm', 'ImportAsLaidAlgorithm')
-        safe_add('import_plough_data_algorithm', 'ImportPloughDataAlgorithm')
-
-        # --- Cable Lay QC & Analysis ---
-        safe_add('run_cable_lay_qc_algorithm', 'RunCableLayQcAlgorithm')
-
-        # --- MDB Tools ---
-        safe_add('import_mdb_algorithm', 'ImportMdbAlgorithm')
-
-        # --- MBES Tools ---
-        safe_add('create_mbes_raster_from_xyz_algorithm', 'CreateMBESRasterFromXYZAlgorithm')
-        safe_add('merge_mbes_rasters_algorithm', 'MergeMBESRastersAlgorithm')
-
-        # --- Other Tools ---
-        safe_add('dynamic_buffer_lay_corridor_algorithm', 'DynamicBufferLayCorridorAlgorithm')
-        safe_add('export_kp_section_chartlets_algorithm', 'ExportKPSectionChartletsAlgorithm')
-        safe_add('extract_lines_intersecting_polygons_algorithm', 'ExtractLinesIntersectingPolygonsAlgorithm')
-        safe_add('import_ship_outline_algorithm', 'ImportShipOutlineAlgorithm')
-        safe_add('place_outline_along_route_algorithm', 'PlaceOutlineAlongRouteAlgorithm')
-        safe_add('place_ship_outlines_algorithm', 'PlaceShipOutlinesAlgorithm')
-        safe_add('plot_line_segments_from_table_algorithm', 'PlotLineSegmentsFromTableAlgorithm')
-
+        for entry in ALGORITHMS:
+            self.addAlgorithm(LazyAlgorithm(entry))
 
     def id(self):
         """
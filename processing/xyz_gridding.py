@@ -0,0 +1,478 @@
+# -*- coding: utf-8 -*-
+"""In-process binning of XYZ point files onto a regular grid.
+
+Create Raster from XYZ used to parse each file with ``np.loadtxt``, write the
+points back out as a temporary CSV, wrap that in a VRT and hand it to
+``gdal:rasterize`` — three passes over the point cloud's worth of text for
+every multi-GB MBES export. This engine streams the file in chunks instead:
+
+1. ``scan_xyz`` — one parse of the text (``iter_xyz_chunks``: fixed-size
+   byte blocks) for the point count, bounds and (for grid-size
+   auto-detection) the distinct coordinates per axis up to a fixed cap,
+   spilling the parsed points to a raw float64 temp file instead of keeping
+   them in memory;
+2. ``CellAccumulator`` — a second pass over the spill that bins every chunk
+   into per-cell sum / count / min / max with ``np.bincount`` (sums,
+   counts) and ``np.minimum.at`` / ``np.maximum.at`` over the chunk's
+   occupied cells;
+3. ``write_geotiff`` — the mean (plus optional min / max / count bands)
+   written straight through GDAL's Python API.
+
+``grid_file`` runs all three for one file from a plain dict and never
+raises, so the tool can hand independent files to a process pool.
+
+Cells follow the tool's cell-centred registration (the outermost points sit
+at cell centres), so a regularly gridded export reproduces its values
+exactly. Pure NumPy apart from the GDAL writer, which is imported lazily —
+worker processes never import QGIS.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import uuid
+import warnings
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+NODATA = -9999.0
+DEFAULT_CHUNK_BYTES = 16 * 1024 * 1024
+DEFAULT_SPILL_ROWS = 2_000_000
+# The accumulators cost 32 bytes per cell (sum, min, max as float64 plus an
+# int64 count). Beyond this the GDAL rasterize path, which does not hold the
+# grid in memory, is used instead.
+MAX_NATIVE_CELLS = 100_000_000
+# Distinct coordinates kept per axis for grid-size detection (8 MB each).
+# A gridded export has one per raster column/row; scattered data passes the
+# cap and falls back to per-chunk spacing statistics.
+MAX_UNIQUE_VALUES = 1_000_000
+
+
+class GriddingUnavailable(Exception):
+    """The in-process engine cannot handle this input; use the GDAL path."""
+
+
+def gdal_available() -> bool:
+    try:
+        from osgeo import gdal  # noqa: F401
+    except Exception:
+        return False
+    return True
+
+
+def _parse_block(block: bytes, delimiter: Optional[str]) -> np.ndarray:
+    """One newline-terminated block of rows → (n, k) float64.
+
+    Fast path for the normal export (no comments, one column count): one
+    ``np.fromstring`` over the whole block after a vectorised check that
+    every line has the first line's token count. Anything else — comments,
+    blank or ragged lines, junk — goes through ``np.loadtxt``, which parses
+    it exactly as before or raises its usual ValueError.
+    """
+    text = block.replace(delimiter.encode(), b" ") if delimiter else block
+    if b"#" not in text and b"//" not in text:
+        raw = np.frombuffer(text, dtype=np.uint8)
+        space = (raw == 32) | (raw == 9) | (raw == 13) | (raw == 10)
+        starts = ~space
+        starts[1:] &= space[:-1]
+        line_of = np.cumsum(raw == 10) - (raw == 10)
+        lines = int(line_of[-1]) + 1 if len(raw) else 0
+        tokens = np.bincount(line_of[starts], minlength=lines)
+        ncols = int(tokens[0]) if lines else 0
+        if ncols and bool(np.all(tokens == ncols)):
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", DeprecationWarning)
+                values = np.fromstring(text, sep=" ")
+            if values.size == ncols * lines:
+                return values.reshape(lines, ncols)
+    with warnings.catch_warnings():
+        # A block of only comments/blank lines is not an error.
+        warnings.simplefilter("ignore", UserWarning)
+        return np.loadtxt(block.decode("utf-8", "replace").splitlines(),
+                          comments=["#", "//"], delimiter=delimiter, ndmin=2)
+
+
+def iter_xyz_chunks(path: str, delimiter: Optional[str] = None,
+                    skiprows: int = 0,
+                    chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> Iterator[np.ndarray]:
+    """(n, 3) float64 X/Y/Z arrays, about ``chunk_bytes`` of text at a time.
+
+    ``delimiter``/``skiprows`` come from ``sniff_xyz_format`` and mean what
+    they mean to ``np.loadtxt``; ``#``/``//`` comments and extra columns are
+    ignored. Memory stays at a few chunks whatever the file size. Raises
+    ValueError for rows with fewer than three columns.
+    """
+    with open(path, "rb") as handle:
+        for _i in range(skiprows):
+            if not handle.readline():
+                return
+        tail = b""
+        while True:
+            block = handle.read(chunk_bytes)
+            if not block:
+                break
+            block = tail + block
+            cut = block.rfind(b"\n")
+            if cut < 0:
+                tail = block
+                continue
+            tail = block[cut + 1:]
+            data = _parse_block(block[:cut + 1], delimiter)
+            if data.size:
+                yield _xyz_columns(data)
+        if tail.strip():
+            data = _parse_block(tail + b"\n", delimiter)
+            if data.size:
+                yield _xyz_columns(data)
+
+
+def _xyz_columns(data: np.ndarray) -> np.ndarray:
+    if data.shape[1] < 3:
+        raise ValueError(
+            "Input file must have at least 3 columns (X, Y, Z). "
+            f"Found shape: {data.shape}")
+    return data[:, :3]
+
+
+def iter_spilled_chunks(path: str, rows: int = DEFAULT_SPILL_ROWS
+                        ) -> Iterator[np.ndarray]:
+    """Chunks back from a ``scan_xyz`` spill file (raw little-endian float64)."""
+    with open(path, "rb") as handle:
+        while True:
+            data = np.fromfile(handle, dtype="<f8", count=rows * 3)
+            if not data.size:
+                return
+            yield data.reshape(-1, 3)
+
+
+@dataclass
+class XYZScan:
+    """What the first pass learns about a file (no points are retained)."""
+    count: int = 0
+    x_min: float = float("inf")
+    x_max: float = float("-inf")
+    y_min: float = float("inf")
+    y_max: float = float("-inf")
+    # Distinct coordinates per axis — ``detect_grid_size`` input. For a
+    # gridded export these are one value per raster column/row. None once
+    # an axis passes ``MAX_UNIQUE_VALUES``.
+    x_unique: Optional[np.ndarray] = None
+    y_unique: Optional[np.ndarray] = None
+    # Median distinct-coordinate step of each chunk, per axis: the bounded
+    # spacing estimate used when the distinct set was dropped.
+    x_chunk_steps: List[float] = field(default_factory=list)
+    y_chunk_steps: List[float] = field(default_factory=list)
+
+    def detected_grid_size(self) -> float:
+        """``detect_grid_size`` over the distinct coordinates, or the median
+        per-chunk step on axes whose distinct set passed the cap."""
+        return (_axis_step(self.x_unique, self.x_chunk_steps)
+                + _axis_step(self.y_unique, self.y_chunk_steps)) / 2.0
+
+
+def scan_xyz(chunks: Iterable[np.ndarray], track_unique: bool = True,
+             cancel=None, spill=None,
+             max_unique: int = MAX_UNIQUE_VALUES) -> Optional[XYZScan]:
+    """Bounds and count over a chunk stream; None when ``cancel()`` fires.
+
+    ``spill`` (a binary file) receives every chunk as raw float64 so the
+    binning pass reads it back instead of parsing the text a second time;
+    at 24 bytes per point it is smaller than the XYZ text it replaces.
+    ``track_unique`` keeps at most ``max_unique`` distinct coordinates per
+    axis plus one spacing statistic per chunk, so memory stays bounded on
+    irregular data too.
+    """
+    scan = XYZScan()
+    xs_u: Optional[List[np.ndarray]] = [] if track_unique else None
+    ys_u: Optional[List[np.ndarray]] = [] if track_unique else None
+    for chunk in chunks:
+        if cancel is not None and cancel():
+            return None
+        xs, ys = chunk[:, 0], chunk[:, 1]
+        scan.count += len(chunk)
+        if spill is not None:
+            np.ascontiguousarray(chunk, dtype="<f8").tofile(spill)
+        scan.x_min = min(scan.x_min, float(xs.min()))
+        scan.x_max = max(scan.x_max, float(xs.max()))
+        scan.y_min = min(scan.y_min, float(ys.min()))
+        scan.y_max = max(scan.y_max, float(ys.max()))
+        if track_unique:
+            xs_u = _track_axis(xs, xs_u, scan.x_chunk_steps, max_unique)
+            ys_u = _track_axis(ys, ys_u, scan.y_chunk_steps, max_unique)
+    if xs_u:
+        scan.x_unique = _fold_unique(xs_u, max_unique)
+    if ys_u:
+        scan.y_unique = _fold_unique(ys_u, max_unique)
+    return scan
+
+
+def _track_axis(values: np.ndarray, kept: Optional[List[np.ndarray]],
+                steps: List[float], max_unique: int
+                ) -> Optional[List[np.ndarray]]:
+    """Record one chunk's axis: its median step, and its distinct values
+    while the running set stays under ``max_unique`` (None past it)."""
+    unique = np.unique(values)
+    diffs = np.diff(unique)
+    diffs = diffs[diffs > 1e-9]
+    if diffs.size:
+        steps.append(float(np.median(diffs)))
+    if kept is None:
+        return None
+    kept.append(unique)
+    if len(kept) > 8:  # fold periodically: memory ~ distinct values
+        folded = _fold_unique(kept, max_unique)
+        return None if folded is None else [folded]
+    return kept
+
+
+def _fold_unique(parts: List[np.ndarray], max_unique: int
+                 ) -> Optional[np.ndarray]:
+    folded = np.unique(np.concatenate(parts))
+    return folded if len(folded) <= max_unique else None
+
+
+def _axis_step(unique: Optional[np.ndarray], chunk_steps: List[float]) -> float:
+    if unique is not None:
+        diffs = np.diff(unique)
+        diffs = diffs[diffs > 1e-9]
+        return float(np.median(diffs)) if diffs.size else 1.0
+    return float(np.median(chunk_steps)) if chunk_steps else 1.0
+
+
+def detect_grid_size(xs, ys):
+    """Median spacing between distinct sorted coordinates, per axis, averaged.
+
+    Exact for regularly gridded exports (the normal MBES deliverable) even
+    with missing cells, because the median of the unique-coordinate gaps is
+    the grid step. Scattered data can under-estimate; the raster-size guard
+    catches the pathological results.
+    """
+    dx = np.diff(np.unique(xs))
+    dy = np.diff(np.unique(ys))
+    grid_x = float(np.median(dx[dx > 1e-9])) if np.any(dx > 1e-9) else 1.0
+    grid_y = float(np.median(dy[dy > 1e-9])) if np.any(dy > 1e-9) else 1.0
+    return (grid_x + grid_y) / 2.0
+
+
+@dataclass
+class GridSpec:
+    """A north-up grid: top-left corner, square cell size and shape."""
+    x0: float
+    y_top: float
+    cell: float
+    width: int
+    height: int
+
+    @classmethod
+    def cell_centred(cls, scan: XYZScan, cell: float) -> "GridSpec":
+        """Same registration as ``cell_centred_extent`` in the algorithm."""
+        half = cell / 2.0
+        width = max(1, int(round((scan.x_max - scan.x_min + cell) / cell)))
+        height = max(1, int(round((scan.y_max - scan.y_min + cell) / cell)))
+        return cls(scan.x_min - half, scan.y_max + half, cell, width, height)
+
+    @property
+    def cells(self) -> int:
+        return self.width * self.height
+
+    def geotransform(self):
+        return (self.x0, self.cell, 0.0, self.y_top, 0.0, -self.cell)
+
+    def cell_index(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Flat row-major cell index per point (edge points clamped in)."""
+        cols = np.floor((xs - self.x0) / self.cell).astype(np.int64)
+        rows = np.floor((self.y_top - ys) / self.cell).astype(np.int64)
+        np.clip(cols, 0, self.width - 1, out=cols)
+        np.clip(rows, 0, self.height - 1, out=rows)
+        return rows * self.width + cols
+
+
+@dataclass
+class CellAccumulator:
+    """Per-cell sum, count, min and max over any number of point chunks."""
+    spec: GridSpec
+    total: np.ndarray = field(init=False)
+    count: np.ndarray = field(init=False)
+    low: np.ndarray = field(init=False)
+    high: np.ndarray = field(init=False)
+
+    def __post_init__(self):
+        n = self.spec.cells
+        self.total = np.zeros(n, dtype=np.float64)
+        self.count = np.zeros(n, dtype=np.int64)
+        self.low = np.full(n, np.inf)
+        self.high = np.full(n, -np.inf)
+
+    def add(self, chunk: np.ndarray) -> None:
+        zs = chunk[:, 2]
+        valid = np.isfinite(zs)
+        if not valid.all():
+            chunk, zs = chunk[valid], zs[valid]
+        if not len(zs):
+            return
+        index = self.spec.cell_index(chunk[:, 0], chunk[:, 1])
+        # Compact to the chunk's occupied cells so bincount and the
+        # min/max scatter run over O(chunk), not O(grid).
+        cells, local = np.unique(index, return_inverse=True)
+        self.total[cells] += np.bincount(local, weights=zs)
+        self.count[cells] += np.bincount(local)
+        low = np.full(len(cells), np.inf)
+        high = np.full(len(cells), -np.inf)
+        np.minimum.at(low, local, zs)
+        np.maximum.at(high, local, zs)
+        np.minimum(self.low[cells], low, out=low)
+        np.maximum(self.high[cells], high, out=high)
+        self.low[cells] = low
+        self.high[cells] = high
+
+    def bands(self, statistics: bool = False) -> List[np.ndarray]:
+        """(height, width) float32 grids: mean, then min/max/count if asked.
+
+        Empty cells carry ``NODATA`` (count is 0 there).
+        """
+        empty = self.count == 0
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = self.total / self.count
+        out = [mean]
+        if statistics:
+            out.extend([self.low, self.high, self.count.astype(np.float64)])
+        shape = (self.spec.height, self.spec.width)
+        grids = []
+        for i, values in enumerate(out):
+            grid = values.astype(np.float32)
+            if i < len(out) - 1 or not statistics:
+                grid[empty] = NODATA
+            grids.append(grid.reshape(shape))
+        return grids
+
+
+def write_geotiff(path: str, spec: GridSpec, bands: Sequence[np.ndarray],
+                  crs_wkt: str, compress: bool = True,
+                  descriptions: Sequence[str] = ()) -> str:
+    """Write Float32 bands through GDAL (raises GriddingUnavailable without it)."""
+    try:
+        from osgeo import gdal
+    except Exception as exc:
+        raise GriddingUnavailable(f"GDAL Python bindings unavailable ({exc})")
+    options = ["BIGTIFF=IF_SAFER"]
+    if compress:
+        options += ["COMPRESS=LZW", "TILED=YES"]
+    dataset = gdal.GetDriverByName("GTiff").Create(
+        path, spec.width, spec.height, len(bands), gdal.GDT_Float32, options)
+    if dataset is None:
+        raise OSError(f"GDAL could not create {path}")
+    try:
+        dataset.SetGeoTransform(spec.geotransform())
+        if crs_wkt:
+            dataset.SetProjection(crs_wkt)
+        for i, grid in enumerate(bands):
+            band = dataset.GetRasterBand(i + 1)
+            band.SetNoDataValue(NODATA)
+            if i < len(descriptions):
+                band.SetDescription(descriptions[i])
+            band.WriteArray(grid)
+        dataset.FlushCache()
+    finally:
+        dataset = None  # closes the file
+    return path
+
+
+# ---------------------------------------------------------------------------
+# One file, end to end — what each pool worker runs
+# ---------------------------------------------------------------------------
+
+STATUS_OK = "ok"
+STATUS_FALLBACK = "fallback"      # too large to bin in memory: use GDAL path
+STATUS_TOO_LARGE = "too_large"    # beyond the tool's raster-size guard
+STATUS_CANCELLED = "cancelled"
+STATUS_ERROR = "error"
+
+
+def grid_file(job: Dict, cancel: Optional[Callable[[], bool]] = None) -> Dict:
+    """Scan, bin and write one XYZ file; never raises.
+
+    ``job`` is a plain (picklable) dict: path, delimiter, skiprows,
+    grid_size (0 = auto), output, crs_wkt, compress, statistics,
+    max_raster_cells (the tool's size guard), max_cells (in-memory limit),
+    temp_dir and cancel_path — a file whose existence cancels the run, since
+    a pool worker cannot see the parent's feedback object. Returns a dict
+    with ``status`` (STATUS_*), ``message`` and the grid facts the caller
+    logs (count, grid_size, width, height, output).
+    """
+    if cancel is None:
+        cancel_path = job.get("cancel_path") or ""
+        cancel = (lambda: os.path.exists(cancel_path)) if cancel_path \
+            else (lambda: False)
+    result = {"path": job["path"], "status": STATUS_OK, "message": "",
+              "count": 0, "grid_size": 0.0, "width": 0, "height": 0,
+              "output": ""}
+    grid_size = float(job.get("grid_size") or 0.0)
+    spill_path = os.path.join(job.get("temp_dir") or tempfile.gettempdir(),
+                              f"xyz_{uuid.uuid4().hex[:8]}.f8")
+    try:
+        try:
+            with open(spill_path, "wb") as spill:
+                scan = scan_xyz(
+                    iter_xyz_chunks(job["path"], job.get("delimiter"),
+                                    int(job.get("skiprows") or 0)),
+                    track_unique=grid_size <= 0, cancel=cancel, spill=spill)
+        except (ValueError, OSError) as exc:
+            result.update(status=STATUS_ERROR, message=(
+                f"Failed to read or parse XYZ file "
+                f"{os.path.basename(job['path'])}. Error: {exc}"))
+            return result
+        if scan is None:
+            result["status"] = STATUS_CANCELLED
+            return result
+        result["count"] = scan.count
+        if scan.count == 0:
+            result.update(status=STATUS_ERROR, message=(
+                f"No data points found in {os.path.basename(job['path'])}."))
+            return result
+        if grid_size <= 0:
+            grid_size = scan.detected_grid_size()
+        scan.x_unique = scan.y_unique = None
+        spec = GridSpec.cell_centred(scan, grid_size)
+        result.update(grid_size=grid_size, width=spec.width, height=spec.height)
+        if spec.cells > int(job.get("max_raster_cells") or spec.cells):
+            result["status"] = STATUS_TOO_LARGE
+            return result
+        if spec.cells > int(job.get("max_cells") or MAX_NATIVE_CELLS):
+            result.update(status=STATUS_FALLBACK, message=(
+                f"{spec.width} x {spec.height} cells exceed the in-process "
+                "gridding limit"))
+            return result
+
+        accumulator = CellAccumulator(spec)
+        for chunk in iter_spilled_chunks(spill_path):
+            if cancel():
+                result["status"] = STATUS_CANCELLED
+                return result
+            accumulator.add(chunk)
+        bands = accumulator.bands(bool(job.get("statistics")))
+        accumulator = None
+        descriptions = ["mean"] + (["min", "max", "count"]
+                                   if job.get("statistics") else [])
+        try:
+            result["output"] = write_geotiff(
+                job["output"], spec, bands, job.get("crs_wkt") or "",
+                compress=bool(job.get("compress", True)),
+                descriptions=descriptions)
+        except GriddingUnavailable as exc:
+            result.update(status=STATUS_FALLBACK, message=str(exc))
+        except OSError as exc:
+            result.update(status=STATUS_ERROR,
+                          message=f"Could not write {job['output']}: {exc}")
+        return result
+    except MemoryError:
+        result.update(status=STATUS_FALLBACK,
+                      message="not enough memory to bin in process")
+        return result
+    finally:
+        try:
+            os.remove(spill_path)
+        except OSError:
+            pass
@@ -22,6 +22,7 @@ from qgis.core import (
     Qgis,
     QgsMapLayer,
     QgsMapLayerProxyModel,
+    QgsMapSettings,
     QgsProcessingParameterField,
     QgsProcessingParameterNumber,
     QgsSnappingConfig,
@@ -74,6 +75,14 @@ def _wkb_type(member_name):
     return _scoped_member(QgsWkbTypes, "Type", member_name)
 
 
+def _map_settings_flag(member_name):
+    """QGIS 3.22 moved QgsMapSettings.Flag to Qgis.MapSettingsFlag."""
+    scope = getattr(Qgis, "MapSettingsFlag", None)
+    if scope is not None and hasattr(scope, member_name):
+        return getattr(scope, member_name)
+    return _scoped_member(QgsMapSettings, "Flag", member_name)
+
+
 def _snapping_member(member_name, scope_names):
     """Resolve snapping enums moved from legacy classes to Qgis in QGIS 4."""
     for parent in (QgsSnappingConfig, QgsTolerance, Qgis):
@@ -189,6 +198,9 @@ WKB_POINT_M = _wkb_type("PointM")
 WKB_LINESTRING = _wkb_type("LineString")
 WKB_NO_GEOMETRY = _wkb_type("NoGeometry")
 
+MAP_SETTINGS_ANTIALIASING = _map_settings_flag("Antialiasing")
+MAP_SETTINGS_DRAW_SELECTION = _map_settings_flag("DrawSelection")
+
 LAYER_VECTOR = _scoped_member(QgsMapLayer, "LayerType", "VectorLayer")
 LAYER_RASTER = _scoped_member(QgsMapLayer, "LayerType", "RasterLayer")
 
@@ -234,6 +246,8 @@ FIELD_TYPE_DOUBLE = _field_type("Double", "Double")
 FIELD_TYPE_INT = _field_type("Int", "Int")
 FIELD_TYPE_LONG_LONG = _field_type("LongLong", "LongLong")
 FIELD_TYPE_BOOL = _field_type("Bool", "Bool")
+FIELD_TYPE_BINARY = _field_type("QByteArray", "ByteArray")
+FIELD_TYPE_TIME = _field_type("QTime", "Time")
 
 # QDialogButtonBox button constants - PyQt6 moved these under StandardButton scope
 BUTTON_BOX_OK = _scoped_member(QDialogButtonBox, "StandardButton", "Ok")
@@ -332,3 +346,39 @@ def processing_generate_temp_filename(basename, context=None):
         except TypeError:
             pass
     return QgsProcessingUtils.generateTempFilename(basename)
+
+
+def python_executable():
+    """The Python interpreter of this installation, for spawn worker pools.
+
+    Inside QGIS on Windows ``sys.executable`` is usually qgis-bin.exe, not a
+    Python interpreter. Only a real ``python``/``python3`` binary under
+    ``sys.prefix`` or ``sys.exec_prefix`` (or ``QGIS_PYTHON_EXECUTABLE``)
+    qualifies: a ``.bat`` wrapper cannot host a spawn worker and a
+    ``python3`` from ``PATH`` may lack qgis / numpy. Returns ``None`` when
+    there is none; callers then stay in process.
+    """
+    import os
+    import sys
+
+    names = ('python.exe', 'python3.exe', 'python3', 'python')
+    override = os.environ.get('QGIS_PYTHON_EXECUTABLE', '')
+    if override and os.path.basename(override).lower() in names \
+            and os.path.isfile(override):
+        return override
+    prefixes = []
+    for prefix in (sys.prefix, sys.exec_prefix):
+        prefix = os.path.normcase(os.path.abspath(prefix)) if prefix else ''
+        if prefix and prefix not in prefixes:
+            prefixes.append(prefix)
+    exe = os.path.normcase(os.path.abspath(sys.executable or ''))
+    if os.path.basename(exe).lower() in names \
+            and any(exe.startswith(prefix + os.sep) for prefix in prefixes):
+        return sys.executable
+    for prefix in prefixes:
+        for folder in (prefix, os.path.join(prefix, 'bin')):
+            for name in names:
+                candidate = os.path.join(folder, name)
+                if os.path.isfile(candidate):
+                    return candidate
+    return None
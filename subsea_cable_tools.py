@@ -11,20 +11,24 @@ from qgis.PyQt.QtCore import QSettings, QTranslator, QCoreApplication, Qt
 from qgis.PyQt.QtGui import QIcon
 from qgis.PyQt.QtWidgets import QMenu, QToolButton
 
-from qgis.core import QgsApplication
+from qgis.core import QgsApplication, QgsProject
 
 from .qgis_compat import QAction, TOOLBUTTON_POPUP_MODE_INSTANT
 
-# Load Qt resources
-from .resources import *
-# Import the KP Mouse Tool (map tool integration)
-from .maptools.kp_mouse_maptool import KPMouseTool
+# Toolbar stub for the KP Mouse Tool; the map tool itself loads on first use.
+from .maptools.kp_mouse_toolbar import LazyKPMouseTool
 
 # Import the processing provider
 from .processing.subsea_cable_processing_provider import SubseaCableProcessingProvider
 
-# NOTE: Larger dock widgets are imported lazily so plugin startup remains robust
-# if an optional or vendored plotting dependency fails to load.
+# NOTE: Every dock widget, dialog and map tool (and with them pyqtgraph,
+# openpyxl and the catenary / burial / workbench / planner packages) is
+# imported on first activation, so a QGIS launch only pays for the menu and
+# toolbar stubs, and startup stays robust if an optional or vendored plotting
+# dependency fails to load. Icons load from the plugin folder rather than the
+# compiled resources.py, which is not imported at all.
+# ``python tests/bench_plugin_import.py`` measures what loading the plugin
+# costs and fails if a heavy module is pulled in at import time.
 
 
 class SubseaCableTools:
@@ -58,7 +62,7 @@ class SubseaCableTools:
         self.menu = self.tr(u'&Subsea Cable Tools')
 
         # Components
-        self.kp_mouse_tool = KPMouseTool(self.iface)
+        self.kp_mouse_tool = LazyKPMouseTool(self.iface)
         self.kpProvider = SubseaCableProcessingProvider()
 
         # UI elements (dock widgets / actions)
@@ -90,6 +94,15 @@ class SubseaCableTools:
         """Return the translation for a string."""
         return QCoreApplication.translate('SubseaCableTools', message)
 
+    def plugin_icon(self, *names):
+        """Icon from the first of ``names`` found in the plugin folder,
+        falling back to the main plugin icon."""
+        for name in names + ('icon.png',):
+            path = os.path.join(self.plugin_dir, name)
+            if os.path.exists(path):
+                return QIcon(path)
+        return QIcon()
+
     def add_action(self, icon_path, text, callback, parent=None, add_to_menu=True):
         """Add a toolbar icon and menu item for an action."""
         icon = QIcon(icon_path)
@@ -118,12 +131,7 @@ class SubseaCableTools:
         self.actions.append(self.plotter_action)
 
         # Depth Profile Tool action (dedicated icon with resource fallback like other tools)
-        depth_icon_path = os.path.join(self.plugin_dir, 'depth_profile_icon.png')
-        if os.path.exists(depth_icon_path):
-            depth_icon = QIcon(depth_icon_path)
-        else:
-            # Fallback to plugin resource icon
-            depth_icon = QIcon(":/plugins/subsea_cable_tools/icon.png")
+        depth_icon = self.plugin_icon('depth_profile_icon.png')
         self.depth_profile_action = QAction(depth_icon, "Depth Profile", self.iface.mainWindow() if hasattr(self.iface, 'mainWindow') else None)
         self.depth_profile_action.triggered.connect(self.show_depth_profile)
         self.iface.addToolBarIcon(self.depth_profile_action)
@@ -158,10 +166,7 @@ class SubseaCableTools:
         self.actions.append(self.bu_lowering_action)
 
         # Cable Route Workbench (assemblies + RPLs + systems in one dock)
-        wb_icon = QIcon(":/plugins/subsea_cable_tools/icon.png")
-        wb_icon_path = os.path.join(self.plugin_dir, 'workbench_icon.png')
-        if os.path.exists(wb_icon_path):
-            wb_icon = QIcon(wb_icon_path)
+        wb_icon = self.plugin_icon('workbench_icon.png')
         self.workbench_action = QAction(wb_icon, "Cable Route Workbench", self.iface.mainWindow() if hasattr(self.iface, 'mainWindow') else None)
         self.workbench_action.setToolTip("Cable Route Workbench: assemblies, RPLs, fits, and cable systems — with map editing and an SLD.")
         self.workbench_action.triggered.connect(self.show_workbench)
@@ -169,7 +174,7 @@ class SubseaCableTools:
         self.actions.append(self.workbench_action)
 
         # Spatial planning scenario editor and simulator
-        planner_icon = QIcon(":/plugins/subsea_cable_tools/icon.png")
+        planner_icon = self.plugin_icon()
         self.planner_action = QAction(
             planner_icon, "Planner",
             self.iface.mainWindow() if hasattr(self.iface, 'mainWindow') else None)
@@ -180,7 +185,7 @@ class SubseaCableTools:
         self.actions.append(self.planner_action)
 
         # Burial planning workflow (plough / ROV jet) over an RPL
-        burial_icon = QIcon(":/plugins/subsea_cable_tools/icon.png")
+        burial_icon = self.plugin_icon()
         self.burial_action = QAction(
             burial_icon, "Burial Planner (beta)",
             self.iface.mainWindow() if hasattr(self.iface, 'mainWindow') else None)
@@ -192,12 +197,7 @@ class SubseaCableTools:
         self.actions.append(self.burial_action)
 
         # Transit Measure Tool action
-        transit_icon_path = os.path.join(self.plugin_dir, 'transit_measure_icon.png')
-        if os.path.exists(transit_icon_path):
-            transit_icon = QIcon(transit_icon_path)
-        else:
-            # Fallback to plugin resource icon
-            transit_icon = QIcon(":/plugins/subsea_cable_tools/icon.png")
+        transit_icon = self.plugin_icon('transit_measure_icon.png')
         self.transit_measure_action = QAction(transit_icon, "Transit Measure", self.iface.mainWindow() if hasattr(self.iface, 'mainWindow') else None)
         self.transit_measure_action.triggered.connect(self.activate_transit_measure_tool)
         self.iface.addToolBarIcon(self.transit_measure_action)
@@ -205,7 +205,7 @@ class SubseaCableTools:
         self.actions.append(self.transit_measure_action)
 
         # Cable Lay Data Explorer action (standalone analysis / QC window)
-        explorer_icon = QIcon(":/plugins/subsea_cable_tools/icon.png")
+        explorer_icon = self.plugin_icon()
         self.explorer_action = QAction(explorer_icon, "Cable Lay Data Explorer", self.iface.mainWindow() if hasattr(self.iface, 'mainWindow') else None)
         self.explorer_action.triggered.connect(self.show_cable_lay_explorer)
         self.iface.addPluginToMenu(self.menu, self.explorer_action)
@@ -225,8 +225,15 @@ class SubseaCableTools:
         except Exception:
             pass
         # The plugin may have been enabled while a project is already open.
-        self._restore_workbench_layers()
-        self._restore_burial_layers()
+        # At QGIS launch the project is still empty, so skip the imports.
+        if self._project_is_open():
+            self._restore_workbench_layers()
+            self._restore_burial_layers()
+
+    @staticmethod
+    def _project_is_open():
+        project = QgsProject.instance()
+        return bool(project.fileName() or project.mapLayers())
 
     def _restore_workbench_layers(self):
         """Self-heal workbench layers for the current project (cheap no-op
@@ -252,8 +259,7 @@ class SubseaCableTools:
         self.experimental_tool_button = QToolButton(parent)
         self.experimental_tool_button.setObjectName(
             "subseaCableToolsExperimentalButton")
-        self.experimental_tool_button.setIcon(
-            QIcon(":/plugins/subsea_cable_tools/icon.png"))
+        self.experimental_tool_button.setIcon(self.plugin_icon())
         self.experimental_tool_button.setText(self.tr("Experimental"))
         self.experimental_tool_button.setToolTip(
             self.tr("Experimental tools (beta)"))
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""Import-time measurement for plugin start-up.
+
+Loads the plugin package and ``subsea_cable_tools`` (what QGIS does before
+``classFactory`` / ``initGui``) in fresh interpreters and reports the median
+wall-clock, the slowest imports from ``-X importtime``, and any heavy module
+that start-up pulled in. Needs the QGIS Python environment:
+
+    python-qgis.bat tests\\bench_plugin_import.py            # report
+    python-qgis.bat tests\\bench_plugin_import.py --runs 9
+    python-qgis.bat tests\\bench_plugin_import.py --check    # exit 1 if heavy
+
+Dock widgets, dialogs, map tools and vendored libraries must load on first
+activation, so ``--check`` fails when any module under ``HEAVY`` is imported.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+PACKAGE = "sct_import_bench"
+
+# Loaded on first activation only (relative to the plugin package).
+HEAVY = (
+    "resources",
+    "maptools.kp_mouse_maptool",
+    "maptools.transit_measure_tool",
+    "kp_plotter_dockwidget",
+    "depth_profile_dockwidget",
+    "plot_widget",
+    "catenary",
+    "burial",
+    "workbench",
+    "planner",
+    "explorer",
+    "rpl_import",
+)
+VENDORED = ("pyqtgraph", "openpyxl", "access_parser", "construct", "tabulate")
+
+_CHILD = r"""
+import importlib.util, json, sys, time
+root, name = sys.argv[1], sys.argv[2]
+t0 = time.perf_counter()
+spec = importlib.util.spec_from_file_location(
+    name, root + "/__init__.py", submodule_search_locations=[root])
+pkg = importlib.util.module_from_spec(spec)
+sys.modules[name] = pkg
+spec.loader.exec_module(pkg)
+__import__(name + ".subsea_cable_tools")
+elapsed = time.perf_counter() - t0
+print(json.dumps({"seconds": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def _run_once(importtime: bool = False):
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ["-X", "importtime"]
+    cmd += ["-c", _CHILD, str(ROOT), PACKAGE]
+    proc = subprocess.run(cmd, capture_output=True, text=True)
+    if proc.returncode != 0:
+        tail = proc.stderr.strip().splitlines()[-1:] or ["(no output)"]
+        raise SystemExit(f"plugin import failed: {tail[0]}")
+    return json.loads(proc.stdout.strip().splitlines()[-1]), proc.stderr
+
+
+def _heavy_modules(modules):
+    found = []
+    for module in modules:
+        if module.startswith(PACKAGE + "."):
+            rel = module[len(PACKAGE) + 1:]
+            if any(rel == h or rel.startswith(h + ".") for h in HEAVY):
+                found.append(rel)
+        elif module.split(".")[0] in VENDORED:
+            found.append(module)
+    return sorted(set(found))
+
+
+def _slowest(importtime_log: str, top: int):
+    rows = []
+    for line in importtime_log.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        try:
+            rows.append((int(parts[0]), parts[2].strip()))
+        except (IndexError, ValueError):   # header line
+            continue
+    return sorted(rows, reverse=True)[:top]
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--runs", type=int, default=5, help="fresh interpreters to time")
+    ap.add_argument("--top", type=int, default=10, help="slowest imports to list")
+    ap.add_argument("--check", action="store_true",
+                    help="exit 1 if start-up imports a heavy module")
+    args = ap.parse_args(argv)
+
+    times = []
+    modules = []
+    for _ in range(max(1, args.runs)):
+        result, _log = _run_once()
+        times.append(result["seconds"])
+        modules = result["modules"]
+    _result, log = _run_once(importtime=True)
+
+    print(f"plugin import: median {statistics.median(times) * 1000:.1f} ms "
+          f"(min {min(times) * 1000:.1f}, max {max(times) * 1000:.1f}, {len(times)} runs)")
+    plugin_modules = [m for m in modules if m.startswith(PACKAGE + ".")]
+    print(f"plugin modules loaded: {len(plugin_modules)}")
+    print("slowest imports (self time):")
+    for self_us, name in _slowest(log, args.top):
+        print(f"  {self_us / 1000:8.1f} ms  {name}")
+    heavy = _heavy_modules(modules)
+    if heavy:
+        print("heavy modules imported at start-up:")
+        for name in heavy:
+            print(f"  {name}")
+    else:
+        print("no heavy modules imported at start-up")
+    return 1 if (args.check and heavy) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
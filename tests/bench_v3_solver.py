@@ -42,6 +42,9 @@ REL_TENSION_TOL = 0.005      # 0.5 % on top tensions
 REL_TENSION_TOL_BED = 0.05   # 5 % on lay-history-dependent end/max tensions
 ABS_GEOM_TOL_M = 0.05        # 5 cm on every geometry statistic
 REL_RADIUS_TOL = 0.10        # 10 % on min bend radius (curvature of slack bed cable)
+# Above this the three-point radius of a taut, nearly straight chain is
+# round-off in a tiny curvature; two such values both just mean "straight".
+STRAIGHT_RADIUS_M = 1e4
 
 
 def _load_engine():
@@ -240,7 +243,9 @@ def _walk_compare(path: str, ref, new, failures: list):
                 failures.append(f"{path}: {r:.3f} -> {n:.3f}")
         elif leaf in ("min_radius_m",):
             scale = max(abs(r), 1.0)
-            if abs(n - r) / scale > REL_RADIUS_TOL:
+            if min(r, n) >= STRAIGHT_RADIUS_M:
+                pass
+            elif abs(n - r) / scale > REL_RADIUS_TOL:
                 failures.append(f"{path}: {r:.1f} -> {n:.1f} m")
         else:  # geometry statistics in metres
             if abs(n - r) > ABS_GEOM_TOL_M:
@@ -85,7 +85,26 @@ def _provider_loads() -> bool:
         print("Registered algorithms:")
         for name in names:
             print(f"  {name}")
-    return ok
+
+    # Registration is metadata only: each entry must load its module on
+    # create() and describe the real algorithm exactly.
+    mismatched = []
+    for entry in algorithms:
+        try:
+            real = entry.create()
+        except Exception as exc:
+            mismatched.append(f"{entry.name()}: {exc}")
+            continue
+        for attr in ("name", "displayName", "group", "groupId"):
+            if getattr(real, attr)() != getattr(entry, attr)():
+                mismatched.append(f"{entry.name()}.{attr}: {getattr(real, attr)()!r}")
+        if not real.parameterDefinitions():
+            mismatched.append(f"{entry.name()}: no parameters")
+    tag = "PASS" if not mismatched else "FAIL"
+    print(f"[{tag}] lazily registered algorithms match their classes")
+    for line in mismatched:
+        print(f"  {line}")
+    return ok and not mismatched
 
 
 def _plugin_imports() -> bool:
@@ -104,6 +123,7 @@ def main() -> int:
     checks = [
         ("distance round trip", lambda: _run_module(f"{PACKAGE_NAME}.tests.test_distance_round_trip")),
         ("KP geo utilities", lambda: _run_module(f"{PACKAGE_NAME}.tests.test_kp_geo_utils")),
+        ("KP mouse tool hover", lambda: _run_module(f"{PACKAGE_NAME}.tests.test_kp_mouse_maptool")),
         ("catenary solver (V2)", lambda: _run_module(f"{PACKAGE_NAME}.tests.test_catenary_solver")),
         ("simple catenary (V1)", lambda: _run_module(f"{PACKAGE_NAME}.tests.test_simple_catenary")),
         ("drape solver (multi-span)", lambda: _run_module(f"{PACKAGE_NAME}.tests.test_drape_solver")),
@@ -111,9 +131,11 @@ def main() -> int:
         ("lay simulator 3D solver (V3)", lambda: _run_module(f"{PACKAGE_NAME}.tests.test_v3_solver3d")),
         ("lay simulator steady lay (V3)", lambda: _run_module(f"{PACKAGE_NAME}.tests.test_v3_steady_lay")),
         ("lay simulator timeline (V3)", lambda: _run_module(f"{PACKAGE_NAME}.tests.test_v3_timeline")),
+        ("lay simulator snapshot store (V3)", lambda: _run_module(f"{PACKAGE_NAME}.tests.test_v3_snapshot_store")),
         ("lay simulator vessel geometry (V3)", lambda: _run_module(f"{PACKAGE_NAME}.tests.test_v3_vessel_geometry")),
         ("lay simulator QGIS adapters (V3)", lambda: _run_module(f"{PACKAGE_NAME}.tests.test_v3_qgis_adapters")),
         ("seabed length algorithm", lambda: _run_module(f"{PACKAGE_NAME}.tests.test_seabed_length")),
+        ("KP section chartlet render pool", lambda: _run_module(f"{PACKAGE_NAME}.tests.test_chartlet_render_pool")),
         ("cable lay importers", lambda: _run_module(f"{PACKAGE_NAME}.tests.test_cable_lay_importers")),
         ("MDB import algorithm", lambda: _run_module(f"{PACKAGE_NAME}.tests.test_mdb_import_algorithm")),
         ("workbench store", lambda: _run_module(f"{PACKAGE_NAME}.tests.test_workbench_store")),
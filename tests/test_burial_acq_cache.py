@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""Standalone checks for the persisted rule-acquisition cache policy.
+
+The interval codec, LRU eviction order and the two-tier lookup (memory,
+then a stored row validated by input fingerprint) are pure python; the
+GeoPackage side is covered in ``test_burial_store.py``.
+"""
+
+from __future__ import annotations
+
+from ..burial.acq_cache import (
+    AcquisitionCache, decode_acquisition, encode_acquisition, lru_evictions,
+)
+from ..workbench.rules_engine import Interval
+
+
+def _result(name, ok, detail=""):
+    print("[%s] %s%s" % ("PASS" if ok else "FAIL", name, (" — " + detail) if detail else ""))
+    return ok
+
+
+class _RowStore:
+    """The two store calls the cache uses, over a dict of rows."""
+
+    def __init__(self):
+        self.rows = {}
+        self.touched = []
+
+    def get_acquisition(self, cache_key):
+        return self.rows.get(cache_key)
+
+    def save_acquisitions(self, rows, touched_keys, max_bytes):
+        for row in rows:
+            self.rows[row["cache_key"]] = dict(row)
+        self.touched.extend(touched_keys)
+        return []
+
+
+def test_codec_and_lru_order():
+    footprint = [Interval(0.1, 0.30000000000000004), Interval(2.0, 3.5)]
+    nodata = [Interval(4.0, 4.2)]
+    decoded = decode_acquisition(encode_acquisition(footprint, nodata))
+    ok = decoded == (footprint, nodata)
+    ok = ok and decode_acquisition("{not json") is None
+    ok = ok and decode_acquisition('{"footprint": []}') is None
+    entries = [("old", 40, "2026-01-01T00:00:00Z"),
+               ("new", 40, "2026-03-01T00:00:00Z"),
+               ("mid", 40, "2026-02-01T00:00:00Z")]
+    ok = ok and lru_evictions(entries, 80) == ["old"]
+    ok = ok and lru_evictions(entries, 120) == []
+    ok = ok and sorted(lru_evictions(entries, 10)) == ["mid", "new", "old"]
+    return _result("interval codec is exact; LRU drops the least recent", ok)
+
+
+def test_lookup_validates_fingerprint_and_flushes_once():
+    store = _RowStore()
+    cache = AcquisitionCache(lambda: store)
+    ok = cache.lookup("k1", "fp-1") is None
+    cache.put("k1", [Interval(1.0, 2.0)], [], rule_id="r1")
+    ok = ok and not store.rows and cache.flush()
+    row = store.rows.get("k1") or {}
+    ok = ok and row.get("input_fingerprint") == "fp-1" and row.get("rule_id") == "r1"
+
+    reopened = AcquisitionCache(lambda: store)
+    ok = ok and reopened.lookup("k1", "fp-2") is None       # input changed
+    hit = reopened.lookup("k1", "fp-1")
+    ok = ok and hit == ([Interval(1.0, 2.0)], []) and "k1" in reopened
+    ok = ok and reopened.flush() and store.touched == ["k1"]
+    ok = ok and reopened.flush() and store.touched == ["k1"]  # nothing queued
+    return _result("stored rows reused only for a matching input fingerprint", ok)
+
+
+def test_clear_drops_queued_writes():
+    old_store, new_store = _RowStore(), _RowStore()
+    stores = [old_store]
+    cache = AcquisitionCache(lambda: stores[0])
+    cache.lookup("k1", "fp-1")
+    cache.put("k1", [Interval(1.0, 2.0)], [], rule_id="r1")
+    old_store.rows["k2"] = {"cache_key": "k2", "input_fingerprint": "",
+                            "intervals_json": encode_acquisition([], [])}
+    cache.lookup("k2")                      # queues a recency touch
+    cache.clear()
+    stores[0] = new_store                   # the next plan's store
+    ok = len(cache) == 0 and cache.flush()
+    ok = ok and not new_store.rows and not new_store.touched
+    return _result("clear drops queued rows and touches with the memory tier", ok)
+
+
+def run_all():
+    return [test_codec_and_lru_order(),
+            test_lookup_validates_fingerprint_and_flushes_once(),
+            test_clear_drops_queued_writes()]
+
+
+if __name__ == "__main__":
+    raise SystemExit(0 if all(run_all()) else 1)
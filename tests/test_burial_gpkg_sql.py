@@ -69,6 +69,8 @@ def test_read_write_filtered() -> bool:
               and p1[0]["kp"] == 1.5 and len(all_rows) == 2
               and all_rows[1]["notes"] is None
               and "fid" not in all_rows[0])
+        slim = gpkg_sql.read_rows(conn, "bp_event", columns=("event_id", "kp"))
+        ok = ok and slim[0] == {"event_id": "e1", "kp": 1.5}
         return _result("filtered SQL reads + typed round trip", ok)
     finally:
         _cleanup(path)
@@ -5,10 +5,14 @@ from __future__ import annotations
 
 import math
 
+import json
+
 from ..burial.profile_data import (
     PlanProfile,
     absolute_slope_series,
     cross_slope_series,
+    decode_samples,
+    encode_samples,
     long_slope_series,
 )
 
@@ -22,6 +26,13 @@ def _result(name: str, ok: bool, detail: str = "") -> bool:
     return ok
 
 
+def _plain(column) -> list:
+    """Decoded column (NaN-gapped array or None-gapped list) as a list."""
+    if column is None:
+        return []
+    return [None if v is None or v != v else float(v) for v in column]
+
+
 def _profile() -> PlanProfile:
     kps = [0.0, 0.1, 0.2, 0.3, 0.4]
     return PlanProfile(
@@ -56,6 +67,61 @@ def test_row_round_trip() -> bool:
     return _result("plan profile row round trip (gaps preserved)", ok)
 
 
+def test_binary_samples_and_json_fallback() -> bool:
+    """Blob rows round-trip exactly; legacy JSON rows still load."""
+    count = 20000
+    kps = [round(i * 0.025, 6) for i in range(count)]
+    depths = [None if i % 97 == 0 else round(2500.0 + 900.0 * math.sin(i / 300.0), 3)
+              for i in range(count)]
+    profile = PlanProfile(step_m=25.0, scope_end_kp=kps[-1], kps=kps,
+                          depths=depths, port_depths=[None] * count,
+                          stbd_depths=list(depths))
+    row = profile.to_row("plan-big")
+    back = PlanProfile.from_row(row)
+    ok = back is not None and back.kps == kps and back.depths == depths
+    ok = ok and back.stbd_depths == depths and back.port_depths == [None] * count
+    legacy_json = json.dumps({"kps": kps, "depths": depths,
+                              "port": [None] * count, "stbd": depths},
+                             separators=(",", ":"))
+    ok = ok and not row["samples_json"] and len(row["samples_blob"]) < len(legacy_json) / 2
+    legacy = dict(row, samples_blob=None, samples_json=legacy_json)
+    old = PlanProfile.from_row(legacy)
+    ok = ok and old is not None and old.depths == depths
+    # Uncompressed blobs, truncated blobs and foreign bytes.
+    plain = encode_samples({"kps": [0.0, 1.0], "depths": [5.5, None]},
+                           compress=False)
+    decoded = decode_samples(plain) or {}
+    ok = ok and _plain(decoded.get("kps")) == [0.0, 1.0]
+    ok = ok and _plain(decoded.get("depths")) == [5.5, None]
+    ok = ok and _plain(decoded.get("port")) == [None, None]
+    ok = ok and decode_samples(plain[:-3]) is None
+    ok = ok and decode_samples(b"not a profile") is None
+    # Corrupt blobs decode to None so from_row falls back to samples_json:
+    # cut inside the column descriptors, a non-ASCII dtype byte, and a
+    # damaged zlib stream.
+    blob = row["samples_blob"]
+    ok = ok and decode_samples(blob[:20]) is None
+    ok = ok and decode_samples(blob[:16] + b"\xff" + blob[17:]) is None
+    ok = ok and decode_samples(blob[:40] + b"\x00" * 16 + blob[56:]) is None
+    rescued = PlanProfile.from_row(dict(legacy, samples_blob=blob[:20]))
+    ok = ok and rescued is not None and rescued.depths == depths
+    # Both decoders fill NaN-gapped float arrays; the lists are views.
+    for loaded in (back, old):
+        arr = loaded.depth_array
+        ok = ok and getattr(arr, "dtype", None) == "float64"
+        ok = ok and [i for i, v in enumerate(arr) if v != v] == \
+            [i for i, d in enumerate(depths) if d is None]
+        ok = ok and loaded.stbd_array.shape == loaded.kp_array.shape == (count,)
+    fresh = PlanProfile.from_row(row)
+    ok = ok and not fresh._lists and fresh.sample_count == count
+    ok = ok and fresh.depth_at(kps[1]) == depths[1] and not fresh._lists
+    ok = ok and fresh.depths is fresh.depths and set(fresh._lists) == {"depths"}
+    # Blob-loaded profiles compute the same slopes as list-built ones.
+    ok = ok and back.slope_series(0.05, 1) == profile.slope_series(0.05, 1)
+    return _result("binary profile samples: exact round trip, JSON fallback",
+                   ok, f"blob {len(row['samples_blob'])} B vs json {len(legacy_json)} B")
+
+
 def test_currency() -> bool:
     profile = _profile()
     base = ("route-fp", "depth-fp", 0.0, 0.4, 50.0)
@@ -161,6 +227,7 @@ def test_slope_component_series() -> bool:
 def run_all() -> list:
     return [
         test_row_round_trip(),
+        test_binary_samples_and_json_fallback(),
         test_currency(),
         test_long_slope_sign_and_gaps(),
         test_cross_slope_sign_and_direction(),
@@ -404,6 +404,40 @@ def test_plan_profile_persistence() -> bool:
     return _result("plan profile persists, replaces, copies and deletes", ok)
 
 
+def test_acquisition_cache_survives_reopen() -> bool:
+    from ..burial.acq_cache import AcquisitionCache
+
+    store = _store()
+    footprint = [Interval(1.25, 2.5), Interval(7.0, 7.000123456789)]
+    nodata = [Interval(9.5, 10.0)]
+    cache = AcquisitionCache(lambda: store)
+    ok = cache.lookup("key-a", "layer-fp") is None
+    cache.put("key-a", footprint, nodata, rule_id="rule-1")
+    ok = ok and cache.flush()
+
+    # A new session: empty memory tier, same GeoPackage.
+    reopened = BurialStore(store.gpkg_path,
+                           QgsProject.instance().transformContext())
+    fresh = AcquisitionCache(lambda: reopened)
+    hit = fresh.lookup("key-a", "layer-fp")
+    ok = ok and hit is not None and hit[0] == footprint and hit[1] == nodata
+    # The input changed under the same key: the row is not trusted.
+    ok = ok and AcquisitionCache(lambda: reopened).lookup(
+        "key-a", "layer-fp-edited") is None
+
+    # LRU: a tight budget keeps only the most recently used rows.
+    size = int(reopened.get_acquisition("key-a")["size_bytes"])
+    evicted = reopened.save_acquisitions(
+        [{"cache_key": "key-b", "input_fingerprint": "fp",
+          "intervals_json": '{"footprint":[],"nodata":[]}', "size_bytes": 30,
+          "created_utc": "2099-01-01T00:00:00Z",
+          "used_utc": "2099-01-01T00:00:00Z"}], [], size)
+    ok = ok and evicted == ["key-a"]
+    ok = ok and reopened.get_acquisition("key-a") is None
+    ok = ok and reopened.get_acquisition("key-b") is not None
+    return _result("rule acquisition cache persists, validates and evicts", ok)
+
+
 def run_all() -> list:
     return [
         test_create_and_migrate(),
@@ -414,6 +448,7 @@ def run_all() -> list:
         test_plan_builder_merge_insert_and_undo(),
         test_dismiss_insufficient_persist_and_undo(),
         test_plan_profile_persistence(),
+        test_acquisition_cache_survives_reopen(),
     ]
 
 
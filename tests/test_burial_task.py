@@ -12,6 +12,10 @@ import json
 import math
 import os
 import tempfile
+import threading
+import time
+
+import numpy as np
 
 from qgis.core import (
     QgsCoordinateReferenceSystem,
@@ -830,6 +834,152 @@ def test_analysis_reuses_stored_depth_samples() -> bool:
     return _result("analysis consumes stored plan-profile samples", ok)
 
 
+def test_parallel_rules_match_serial() -> bool:
+    """Pooled rule acquisition returns the serial results, in rule order."""
+    route, da = _route()
+    stations = [round(0.05 * i, 6) for i in range(401)]
+    depth_samples = [(kp, 100.0 + 30.0 * math.sin(kp) + 5.0 * kp)
+                     for kp in stations]
+    configs = [{"profile": "depth", "op": ">", "value": v}
+               for v in (110.0, 140.0, 170.0)]
+    configs.append({"profile": "slope", "op": ">", "value": 1.0, "abs": True})
+    configs.append({"profile": "depth", "op": "<", "value": 90.0})
+
+    def run(workers: int):
+        work = analysis_task.AnalysisWork(
+            route=route, distance=da, scope=Interval(0.0, 20.0), step_m=50.0,
+            direction=1, method="plough", refine_tol_m=1.0, depth=None,
+            depth_samples=depth_samples, workers=workers)
+        for n, config in enumerate(configs):
+            work.rules.append(analysis_task.RuleWork(
+                rule_row={"rule_id": f"r{n}", "name": f"Rule {n}"},
+                kind="threshold_profile", config=dict(config),
+                cache_key=f"key-{n}"))
+        work.rules.append(analysis_task.RuleWork(
+            rule_row={"rule_id": "bad", "name": "Bad"}, kind="nonsense",
+            cache_key="key-bad"))
+        task = analysis_task.BurialAnalysisTask(work, lambda _t: None)
+        return task.run(), task.results
+
+    ok_serial, serial = run(1)
+    ok_pool, pooled = run(4)
+    ok = ok_serial and ok_pool and len(serial) == len(pooled) == len(configs) + 1
+    ok = ok and [r.cache_key for r in pooled] == [r.cache_key for r in serial]
+    ok = ok and all(a.footprint == b.footprint and a.nodata == b.nodata
+                    and a.error == b.error for a, b in zip(serial, pooled))
+    ok = ok and bool(pooled[-1].error) and not pooled[0].error
+    return _result("parallel rule acquisition matches the serial run", ok)
+
+
+def test_concurrent_rules_share_cold_depth_lookup() -> bool:
+    """Pooled rules on a cold cache sample the profile once, never per point."""
+
+    class _SlowProfile:
+        def __init__(self):
+            self.profile_calls = 0
+            self.route_calls = 0
+            self._count_lock = threading.Lock()
+
+        def is_available(self):
+            return True
+
+        def prepare(self, cancel=None, progress=None):
+            return True
+
+        def profile_samples(self, _route, kps, cancel=None, progress=None):
+            with self._count_lock:
+                self.profile_calls += 1
+            # Hold the build open so every worker reaches the lookup first.
+            time.sleep(0.2)
+            return [(kp, None if 9.0 <= kp <= 9.5
+                     else 100.0 + 30.0 * math.sin(kp) + 5.0 * kp)
+                    for kp in kps]
+
+        def sample(self, lat, lon):
+            return -100.0
+
+        def sample_route(self, _route, kp):
+            with self._count_lock:
+                self.route_calls += 1
+            return 100.0 + 30.0 * math.sin(kp) + 5.0 * kp
+
+    route, da = _route()
+    configs = [{"profile": "depth", "op": ">", "value": v}
+               for v in (110.0, 130.0, 150.0, 170.0)]
+    configs.append({"profile": "depth", "op": "<", "value": 105.0})
+
+    def run(workers: int):
+        depth = _SlowProfile()
+        work = analysis_task.AnalysisWork(
+            route=route, distance=da, scope=Interval(0.0, 20.0), step_m=50.0,
+            direction=1, method="plough", refine_tol_m=1.0, depth=depth,
+            depth_step_m=50.0, workers=workers)
+        for n, config in enumerate(configs):
+            work.rules.append(analysis_task.RuleWork(
+                rule_row={"rule_id": f"r{n}", "name": f"Rule {n}"},
+                kind="threshold_profile", config=dict(config),
+                cache_key=f"key-{n}"))
+        task = analysis_task.BurialAnalysisTask(work, lambda _t: None)
+        return task.run(), task.results, depth
+
+    ok_serial, serial, serial_depth = run(1)
+    ok_pool, pooled, pooled_depth = run(len(configs))
+    ok = ok_serial and ok_pool and len(pooled) == len(serial) == len(configs)
+    ok = ok and pooled_depth.profile_calls == 1
+    ok = ok and pooled_depth.route_calls == serial_depth.route_calls
+    ok = ok and not any(r.error for r in pooled)
+    ok = ok and all(r.nodata for r in pooled)
+    ok = ok and all(a.footprint == b.footprint and a.nodata == b.nodata
+                    for a, b in zip(serial, pooled))
+    return _result("concurrent rules build the cold depth lookup once", ok,
+                   f"profile={pooled_depth.profile_calls} "
+                   f"route={pooled_depth.route_calls}/{serial_depth.route_calls}")
+
+
+def test_depth_snapshot_serialises_raster_reads() -> bool:
+    """Worker threads sharing one snapshot never enter the block cache together."""
+    from ..workbench.depth_service import DepthSourceConfig
+
+    class _Blocks:
+        def __init__(self):
+            self.active = 0
+            self.peak = 0
+
+        def _enter(self):
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            time.sleep(0.005)
+            self.active -= 1
+
+        def value_at(self, x, y, band):
+            self._enter()
+            return -50.0 - y
+
+        def sample_xy(self, xs, ys, band, method):
+            self._enter()
+            return -50.0 - np.asarray(ys, dtype=float)
+
+    depth = analysis_task.DepthSnapshot(DepthSourceConfig({"mode": 1}),
+                                        QgsProject.instance())
+    blocks = _Blocks()
+    depth._rasters = [(None, None, blocks)]
+    values = {}
+
+    def worker(n: int):
+        values[n] = [depth.sample(50.0 + 0.001 * k, 0.0) for k in range(10)]
+        values[-n - 1] = depth.sample_many([(50.0, 0.0), (50.1, 0.0)])
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    ok = blocks.peak == 1 and len(values) == 12
+    ok = ok and all(v[0] == -100.0 for n, v in values.items() if n >= 0)
+    return _result("depth snapshot serialises shared raster reads", ok,
+                   f"peak concurrent reads={blocks.peak}")
+
+
 def test_local_slope_uses_profile_resolution() -> bool:
     """A short 25-degree face is not diluted over the coarse 100 m window."""
     face_start_m = 90.0
@@ -1425,6 +1575,9 @@ def run_all() -> list:
         test_cross_offset_uses_contour_crossings(),
         test_profile_widget_axes_crosshair_toggles(),
         test_analysis_reuses_stored_depth_samples(),
+        test_parallel_rules_match_serial(),
+        test_concurrent_rules_share_cold_depth_lookup(),
+        test_depth_snapshot_serialises_raster_reads(),
         test_local_slope_uses_profile_resolution(),
         test_profile_step_resolution_and_staleness(),
         test_workflow_settings_are_separated(),
@@ -646,6 +646,72 @@ def test_failed_solve_restores_bottom_tension_input():
     _assert_close("H_input_N restored after failure", cfg["H_input_N"], T_in, 1e-9)
 
 
+def _integrate_both(cfg, H_N, S_free_m, ds):
+    out = {}
+    for engine in ("stepping", "closed_form"):
+        calc = CatenarySystemCalculator(dict(cfg, integrator=engine))
+        result = calc.integrate(H_N=H_N, S_free_m=S_free_m, ds=ds)
+        out[engine] = (calc, result)
+    return out["stepping"], out["closed_form"]
+
+
+def test_closed_form_integration_matches_stepping_reference():
+    """The closed-form piecewise integrator reproduces the stepping reference
+    (segment weights, buoyancy, body loads, chute contact) to the reference's
+    own discretisation error, on the same output grid."""
+    assembly = [
+        AssemblyItem("segment", "Upper", 40.0, 10.0, 14.0, 0.0),
+        AssemblyItem("body", "Repeater", 0.0, 0.0, 0.0, 5.0),
+        AssemblyItem("segment", "Buoy", 20.0, -6.0, -6.0, 0.0),
+        AssemblyItem("segment", "Lower", 1000.0, 10.0, 10.0, 0.0),
+    ]
+    cfg = _base_config(water_depth_m=20.0, q_water_npm=10.0, q_air_npm=12.0,
+                       chute_radius_m=3.0, assembly=assembly)
+    (ref, r), (cf, c) = _integrate_both(cfg, 10_000.0, 100.0, 0.01)
+    _assert_close("end x", c[0], r[0], 1e-4)
+    _assert_close("end y", c[1], r[1], 1e-4)
+    _assert_close("end V", c[2], r[2], 1e-6)
+    _assert_close("chute contact", cf.chute_contact_len_m, ref.chute_contact_len_m, 1e-6)
+    assert len(c[5]) == len(r[5])
+    assert max(abs(a - b) for a, b in zip(c[7], r[7])) < 1e-4
+    assert max(abs(a - b) for a, b in zip(cf.tension_kN, ref.tension_kN)) < 1e-6
+
+
+def test_closed_form_integration_splits_exactly_at_sea_level():
+    """Crossing into air switches to the air weight at the exact crossing,
+    which the stepping reference only resolves to its step."""
+    comps = parse_components("Buoy, 100, 60, -80, -80, 0")
+    cfg = _base_config(water_depth_m=30.0, q_water_npm=10.0, q_air_npm=12.0,
+                       components=comps)
+    (ref, r), (cf, c) = _integrate_both(cfg, 1500.0, 150.0, 0.01)
+    assert ref.s_sea_surface is not None and cf.s_sea_surface is not None
+    _assert_close("crossing", cf.s_sea_surface, ref.s_sea_surface, 0.02)
+    _assert_close("end y", c[1], r[1], 0.01)
+    i = int(round(cf.s_sea_surface / 0.01))
+    assert abs(c[7][i]) < 0.02
+    # Coarse steps leave the closed form unchanged at the shared grid points.
+    coarse = CatenarySystemCalculator(dict(cfg, integrator="closed_form"))
+    c2 = coarse.integrate(H_N=1500.0, S_free_m=150.0, ds=1.0)
+    _assert_close("ds-independent end y", c2[1], c[1], 1e-6)
+    _assert_close("ds-independent end x", c2[0], c[0], 1e-6)
+
+
+def test_closed_form_solve_matches_stepping_solve():
+    results = {}
+    for engine in ("stepping", "closed_form"):
+        calc = CatenarySystemCalculator(_base_config(
+            ds_m=0.1, integrator=engine, chute_exit_height_m=8.0,
+            seabed=PlanarSlopeSeabed(100.0, 3.0)))
+        calc.solve()
+        assert calc.diagnostics.converged, calc.diagnostics.warnings
+        results[engine] = calc
+    ref, cf = results["stepping"], results["closed_form"]
+    _assert_close("layback", cf.layback, ref.layback, 0.02)
+    _assert_close("top tension", cf.top_tension_kN, ref.top_tension_kN, 1e-3)
+    _assert_close("exit angle", cf.exit_angle_deg_from_h, ref.exit_angle_deg_from_h, 1e-3)
+    _assert_close("TDP", cf.tdp_x_world, ref.tdp_x_world, 0.02)
+
+
 def run_all() -> List[str]:
     failures: List[str] = []
     tests: List[Callable[[], None]] = [
@@ -678,6 +744,9 @@ def run_all() -> List[str]:
         test_normal_solve_does_not_flag_surface_piercing,
         test_refinement_delta_is_small_on_sloped_seabed,
         test_failed_solve_restores_bottom_tension_input,
+        test_closed_form_integration_matches_stepping_reference,
+        test_closed_form_integration_splits_exactly_at_sea_level,
+        test_closed_form_solve_matches_stepping_solve,
     ]
     for test in tests:
         try:
@@ -0,0 +1,147 @@
+"""Pure-Python checks for the V2 catenary parametric sweep.
+
+No QGIS imports. Verifies that sweep cases solve to the same answers as
+individual cold solves (the nearest-neighbour warm start only changes the
+seeds), that failures are tabulated rather than raised, that the process
+pool path matches the in-process one, and the CSV export.
+"""
+
+from __future__ import annotations
+
+import csv
+import math
+from pathlib import Path
+import sys
+import tempfile
+import threading
+from typing import Callable, List
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from catenary import catenary_sweep as sweep  # noqa: E402  (no QGIS)
+from catenary.catenary_solver import (  # noqa: E402
+    AssemblyItem,
+    CatenarySystemCalculator,
+    PlanarSlopeSeabed,
+)
+
+
+def _base_config(**overrides):
+    cfg = {
+        "water_depth_m": 100.0,
+        "chute_exit_height_m": 5.0,
+        "chute_radius_m": 0.0,
+        "ds_m": 0.5,
+        "max_integration_steps": 100000,
+        "q_water_npm": 22.0,
+        "q_air_npm": 28.0,
+        "assembly": [],
+        "components": [],
+        "input_mode": "Bottom Tension",
+        "H_input_N": 20_000.0,
+        "H_guess_N": 20_000.0,
+        "S_guess_m": 400.0,
+    }
+    cfg.update(overrides)
+    return cfg
+
+
+def _result(name: str, ok: bool, detail: str = "") -> bool:
+    print(f"[{'PASS' if ok else 'FAIL'}] {name}" + (f" - {detail}" if detail else ""))
+    return ok
+
+
+def test_grid_is_full_factorial_with_variant_labels():
+    lw = [AssemblyItem("segment", "LW", 5000.0, 8.0, 10.0, 0.0)]
+    sa = [AssemblyItem("segment", "SA", 5000.0, 25.0, 30.0, 0.0)]
+    cases = sweep.sweep_grid(water_depth_m=[50.0, 100.0, 150.0],
+                             assembly={"LW": lw, "SA": sa})
+    assert len(cases) == 6
+    assert [c.labels["assembly"] for c in cases[:2]] == ["LW", "SA"]   # last axis fastest
+    assert cases[1].overrides["assembly"] is sa
+    assert cases[2].overrides["water_depth_m"] == 100.0
+
+
+def test_sweep_matches_individual_cold_solves():
+    base = _base_config(seabed=PlanarSlopeSeabed(100.0, 2.0))
+    cases = sweep.sweep_grid(H_input_N=[10_000.0, 20_000.0, 40_000.0],
+                             chute_radius_m=[0.0, 3.0])
+    table = sweep.run_sweep(base, cases)
+    assert len(table) == 6 and table.params == ["H_input_N", "chute_radius_m"]
+    assert bool(np.all(table.converged)), table.errors
+    for i, case in enumerate(cases):
+        cfg = dict(base)
+        cfg.update(case.overrides)
+        calc = CatenarySystemCalculator(cfg)
+        calc.solve()
+        assert abs(table["top_tension_kN"][i] - calc.top_tension_kN) < 1e-3
+        assert abs(table["layback_m"][i] - calc.layback) < 0.05
+        assert abs(table["tdp_x_m"][i] - calc.tdp_x_world) < 0.5
+    # Heavier bottom tension -> longer layback, for each chute radius.
+    lay = table["layback_m"].reshape(3, 2)
+    assert bool(np.all(np.diff(lay, axis=0) > 0))
+
+
+def test_failed_cases_are_tabulated_not_raised():
+    cases = sweep.sweep_grid(H_input_N=[20_000.0, 0.0, 30_000.0])
+    table = sweep.run_sweep(_base_config(), cases)
+    assert table.errors[0] == "" and table.errors[2] == ""
+    assert table.errors[1] and not table.converged[1]
+    assert math.isnan(table["top_tension_kN"][1])
+    assert math.isfinite(table["top_tension_kN"][2])
+
+
+def test_process_pool_matches_in_process_and_exports_csv():
+    cases = sweep.sweep_grid(water_depth_m=[60.0, 90.0], H_input_N=[15_000.0, 25_000.0])
+    seq = sweep.run_sweep(_base_config(), cases)
+    par = sweep.run_sweep(_base_config(), cases, workers=2, batch_size=2)
+    for name in ("top_tension_kN", "layback_m", "catenary_length_m"):
+        assert np.allclose(seq[name], par[name], atol=1e-6), name
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "sweep.csv")
+        par.to_csv(path)
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+    assert rows[0][:3] == ["water_depth_m", "H_input_N", "top_tension_kN (kN)"]
+    assert rows[0][-2:] == ["converged", "error"]
+    assert len(rows) == 5
+    assert abs(float(rows[1][2]) - par["top_tension_kN"][0]) < 1e-9
+
+
+def test_broken_pool_finishes_in_process():
+    # A lock cannot pickle, so every pooled batch fails to reach a worker.
+    cfg = _base_config(unpicklable=threading.Lock())
+    cases = sweep.sweep_grid(water_depth_m=[60.0, 90.0], H_input_N=[15_000.0, 25_000.0])
+    seq = sweep.run_sweep(cfg, cases)
+    par = sweep.run_sweep(cfg, cases, workers=2, batch_size=1)
+    assert bool(np.all(par.converged)), par.errors
+    for name in ("top_tension_kN", "layback_m"):
+        assert np.allclose(seq[name], par[name], atol=1e-6), name
+
+
+def run_all() -> List[str]:
+    failures: List[str] = []
+    tests: List[Callable[[], None]] = [
+        test_grid_is_full_factorial_with_variant_labels,
+        test_sweep_matches_individual_cold_solves,
+        test_failed_cases_are_tabulated_not_raised,
+        test_process_pool_matches_in_process_and_exports_csv,
+        test_broken_pool_finishes_in_process,
+    ]
+    for test in tests:
+        try:
+            test()
+            _result(test.__name__, True)
+        except Exception as exc:  # pragma: no cover - manual runner support
+            _result(test.__name__, False, repr(exc))
+            failures.append(test.__name__)
+    print(f"\n{len(failures)} failure(s)." if failures else "\nAll checks passed.")
+    return failures
+
+
+if __name__ == "__main__":  # pragma: no cover
+    run_all()
@@ -0,0 +1,128 @@
+"""Checks for the chartlet render pool used by Export KP Section Chartlets.
+
+Renders a deterministic style (solid fill and line symbols, no labels) for a
+run of extents with one job and with several concurrent jobs; the PNG files
+must be byte-identical and written in submission order.
+
+Requires the QGIS API (run via tests/run_qgis_smoke_tests.py).
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from typing import List
+
+from qgis.core import (
+    QgsCoordinateReferenceSystem,
+    QgsCoordinateTransformContext,
+    QgsFeature,
+    QgsFillSymbol,
+    QgsGeometry,
+    QgsLineSymbol,
+    QgsPointXY,
+    QgsProject,
+    QgsRectangle,
+    QgsSingleSymbolRenderer,
+    QgsVectorLayer,
+)
+
+from ..processing.chartlet_render_pool import ChartletRenderPool
+
+
+def _result(name: str, ok: bool, detail: str = "") -> bool:
+    tag = "PASS" if ok else "FAIL"
+    msg = f"[{tag}] {name}"
+    if detail:
+        msg += f" — {detail}"
+    print(msg)
+    return ok
+
+
+_X0, _Y0 = 500000.0, 4000000.0
+
+
+def _layers():
+    seabed = QgsVectorLayer("Polygon?crs=EPSG:32631", "zones", "memory")
+    feats = []
+    for i in range(6):
+        f = QgsFeature()
+        x = _X0 + i * 2000.0
+        f.setGeometry(QgsGeometry.fromRect(QgsRectangle(x, _Y0 - 800.0, x + 1500.0, _Y0 + 800.0)))
+        feats.append(f)
+    seabed.dataProvider().addFeatures(feats)
+    seabed.setRenderer(QgsSingleSymbolRenderer(QgsFillSymbol.createSimple(
+        {"color": "120,170,210,255", "outline_color": "30,60,90,255", "outline_width": "0.4"})))
+
+    route = QgsVectorLayer("LineString?crs=EPSG:32631", "route", "memory")
+    f = QgsFeature()
+    f.setGeometry(QgsGeometry.fromPolylineXY(
+        [QgsPointXY(_X0 + i * 500.0, _Y0 + (300.0 if i % 2 else -300.0)) for i in range(25)]))
+    route.dataProvider().addFeatures([f])
+    route.setRenderer(QgsSingleSymbolRenderer(QgsLineSymbol.createSimple(
+        {"line_color": "200,30,30,255", "line_width": "0.8"})))
+    return [route, seabed]
+
+
+def _render(folder: str, max_jobs: int, layers) -> List[str]:
+    project = QgsProject.instance()
+    pool = ChartletRenderPool(
+        project, layers, QgsCoordinateReferenceSystem("EPSG:32631"),
+        QgsCoordinateTransformContext(), 300, 200,
+        add_scalebar=True, add_north_arrow=True, max_jobs=max_jobs,
+    )
+    written = []
+    for i in range(7):
+        x = _X0 + i * 1500.0
+        extent = QgsRectangle(x - 500.0, _Y0 - 1000.0, x + 2500.0, _Y0 + 1000.0)
+        path = os.path.join(folder, f"chartlet_{i}.png")
+        written.extend(p for p, ok in pool.submit(extent, path) if ok)
+    written.extend(p for p, ok in pool.finish() if ok)
+    return written
+
+
+def test_concurrent_jobs_match_single_job() -> bool:
+    layers = _layers()
+    with tempfile.TemporaryDirectory() as one, tempfile.TemporaryDirectory() as many:
+        serial = _render(one, 1, layers)
+        pooled = _render(many, 3, layers)
+        names = [os.path.basename(p) for p in pooled]
+        ok = len(serial) == 7 and names == [os.path.basename(p) for p in serial]
+        differing = []
+        for a, b in zip(serial, pooled):
+            with open(a, "rb") as fa, open(b, "rb") as fb:
+                if fa.read() != fb.read():
+                    differing.append(os.path.basename(a))
+        ok = ok and not differing
+    return _result("chartlets: 3 concurrent jobs byte-identical to 1", ok,
+                   f"written={len(pooled)} differing={differing}")
+
+
+def test_cancel_writes_nothing() -> bool:
+    layers = _layers()
+    with tempfile.TemporaryDirectory() as folder:
+        pool = ChartletRenderPool(
+            QgsProject.instance(), layers, QgsCoordinateReferenceSystem("EPSG:32631"),
+            QgsCoordinateTransformContext(), 300, 200, max_jobs=4,
+        )
+        for i in range(3):
+            extent = QgsRectangle(_X0, _Y0 - 1000.0, _X0 + 3000.0 + i, _Y0 + 1000.0)
+            pool.submit(extent, os.path.join(folder, f"c{i}.png"))
+        pool.cancel()
+        left = os.listdir(folder)
+        ok = not left and pool.finish() == []
+    return _result("chartlets: cancel drops queued jobs unwritten", ok, f"files={left}")
+
+
+def run_all() -> List[bool]:
+    results = [
+        test_concurrent_jobs_match_single_job(),
+        test_cancel_writes_nothing(),
+    ]
+    print("")
+    print(f"{sum(results)}/{len(results)} passed")
+    return results
+
+
+if __name__ == "__main__":  # pragma: no cover
+    run_all()
@@ -314,6 +314,53 @@ def test_routeframe_total_length_and_extract() -> bool:
     )
 
 
+def test_nearest_kp_indexed_matches_walk() -> bool:
+    """Find Nearest KP's indexed search returns exactly what walking every
+    path returned: same path, DCC, signed DCC, KP and snapped point. Uses a
+    high-latitude geographic route, where planar-nearest and
+    geodesic-nearest segments disagree most."""
+    from ..processing.nearest_kp_algorithm import NearestKPAlgorithm
+
+    da = _da_geog()
+    geoms = [
+        _line("LINESTRING(0 70, 0.3 70.05, 0.6 69.98, 0.9 70.1)"),
+        _line("MULTILINESTRING((0.9 70.1, 1.2 70.0),(1.2 70.0, 1.2 70.3, 0.4 70.25))"),
+        _line("LINESTRING(0.4 70.25, 0.1 70.2, 0.1 70.01)"),
+    ]
+    alg = NearestKPAlgorithm()
+    lengths = [float(da.measureLength(g)) for g in geoms]
+    route = RouteFrame(geoms, lengths, da)
+    offsets = route.feature_offsets_m
+    segments = route.segments()
+    segment_kp_m = alg._segment_start_kps(segments, offsets)
+
+    mismatches = 0
+    checked = 0
+    for i in range(-2, 16):
+        for j in range(-2, 12):
+            pt = QgsPointXY(-0.1 + 0.09 * i, 69.9 + 0.04 * j)
+            best = None
+            for idx, geom in enumerate(geoms):
+                res = alg.find_nearest_point_on_path(geom, pt, da, base_distance_m=offsets[idx])
+                if best is None or res["distance"] < best[1]["distance"]:
+                    best = (idx, res)
+            got = alg.find_nearest_point_on_route(route, segments, segment_kp_m, pt, da)
+            checked += 1
+            same = (
+                got["path_index"] == best[0]
+                and got["distance"] == best[1]["distance"]
+                and got["distance_signed"] == best[1]["distance_signed"]
+                and got["kp"] == best[1]["kp"]
+                and got["point_geometry"].asPoint() == best[1]["point_geometry"].asPoint()
+            )
+            mismatches += 0 if same else 1
+    return _result(
+        "Nearest KP indexed search equals the full walk",
+        mismatches == 0,
+        f"{checked} points, {mismatches} mismatches",
+    )
+
+
 # ---------------------------------------------------------------------------
 # Regression: RPLComparator no longer silently falls back to planar metres
 # when the project ellipsoid is unset (1.6 fix).
@@ -458,6 +505,7 @@ def run_all() -> List[bool]:
         test_extract_line_segment_basic(),
         test_extract_line_segment_out_of_range(),
         test_routeframe_total_length_and_extract(),
+        test_nearest_kp_indexed_matches_walk(),
         test_rplcomparator_ellipsoid_fallback(),
         test_geodesic_interpolation_long_geographic_segment(),
         test_geodesic_interpolation_projected_unchanged(),
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""QGIS checks for the KP Mouse Tool's live hover readout."""
+
+from __future__ import annotations
+
+from typing import List
+
+from qgis.PyQt.QtCore import QEvent, QPoint, Qt
+from qgis.PyQt.QtWidgets import QMainWindow
+from qgis.core import (
+    QgsCoordinateReferenceSystem, QgsFeature, QgsGeometry, QgsPointXY, QgsProject,
+    QgsRectangle, QgsVectorLayer,
+)
+from qgis.gui import QgsMapCanvas, QgsMapMouseEvent
+
+from ..kp_geo_utils import kp_at_point
+from ..maptools.kp_mouse_maptool import KPMouseMapTool
+
+
+def _result(name, ok, detail=""):
+    print("[%s] %s%s" % ("PASS" if ok else "FAIL", name, (" — " + detail) if detail else ""))
+    return ok
+
+
+class _Iface:
+    def __init__(self):
+        self.window = QMainWindow()
+
+    def mainWindow(self):
+        return self.window
+
+
+def _route_tool():
+    canvas = QgsMapCanvas()
+    canvas.resize(640, 480)
+    canvas.setDestinationCrs(QgsCoordinateReferenceSystem("EPSG:4326"))
+    layer = QgsVectorLayer("LineString?crs=EPSG:4326", "Route", "memory")
+    for wkt in ("LINESTRING(0 0, 0.5 0, 0.5 0.5)", "LINESTRING(0.5 0.5, 1 0.5)"):
+        feature = QgsFeature()
+        feature.setGeometry(QgsGeometry.fromWkt(wkt))
+        layer.dataProvider().addFeature(feature)
+    QgsProject.instance().addMapLayer(layer)
+    canvas.setLayers([layer])
+    canvas.setExtent(QgsRectangle(-0.2, -0.2, 1.2, 0.7))
+    tool = KPMouseMapTool(canvas, layer, _Iface(), measurementUnit="m", showReverseKP=True)
+    return canvas, layer, tool
+
+
+def test_hover_reports_indexed_kp():
+    canvas, layer, tool = _route_tool()
+    try:
+        ok = tool.route_frame is not None and tool.route_frame._kp_index is not None
+        pixel = canvas.getCoordinateTransform().transform(QgsPointXY(0.52, 0.25))
+        event = QgsMapMouseEvent(canvas, QEvent.Type.MouseMove,
+                                 QPoint(round(pixel.x()), round(pixel.y())),
+                                 Qt.MouseButton.NoButton)
+        tool.canvasMoveEvent(event)
+        expected = kp_at_point(tool.features_geoms, event.mapPoint(), tool.distanceArea)
+        ok = ok and tool.last_chainage is not None
+        ok = ok and abs(tool.last_chainage - expected.kp_km) < 1e-6
+        ok = ok and abs(tool.last_distance - expected.dcc_m) < 1e-3
+        total_km = tool.total_length_meters / 1000.0
+        ok = ok and abs(tool.last_reverse_chainage - (total_km - expected.kp_km)) < 1e-9
+        ok = ok and tool.last_message.startswith(f"KP: {expected.kp_km:.3f}")
+        detail = f"kp={tool.last_chainage} expected={expected.kp_km:.6f}"
+    finally:
+        tool.cleanup_resources()
+        QgsProject.instance().removeMapLayer(layer.id())
+    return _result("hover KP/rKP/DCC from the prebuilt route index", ok, detail)
+
+
+def run_all() -> List[bool]:
+    return [test_hover_reports_indexed_kp()]
+
+
+if __name__ == "__main__":
+    run_all()
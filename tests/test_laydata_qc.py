@@ -22,9 +22,21 @@ Standalone example::
 
 from __future__ import annotations
 
+from datetime import date, time
 from typing import List
 
+import numpy as np
+
 from ..laydata import LayDataset, QcRunner
+from ..laydata.dataset import (
+    KIND_INTEGER,
+    KIND_REAL,
+    KIND_TEXT,
+    KIND_TIME,
+    _ColumnBuilder,
+    epoch_array,
+    parse_iso_epoch,
+)
 from ..laydata.qc_checks import (
     DecimalPrecisionCheck,
     DistanceGapCheck,
@@ -146,6 +158,87 @@ def test_runner_aggregates() -> bool:
     return _report("runner aggregates and builds rows", ok)
 
 
+def test_epoch_array_vectorised_matches_scalar() -> bool:
+    # Plain ISO strings take the numpy path; a "Z" / offset value or junk
+    # sends the whole array to the per-value parser (wall-clock, no shift).
+    plain = [_iso(5), None, "", "2024-01-05 00:00:06.250"]
+    mixed = plain + ["2024-01-05T00:00:07Z", "2024-01-05T01:00:08+01:00", "junk"]
+    ok = True
+    for values in (plain, mixed):
+        expected = np.array([parse_iso_epoch(v) for v in values])
+        got = epoch_array(values)
+        ok = ok and np.array_equal(np.isnan(got), np.isnan(expected))
+        ok = ok and np.allclose(got[~np.isnan(got)], expected[~np.isnan(expected)], atol=1e-6)
+    return _report("vectorised epoch parsing matches parse_iso_epoch", bool(ok))
+
+
+def _typed_dataset(rows, fields) -> LayDataset:
+    builder = _ColumnBuilder(
+        [(i, name, kind) for i, (name, kind) in enumerate(fields)], capacity=2)
+    for row, attrs in enumerate(rows):
+        if row == builder.capacity:
+            builder.grow()
+        builder.add(row, attrs, 100 + row)
+        builder.lat[row] = 0.00001 * row
+        builder.lon[row] = 0.0
+    return builder.dataset("typed")
+
+
+def test_typed_columns_match_object_columns() -> bool:
+    seconds = [0, 1, 2, 30, 30, 31]
+    fields = [("ISO_Time", KIND_TIME), ("source_file", KIND_TEXT),
+              ("KP", KIND_REAL), ("Count", KIND_INTEGER)]
+    rows = [
+        [_iso(s), "a.csv" if i % 2 else "b.csv", 1.5 + i if i != 2 else None,
+         i if i != 3 else None]
+        for i, s in enumerate(seconds)
+    ]
+    typed = _typed_dataset(rows, fields)
+    plain = LayDataset({name: [r[k] for r in rows] for k, (name, _kind) in enumerate(fields)},
+                       lat=typed.lat, lon=typed.lon, fids=typed.fids)
+    ok = typed.row_count == len(rows) and typed.raw("KP").dtype == np.float64
+    ok = ok and typed.raw("Count").dtype == np.int64 and typed.raw("ISO_Time").dtype.kind == "M"
+    ok = ok and np.array_equal(typed.time_epoch, plain.time_epoch)
+    ok = ok and np.array_equal(typed.numeric("KP"), plain.numeric("KP"), equal_nan=True)
+    ok = ok and np.array_equal(typed.numeric("Count"), plain.numeric("Count"), equal_nan=True)
+    ok = ok and typed.is_numeric_field("Count") and not typed.is_numeric_field("source_file")
+    ok = ok and typed.sources() == plain.sources() == ["b.csv", "a.csv"]
+    ok = ok and typed.iso_time_at(3) == plain.iso_time_at(3) == _iso(30)
+    # Text cells share one string object per distinct value.
+    ok = ok and typed.raw("source_file")[1] is typed.raw("source_file")[3]
+    ok = ok and [typed.value_text("Count", i) for i in (2, 3)] == ["2", ""]
+    ok = ok and typed.value_text("KP", 2) == "" and typed.value_text("KP", 0) == "1.5"
+    check = {"expected_interval_s": 1.0, "gap_factor": 1.5}
+    a = [(f.value, f.time_start) for f in TimeGapCheck().run(typed, check)]
+    b = [(f.value, f.time_start) for f in TimeGapCheck().run(plain, check)]
+    ok = ok and a == b and len(a) == 3
+    return _report("typed columns match object columns", bool(ok))
+
+
+class _QtValue:
+    """Stand-in for a QDate / QTime attribute: only the Qt unwrap methods."""
+
+    def __init__(self, method: str, value) -> None:
+        setattr(self, method, lambda: value)
+
+    def isNull(self) -> bool:
+        return False
+
+
+def test_date_and_time_only_values_load() -> bool:
+    fields = [("Survey_Date", KIND_TIME), ("Shift_Start", KIND_TEXT)]
+    rows = [
+        [_QtValue("toPyDate", date(2024, 1, 2)), _QtValue("toPyTime", time(6, 30))],
+        [_QtValue("toPyDate", date(2024, 1, 3)), _QtValue("toPyTime", time(18, 0, 15))],
+    ]
+    typed = _typed_dataset(rows, fields)
+    dates = typed.raw("Survey_Date")
+    ok = dates.dtype.kind == "M" and not np.isnat(dates).any()
+    ok = ok and [str(d) for d in dates.astype("datetime64[D]")] == ["2024-01-02", "2024-01-03"]
+    ok = ok and list(typed.raw("Shift_Start")) == ["06:30:00", "18:00:15"]
+    return _report("date-only and time-only attributes load", bool(ok))
+
+
 def run_all() -> List[bool]:
     results = [
         test_time_gap_detects_single_gap(),
@@ -156,6 +249,9 @@ def run_all() -> List[bool]:
         test_decimal_precision_all_ok(),
         test_duplicate_time(),
         test_runner_aggregates(),
+        test_epoch_array_vectorised_matches_scalar(),
+        test_typed_columns_match_object_columns(),
+        test_date_and_time_only_values_load(),
     ]
     print(f"\n{sum(results)}/{len(results)} laydata QC checks passed.")
     return results
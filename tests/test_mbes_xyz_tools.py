@@ -31,6 +31,7 @@ from ..processing.create_mbes_raster_from_xyz_algorithm import (
     sniff_xyz_format,
 )
 from ..processing.merge_mbes_rasters_algorithm import MergeMBESRastersAlgorithm
+from ..qgis_compat import python_executable
 
 try:
     import numpy as np
@@ -198,10 +199,41 @@ def test_multifile_create_and_merge() -> bool:
     return _result("multi-file create + merge keeps per-file resolution", ok, detail)
 
 
+def test_worker_interpreter_lookup() -> bool:
+    """Only a real interpreter under the install prefix hosts spawn workers."""
+    import sys
+
+    saved = (sys.executable, sys.prefix, sys.exec_prefix,
+             os.environ.pop("QGIS_PYTHON_EXECUTABLE", None))
+    with tempfile.TemporaryDirectory() as tmp:
+        apps = os.path.join(tmp, "apps", "Python312")
+        qgis_bin = os.path.join(tmp, "bin")
+        for folder in (apps, qgis_bin):
+            os.makedirs(folder)
+        for path in (os.path.join(qgis_bin, "qgis-bin.exe"),
+                     os.path.join(qgis_bin, "python-qgis.bat")):
+            open(path, "w").close()
+        try:
+            sys.executable = os.path.join(qgis_bin, "qgis-bin.exe")
+            sys.prefix = sys.exec_prefix = apps
+            missing = python_executable()
+            bundled = os.path.join(apps, "python.exe")
+            open(bundled, "w").close()
+            found = python_executable()
+        finally:
+            sys.executable, sys.prefix, sys.exec_prefix, override = saved
+            if override is not None:
+                os.environ["QGIS_PYTHON_EXECUTABLE"] = override
+    ok = missing is None and found == bundled
+    return _result("worker interpreter: prefix python only, no .bat or PATH guess",
+                   ok, f"missing={missing!r}, found={found!r}")
+
+
 def run_all():
     return [
         test_pure_helpers(),
         test_multifile_create_and_merge(),
+        test_worker_interpreter_lookup(),
     ]
 
 
@@ -272,10 +272,63 @@ def test_v5_to_v6_advanced_task_migration():
     return _result("v5→v6 advanced schedule/progress migration", ok)
 
 
+def test_save_tasks_writes_only_changed_rows():
+    store = _temp_store()
+    scenario_id = store.create_scenario("Large", "2026-01-01T00:00")
+    resource_id = store.list_resources()[0]["resource_id"]
+    store.save_tasks(scenario_id, [
+        {"task_id": schema.new_id(), "name": "T%d" % i, "duration_mode": "manual",
+         "duration_hours": 1.0, "resource_id": resource_id} for i in range(40)])
+    tasks = store.list_tasks(scenario_id)
+    for task in tasks:
+        task["modified_utc"] = "2000-01-01T00:00:00Z"
+    # Pin the stamps so an untouched row is recognisable afterwards.
+    store.upsert_rows(schema.TABLE_TASK, tasks)
+    tasks = store.list_tasks(scenario_id)
+    tasks[7]["duration_hours"] = 5.0
+    removed = tasks.pop(3)
+    store.save_tasks(scenario_id, tasks)
+    saved = {row["task_id"]: row for row in store.list_tasks(scenario_id)}
+    stamped = [row for row in saved.values()
+               if row["modified_utc"] != "2000-01-01T00:00:00Z"]
+    ok = store._sql_mode is True and len(saved) == 39
+    ok = ok and removed["task_id"] not in saved
+    # The edit plus the rows whose seq shifted after the removed task.
+    ok = ok and len(stamped) == 40 - 4
+    ok = ok and float(saved[tasks[7]["task_id"]]["duration_hours"]) == 5.0
+    ok = ok and saved[tasks[0]["task_id"]]["modified_utc"] == "2000-01-01T00:00:00Z"
+    store.close()
+    return _result("save_tasks rewrites only changed task rows", ok,
+                   "%d stamped" % len(stamped))
+
+
+def test_sql_and_layer_reads_agree():
+    store = _temp_store()
+    scenario_id = store.create_scenario("Read paths", "2026-01-01T00:00")
+    resource_id = store.list_resources()[0]["resource_id"]
+    store.save_tasks(scenario_id, [
+        {"task_id": schema.new_id(), "name": "T%d" % i, "duration_mode": "manual",
+         "duration_hours": 1.5 * i, "resource_id": resource_id} for i in range(3)])
+    ok = store._sql_mode is True
+    store.close()
+    via_sql = PlannerStore(store.gpkg_path)
+    sql_tasks = via_sql.list_tasks(scenario_id)
+    sql_table = via_sql.read_table(schema.TABLE_SCENARIO)
+    ok = ok and via_sql._sql_mode is True
+    via_sql.close()
+    via_layer = PlannerStore(store.gpkg_path)
+    via_layer._sql_mode = False
+    ok = ok and len(sql_tasks) == 3
+    ok = ok and sql_tasks == via_layer.list_tasks(scenario_id)
+    ok = ok and sql_table == via_layer.read_table(schema.TABLE_SCENARIO)
+    return _result("SQL and layer read paths return equal rows", ok)
+
+
 def run_all():
     return [
         test_create_crud_and_meta(), test_duplicate_independence_and_remap(),
         test_shared_geometry_adoption_and_duplication(),
         test_v2_to_v3_phase_and_resource_migration(), test_v3_to_v4_fuel_migration(),
         test_v4_to_v5_shared_resource_migration(), test_v5_to_v6_advanced_task_migration(),
+        test_save_tasks_writes_only_changed_rows(), test_sql_and_layer_reads_agree(),
     ]
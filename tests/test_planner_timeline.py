@@ -1,10 +1,13 @@
 # -*- coding: utf-8 -*-
 """Standalone checks for the Qt-free Plan of Work timeline engine."""
 
+import dataclasses
+import random
 from datetime import datetime, timedelta
 
 from ..planner.timeline_engine import (
-    TaskSpec, compute_cable, compute_fuel, compute_schedule, position_at,
+    IncrementalScheduler, TaskSpec, compute_cable, compute_fuel, compute_schedule,
+    position_at,
 )
 
 
@@ -324,6 +327,119 @@ def test_cable_onboard_tracking():
     return _result("cable onboard: auto lay amount, totals, negative warning", ok)
 
 
+def _campaign(rng, count, window_start, constraint_types):
+    """A plan of phases and linked work across six vessels.
+
+    Constraint dates fall in the 400 h after ``window_start``.
+    """
+    specs = []
+    work_ids = []
+    for index in range(count):
+        if index % 25 == 0:
+            specs.append(TaskSpec("p%d" % index, index, "Phase %d" % index,
+                                  is_phase=True, outline_level=0))
+            continue
+        predecessor = rng.choice(work_ids[-15:]) if work_ids and rng.random() < 0.6 else ""
+        constraint_type = rng.choice(("",) * 6 + constraint_types)
+        specs.append(TaskSpec(
+            "t%d" % index, index, "Task %d" % index, "v%d" % (index % 6),
+            duration_hours=rng.choice([0.0, 1.0, 2.5, 6.0, 12.0]),
+            predecessor_task_id=predecessor, lag_hours=rng.choice([0.0, 0.0, 1.0, 2.0]),
+            dependency_type=rng.choice(["FS", "FS", "FS", "SS", "FF"]),
+            constraint_type=constraint_type,
+            constraint_datetime=(window_start + timedelta(hours=rng.randint(0, 400))
+                                 if constraint_type else None),
+            outline_level=1, location_key=rng.choice(["", "", "", "joint-a", "joint-b"])))
+        work_ids.append("t%d" % index)
+    return specs
+
+
+def _edit(rng, spec, window_start, constraint_types):
+    field_name = rng.choice(["duration_hours", "duration_hours", "lag_hours",
+                             "dependency_type", "constraint_type", "name"])
+    if field_name == "duration_hours":
+        return dataclasses.replace(spec, duration_hours=rng.choice([0.0, 1.0, 3.0, 8.0, 30.0]))
+    if field_name == "lag_hours":
+        return dataclasses.replace(spec, lag_hours=rng.choice([0.0, 2.0, 5.0]))
+    if field_name == "dependency_type":
+        return dataclasses.replace(spec, dependency_type=rng.choice(["FS", "SS", "FF"]))
+    if field_name == "constraint_type":
+        return dataclasses.replace(
+            spec, constraint_type=rng.choice(("",) + constraint_types),
+            constraint_datetime=window_start + timedelta(hours=rng.randint(0, 400)))
+    return dataclasses.replace(spec, name=spec.name + "'")
+
+
+def _snapshot(result):
+    return (
+        [dataclasses.astuple(task) for task in result.tasks],
+        [(key, [dataclasses.astuple(task) for task in lane])
+         for key, lane in result.by_resource.items()],
+        result.span_start, result.span_end, result.errors, result.warnings,
+    )
+
+
+def test_incremental_schedule_matches_full():
+    anchor = datetime(2026, 1, 1)
+    rng = random.Random(25)
+    mismatches = []
+    partial = 0
+    edits = 0
+    # A backward plan finishes at the anchor: deadlines before it.
+    for mode, window_start, constraint_types in (
+            ("forward", anchor, ("snet", "fnlt")),
+            ("backward", anchor - timedelta(hours=400), ("fnlt",))):
+        specs = _campaign(rng, 300, window_start, constraint_types)
+        scheduler = IncrementalScheduler()
+        first = scheduler.schedule(anchor, specs, {"v2": 4.0}, mode)
+        before = _snapshot(first)
+        for step in range(40):
+            specs = list(specs)
+            for _ in range(rng.randint(1, 3)):
+                index = rng.randrange(len(specs))
+                if not specs[index].is_phase:
+                    specs[index] = _edit(rng, specs[index], window_start, constraint_types)
+            incremental = _snapshot(scheduler.schedule(anchor, specs, {"v2": 4.0}, mode))
+            full = _snapshot(compute_schedule(anchor, specs, {"v2": 4.0}, mode))
+            edits += 1
+            partial += scheduler.placed_count < len(specs) - 12
+            if incremental != full:
+                mismatches.append("%s edit %d" % (mode, step))
+        # Results already handed out are never updated in place.
+        if _snapshot(first) != before:
+            mismatches.append("%s first result changed" % mode)
+    ok = not mismatches and partial > edits // 2
+    return _result("incremental reschedule equals full recompute", ok,
+                   "%d/%d edits re-placed part of the plan%s" % (
+                       partial, edits, "; " + ", ".join(mismatches) if mismatches else ""))
+
+
+def test_incremental_schedule_rebuilds_on_structural_edit():
+    anchor = datetime(2026, 1, 1)
+    specs = [
+        TaskSpec("a", 0, "Load", "v1", duration_hours=4),
+        TaskSpec("b", 1, "Transit", "v1", duration_hours=6),
+        TaskSpec("c", 2, "Lay", "v2", duration_hours=10, predecessor_task_id="a"),
+        TaskSpec("d", 3, "Bury", "v3", duration_hours=8, predecessor_task_id="c"),
+    ]
+    scheduler = IncrementalScheduler()
+    scheduler.schedule(anchor, specs)
+    # Duration edit on the last task: only that task is placed again.
+    specs[3] = dataclasses.replace(specs[3], duration_hours=9)
+    result = scheduler.schedule(anchor, specs)
+    ok = scheduler.placed_count == 1
+    ok = ok and _snapshot(result) == _snapshot(compute_schedule(anchor, specs))
+    # Re-linking changes the graph: the plan is rebuilt.
+    specs[2] = dataclasses.replace(specs[2], predecessor_task_id="b")
+    result = scheduler.schedule(anchor, specs)
+    ok = ok and scheduler.placed_count == 4
+    ok = ok and _snapshot(result) == _snapshot(compute_schedule(anchor, specs))
+    ok = ok and result.tasks[2].start == anchor + timedelta(hours=10)
+    # Nothing changed: nothing placed, same result.
+    ok = ok and scheduler.schedule(anchor, specs) is result and scheduler.placed_count == 0
+    return _result("incremental scheduler rebuilds on re-link, skips no-op", ok)
+
+
 def run_all():
     return [
         test_duration_resolution(), test_dependencies_resources_and_lag(),
@@ -336,6 +452,8 @@ def run_all():
         test_cable_onboard_tracking(),
         test_speed_profile_duration_and_position(),
         test_task_paced_playback_clock(),
+        test_incremental_schedule_matches_full(),
+        test_incremental_schedule_rebuilds_on_structural_edit(),
     ]
 
 
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the peak-preserving plot decimation (``plot_decimation``).
+
+Pure Python + numpy (no QGIS). Each test returns ``True`` / ``False`` and
+``run_all`` prints PASS / FAIL per check; run it the same way as
+``test_laydata_qc``.
+"""
+
+from __future__ import annotations
+
+from typing import List
+
+import numpy as np
+
+from ..plot_decimation import MinMaxPyramid
+
+
+def _report(name: str, ok: bool) -> bool:
+    print(f"[{'PASS' if ok else 'FAIL'}] {name}")
+    return ok
+
+
+def _noisy(n: int, seed: int = 3):
+    rng = np.random.default_rng(seed)
+    x = np.arange(n, dtype=float) * 0.5
+    y = np.sin(x / 500.0) + 0.01 * rng.standard_normal(n)
+    return x, y
+
+
+def test_short_series_drawn_whole() -> bool:
+    x, y = _noisy(1000)
+    idx = MinMaxPyramid(x, y).indices(max_points=5000)
+    return _report("short series is drawn unchanged", bool(np.array_equal(idx, np.arange(1000))))
+
+
+def test_single_sample_spikes_survive_full_view() -> bool:
+    x, y = _noisy(1_000_003)
+    y[123_457] = 40.0     # tension spike
+    y[876_543] = -25.0    # depth excursion
+    pyramid = MinMaxPyramid(x, y)
+    idx = pyramid.indices(max_points=4000)
+    px, py = pyramid.view(max_points=4000)
+    ok = idx.size <= 4000 + 2 * 512 + 2
+    ok = ok and 123_457 in idx and 876_543 in idx
+    ok = ok and py.max() == 40.0 and py.min() == -25.0
+    ok = ok and px[0] == x[0] and px[-1] == x[-1] and bool(np.all(np.diff(px) > 0))
+    return _report("spikes and series ends survive a zoomed-out view", bool(ok))
+
+
+def test_zoom_picks_finer_level() -> bool:
+    x, y = _noisy(1_000_000)
+    y[500_010] = 9.0
+    pyramid = MinMaxPyramid(x, y)
+    x0, x1 = x[500_000], x[500_999]
+    idx = pyramid.indices(x0, x1, max_points=4000)
+    inside = idx[(x[idx] >= x0) & (x[idx] <= x1)]
+    ok = inside.size == 1000 and 500_010 in idx      # raw samples in view
+    wide = pyramid.indices(x[100_000], x[900_000], max_points=4000)
+    ok = ok and 500_010 in wide and wide.size < idx.size + 4000
+    # The whole series is still represented, so auto-range covers it.
+    ok = ok and idx[0] == 0 and idx[-1] == x.size - 1 and idx.size < 4000
+    return _report("zoom draws raw samples in view, coarse outside", bool(ok))
+
+
+def run_all() -> List[bool]:
+    results = [
+        test_short_series_drawn_whole(),
+        test_single_sample_spikes_survive_full_view(),
+        test_zoom_picks_finer_level(),
+    ]
+    print(f"\n{sum(results)}/{len(results)} plot decimation checks passed.")
+    return results
+
+
+if __name__ == "__main__":
+    run_all()
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""Standalone checks for the block-cached raster sampler.
+
+The sampler is driven by a NumPy grid through its tile-reader hook, so the
+nearest/bilinear maths, tile gathering, LRU bound and no-data handling are
+checked without QGIS; ``from_provider`` only adapts ``provider.block()``.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from ..processing.raster_blocks import (
+    BILINEAR, RasterBlockSampler, first_valid, to_optional_list,
+)
+
+
+def _result(name, ok, detail=""):
+    print("[%s] %s%s" % ("PASS" if ok else "FAIL", name, (" — " + detail) if detail else ""))
+    return ok
+
+
+class _Point:
+    def __init__(self, x, y):
+        self._x, self._y = x, y
+
+    def x(self):
+        return self._x
+
+    def y(self):
+        return self._y
+
+
+def _sampler(grid, x_min=1000.0, y_max=5000.0, upp=2.0, tile_size=16, max_tiles=4):
+    rows, cols = grid.shape
+    reads = []
+
+    def read(band, col0, row0, w, h):
+        reads.append((band, col0, row0, w, h))
+        return grid[row0:row0 + h, col0:col0 + w].astype(np.float64)
+
+    sampler = RasterBlockSampler(x_min, y_max, upp, upp, cols, rows, read,
+                                 tile_size=tile_size, max_tiles=max_tiles)
+    return sampler, reads
+
+
+def test_nearest_matches_cell_lookup():
+    rng = np.random.default_rng(7)
+    grid = rng.normal(-100.0, 20.0, size=(70, 90))
+    sampler, _reads = _sampler(grid)
+    xs = rng.uniform(1000.0, 1000.0 + 90 * 2.0, 5000)
+    ys = rng.uniform(5000.0 - 70 * 2.0, 5000.0, 5000)
+    got = sampler.sample_xy(xs, ys)
+    cols = np.minimum(((xs - 1000.0) / 2.0).astype(int), 89)
+    rows = np.minimum(((5000.0 - ys) / 2.0).astype(int), 69)
+    ok = np.array_equal(got, grid[rows, cols])
+    outside = sampler.sample_xy([999.0, 1181.0, 1050.0], [4990.0, 4990.0, 5000.5])
+    ok = ok and bool(np.all(np.isnan(outside)))
+    edge = sampler.value_at(1000.0 + 90 * 2.0, 5000.0 - 70 * 2.0)
+    ok = ok and edge == grid[69, 89]
+    return _result("nearest: identical to the containing cell, NaN outside", ok)
+
+
+def test_bilinear_exact_on_plane():
+    rows, cols = np.mgrid[0:40, 0:50]
+    # Value at cell centre (c + 0.5, r + 0.5) of a plane z = a + b*x + c*y.
+    grid = -50.0 + 0.25 * (cols + 0.5) * 2.0 - 0.4 * (rows + 0.5) * 2.0
+    sampler, _reads = _sampler(grid.astype(np.float64), x_min=0.0, y_max=0.0)
+    rng = np.random.default_rng(3)
+    xs = rng.uniform(1.0, 99.0, 2000)   # keep inside the outer cell centres
+    ys = rng.uniform(-79.0, -1.0, 2000)
+    got = sampler.sample_xy(xs, ys, method=BILINEAR)
+    expected = -50.0 + 0.25 * xs + 0.4 * ys
+    err = float(np.max(np.abs(got - expected)))
+    return _result("bilinear: exact on a planar surface", err < 1e-9, "max err %.2e" % err)
+
+
+def test_nodata_and_bilinear_renormalisation():
+    grid = np.full((20, 20), -10.0)
+    grid[5, 5] = np.nan
+    sampler, _reads = _sampler(grid, x_min=0.0, y_max=20.0, upp=1.0)
+    ok = sampler.value_at(5.5, 14.5) is None            # inside the no-data cell
+    near = sampler.value_at(6.1, 14.5, method=BILINEAR)  # neighbour of it
+    ok = ok and near is not None and abs(near + 10.0) < 1e-12
+    inside_hole = sampler.value_at(5.4, 14.6, method=BILINEAR)
+    ok = ok and inside_hole is None
+    return _result("no-data cells are NaN; bilinear renormalises over valid neighbours",
+                   ok, "near=%r" % (near,))
+
+
+def test_tile_cache_reads_once_and_is_bounded():
+    grid = np.arange(64 * 64, dtype=np.float64).reshape(64, 64)
+    sampler, reads = _sampler(grid, x_min=0.0, y_max=64.0, upp=1.0,
+                              tile_size=16, max_tiles=4)
+    # A profile walking one tile row: 2000 stations, 4 distinct tiles.
+    xs = np.linspace(0.1, 63.9, 2000)
+    ys = np.full_like(xs, 60.0)
+    sampler.sample_xy(xs, ys)
+    ok = len(reads) == 4
+    sampler.sample_xy(xs[::-1], ys)                      # all cache hits
+    ok = ok and len(reads) == 4
+    # Walk the whole grid: 16 tiles through a 4-tile cache.
+    gx, gy = np.meshgrid(np.arange(64) + 0.5, np.arange(64) + 0.5)
+    values = sampler.sample_xy(gx.ravel(), gy.ravel())
+    ok = ok and len(sampler._tiles) <= 4
+    ok = ok and np.array_equal(values, grid[::-1].ravel())
+    per_point = all(sampler.value_at(x, 59.5) == grid[4, int(x)] for x in (0.5, 20.5, 63.5))
+    ok = ok and per_point
+    return _result("tiles read once per pass, LRU bounded by max_tiles", ok,
+                   "%d reads" % len(reads))
+
+
+def test_first_valid_composite():
+    hi = np.full((10, 10), -1.0)
+    hi[:, 5:] = np.nan                                  # hi-res covers the west half
+    lo = np.full((10, 10), -2.0)
+    s_hi, _reads_hi = _sampler(hi, x_min=0.0, y_max=10.0, upp=1.0)
+    s_lo, _reads_lo = _sampler(lo, x_min=0.0, y_max=10.0, upp=1.0)
+    points = [_Point(1.5, 5.0), _Point(8.5, 5.0), None, _Point(50.0, 5.0)]
+    values, source = first_valid([(s_hi, None), (s_lo, None)], points)
+    ok = to_optional_list(values) == [-1.0, -2.0, None, None]
+    ok = ok and source.tolist() == [0, 1, -1, -1]
+    ok = ok and all(math.isfinite(v) for v in values[:2])
+    return _result("first-valid composite over several rasters", ok, str(values))
+
+
+def run_all():
+    return [test_nearest_matches_cell_lookup(),
+            test_bilinear_exact_on_plane(),
+            test_nodata_and_bilinear_renormalisation(),
+            test_tile_cache_reads_once_and_is_bounded(),
+            test_first_valid_composite()]
+
+
+if __name__ == "__main__":
+    raise SystemExit(0 if all(run_all()) else 1)
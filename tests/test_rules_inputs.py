@@ -118,6 +118,84 @@ def test_proximity_point() -> bool:
     return _result("proximity (point) acquisition", ok, f"coverage={cov:.3f} km")
 
 
+def test_proximity_buffer_matches_stations() -> bool:
+    sampler = _sampler(step_m=10.0)
+    layer = _add_layer("LineString?crs=EPSG:4326&field=buf:double", "cables")
+    pr = layer.dataProvider()
+    feats = []
+    # ~144 m east of the route, between ~KP 3.3 and ~KP 6.7
+    for wkt, buf in (("LINESTRING(0.002 50.03, 0.002 50.06)", None),
+                     # crosses the route diagonally, wider per-feature buffer
+                     ("LINESTRING(-0.01 50.075, 0.01 50.085)", 400.0)):
+        feat = QgsFeature(layer.fields())
+        feat.setGeometry(QgsGeometry.fromWkt(wkt))
+        feat.setAttributes([buf])
+        feats.append(feat)
+    pr.addFeatures(feats)
+    index, loaded = ri._load_features_wgs84(layer, QgsProject.instance())
+    config = {"distance_m": 250.0, "mode": "distance", "buffer_field": "buf"}
+    fast = ri.proximity_intervals(sampler, index, loaded, layer.geometryType(), config)
+    ref = ri.proximity_intervals(sampler, index, loaded, layer.geometryType(), config,
+                                 method="stations")
+    ok = len(fast) == len(ref) == 2
+    for a, b in zip(fast, ref):
+        # the station method resolves each boundary to half a station step
+        ok = ok and abs(a.start_km - b.start_km) < 0.011 and abs(a.end_km - b.end_km) < 0.011
+    sym = eng.interval_length_km(eng.subtract_intervals(fast, ref)) + \
+        eng.interval_length_km(eng.subtract_intervals(ref, fast))
+    QgsProject.instance().removeMapLayer(layer.id())
+    return _result("proximity (line) buffer method matches stations", ok,
+                   f"symmetric difference={sym * 1000.0:.1f} m")
+
+
+def test_proximity_buffer_matches_stations_polygon() -> bool:
+    sampler = _sampler(step_m=10.0)
+    layer = _add_layer("Polygon?crs=EPSG:4326&field=buf:double", "zones")
+    pr = layer.dataProvider()
+    feats = []
+    # straddles the route between ~KP 2.2 and ~KP 3.3 (route inside)
+    for wkt, buf in (("POLYGON((-0.003 50.02, 0.003 50.02, 0.003 50.03, "
+                      "-0.003 50.03, -0.003 50.02))", None),
+                     # ~216 m east of the route, wider per-feature buffer
+                     ("POLYGON((0.003 50.06, 0.006 50.06, 0.006 50.07, "
+                      "0.003 50.07, 0.003 50.06))", 400.0)):
+        feat = QgsFeature(layer.fields())
+        feat.setGeometry(QgsGeometry.fromWkt(wkt))
+        feat.setAttributes([buf])
+        feats.append(feat)
+    pr.addFeatures(feats)
+    index, loaded = ri._load_features_wgs84(layer, QgsProject.instance())
+    config = {"distance_m": 100.0, "mode": "distance", "buffer_field": "buf"}
+    geom_type = layer.geometryType()
+    fast = ri.proximity_intervals(sampler, index, loaded, geom_type, config)
+    ref = ri.proximity_intervals(sampler, index, loaded, geom_type, config,
+                                 method="stations")
+    ok = len(fast) == len(ref) == 2
+    for a, b in zip(fast, ref):
+        ok = ok and abs(a.start_km - b.start_km) < 0.011 and abs(a.end_km - b.end_km) < 0.011
+
+    # A feature the buffer intersection rejects is answered by the station
+    # test rather than dropped.
+    original = ri._buffer_route_kps
+
+    def _failing(*_args, **_kwargs):
+        raise RuntimeError("GEOS rejected the geometry")
+
+    ri._buffer_route_kps = _failing
+    try:
+        fallback = ri.proximity_intervals(sampler, index, loaded, geom_type, config)
+    finally:
+        ri._buffer_route_kps = original
+    ok = ok and len(fallback) == len(ref)
+    for a, b in zip(fallback, ref):
+        ok = ok and abs(a.start_km - b.start_km) < 0.011 and abs(a.end_km - b.end_km) < 0.011
+    sym = eng.interval_length_km(eng.subtract_intervals(fast, ref)) + \
+        eng.interval_length_km(eng.subtract_intervals(ref, fast))
+    QgsProject.instance().removeMapLayer(layer.id())
+    return _result("proximity (polygon) buffer method matches stations", ok,
+                   f"symmetric difference={sym * 1000.0:.1f} m")
+
+
 def test_migrate_framework() -> bool:
     path = _tmp_gpkg()
     store = WorkbenchStore(path, QgsProject.instance().transformContext())
@@ -231,14 +309,68 @@ def test_run_assessment_end_to_end() -> bool:
     return _result("run_assessment end-to-end (depth exclusion)", ok, f"excluded={excl_km:.2f} km")
 
 
+def test_assessment_task_matches_and_caches() -> bool:
+    from ..workbench import assessment_task
+
+    path = _tmp_gpkg()
+    store = WorkbenchStore(path, QgsProject.instance().transformContext())
+    store.migrate()
+    rid = _build_rpl(store)
+    import json
+    rule_set_id = store.save_rule_set(
+        {"name": "two rules", "methods_json": json.dumps(["plough"])},
+        [{
+            "name": "Depth > 550 m", "enabled": 1, "kind": schema.RULE_KIND_THRESHOLD,
+            "action": schema.RULE_ACTION_EXCLUDE, "risk_level": 0,
+            "methods_json": json.dumps(["plough"]),
+            "config_json": json.dumps({"profile": "depth", "op": ">", "value": 550.0}),
+        }, {
+            "name": "Crossing", "enabled": 1, "kind": schema.RULE_KIND_MANUAL,
+            "action": schema.RULE_ACTION_RISK, "risk_level": 2,
+            "methods_json": json.dumps(["plough"]),
+            "config_json": json.dumps({"ranges": [{"start_kp": 1.0, "end_kp": 2.0}]}),
+        }],
+    )
+    expected, _sampler = ri.run_assessment(store, rid, rule_set_id, sample_step_m=100.0)
+    cache = assessment_task.RuleAcquisitionCache()
+
+    def run_task():
+        work = assessment_task.build_assessment_work(
+            store, rid, rule_set_id, cache, sample_step_m=100.0)
+        task = assessment_task.AssessmentTask(work, lambda _t: None)
+        done = task.run()   # worker body, run inline
+        for key, intervals in task.acquired.items():
+            cache.put(key, intervals)
+        return done, task
+
+    done, first = run_task()
+    ok = done and first.result is not None and first.reused == 0
+    ok = ok and [(v.start_km, v.end_km, v.status) for v in first.result.per_method["plough"]] \
+        == [(v.start_km, v.end_km, v.status) for v in expected.per_method["plough"]]
+    done, second = run_task()
+    ok = ok and done and second.reused == 2 and not second.acquired
+
+    # editing one rule's condition re-acquires that rule only
+    rules = store.list_rules(rule_set_id)
+    rules[1]["config_json"] = json.dumps({"ranges": [{"start_kp": 1.0, "end_kp": 3.0}]})
+    store.save_rule_set(store.get_rule_set(rule_set_id), rules)
+    done, third = run_task()
+    ok = ok and done and third.reused == 1 and len(third.acquired) == 1
+    return _result("assessment task matches run_assessment and caches per rule", ok,
+                   f"reused={second.reused}/{third.reused}")
+
+
 def run_all() -> list:
     return [
         test_manual_and_kp_table(),
         test_polygon_class(),
         test_proximity_point(),
+        test_proximity_buffer_matches_stations(),
+        test_proximity_buffer_matches_stations_polygon(),
         test_migrate_framework(),
         test_store_rule_crud(),
         test_run_assessment_end_to_end(),
+        test_assessment_task_matches_and_caches(),
     ]
 
 
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""Standalone checks for the single-pass seabed profile arithmetic.
+
+``SeabedProfile`` replaces per-spacing and per-KP-interval re-sampling in the
+Calculate Seabed Length algorithm, so these compare its derived results with
+sampling a synthetic seabed directly at each spacing (what the algorithm used
+to do). No QGIS needed.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from ..processing.seabed_profile import SeabedProfile, profile_spacing, station_kps
+
+
+def _result(name, ok, detail=""):
+    print("[%s] %s%s" % ("PASS" if ok else "FAIL", name, (" — " + detail) if detail else ""))
+    return ok
+
+
+_TOTAL = 12345.6
+
+
+def _seabed(kp):
+    """Depth (m) of a rough synthetic seabed, NaN over one coverage gap."""
+    kp = np.asarray(kp, dtype=np.float64)
+    depth = -800.0 + 40.0 * np.sin(kp / 90.0) + 6.0 * np.sin(kp / 7.0)
+    depth[(kp > 4000.0) & (kp < 4500.0)] = np.nan
+    return depth
+
+
+def _direct_length(kp, depth):
+    """Reference: the per-station loop over consecutive valid samples."""
+    pts = [(k, z) for k, z in zip(kp.tolist(), depth.tolist()) if not math.isnan(z)]
+    return sum(math.hypot(k1 - k0, z1 - z0) for (k0, z0), (k1, z1) in zip(pts, pts[1:]))
+
+
+def test_station_kps_and_spacing():
+    kps = station_kps(_TOTAL, 10)
+    ok = kps[0] == 0.0 and kps[-1] == _TOTAL and kps[-2] == 12340.0 and kps.size == 1236
+    ok = ok and station_kps(100.0, 25).tolist() == [0.0, 25.0, 50.0, 75.0, 100.0]
+    ok = ok and profile_spacing([10, 25, 50, 100]) == 5 and profile_spacing([0]) == 1
+    ok = ok and profile_spacing([10, 1, 5, 25, 50, 100]) == 1
+    # Coprime spacings would collapse to a 1 m GCD: use the smallest instead.
+    ok = ok and profile_spacing([7, 10]) == 7 and profile_spacing([10, 3]) == 3
+    return _result("stations from KP 0 plus the end; GCD spacing, coprime fallback", ok)
+
+
+def test_resampled_spacings_match_direct_sampling():
+    base = profile_spacing([10, 1, 5, 25, 50, 100])
+    kps = station_kps(_TOTAL, base)
+    dense = SeabedProfile(kps, _seabed(kps), base)
+    worst = 0.0
+    ok = True
+    for spacing in (1, 5, 10, 25, 50, 100):
+        direct_kp = station_kps(_TOTAL, spacing)
+        got = dense.resample(spacing)
+        ok = ok and np.array_equal(got.kp, direct_kp)
+        expected = _direct_length(direct_kp, _seabed(direct_kp))
+        worst = max(worst, abs(got.seabed_length() - expected))
+    ok = ok and worst < 1e-6
+    return _result("every sensitivity spacing from one dense profile", ok, "max err %.2e m" % worst)
+
+
+def test_interval_lengths_sum_and_match_per_interval():
+    kps = station_kps(_TOTAL, 10)
+    profile = SeabedProfile(kps, _seabed(kps), 10)
+    edges = station_kps(_TOTAL, 1000)
+    parts = profile.interval_lengths(edges)
+    ok = parts.size == edges.size - 1
+    ok = ok and bool(abs(parts.sum() - profile.seabed_length()) < 1e-6)
+    # Per-interval re-sampling (the old path) from each interval start.
+    worst = 0.0
+    for start, end, got in zip(edges[:-1], edges[1:], parts):
+        if 3900.0 < end and start < 4600.0:
+            continue  # gap bridging differs at interval edges by design
+        local = start + station_kps(end - start, 10)
+        worst = max(worst, abs(got - _direct_length(local, _seabed(local))))
+    ok = ok and worst < 1e-6
+    return _result("KP-interval 3D lengths from one cumulative sum", ok, "max err %.2e m" % worst)
+
+
+def test_non_multiple_spacing_and_empty_profile():
+    kps = station_kps(1000.0, 4)
+    profile = SeabedProfile(kps, _seabed(kps), 4)
+    coarse = profile.resample(10)
+    expected = _direct_length(coarse.kp, _seabed(coarse.kp))
+    ok = abs(coarse.seabed_length() - expected) < 0.01 * expected  # linear interp
+    gap_kps = station_kps(5000.0, 4)
+    gap = SeabedProfile(gap_kps, _seabed(gap_kps), 4).resample(10)
+    inside = (gap.kp > 4004.0) & (gap.kp < 4496.0)
+    ok = ok and bool(np.all(np.isnan(gap.depth[inside])))
+    empty = SeabedProfile(kps, np.full(kps.size, np.nan), 4)
+    ok = ok and empty.seabed_length() == 0.0 and empty.valid_count == 0
+    ok = ok and empty.interval_lengths([0.0, 500.0, 1000.0]).tolist() == [0.0, 0.0]
+    return _result("interpolated spacing, gaps and empty coverage", ok)
+
+
+def run_all():
+    return [test_station_kps_and_spacing(),
+            test_resampled_spacings_match_direct_sampling(),
+            test_interval_lengths_sum_and_match_per_interval(),
+            test_non_multiple_spacing_and_empty_profile()]
+
+
+if __name__ == "__main__":
+    raise SystemExit(0 if all(run_all()) else 1)
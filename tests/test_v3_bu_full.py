@@ -13,6 +13,7 @@ import importlib.util
 import math
 from pathlib import Path
 import sys
+import tempfile
 import types
 
 import numpy as np
@@ -255,6 +256,96 @@ def test_optimizer_lands_on_target():
             f"limit warning must fire: {out2.warnings}")
 
 
+def test_stencil_step_inverts_the_landing_map():
+    """The parallel search's correction fits the stencil's landing map and
+    falls back to the pure translation when it cannot."""
+    J = np.array([[1.3, 0.2], [-0.1, 0.9]])
+    b = np.array([40.0, -15.0])
+    target = np.array([150.0, 30.0])
+    starts = sopt._stencil(np.array([10.0, 5.0]), 20.0, 4)
+    _assert(len(starts) == 5 and np.allclose(starts[0], [10.0, 5.0]), "centre + ring")
+    landings = [b + J @ xy for xy in starts]
+    step = sopt._stencil_step(starts, landings, landings[0] - target)
+    _assert(np.allclose(b + J @ (starts[0] + step), target),
+            "one corrected round lands on target for a linear map")
+    err = landings[0] - target
+    _assert(np.allclose(sopt._stencil_step(starts[:2], landings[:2], err), -err),
+            "too few candidates: translate by minus the error")
+    flat = [b for _xy in starts]   # landing ignores the start: implausible fit
+    _assert(np.allclose(sopt._stencil_step(starts, flat, err), -err),
+            "degenerate fit falls back to the translation")
+
+
+def _packaged_engine():
+    """The engine imported as ``catenary.v3.engine`` so spawn workers can
+    unpickle its classes (the ``sct_v3_bu`` alias exists only here)."""
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    return {m: importlib.import_module(f"catenary.v3.engine.{m}")
+            for m in ("bathymetry", "cable_system", "timeline", "quick_bu",
+                      "schedule_opt")}
+
+
+def _pool_params(pk):
+    asm = pk["cable_system"].uniform_assembly(
+        3000.0, 180.0, q_air_npm=300.0, diameter_m=0.035,
+        cd_normal=1.2, cd_tangential=0.01, mu=0.3, name="LW cable")
+    return dict(
+        leg1_assembly=asm, leg2_assembly=asm, trunk_assembly=asm,
+        defaults=pk["cable_system"].Defaults(q_water_npm=180.0, mu=0.3,
+                                             diameter_m=0.035),
+        bu_weight_kN=15.0, bu_cda_m2=1.5,
+        laid_end_1_xy=(-60.0, 140.0), laid_end_2_xy=(-60.0, -140.0),
+        vessel_xy=(0.0, 0.0), vessel_heading_deg=0.0,
+        tail_length_m=60.0, payout_mps=0.5, lay_speed_mps=0.35,
+        target_ds_m=6.0,
+    )
+
+
+def test_optimizer_process_pool_lands_on_target():
+    """``workers=2`` previews the stencil in a spawn pool and still lands
+    within tolerance."""
+    pk = _packaged_engine()
+    bathy = pk["bathymetry"].PlanarSlopeBathymetry(45.0, gx=0.02, gy=0.0)
+    out = pk["schedule_opt"].optimize_bu_schedule(
+        bathy, _pool_params(pk), (150.0, 30.0), tol_m=12.0, max_rounds=3,
+        sim_factory=pk["quick_bu"].QuickOperationSimulator, workers=2)
+    _assert(not any("Parallel previews" in w for w in out.warnings),
+            f"pool must run the previews: {out.warnings}")
+    _assert(out.preview is not None and not out.preview.aborted, "preview must run")
+    _assert(out.landing_error_m <= 12.0,
+            f"pooled landing error {out.landing_error_m:.1f} m > 12 m "
+            f"(rounds={out.rounds})")
+
+
+def test_optimizer_process_pool_cancels():
+    """The options' cancel hook, polled between pool results, stops the
+    search once the first candidate is in and leaves no sentinel file
+    behind."""
+    pk = _packaged_engine()
+    bathy = pk["bathymetry"].PlanarSlopeBathymetry(45.0, gx=0.02, gy=0.0)
+    seen = []
+
+    def progress(_frac, label):
+        if "candidates" in label:
+            seen.append(label)
+        return True
+
+    opts = pk["timeline"].SimOptions.preview()
+    opts.cancel = lambda: bool(seen)
+    sentinels = set(Path(tempfile.gettempdir()).glob("sct_preview_cancel_*"))
+    out = pk["schedule_opt"].optimize_bu_schedule(
+        bathy, _pool_params(pk), (150.0, 30.0), tol_m=12.0, max_rounds=3,
+        preview_options=opts, progress=progress,
+        sim_factory=pk["quick_bu"].QuickOperationSimulator, workers=3)
+    _assert(seen and not seen[-1].startswith("preview 1: 3/3"),
+            f"search must stop before the round completes: {seen}")
+    _assert(out.preview is None and out.rounds == 1, "cancelled round has no preview")
+    _assert(not math.isfinite(out.landing_error_m), "no landing when cancelled")
+    _assert(set(Path(tempfile.gettempdir()).glob("sct_preview_cancel_*")) <= sentinels,
+            "cancel sentinel must be removed")
+
+
 # ---------------------------------------------------------------------------
 
 def _result(name: str, ok: bool, detail: str = ""):
@@ -270,6 +361,9 @@ def run_all():
         test_controller_balances_on_asymmetric_slope,
         test_balance_leg_lengths_trims_to_tolerance,
         test_optimizer_lands_on_target,
+        test_stencil_step_inverts_the_landing_map,
+        test_optimizer_process_pool_lands_on_target,
+        test_optimizer_process_pool_cancels,
     ]
     for test in tests:
         try:
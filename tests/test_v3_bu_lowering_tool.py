@@ -202,6 +202,29 @@ def test_quick_run_lands_the_bu_and_wraps_the_trunk_over_the_sheave():
     assert float(np.linalg.norm(leg1.xyz[0] - top)) > 1.0
 
 
+def test_quick_run_streams_snapshots_while_solving():
+    if not HAVE_QT:
+        return
+    live = []
+    out = sc.run_operation(_tool_config("quick"),
+                           on_snapshot=lambda snap, build: live.append((snap, build)))
+    assert not out.error, out.error
+    assert len(live) == len(out.snapshots)
+    assert [s.t_s for s, _b in live] == [s.t_s for s in out.snapshots]
+    snap, build = live[len(live) // 2]
+    scene = build()
+    assert scene.title == f"t = {snap.t_s:.0f} s"
+    assert scene.cables
+    assert {p.name for p in scene.cables} <= {c.name for c in snap.chains}
+    # Each live frame's trail is the vessel track up to that snapshot, even
+    # after the growing buffer behind it has been written further.
+    track = np.array([s.vessel_xy for s in out.snapshots], dtype=float)
+    for k in (0, len(live) // 2, len(live) - 1):
+        trail = live[k][1]().vessel_trail
+        assert trail.shape == (k + 1, 2)
+        assert np.allclose(trail, track[:k + 1])
+
+
 def test_bu_lowering_dialog_builds_a_lowering_only_config():
     """Full dialog construction needs the QGIS plot shim — covered by
     tests/test_qgis_compat_widgets.py in the QGIS smoke run; here it runs
@@ -243,6 +266,7 @@ def run_all():
                test_wrap_adds_no_kink_at_the_arc_exit,
                test_wrap_vertical_hang_uses_the_fallback_direction,
                test_quick_run_lands_the_bu_and_wraps_the_trunk_over_the_sheave,
+               test_quick_run_streams_snapshots_while_solving,
                test_bu_lowering_dialog_builds_a_lowering_only_config):
         try:
             fn()
@@ -58,7 +58,7 @@ def _asm(length):
         cd_normal=1.2, cd_tangential=0.01, mu=0.3, name="LW cable")
 
 
-def _controller(bathy, *, heading=90.0, target=(0.0, 150.0)):
+def _controller(bathy, *, heading=90.0, target=(0.0, 150.0), **over):
     asm = _asm(3000.0)
     scn = sc.bu_full_deployment(
         bathy, asm, asm, asm, DEFAULTS,
@@ -68,7 +68,7 @@ def _controller(bathy, *, heading=90.0, target=(0.0, 150.0)):
         tail_length_m=60.0, payout_mps=0.5, lay_speed_mps=0.35, target_ds_m=6.0,
     )
     sim = qb.QuickOperationSimulator(scn, bathy, tl.SimOptions())
-    c = man.ManualBUController(sim, nominal_speed_mps=0.5, target_xy=target)
+    c = man.ManualBUController(sim, nominal_speed_mps=0.5, target_xy=target, **over)
     c.settle()
     return c
 
@@ -174,6 +174,47 @@ def test_undo_reset_replay_determinism():
             and abs(c.vessel_xy()[1]) < 1e-6, "reset returns to origin")
 
 
+def test_checkpoints_bound_replay_work():
+    """Undo / branching restore the nearest checkpoint and re-solve only the
+    tail; the result matches the original run and the store stays within
+    its budget."""
+    bathy = bathy_mod.FlatBathymetry(40.0)
+    c = _controller(bathy, heading=90.0, checkpoint_every=3, checkpoint_budget=2)
+    cmds = [man.ManualCommand(fwd_m=4.0, payout_m={"leg1": 2.0 + i})
+            for i in range(10)]
+    snaps = [c.apply(cmd) for cmd in cmds]
+    _assert(len(c._checkpoints) <= 3, f"budget exceeded: {sorted(c._checkpoints)}")
+    _assert(0 in c._checkpoints and 9 in c._checkpoints,
+            f"start and newest checkpoints kept: {sorted(c._checkpoints)}")
+
+    applied = []
+    orig_apply = c.apply
+
+    def counting_apply(cmd):
+        applied.append(cmd)
+        return orig_apply(cmd)
+
+    c.apply = counting_apply
+    snap = c.undo()
+    _assert(len(c.history) == 9 and not applied,
+            f"undo onto a checkpoint re-solves nothing ({len(applied)} applied)")
+    _assert(np.allclose(snap.chain("leg1").xyz, snaps[8].chain("leg1").xyz),
+            "undo must return the state after command 9")
+
+    c.branch_from(7)
+    _assert(len(c.history) == 7 and len(applied) == 7 - max(
+        k for k in c._checkpoints if k <= 7), "branch re-solves only the tail")
+    _assert(abs(c.vessel_xy()[1] - 7 * 4.0) < 1e-6, "branch vessel position")
+    c.apply(man.ManualCommand(stbd_m=5.0))
+    _assert(len(c.history) == 8, "branch continues after command 7")
+    _assert(all(k <= 8 for k in c._checkpoints), "stale checkpoints dropped")
+
+    c.apply = orig_apply
+    c.replay(cmds)
+    _assert(np.allclose(c.sim._last_snap.chain("leg1").xyz, snaps[-1].chain("leg1").xyz),
+            "replay from a checkpoint must reproduce the original run")
+
+
 def test_to_schedule_reproduces_landing_in_full_solver():
     """The manual history, folded into a PhaseRow schedule and run through the
     FULL solver, lands the BU close to the manual quick-run landing."""
@@ -415,6 +456,7 @@ def run_all():
         test_payout_updates_length_and_count,
         test_manual_overboard_and_lower_lands_bu,
         test_undo_reset_replay_determinism,
+        test_checkpoints_bound_replay_work,
         test_to_schedule_reproduces_landing_in_full_solver,
         test_lay_history_freezes_bed_cable,
         test_lay_history_pickup_shortens_path,
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""Columnar snapshot store tests.
+
+Pure Python + NumPy; no QGIS imports. Checks that a SnapshotStore (in RAM
+and spilled to memory-mapped temporary files) hands back the snapshots it
+was given, that its whole-run columns match the list-based time series and
+CSV exporters, and that a real operation run stores into it.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+import sys
+import types
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _load(pkg_name, subdir, names):
+    pkg = types.ModuleType(pkg_name)
+    pkg.__path__ = [str(ROOT / "catenary" / "v3" / subdir)]
+    sys.modules[pkg_name] = pkg
+    mods = {}
+    for m in names:
+        spec = importlib.util.spec_from_file_location(
+            f"{pkg_name}.{m}", ROOT / "catenary" / "v3" / subdir / f"{m}.py")
+        mm = importlib.util.module_from_spec(spec)
+        sys.modules[f"{pkg_name}.{m}"] = mm
+        spec.loader.exec_module(mm)
+        mods[m] = mm
+    return mods
+
+
+M = _load("sct_v3_store", "engine", (
+    "bathymetry", "cable_system", "solver3d", "hydrodynamics", "steady_lay",
+    "snapshot_store", "timeline", "scenarios"))
+U = _load("sct_v3_store_ui", "ui", ("views2d", "timeseries_view", "exporters"))
+bathy_mod = M["bathymetry"]
+cs = M["cable_system"]
+tl = M["timeline"]
+sc = M["scenarios"]
+ss = M["snapshot_store"]
+TS = U["timeseries_view"]
+EX = U["exporters"]
+
+
+def _chain(name, i, n, x0=5.0e5):
+    xyz = np.column_stack([
+        x0 + np.linspace(0.0, 100.0, n) + i,
+        np.linspace(0.0, 10.0, n),
+        -np.linspace(0.0, 40.0, n),
+    ])
+    contact = np.arange(n) >= n // 2
+    return tl.ChainSnapshot(
+        name=name, xyz=xyz, s=np.linspace(0.0, 110.0, n),
+        tension_kN=np.linspace(20.0 + i, 5.0, n), contact=contact,
+        seg_id=np.zeros(n - 1, dtype=int), top_tension_kN=20.0 + i,
+        end_tension_kN=5.0, min_radius_m=50.0, length_m=110.0,
+        joints_xyz=[("J1", (1.0, 2.0, -3.0))] if name == "leg1" else [],
+        count_top_m=(1000.0 + i) if name == "trunk" else None,
+    )
+
+
+def _snaps(n=6):
+    out = []
+    for i in range(n):
+        chains = [_chain("leg1", i, 12 + i), _chain("leg2", i, 9)]
+        if i >= 2:
+            chains.append(_chain("trunk", i, 15))
+        out.append(tl.Snapshot(
+            t_s=10.0 * i, vessel_xy=(5.0e5 + i, 20.0), vessel_heading_deg=90.0,
+            chains=chains,
+            junction_xyz={"BU": (5.0e5 + 3.0 * i, 20.0, -5.0 * i)} if i >= 2 else {},
+            converged=i != 3, residual_ratio=1e-3 * i,
+            warnings=["w"] if i == 4 else [], label=f"step {i}",
+            payout_mps={"leg1": 0.1 * i},
+        ))
+    return out
+
+
+def _store(snaps, **kw):
+    store = ss.SnapshotStore(**kw)
+    for i, s in enumerate(snaps):
+        store.append(s, step_index=i // 2)
+    return store
+
+
+def test_round_trip_in_ram_and_spilled():
+    snaps = _snaps()
+    for spill in (False, True):
+        store = _store(snaps, spill=spill)
+        assert len(store) == len(snaps)
+        assert list(store.step_index) == [0, 0, 1, 1, 2, 2]
+        for ref, got in zip(snaps, store):
+            assert got.t_s == ref.t_s and got.label == ref.label
+            assert got.converged == ref.converged
+            assert got.junction_xyz == ref.junction_xyz
+            assert [c.name for c in got.chains] == [c.name for c in ref.chains]
+            for rc in ref.chains:
+                c = got.chain(rc.name)
+                # float32 relative to the vessel: sub-millimetre far from origin.
+                assert np.max(np.abs(c.xyz - rc.xyz)) < 1e-3
+                assert np.allclose(c.tension_kN, rc.tension_kN, rtol=1e-6)
+                assert np.array_equal(c.contact, rc.contact)
+                assert len(c.seg_id) == len(rc.seg_id)
+                assert c.count_top_m == rc.count_top_m
+                assert c.joints_xyz == rc.joints_xyz
+        assert store[-1].t_s == snaps[-1].t_s
+        assert [s.t_s for s in store[1:3]] == [10.0, 20.0]
+        assert [s.t_s for s in reversed(store)][0] == snaps[-1].t_s
+        store.close()
+        assert len(store) == 0
+
+
+def test_series_and_exports_match_snapshot_lists():
+    snaps = _snaps()
+    store = _store(snaps, spill=True)
+    ref, got = TS.snapshots_to_series(snaps), TS.snapshots_to_series(store)
+    assert got["names"] == ref["names"] and got["labels"] == ref["labels"]
+    for key in ("t", "leg_imbalance", "bu_z", "layback_bu"):
+        assert np.allclose(got[key], ref[key], equal_nan=True), key
+    for key in ("top_tension", "tdp_tension", "payout"):
+        for name in ref["names"]:
+            assert np.allclose(got[key][name], ref[key][name], rtol=1e-6,
+                               equal_nan=True), (key, name)
+    for rows_fn in (EX.timeline_csv_rows, EX.schedule_csv_rows):
+        assert rows_fn(store) == rows_fn(snaps), rows_fn.__name__
+
+
+def test_track_and_bounds_from_columns():
+    snaps = _snaps()
+    pts = np.concatenate([c.xyz for s in snaps for c in s.chains]
+                         + [np.array([[s.vessel_xy[0], s.vessel_xy[1], 0.0]])
+                            for s in snaps])
+    for spill in (False, True):
+        store = _store(snaps, spill=spill)
+        assert np.array_equal(store.vessel_xy,
+                              np.array([s.vessel_xy for s in snaps], dtype=float))
+        box = store.bounds()
+        assert box.shape == (2, 3)
+        assert np.max(np.abs(box[0] - pts.min(axis=0))) < 1e-3
+        assert np.max(np.abs(box[1] - pts.max(axis=0))) < 1e-3
+        store.close()
+    assert ss.SnapshotStore().bounds().shape == (0, 3)
+
+
+def test_operation_run_stores_snapshots():
+    bathy = bathy_mod.FlatBathymetry(60.0)
+    asm = cs.uniform_assembly(
+        2000.0, 180.0, q_air_npm=300.0, diameter_m=0.035,
+        cd_normal=1.2, cd_tangential=0.01, mu=0.3, name="LW cable")
+    scn = sc.straight_lay(
+        bathy, asm, cs.Defaults(q_water_npm=180.0, mu=0.3, diameter_m=0.035),
+        ship_speed_mps=1.0, slack_percent=2.0, duration_s=30.0,
+        chute_height_m=5.0, target_ds_m=6.0,
+    )
+    sim = tl.OperationSimulator(scn, bathy, tl.SimOptions(
+        max_move_m=10.0, tol=5e-3, max_iters=20000, spill_snapshots=True))
+    res = sim.run()
+    assert isinstance(res.snapshots, ss.SnapshotStore) and res.snapshots.spill
+    assert len(res.snapshots) >= 2
+    assert list(res.snapshots.step_index)[:2] == [-1, 0]
+    last = res.snapshots[-1]
+    assert last.chain("cable") is not None and last.converged
+
+
+def _result(name: str, ok: bool, detail: str = ""):
+    print(f"[{'PASS' if ok else 'FAIL'}] {name}" + (f" - {detail}" if detail else ""))
+
+
+def run_all():
+    failures = []
+    tests = [
+        test_round_trip_in_ram_and_spilled,
+        test_series_and_exports_match_snapshot_lists,
+        test_track_and_bounds_from_columns,
+        test_operation_run_stores_snapshots,
+    ]
+    for test in tests:
+        try:
+            test()
+            _result(test.__name__, True)
+        except Exception as exc:  # pragma: no cover
+            _result(test.__name__, False, repr(exc))
+            failures.append(test.__name__)
+    print(f"\n{len(failures)} failure(s)." if failures else "\nAll checks passed.")
+    return failures
+
+
+if __name__ == "__main__":  # pragma: no cover
+    failures = run_all()
+    sys.exit(1 if failures else 0)
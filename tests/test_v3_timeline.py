@@ -263,6 +263,84 @@ def test_static_hold_bu_and_bight():
     _assert(-60.0 < apex_z < -10.0, f"apex should hold at depth (z = {apex_z:.1f})")
 
 
+def test_warm_extrapolation_seed():
+    """The substep seed continues the last move of suspended chains only;
+    ends stay pinned and a chain near the bed keeps its plain seed."""
+    chute = np.array([0.0, 0.0, 5.0])
+    anchor = (-60.0, 0.0, -40.0)
+
+    def sim_for(depth_m, **over):
+        chain = tl.ChainState(
+            name="cable", assembly=_telecom_assembly(500.0), defaults=DEFAULTS,
+            length_m=80.0, top=tl.Attachment("vessel", chute_height_m=5.0),
+            bottom=tl.Attachment("fixed", xyz=anchor),
+            shape=cs.straight_shape(chute, np.asarray(anchor), 20), target_ds_m=4.0,
+        )
+        scn = tl.Scenario(chains={"cable": chain}, vessel_xy=(0.0, 0.0), steps=[])
+        return tl.OperationSimulator(scn, bathy_mod.FlatBathymetry(depth_m), _opts(**over))
+
+    sim = sim_for(200.0, warm_extrapolate=True)
+    sysm, _jnode = sim._build()
+    _assert(sim._extrapolated_seed(sysm, 10.0) is None, "no history, no extrapolation")
+    sim._shape_hist = {"cable": sim.sc.chains["cable"].shape - np.array([1.0, 0.0, 0.0])}
+    sim._hist_dt = 20.0
+    X = sim._extrapolated_seed(sysm, 10.0)
+    idx = sysm.chains[0].idx
+    _assert(X is not None, "suspended chain should be extrapolated")
+    _assert(np.allclose(X[idx[1:-1]] - sysm.X[idx[1:-1]], [0.5, 0.0, 0.0]),
+            "inner nodes continue the last move, scaled by the substep ratio")
+    _assert(np.allclose(X[idx[[0, -1]]], sysm.X[idx[[0, -1]]]), "ends stay pinned")
+
+    off = sim_for(200.0)
+    off._shape_hist, off._hist_dt = sim._shape_hist, sim._hist_dt
+    _assert(off._extrapolated_seed(sysm, 10.0) is None, "disabled by default")
+    on_bed = sim_for(30.0, warm_extrapolate=True)
+    on_bed._shape_hist, on_bed._hist_dt = sim._shape_hist, sim._hist_dt
+    _assert(on_bed._extrapolated_seed(on_bed._build()[0], 10.0) is None,
+            "a chain touching the bed keeps its lay history")
+
+
+def test_iter_run_streams_snapshots():
+    """iter_run yields the snapshots run() returns, in order, as they are
+    stored; a progress callback returning False stops run() early."""
+    chute = np.array([0.0, 0.0, 5.0])
+    anchor = (-70.0, 0.0, -50.0)
+
+    def sim():
+        chain = tl.ChainState(
+            name="cable", assembly=_telecom_assembly(1000.0), defaults=DEFAULTS,
+            length_m=100.0, top=tl.Attachment("vessel", chute_height_m=5.0),
+            bottom=tl.Attachment("fixed", xyz=anchor),
+            shape=cs.straight_shape(chute, np.asarray(anchor), 25), target_ds_m=4.0,
+        )
+        scn = tl.Scenario(
+            chains={"cable": chain}, vessel_xy=(0.0, 0.0),
+            steps=[tl.Step(duration_s=40.0, vessel_speed_mps=0.0,
+                           payout_mps={"cable": 0.3}, label="pay out")],
+        )
+        return tl.OperationSimulator(scn, bathy_mod.FlatBathymetry(50.0), _opts())
+
+    ref = sim().run()
+    out = tl.SimResult()
+    seen = []
+    for snap, frac, label in sim().iter_run(out):
+        _assert(len(out.snapshots) == len(seen) + 1, "yielded once stored")
+        seen.append((snap.t_s, frac, label))
+    _assert([t for t, _f, _l in seen] == [s.t_s for s in ref.snapshots],
+            "same snapshots as run()")
+    _assert(seen[0][1:] == (0.0, "settle") and seen[-1][1] == 1.0,
+            "settle first, fraction reaches 1")
+    _assert(all(lbl == "pay out" for _t, _f, lbl in seen[1:]), "step labels")
+    _assert(np.allclose(out.snapshots[-1].chain("cable").tension_kN,
+                        ref.snapshots[-1].chain("cable").tension_kN),
+            "deterministic: streamed and batch runs agree")
+
+    calls = []
+    stopped = sim().run(lambda f, lbl: calls.append(f) or False)
+    _assert(stopped.aborted and len(calls) == 1, "cancelled at the first substep")
+    _assert(len(stopped.snapshots) == 2, "settle plus the cancelled substep kept")
+
+
 # ---------------------------------------------------------------------------
 
 def _result(name: str, ok: bool, detail: str = ""):
@@ -277,6 +355,8 @@ def run_all():
         test_bu_deployment_descends_and_lands,
         test_final_bight_lowers_releases_and_settles,
         test_static_hold_bu_and_bight,
+        test_warm_extrapolation_seed,
+        test_iter_run_streams_snapshots,
     ]
     for test in tests:
         try:
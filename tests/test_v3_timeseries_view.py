@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 """Pure-helper tests for the V3 time-series tab.
 
-Covers the snapshot flattening, the panel builder (which panels/traces exist
+Covers the snapshot flattening (whole-run and streamed), the panel builder (which panels/traces exist
 for a given run), the layout signature used to decide between an in-place
 update and a rebuild, and the Y-axis fit used by the "Fit Y" action. No Qt
 widgets are constructed.
@@ -84,6 +84,27 @@ def test_snapshots_to_series_shapes_and_values():
     assert ser["labels"][2] == "overboard"
 
 
+def test_extend_series_matches_whole_run():
+    snaps = [_Snap(i, with_bu=i >= 2) for i in range(6)]
+    for snap in snaps[:3]:
+        snap.chains = [c for c in snap.chains if c.name != "trunk"]
+        del snap.payout_mps["trunk"]
+    ser = None
+    for lo, hi in ((0, 1), (1, 3), (3, 3), (3, 6)):
+        ser = TS.extend_series(ser, snaps[lo:hi])
+    ref = TS.snapshots_to_series(snaps)
+    assert ser["names"] == ref["names"] == ["leg1", "leg2", "trunk"]
+    assert ser["labels"] == ref["labels"]
+    for key in ("t", "leg_imbalance", "bu_z", "layback_bu"):
+        assert np.allclose(ser[key], ref[key], equal_nan=True), key
+    for key in ("top_tension", "tdp_tension", "payout"):
+        for name in ref["names"]:
+            assert np.allclose(ser[key][name], ref[key][name], equal_nan=True)
+    # A chain first seen late is NaN-padded back to the start.
+    assert np.all(np.isnan(ser["top_tension"]["trunk"][:3]))
+    assert TS.extend_series(None, []) is None
+
+
 def test_build_panels_drops_empty_panels_and_traces():
     # Fully suspended run, no BU junction: no TDP and no descent panel.
     snaps = [_Snap(i, with_bu=False, laid=False) for i in range(4)]
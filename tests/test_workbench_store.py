@@ -161,6 +161,57 @@ def test_registry_read_cache_tracks_mutations() -> bool:
     return _result("registry read cache is isolated, current, and reloadable", ok)
 
 
+def test_row_level_writes_use_sql_path() -> bool:
+    """Row edits go through direct SQL and leave other parents' rows alone."""
+    store = _temp_store()
+    store.save_assessment_ranges("a1", [{"method": "plough", "start_kp": 0.0,
+                                         "end_kp": 1.0}])
+    store.save_assessment_ranges("a2", [{"method": "plough", "start_kp": 2.0,
+                                         "end_kp": 3.0}])
+    ok = store._sql_mode is True
+    store.save_assessment_ranges("a1", [
+        {"method": "plough", "start_kp": 0.0, "end_kp": 0.5},
+        {"method": "jet", "start_kp": 0.5, "end_kp": 1.0}])
+    ok = ok and len(store.list_assessment_ranges("a1")) == 2
+    ok = ok and len(store.list_assessment_ranges("a2")) == 1
+    store.write_meta("probe", "1")
+    ok = ok and store.read_meta().get("probe") == "1"
+    # A fresh store (no cache) reads the same rows straight from the file.
+    fresh = WorkbenchStore(store.gpkg_path)
+    ok = ok and len(fresh.list_assessment_ranges("a1")) == 2
+    ok = ok and fresh.read_meta().get("probe") == "1"
+    store.delete_assessment("a1")
+    ok = ok and not store.list_assessment_ranges("a1")
+    ok = ok and len(WorkbenchStore(store.gpkg_path).list_assessment_ranges("a2")) == 1
+    store.close()
+    return _result("row-level SQL writes replace only the edited parent's rows", ok)
+
+
+def test_sql_and_layer_reads_agree() -> bool:
+    """The SQL read path returns the same normalised rows as the OGR one."""
+    store = _temp_store()
+    route_id = store.create_route("Read paths")
+    store.save_assessment_ranges("a1", [
+        {"method": "plough", "start_kp": 0.0, "end_kp": 1.25},
+        {"method": "jet", "start_kp": 1.25, "end_kp": None}])
+    ok = store._sql_mode is True
+    store.close()
+    tables = (schema.TABLE_ROUTE, schema.TABLE_ASSESSMENT_RANGE, schema.TABLE_META)
+    via_sql = WorkbenchStore(store.gpkg_path)
+    sql_rows = {table: via_sql.read_table(table) for table in tables}
+    ok = ok and via_sql._sql_mode is True
+    via_sql.close()
+    via_layer = WorkbenchStore(store.gpkg_path)
+    via_layer._sql_mode = False
+    layer_rows = {table: via_layer.read_table(table) for table in tables}
+    ok = ok and any(r.get("route_id") == route_id for r in sql_rows[schema.TABLE_ROUTE])
+    ok = ok and len(sql_rows[schema.TABLE_ASSESSMENT_RANGE]) == 2
+    mismatched = [table for table in tables if sql_rows[table] != layer_rows[table]]
+    ok = ok and not mismatched
+    return _result("SQL and layer read paths return equal rows", ok,
+                   f"mismatched: {mismatched}" if mismatched else "")
+
+
 def test_segment_makeup_orders_assemblies_and_joints() -> bool:
     store = _temp_store()
     route_id = store.create_route("Two-load segment")
@@ -200,6 +251,8 @@ def run_all() -> list:
         test_rpl_and_fit_round_trip(),
         test_topology_invariants(),
         test_registry_read_cache_tracks_mutations(),
+        test_row_level_writes_use_sql_path(),
+        test_sql_and_layer_reads_agree(),
         test_segment_makeup_orders_assemblies_and_joints(),
     ]
 
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""Standalone checks for the in-process XYZ gridding engine.
+
+Chunked parsing (headers, comments, chunk boundaries), the first-pass scan,
+cell registration and the per-cell mean/min/max/count accumulation are pure
+NumPy and run without QGIS; the GeoTIFF writer needs GDAL and is exercised
+by the end-to-end run in ``test_mbes_xyz_tools.py``.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from ..processing import xyz_gridding
+from ..processing.xyz_gridding import (
+    NODATA, CellAccumulator, GridSpec, iter_xyz_chunks, scan_xyz,
+)
+
+
+def _result(name, ok, detail=""):
+    print("[%s] %s%s" % ("PASS" if ok else "FAIL", name, (" — " + detail) if detail else ""))
+    return ok
+
+
+def _write(text):
+    handle = tempfile.NamedTemporaryFile("w", suffix=".xyz", delete=False)
+    handle.write(text)
+    handle.close()
+    return handle.name
+
+
+def test_chunked_reader_matches_loadtxt():
+    rng = np.random.default_rng(11)
+    points = rng.uniform(0.0, 100.0, size=(257, 4))
+    body = "\n".join(f"{x:.6f};{y:.6f};{z:.6f};{w:.2f}" for x, y, z, w in points)
+    path = _write("Easting;Northing;Depth;Q\n# exported\n" + body + "\n// end\n")
+    try:
+        chunks = list(iter_xyz_chunks(path, ";", 1, chunk_bytes=1500))
+        data = np.vstack(chunks)
+        expected = np.loadtxt(path, comments=["#", "//"], delimiter=";",
+                              skiprows=1, ndmin=2)[:, :3]
+        ok = len(chunks) > 4 and np.array_equal(data, expected)
+        scan = scan_xyz(iter_xyz_chunks(path, ";", 1, chunk_bytes=1500))
+        ok = ok and scan.count == 257
+        ok = ok and scan.x_min == expected[:, 0].min() and scan.y_max == expected[:, 1].max()
+        ok = ok and np.array_equal(scan.x_unique, np.unique(expected[:, 0]))
+        ok = ok and scan_xyz(iter([data]), cancel=lambda: True) is None
+    finally:
+        os.remove(path)
+    return _result("chunked reader equals loadtxt; scan keeps bounds and distinct axes", ok)
+
+
+def test_gridded_export_reproduced_cell_for_cell():
+    # A 0.5 m grid with holes, as an MBES export delivers it.
+    cols, rows = np.meshgrid(np.arange(40), np.arange(30))
+    xs = 500000.25 + 0.5 * cols.ravel()
+    ys = 6000000.25 + 0.5 * rows.ravel()
+    zs = -40.0 - 0.01 * cols.ravel() - 0.02 * rows.ravel()
+    keep = (cols.ravel() + rows.ravel()) % 7 != 0
+    data = np.column_stack([xs, ys, zs])[keep]
+    scan = scan_xyz(iter(np.array_split(data, 5)))
+    spec = GridSpec.cell_centred(scan, 0.5)
+    ok = (spec.width, spec.height) == (40, 30)
+    acc = CellAccumulator(spec)
+    for chunk in np.array_split(data, 5):
+        acc.add(chunk)
+    mean = acc.bands()[0]
+    # Raster row 0 is the northern edge.
+    expected = (-40.0 - 0.01 * cols - 0.02 * rows)[::-1].astype(np.float32)
+    holes = ((cols + rows) % 7 == 0)[::-1]
+    ok = ok and np.array_equal(mean[~holes], expected[~holes])
+    ok = ok and bool(np.all(mean[holes] == NODATA))
+    return _result("gridded export: exact values at cell centres, holes are no-data", ok)
+
+
+def test_statistics_match_brute_force():
+    rng = np.random.default_rng(5)
+    data = np.column_stack([rng.uniform(0.0, 10.0, 5000),
+                            rng.uniform(0.0, 8.0, 5000),
+                            rng.normal(-30.0, 2.0, 5000)])
+    data[::97, 2] = np.nan                               # dropped, not binned
+    spec = GridSpec(0.0, 8.0, 1.0, 10, 8)
+    acc = CellAccumulator(spec)
+    for chunk in np.array_split(data, 7):
+        acc.add(chunk)
+    mean, low, high, count = acc.bands(statistics=True)
+    ok = True
+    valid = data[np.isfinite(data[:, 2])]
+    for r in range(8):
+        for c in range(10):
+            inside = ((np.floor(valid[:, 0]).astype(int) == c)
+                      & (np.floor((8.0 - valid[:, 1])).astype(int) == r))
+            z = valid[inside, 2]
+            ok = ok and count[r, c] == len(z)
+            if len(z):
+                ok = ok and abs(mean[r, c] - np.float32(z.mean())) < 1e-4
+                ok = ok and low[r, c] == np.float32(z.min())
+                ok = ok and high[r, c] == np.float32(z.max())
+    return _result("per-cell mean/min/max/count equal a brute-force pass", ok,
+                   "%d points" % int(count.sum()))
+
+
+def test_block_parser_fallbacks():
+    # CRLF, tabs, a blank line mid-file and a trailing row without newline.
+    path = _write("1\t2\t3\r\n4\t5\t6\r\n\r\n7\t8\t9")
+    ragged = _write("1 2 3\n4 5\n6 7 8 9\n")
+    try:
+        data = np.vstack(list(iter_xyz_chunks(path, None, 0, chunk_bytes=8)))
+        ok = data.tolist() == [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+        try:
+            list(iter_xyz_chunks(ragged))
+            ok = False                     # must not be silently reshaped
+        except ValueError:
+            pass
+    finally:
+        os.remove(path)
+        os.remove(ragged)
+    return _result("block parser: CRLF/blank lines parse, ragged rows raise", ok)
+
+
+def test_grid_file_in_worker_processes():
+    cols, rows = np.meshgrid(np.arange(60), np.arange(20))
+    paths = []
+    for step in (0.5, 2.0):
+        body = "\n".join(f"{1000 + step * c:.3f},{2000 + step * r:.3f},{-c - r:.2f}"
+                         for c, r in zip(cols.ravel(), rows.ravel()))
+        paths.append(_write("x,y,z\n" + body + "\n"))
+    folder = tempfile.mkdtemp()
+    jobs = [{"path": p, "delimiter": ",", "skiprows": 1, "grid_size": 0.0,
+             "output": os.path.join(folder, f"out{i}.tif"), "crs_wkt": "",
+             "compress": True, "statistics": False, "temp_dir": folder}
+            for i, p in enumerate(paths)]
+    try:
+        with ProcessPoolExecutor(
+                max_workers=2,
+                mp_context=multiprocessing.get_context("spawn")) as pool:
+            results = list(pool.map(xyz_gridding.grid_file, jobs))
+        # Without the GDAL bindings the binned grid cannot be written and
+        # the tool falls back to gdal:rasterize; the scan facts still hold.
+        expected = xyz_gridding.STATUS_OK if xyz_gridding.gdal_available() \
+            else xyz_gridding.STATUS_FALLBACK
+        ok = [r["status"] for r in results] == [expected, expected]
+        ok = ok and [r["grid_size"] for r in results] == [0.5, 2.0]
+        ok = ok and all((r["width"], r["height"], r["count"]) == (60, 20, 1200)
+                        for r in results)
+        ok = ok and sorted(os.listdir(folder)) == sorted(
+            os.path.basename(j["output"]) for j in jobs
+            if expected == xyz_gridding.STATUS_OK)   # spill files cleaned up
+        cancelled = xyz_gridding.grid_file(jobs[0], cancel=lambda: True)
+        ok = ok and cancelled["status"] == xyz_gridding.STATUS_CANCELLED
+    finally:
+        for p in paths:
+            os.remove(p)
+    return _result("grid_file runs in spawned workers; status per file", ok,
+                   str([r["status"] for r in results]))
+
+
+def test_spacing_detection_is_bounded():
+    # A 0.5 m gridded export keeps its exact step once the distinct set is
+    # dropped; scattered soundings never hold more than the cap.
+    cols, rows = np.meshgrid(np.arange(60), np.arange(50))
+    grid = np.column_stack([1000.0 + 0.5 * cols.ravel(),
+                            2000.0 + 0.5 * rows.ravel(),
+                            np.zeros(cols.size)])
+    chunks = np.array_split(grid, 20)
+    full = scan_xyz(iter(chunks))
+    capped = scan_xyz(iter(chunks), max_unique=55)   # 60 columns, 50 rows
+    ok = full.x_unique is not None and abs(full.detected_grid_size() - 0.5) < 1e-12
+    ok = ok and capped.x_unique is None and capped.y_unique is not None
+    ok = ok and len(capped.x_chunk_steps) <= len(chunks)
+    ok = ok and abs(capped.detected_grid_size() - 0.5) < 1e-12
+
+    rng = np.random.default_rng(5)
+    scattered = np.column_stack([rng.uniform(0.0, 500.0, 200_000),
+                                 rng.uniform(0.0, 500.0, 200_000),
+                                 np.zeros(200_000)])
+    scan = scan_xyz(iter(np.array_split(scattered, 50)), max_unique=10_000)
+    ok = ok and scan.x_unique is None and scan.y_unique is None
+    ok = ok and len(scan.x_chunk_steps) == 50
+    size = scan.detected_grid_size()
+    ok = ok and 0.0 < size < 1.0
+    return _result("grid-size detection memory is bounded on scattered data", ok,
+                   f"scattered estimate={size:.4f} m")
+
+
+def run_all():
+    return [test_chunked_reader_matches_loadtxt(),
+            test_gridded_export_reproduced_cell_for_cell(),
+            test_statistics_match_brute_force(),
+            test_block_parser_fallbacks(),
+            test_spacing_detection_is_bounded(),
+            test_grid_file_in_worker_processes()]
+
+
+if __name__ == "__main__":
+    raise SystemExit(0 if all(run_all()) else 1)
@@ -19,7 +19,7 @@ from __future__ import annotations
 import json
 from typing import Dict, List, Optional
 
-from qgis.core import QgsProject, QgsVectorLayer
+from qgis.core import QgsApplication, QgsProject, QgsVectorLayer
 from qgis.gui import QgsFieldComboBox, QgsMapLayerComboBox
 from qgis.PyQt.QtCore import Qt, QTimer, pyqtSignal
 from qgis.PyQt.QtGui import QBrush, QColor
@@ -39,7 +39,6 @@ from qgis.PyQt.QtWidgets import (
     QLineEdit,
     QMenu,
     QMessageBox,
-    QProgressDialog,
     QPushButton,
     QSpinBox,
     QTableWidget,
@@ -55,7 +54,7 @@ from ..qgis_compat import (
     MAP_LAYER_FILTER_VECTOR,
     layer_filters, qt_exec,
 )
-from . import assessment_output, rules_inputs, schema
+from . import assessment_output, assessment_task, rules_inputs, schema
 from .kp_bars import (
     ACTION_COLORS,
     FireBarDelegate,
@@ -306,6 +305,12 @@ class AssessmentPanel(QWidget):
         self.result = None
         self.sampler = None
         self._loading = False
+        # Background run state: at most one task; an edit made while it runs
+        # cancels it and re-runs once it has stopped.
+        self._task: Optional[assessment_task.AssessmentTask] = None
+        self._task_assessment_id = ""
+        self._rerun_pending = False
+        self._acq_cache = assessment_task.RuleAcquisitionCache()
 
         self._debounce = QTimer(self)
         self._debounce.setSingleShot(True)
@@ -338,7 +343,7 @@ class AssessmentPanel(QWidget):
         header.addWidget(self.step_spin)
         header.addStretch(1)
         self.run_btn = QPushButton("Run assessment")
-        self.run_btn.clicked.connect(self._run)
+        self.run_btn.clicked.connect(self._on_run_clicked)
         header.addWidget(self.run_btn)
         layout.addLayout(header)
 
@@ -649,32 +654,65 @@ class AssessmentPanel(QWidget):
         if self.result is not None:
             self._debounce.start()
 
+    def _on_run_clicked(self):
+        if self._task is not None:
+            self._rerun_pending = False
+            self._task.cancel()
+            self.status_label.setText("Stopping…")
+            return
+        self._run()
+
     def _run(self):
+        if self._task is not None:
+            # An edit while running: stop this run and start afresh after.
+            self._rerun_pending = True
+            self._task.cancel()
+            return
         if not self._ensure_ready() or not self.rpl_id:
             return
         self.assessment["sample_step_m"] = self.step_spin.value()
         self.store.save_assessment(self.assessment)
-        progress = QProgressDialog("Running assessment…", None, 0, 0, self)
-        progress.setWindowModality(Qt.WindowModality.WindowModal)
-        progress.setMinimumDuration(0)
-        progress.show()
-
-        def _tick(msg):
-            progress.setLabelText(msg)
-            from qgis.PyQt.QtWidgets import QApplication
-            QApplication.processEvents()
-
         try:
-            result, sampler = rules_inputs.run_assessment(
+            work = assessment_task.build_assessment_work(
                 self.store, self.rpl_id, self.assessment["rule_set_id"],
-                sample_step_m=self.step_spin.value(),
+                self._acq_cache, sample_step_m=self.step_spin.value(),
                 min_range_km=float(self.assessment.get("min_range_km") or 0.0),
-                project=QgsProject.instance(), progress=_tick,
-            )
+                project=QgsProject.instance())
         except Exception as exc:
-            progress.close()
             QMessageBox.critical(self, "Assessment failed", str(exc))
             return
+        self._task_assessment_id = self.assessment["assessment_id"]
+        self._task = assessment_task.AssessmentTask(work, self._run_finished)
+        self._task.progressMessage.connect(self.status_label.setText)
+        self.run_btn.setText("Stop")
+        self.status_label.setText("Running assessment…")
+        QgsApplication.taskManager().addTask(self._task)
+
+    def _run_finished(self, task: "assessment_task.AssessmentTask"):
+        self._task = None
+        self.run_btn.setText("Run assessment")
+        # Completed rules stay cached even when the run was stopped.
+        for key, intervals in task.acquired.items():
+            self._acq_cache.put(key, intervals)
+        if self._rerun_pending:
+            self._rerun_pending = False
+            self._debounce.start()
+            return
+        if not self.assessment or \
+                self.assessment.get("assessment_id") != self._task_assessment_id:
+            self.status_label.setText(
+                "Assessment run discarded — a different assessment is now open.")
+            return
+        if task.cancelled:
+            self.status_label.setText(
+                "Stopped — completed rules stay cached; run again to resume.")
+            return
+        if task.error or task.result is None:
+            self.status_label.setText("")
+            QMessageBox.critical(self, "Assessment failed",
+                                 task.error or "Assessment task failed.")
+            return
+        result, sampler = task.result, task.sampler
         self.result = result
         self.sampler = sampler
         rule_names = {r["rule_id"]: r.get("name") or r["rule_id"] for r in self.rules}
@@ -686,7 +724,6 @@ class AssessmentPanel(QWidget):
             self._load_output_layer(layer_name)
         except Exception as exc:
             self.status_label.setText(f"Ranges computed but layer write failed: {exc}")
-        progress.close()
 
         self._rebuild_rule_table()
         self._refresh_overview()
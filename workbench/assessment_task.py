@@ -0,0 +1,400 @@
+# -*- coding: utf-8 -*-
+"""Background execution for the Workbench route assessment (QgsTask).
+
+Same thread-safety contract as the Burial Planner's ``analysis_task``: the
+task never touches ``QgsProject``, GUI objects or live layers. On the main
+thread, ``build_assessment_work`` resolves the route, rule stack and inputs
+into worker-safe snapshots — route geometries cloned into a ``RouteFrame``,
+feature layers as ``QgsVectorLayerFeatureSource``, bathymetry as a
+``DepthSnapshot`` — and the task consumes those only. The resolved
+``AssessmentResult`` comes back on the task; the panel writes the ranges
+layer in its completion callback on the main thread.
+
+Caching: each rule's acquisition (its intervals before KP scoping) is kept
+in a ``RuleAcquisitionCache`` owned by the panel, keyed over the rule kind and
+canonicalised config, the resolved input fingerprint, the station step and
+the RPL fingerprint. Renaming, reordering or re-actioning a rule re-uses its
+acquisition; editing one rule's condition re-acquires only that rule. A
+cancelled run keeps the rules it finished.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from qgis.core import (
+    QgsProject,
+    QgsSpatialIndex,
+    QgsTask,
+    QgsVectorLayerFeatureSource,
+)
+from qgis.PyQt.QtCore import pyqtSignal
+
+from ..burial import map_layers
+from ..burial.analysis_task import DepthSnapshot
+from ..kp_geo_utils import RouteFrame
+from . import rules_engine as eng
+from . import rules_inputs as ri
+from . import schema
+from .depth_service import DepthSourceConfig
+from .rules_engine import Interval, RuleHit
+
+
+def _task_flag(name: str, default: int = 0):
+    enum = getattr(QgsTask, "Flag", QgsTask)
+    return getattr(enum, name, default)
+
+
+_CAN_CANCEL = _task_flag("CanCancel")
+
+# Stations per vectorised depth read; also the cancel granularity there.
+_DEPTH_CHUNK = 2048
+
+# Config keys applied after acquisition; editing them must not re-acquire.
+_POST_ACQUISITION_KEYS = ("scope_ranges",)
+
+
+class RuleAcquisitionCache:
+    """Per-rule acquisitions (cache key -> intervals), least recently used
+    evicted past ``max_entries``. Main thread only."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max(1, int(max_entries))
+        self._entries: "OrderedDict[str, List[Interval]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[List[Interval]]:
+        intervals = self._entries.get(key)
+        if intervals is not None:
+            self._entries.move_to_end(key)
+        return intervals
+
+    def put(self, key: str, intervals: List[Interval]) -> None:
+        self._entries[key] = list(intervals)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def rule_cache_key(rule_row: Dict, config: Dict, input_fingerprint: str,
+                   step_m: float, rpl_fingerprint: str) -> str:
+    """Cache key for one rule's acquisition.
+
+    Only what changes the acquired intervals participates: the rule's kind
+    and condition config (not its name, order, action or methods, which the
+    engine applies at resolution time), its input data, the station step and
+    the route.
+    """
+    parts = {
+        "kind": rule_row.get("kind") or "",
+        "config": {k: v for k, v in config.items()
+                   if k not in _POST_ACQUISITION_KEYS},
+        "input_fingerprint": input_fingerprint or "",
+        "step_m": float(step_m),
+        "rpl_fingerprint": rpl_fingerprint or "",
+    }
+    text = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class RuleWork:
+    rule_row: Dict
+    config: Dict = field(default_factory=dict)
+    cache_key: str = ""
+    cached: Optional[List[Interval]] = None
+    # {source, crs, transform_context, feature_count[, fields, filter]}
+    layer_snapshot: Optional[Dict] = None
+    geom_type: object = None
+    error: str = ""
+
+
+@dataclass
+class AssessmentWork:
+    route: RouteFrame
+    distance: object
+    step_m: float
+    min_range_km: float
+    methods: List[str]
+    depth: Optional[DepthSnapshot]
+    # RPL points feature source: ApproxDepth fallback for threshold rules.
+    points_source: Optional[object] = None
+    rules: List[RuleWork] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+
+def build_assessment_work(store, rpl_id: str, rule_set_id: str,
+                          cache: RuleAcquisitionCache, *,
+                          sample_step_m: float = 50.0,
+                          min_range_km: float = 0.0,
+                          project: Optional[QgsProject] = None
+                          ) -> AssessmentWork:
+    """Snapshot everything the task needs (main thread).
+
+    Raises ``RuleInputError`` when the rule set or route cannot be resolved;
+    per-rule input problems become warnings on the work, as in
+    ``rules_inputs.run_assessment``.
+    """
+    project = project or QgsProject.instance()
+    rule_set = store.get_rule_set(rule_set_id)
+    if not rule_set:
+        raise ri.RuleInputError(f"Rule set {rule_set_id} not found.")
+    try:
+        methods = json.loads(rule_set.get("methods_json") or "[]")
+    except (ValueError, TypeError):
+        methods = list(schema.DEFAULT_ASSESSMENT_METHODS)
+    if not methods:
+        methods = list(schema.DEFAULT_ASSESSMENT_METHODS)
+
+    route, distance = ri.route_for_rpl(store, rpl_id, project)
+    rpl = store.get_rpl(rpl_id) or {}
+    rpl_fp = map_layers.rpl_fingerprint(rpl, getattr(store, "gpkg_path", ""))
+
+    depth_config = DepthSourceConfig(store.rpl_depth_config(rpl_id))
+    depth = DepthSnapshot(depth_config, project) \
+        if depth_config.is_configured() else None
+    work = AssessmentWork(route=route, distance=distance,
+                          step_m=float(sample_step_m),
+                          min_range_km=float(min_range_km),
+                          methods=list(methods), depth=depth)
+
+    depth_fp: List[Optional[str]] = [None]
+    for row in store.list_rules(rule_set_id):
+        rule_work = RuleWork(rule_row=dict(row))
+        try:
+            config = json.loads(row.get("config_json") or "{}")
+        except (ValueError, TypeError):
+            config = {}
+        rule_work.config = config if isinstance(config, dict) else {}
+        kind = row.get("kind") or ""
+        input_fp = ""
+        layer = None
+        if kind in (schema.RULE_KIND_PROXIMITY, schema.RULE_KIND_POLYGON,
+                    schema.RULE_KIND_KP_TABLE):
+            try:
+                layer = ri.resolve_layer(project, rule_work.config)
+            except ri.RuleInputError as exc:
+                rule_work.error = str(exc)
+            else:
+                input_fp = map_layers.layer_fingerprint(layer)
+        elif kind == schema.RULE_KIND_THRESHOLD:
+            if depth_fp[0] is None:
+                depth_fp[0] = map_layers.depth_config_fingerprint(
+                    project, depth_config)
+            input_fp = depth_fp[0]
+            if work.points_source is None:
+                points = store.open_layer(rpl.get("points_layer") or "")
+                if points is not None and points.isValid():
+                    work.points_source = QgsVectorLayerFeatureSource(points)
+
+        rule_work.cache_key = rule_cache_key(
+            row, rule_work.config, input_fp, sample_step_m, rpl_fp)
+        if not rule_work.error:
+            rule_work.cached = cache.get(rule_work.cache_key)
+        if rule_work.cached is None and layer is not None:
+            try:
+                snapshot = {
+                    "source": QgsVectorLayerFeatureSource(layer),
+                    "crs": layer.crs(),
+                    "feature_count": max(int(layer.featureCount()), 0),
+                    "transform_context": project.transformContext(),
+                }
+            except Exception as exc:
+                rule_work.error = f"feature layer could not be snapshotted ({exc})"
+            else:
+                if kind == schema.RULE_KIND_KP_TABLE:
+                    snapshot["fields"] = [f.name() for f in layer.fields()]
+                    snapshot["filter"] = rule_work.config.get(
+                        "filter_expression", "")
+                rule_work.layer_snapshot = snapshot
+                rule_work.geom_type = layer.geometryType()
+        work.rules.append(rule_work)
+    return work
+
+
+class AssessmentTask(QgsTask):
+    """Acquire every rule of an assessment and resolve the stack.
+
+    Emits ``progressMessage`` with the current step; on success ``result``
+    and ``sampler`` hold what ``rules_inputs.run_assessment`` returns, and
+    ``acquired`` the fresh per-rule acquisitions (cache key -> intervals) —
+    also populated for the rules a cancelled run completed. ``finished()``
+    invokes the completion callback on the main thread.
+    """
+
+    progressMessage = pyqtSignal(str)
+
+    def __init__(self, work: AssessmentWork,
+                 on_finished: Callable[["AssessmentTask"], None],
+                 description: str = "Workbench assessment"):
+        super().__init__(description, _CAN_CANCEL)
+        self.work = work
+        self.result: Optional[eng.AssessmentResult] = None
+        self.sampler: Optional[ri.RouteSampler] = None
+        self.acquired: Dict[str, List[Interval]] = {}
+        self.reused = 0
+        self.error: Optional[str] = None
+        self.cancelled = False
+        self._on_finished = on_finished
+        self._depth_series: Optional[List[Tuple[float, float]]] = None
+        self._depth_error = ""
+
+    # -- worker thread -------------------------------------------------------
+    def run(self) -> bool:
+        try:
+            work = self.work
+            self.progressMessage.emit("Building route stations…")
+            sampler = ri.RouteSampler.from_route(
+                work.route, work.distance, work.step_m)
+            self.sampler = sampler
+            self.setProgress(5.0)
+            hits: List[RuleHit] = []
+            warnings: List[str] = list(work.warnings)
+            count = max(len(work.rules), 1)
+            for i, rule_work in enumerate(work.rules):
+                if self.isCanceled():
+                    self.cancelled = True
+                    return False
+                rule = ri.rule_from_row(rule_work.rule_row)
+                intervals: List[Interval] = []
+                if rule_work.cached is not None:
+                    intervals = list(rule_work.cached)
+                    self.reused += 1
+                elif rule_work.error:
+                    warnings.append(f"Rule '{rule.name}': {rule_work.error} — skipped.")
+                else:
+                    self.progressMessage.emit(f"Evaluating rule: {rule.name}")
+                    try:
+                        intervals = self._acquire(sampler, rule_work)
+                    except ri.AcquisitionCancelled:
+                        self.cancelled = True
+                        return False
+                    except ri.RuleInputError as exc:
+                        warnings.append(f"Rule '{rule.name}': {exc} — skipped.")
+                    except Exception as exc:  # never let one rule crash the run
+                        warnings.append(
+                            f"Rule '{rule.name}': unexpected error ({exc}) — skipped.")
+                    else:
+                        self.acquired[rule_work.cache_key] = intervals
+                scope = ri.scope_intervals(rule_work.config)
+                if scope is not None:
+                    intervals = eng.intersect_intervals(intervals, scope)
+                hits.append(RuleHit(rule, intervals))
+                self.setProgress(5.0 + 90.0 * (i + 1) / count)
+
+            self.progressMessage.emit("Resolving the rule stack…")
+            result = eng.evaluate(sampler.domain, work.methods, hits,
+                                  min_range_km=work.min_range_km)
+            result.warnings = warnings
+            self.result = result
+            self.setProgress(100.0)
+            return True
+        except Exception as exc:  # pragma: no cover — task-level fail-safe
+            self.error = str(exc)
+            return False
+
+    def _acquire(self, sampler: ri.RouteSampler,
+                 rule_work: RuleWork) -> List[Interval]:
+        kind = rule_work.rule_row.get("kind") or ""
+        config = rule_work.config
+        cancel = self.isCanceled
+        if kind == schema.RULE_KIND_THRESHOLD:
+            return ri.threshold_intervals(
+                self._depth_profile(sampler), config, sampler.domain,
+                step_km=sampler.step_km)
+        if kind == schema.RULE_KIND_MANUAL:
+            return ri.acquire_manual(sampler, config)
+        snap = rule_work.layer_snapshot
+        if snap is None:
+            raise ri.RuleInputError("feature layer for the rule is missing from the project.")
+        if kind == schema.RULE_KIND_KP_TABLE:
+            expr, ctx = ri.filter_expression(snap.get("filter", ""))
+            names = snap.get("fields") or []
+            rows: List[Dict] = []
+            for i, feat in enumerate(snap["source"].getFeatures()):
+                if i % 500 == 0 and cancel():
+                    raise ri.AcquisitionCancelled()
+                if expr is not None:
+                    ctx.setFeature(feat)
+                    if not bool(expr.evaluate(ctx)):
+                        continue
+                rows.append({name: feat[name] for name in names})
+            return ri.kp_table_intervals(rows, config, sampler.domain)
+        index, feats = self._load_features(rule_work)
+        if kind == schema.RULE_KIND_PROXIMITY:
+            return ri.proximity_intervals(
+                sampler, index, feats, rule_work.geom_type, config, cancel=cancel)
+        if kind == schema.RULE_KIND_POLYGON:
+            return ri.polygon_class_intervals(
+                sampler, index, feats, config, cancel=cancel)
+        raise ri.RuleInputError(f"unknown kind '{kind}'")
+
+    def _load_features(self, rule_work: RuleWork
+                       ) -> Tuple[QgsSpatialIndex, Dict]:
+        snap = rule_work.layer_snapshot
+        name = rule_work.rule_row.get("name") or rule_work.rule_row.get("kind")
+        self.progressMessage.emit(f"Loading features: {name}")
+        return ri.load_features_wgs84_from_source(
+            snap["source"], snap["crs"], snap["transform_context"],
+            cancel=self.isCanceled, feature_count=snap.get("feature_count", 0))
+
+    def _depth_profile(self, sampler: ri.RouteSampler
+                       ) -> List[Tuple[float, float]]:
+        """Route depth series, sampled once per run and shared by every
+        threshold rule: the bathymetry snapshot, else the RPL's ApproxDepth."""
+        if self._depth_series is None and not self._depth_error:
+            series: List[Tuple[float, float]] = []
+            depth = self.work.depth
+            if depth is not None and depth.is_available():
+                self.progressMessage.emit("Sampling bathymetry…")
+                if not depth.prepare(cancel=self.isCanceled):
+                    raise ri.AcquisitionCancelled()
+                stations = [(kp, pt) for kp, pt in zip(sampler.stations_km, sampler.coords)
+                            if pt is not None]
+                for lo in range(0, len(stations), _DEPTH_CHUNK):
+                    if self.isCanceled():
+                        raise ri.AcquisitionCancelled()
+                    chunk = stations[lo:lo + _DEPTH_CHUNK]
+                    depths = depth.sample_many([(pt.y(), pt.x()) for _kp, pt in chunk])
+                    series.extend((kp, abs(float(d)))
+                                  for (kp, _pt), d in zip(chunk, depths) if d is not None)
+            if not series and self.work.points_source is not None:
+                series = ri.rpl_depth_series_from_features(
+                    self.work.points_source.getFeatures())
+            if series:
+                self._depth_series = series
+            else:
+                self._depth_error = ("no depth source configured and RPL has "
+                                     "no ApproxDepth values.")
+        if self._depth_series is None:
+            raise ri.RuleInputError(self._depth_error)
+        return self._depth_series
+
+    # -- main thread ---------------------------------------------------------
+    def finished(self, ok: bool) -> None:
+        if not ok and not self.cancelled and self.error is None:
+            self.error = "Assessment task failed."
+        try:
+            self._on_finished(self)
+        except Exception:  # never crash QGIS from a completion callback
+            import traceback
+
+            try:
+                from qgis.core import QgsMessageLog
+
+                from ..qgis_compat import MESSAGE_CRITICAL
+
+                QgsMessageLog.logMessage(
+                    "Workbench assessment: completion handler failed\n"
+                    f"{traceback.format_exc()}", "Workbench", MESSAGE_CRITICAL)
+            except Exception:  # pragma: no cover — logging must never raise
+                pass
@@ -95,22 +95,35 @@ class DepthService:
         )
 
     def sample_many(self, coords: Sequence[Tuple[float, float]]) -> List[Optional[float]]:
-        return [self.sample(lat, lon) for lat, lon in coords]
+        """Depths at many ``(lat, lon)`` pairs; rasters are read in one pass."""
+        if not coords or not self.is_available():
+            return [None] * len(coords)
+        return depth_sampling.sample_depth_many(
+            [QgsPointXY(lon, lat) for lat, lon in coords],
+            self.config.mode,
+            self._raster_samplers,
+            self._contour_samplers,
+            self.config.contour_search_radius_m,
+            self.project.transformContext(),
+            project=self.project,
+            band=self.config.raster_band,
+        )
 
     def sample_profile(self, route_frame, kp0_km: float, kp1_km: float, step_m: float = 25.0
                        ) -> List[Tuple[float, float]]:
         """(kp_km, depth_m) pairs along a RouteFrame between two KPs."""
-        out: List[Tuple[float, float]] = []
         if step_m <= 0:
             step_m = 25.0
         kp = min(kp0_km, kp1_km)
         end = max(kp0_km, kp1_km)
         step_km = step_m / 1000.0
+        kps: List[float] = []
+        coords: List[Tuple[float, float]] = []
         while kp <= end + 1e-9:
             point = route_frame.point_at_kp(min(kp, end), clamp=True)
             if point is not None:
-                depth = self.sample(point.y(), point.x())
-                if depth is not None:
-                    out.append((min(kp, end), float(depth)))
+                kps.append(min(kp, end))
+                coords.append((point.y(), point.x()))
             kp += step_km
-        return out
+        depths = self.sample_many(coords)
+        return [(k, float(d)) for k, d in zip(kps, depths) if d is not None]
@@ -27,6 +27,7 @@ from qgis.core import (
     QgsGeometry,
     QgsPointXY,
     QgsProject,
+    QgsRectangle,
     QgsSpatialIndex,
     QgsVectorLayer,
 )
@@ -35,6 +36,7 @@ from qgis.PyQt.QtGui import QTransform
 from ..kp_geo_utils import RouteFrame
 from ..kp_range_utils import make_distance_area
 from ..qgis_compat import (
+    GEOMETRY_LINE,
     GEOMETRY_POINT,
     GEOMETRY_POLYGON,
     WKB_POINT,
@@ -106,38 +108,7 @@ class RouteSampler:
     def for_rpl(cls, store, rpl_id: str, project: Optional[QgsProject] = None,
                 sample_step_m: float = 50.0,
                 scope: Optional[Interval] = None) -> "RouteSampler":
-        project = project or QgsProject.instance()
-        rpl = store.get_rpl(rpl_id)
-        if not rpl:
-            raise RuleInputError(f"RPL {rpl_id} not found in the workbench store.")
-        lines_layer = store.open_layer(rpl.get("lines_layer") or "")
-        if lines_layer is None or not lines_layer.isValid():
-            raise RuleInputError("RPL route (lines) layer could not be opened.")
-
-        ordered = []
-        for feat in lines_layer.getFeatures():
-            geom = feat.geometry()
-            if geom is None or geom.isEmpty():
-                continue
-            try:
-                seq = int(feat["SeqNo"])
-            except (KeyError, TypeError, ValueError):
-                seq = len(ordered)
-            ordered.append((seq, QgsGeometry(geom)))
-        ordered.sort(key=lambda t: t[0])
-        geoms = [g for _, g in ordered]
-        if not geoms:
-            raise RuleInputError("RPL route has no usable line geometry.")
-        from ..kp_geo_utils import crosses_antimeridian
-
-        if crosses_antimeridian(geoms):
-            raise RuleInputError(
-                "the route crosses the ±180° antimeridian, which the "
-                "assessment geometry does not support — positions and "
-                "intersections would be silently wrong")
-
-        distance = make_distance_area(WGS84, project.transformContext())
-        route = RouteFrame.from_source(geoms, distance)
+        route, distance = route_for_rpl(store, rpl_id, project)
         return cls.from_route(route, distance, sample_step_m, scope)
 
     @classmethod
@@ -154,6 +125,44 @@ class RouteSampler:
                    step_km=max(float(sample_step_m), 1.0) / 1000.0)
 
 
+def route_for_rpl(store, rpl_id: str, project: Optional[QgsProject] = None
+                  ) -> Tuple[RouteFrame, object]:
+    """The RPL's ordered route lines as a WGS84 ``RouteFrame`` plus the
+    ``QgsDistanceArea`` it measures with. Main thread only (opens layers)."""
+    project = project or QgsProject.instance()
+    rpl = store.get_rpl(rpl_id)
+    if not rpl:
+        raise RuleInputError(f"RPL {rpl_id} not found in the workbench store.")
+    lines_layer = store.open_layer(rpl.get("lines_layer") or "")
+    if lines_layer is None or not lines_layer.isValid():
+        raise RuleInputError("RPL route (lines) layer could not be opened.")
+
+    ordered = []
+    for feat in lines_layer.getFeatures():
+        geom = feat.geometry()
+        if geom is None or geom.isEmpty():
+            continue
+        try:
+            seq = int(feat["SeqNo"])
+        except (KeyError, TypeError, ValueError):
+            seq = len(ordered)
+        ordered.append((seq, QgsGeometry(geom)))
+    ordered.sort(key=lambda t: t[0])
+    geoms = [g for _, g in ordered]
+    if not geoms:
+        raise RuleInputError("RPL route has no usable line geometry.")
+    from ..kp_geo_utils import crosses_antimeridian
+
+    if crosses_antimeridian(geoms):
+        raise RuleInputError(
+            "the route crosses the ±180° antimeridian, which the "
+            "assessment geometry does not support — positions and "
+            "intersections would be silently wrong")
+
+    distance = make_distance_area(WGS84, project.transformContext())
+    return RouteFrame.from_source(geoms, distance), distance
+
+
 def _build_stations(route: RouteFrame, sample_step_m: float,
                     scope: Optional[Interval] = None) -> List[float]:
     total_km = route.total_length_km
@@ -282,9 +291,6 @@ def _search_rect(point: QgsPointXY, radius_m: float):
     features lying near the buffer edge. Conservative (slightly oversized)
     by construction; the caller's distance test decides.
     """
-    import math
-
-    from qgis.core import QgsRectangle
     radius = max(radius_m, 1.0)
     deg_lat = radius / 110540.0 + 1e-6
     cos_lat = max(math.cos(math.radians(point.y())), 0.087)
@@ -359,10 +365,10 @@ def _depth_series(sampler: RouteSampler, store, rpl_id: str, project: QgsProject
     service = DepthService(config, project)
     series: List[Tuple[float, float]] = []
     if service.is_available():
-        for kp, pt in zip(sampler.stations_km, sampler.coords):
-            if pt is None:
-                continue
-            depth = service.sample(pt.y(), pt.x())
+        stations = [(kp, pt) for kp, pt in zip(sampler.stations_km, sampler.coords)
+                    if pt is not None]
+        depths = service.sample_many([(pt.y(), pt.x()) for _kp, pt in stations])
+        for (kp, _pt), depth in zip(stations, depths):
             if depth is not None:
                 series.append((kp, abs(float(depth))))
     if not series:
@@ -379,8 +385,14 @@ def _rpl_depth_series(store, rpl_id: str) -> List[Tuple[float, float]]:
     points = store.open_layer(rpl.get("points_layer") or "")
     if points is None or not points.isValid():
         return []
+    return rpl_depth_series_from_features(points.getFeatures())
+
+
+def rpl_depth_series_from_features(features) -> List[Tuple[float, float]]:
+    """(kp, depth-magnitude) from RPL point features' DistCumulative /
+    ApproxDepth (thread-safe over a feature-source snapshot)."""
     out: List[Tuple[float, float]] = []
-    for feat in points.getFeatures():
+    for feat in features:
         try:
             kp = float(feat["DistCumulative"])
             depth = feat["ApproxDepth"]
@@ -546,11 +558,18 @@ def _feature_buffer_m(feat, buffer_field: str, default_m: float) -> float:
 def proximity_intervals(sampler: RouteSampler, index: QgsSpatialIndex,
                         feats: Dict[int, Tuple[QgsGeometry, QgsFeature]],
                         geom_type, config: Dict,
-                        cancel: Optional[Callable[[], bool]] = None) -> List[Interval]:
+                        cancel: Optional[Callable[[], bool]] = None,
+                        method: str = "buffer") -> List[Interval]:
     """Proximity intervals over pre-loaded WGS84 features (thread-safe:
     touches only the supplied snapshot, never the project or live layers).
-    ``cancel`` is checked every ~2000 stations and raises
-    ``AcquisitionCancelled`` when it returns True."""
+    ``cancel`` is checked every ~2000 stations (every feature for the
+    buffer method) and raises ``AcquisitionCancelled`` when it returns True.
+
+    Line / polygon features use ``method``: "buffer" intersects each
+    feature's distance buffer with the route and converts the pieces
+    straight to KP ranges (exact, independent of station spacing);
+    "stations" is the per-station distance test it replaced, kept as the
+    equivalence reference."""
     distance_m = float(config.get("distance_m", 0.0))
     mode = config.get("mode", "distance")
     buffer_m = distance_m if mode == "distance" else 0.0
@@ -593,7 +612,49 @@ def proximity_intervals(sampler: RouteSampler, index: QgsSpatialIndex,
         for _geom, feat in feats.values():
             max_buffer_m = max(max_buffer_m, _feature_buffer_m(feat, buffer_field, buffer_m))
 
-    # Line / polygon: per-station distance test (captures within-buffer proximity)
+    if method == "buffer":
+        intervals = _buffer_proximity_intervals(
+            sampler, index, feats, geom_type, passes_filter,
+            lambda feat: _feature_buffer_m(feat, buffer_field, buffer_m),
+            max_buffer_m, cancel)
+    else:
+        intervals = _station_proximity_intervals(
+            sampler, index, feats, geom_type, passes_filter,
+            lambda feat: _feature_buffer_m(feat, buffer_field, buffer_m),
+            max_buffer_m, cancel)
+
+    # Exact crossings (thin features a coarse buffer might miss between stations).
+    route_geoms = sampler.route.geometries
+    route_boxes = [g.boundingBox() for g in route_geoms]
+    for geom, feat in feats.values():
+        if not passes_filter(feat):
+            continue
+        eps_km = max(_feature_buffer_m(feat, buffer_field, buffer_m), 1.0) / 1000.0
+        feat_box = geom.boundingBox()
+        for route_geom, route_box in zip(route_geoms, route_boxes):
+            if not route_box.intersects(feat_box):
+                continue
+            inter = route_geom.intersection(geom)
+            if inter is None or inter.isEmpty():
+                continue
+            for pt in _iter_points(inter):
+                hit = sampler.route.kp_at_point(QgsPointXY(pt))
+                if hit.snapped_xy is not None:
+                    intervals.append(Interval(hit.kp_km - eps_km, hit.kp_km + eps_km))
+    return eng.clip_intervals(intervals, sampler.domain)
+
+
+def _station_proximity_intervals(sampler: RouteSampler, index: QgsSpatialIndex,
+                                 feats: Dict[int, Tuple[QgsGeometry, QgsFeature]],
+                                 geom_type, passes_filter, feature_buffer_m,
+                                 max_buffer_m: float,
+                                 cancel: Optional[Callable[[], bool]],
+                                 fids: Optional[set] = None) -> List[Interval]:
+    """Line / polygon proximity by a per-station distance test (reference).
+
+    ``fids`` restricts the test to those features (the buffer method's
+    fallback for features it could not intersect).
+    """
     series: List[Tuple[float, bool]] = []
     scaled_cache: Dict = {}
     for station_index, (kp, pt) in enumerate(zip(sampler.stations_km, sampler.coords)):
@@ -604,10 +665,12 @@ def proximity_intervals(sampler: RouteSampler, index: QgsSpatialIndex,
             continue
         flag = False
         for fid in index.intersects(_search_rect(pt, max(max_buffer_m, 1.0))):
+            if fids is not None and fid not in fids:
+                continue
             geom, feat = feats[fid]
             if not passes_filter(feat):
                 continue
-            fb = _feature_buffer_m(feat, buffer_field, buffer_m)
+            fb = feature_buffer_m(feat)
             if (geom_type == GEOMETRY_POLYGON and
                     geom.contains(QgsGeometry.fromPointXY(pt))):
                 flag = True
@@ -617,27 +680,145 @@ def proximity_intervals(sampler: RouteSampler, index: QgsSpatialIndex,
                 flag = True
                 break
         series.append((kp, flag))
-    intervals = eng.intervals_from_bool_series(series, sampler.domain)
+    return eng.intervals_from_bool_series(series, sampler.domain)
 
-    # Exact crossings (thin features a coarse buffer might miss between stations).
+
+_BAND_DEG = 0.25       # latitude band per local metric frame (< ~0.5 % scale drift)
+_BUFFER_SEGMENTS = 16  # buffer arc segments per quarter circle (chord sag ~0.1 %)
+
+
+def _grow_rect_m(rect, margin_m: float):
+    """``rect`` (WGS84) grown by at least ``margin_m`` on every side."""
+    margin = max(margin_m, 1.0) * 1.05
+    lat = max(abs(rect.yMinimum()), abs(rect.yMaximum()))
+    lat = min(lat + margin / 110540.0, 85.0)
+    deg_lat = margin / 110540.0 + 1e-6
+    deg_lon = margin / (111320.0 * max(math.cos(math.radians(lat)), 0.087)) + 1e-6
+    return QgsRectangle(rect.xMinimum() - deg_lon, rect.yMinimum() - deg_lat,
+                        rect.xMaximum() + deg_lon, rect.yMaximum() + deg_lat)
+
+
+def _local_frame(distance, lon0: float, lat0: float) -> Tuple[float, float]:
+    """Metres per degree east / north at (lon0, lat0), on the run's ellipsoid."""
+    origin = QgsPointXY(lon0, lat0)
+    step = 0.01
+    try:
+        kx = float(distance.measureLine(origin, QgsPointXY(lon0 + step, lat0))) / step
+        ky = float(distance.measureLine(origin, QgsPointXY(lon0, lat0 + step))) / step
+    except Exception:
+        kx = ky = 0.0
+    if not (kx > 0.0 and ky > 0.0 and math.isfinite(kx) and math.isfinite(ky)):
+        kx = 111320.0 * max(math.cos(math.radians(lat0)), 1e-6)
+        ky = 110540.0
+    return kx, ky
+
+
+def _buffer_route_kps(sampler: RouteSampler, geom: QgsGeometry, fb: float,
+                      route_geom: QgsGeometry, window) -> List[Interval]:
+    """KP ranges where ``route_geom`` lies within ``fb`` metres of ``geom``.
+
+    Works in latitude bands over ``window`` (the feature's buffered box ∩
+    the route's box). Each band gets a local equirectangular metre frame
+    measured on the run's ellipsoid; the feature, clipped to the band grown
+    by the buffer, is buffered in that frame and prepared once, then the
+    band's route piece is intersected with it. Each resulting line piece is
+    a contiguous stretch of route, so its end points map straight to a KP
+    range.
+    """
+    out: List[Interval] = []
+    y_lo, y_hi = window.yMinimum(), window.yMaximum()
+    n_bands = max(1, int(math.ceil((y_hi - y_lo) / _BAND_DEG)))
+    band_h = (y_hi - y_lo) / n_bands
+    for b in range(n_bands):
+        band = QgsRectangle(window.xMinimum(), y_lo + b * band_h,
+                            window.xMaximum(), y_lo + (b + 1) * band_h)
+        piece = route_geom.clipped(band)
+        if piece is None or piece.isEmpty():
+            continue
+        near = geom.clipped(_grow_rect_m(band, fb))
+        if near is None or near.isEmpty():
+            continue
+        lon0, lat0 = band.center().x(), band.center().y()
+        kx, ky = _local_frame(sampler.distance, lon0, lat0)
+        to_local = QTransform(kx, 0.0, 0.0, ky, -kx * lon0, -ky * lat0)
+        near = QgsGeometry(near)
+        near.transform(to_local)
+        zone = near.buffer(fb, _BUFFER_SEGMENTS) if fb > 0 else near
+        if zone is None or zone.isEmpty() or zone.type() != GEOMETRY_POLYGON:
+            continue   # zero-width line buffer: the crossings pass covers it
+        engine = QgsGeometry.createGeometryEngine(zone.constGet())
+        engine.prepareGeometry()
+        piece = QgsGeometry(piece)
+        piece.transform(to_local)
+        if not engine.intersects(piece.constGet()):
+            continue
+        inside = engine.intersection(piece.constGet())
+        if inside is None:
+            continue
+        for part in QgsGeometry(inside).asGeometryCollection():
+            if part.type() != GEOMETRY_LINE:
+                continue
+            line = part.asPolyline()
+            if len(line) < 2:
+                continue
+            kps = []
+            for p in (line[0], line[-1]):
+                hit = sampler.route.kp_at_point(
+                    QgsPointXY(lon0 + p.x() / kx, lat0 + p.y() / ky))
+                if hit.snapped_xy is not None:
+                    kps.append(float(hit.kp_km))
+            if kps:
+                out.append(Interval(min(kps), max(kps)))
+    return out
+
+
+def _buffer_proximity_intervals(sampler: RouteSampler, index: QgsSpatialIndex,
+                                feats: Dict[int, Tuple[QgsGeometry, QgsFeature]],
+                                geom_type, passes_filter, feature_buffer_m,
+                                max_buffer_m: float,
+                                cancel: Optional[Callable[[], bool]]) -> List[Interval]:
+    """Line / polygon proximity by buffer ∩ route, mapped to KP ranges.
+
+    Polygon buffers include the interior, so the route inside a polygon
+    counts as within range without a separate containment test. The result
+    is limited to the sampler's station span, like the station method.
+    Features whose buffer intersection fails fall back to the station test.
+    """
     route_geoms = sampler.route.geometries
     route_boxes = [g.boundingBox() for g in route_geoms]
-    for geom, feat in feats.values():
+    candidates = set()
+    for route_box in route_boxes:
+        candidates.update(index.intersects(_grow_rect_m(route_box, max_buffer_m)))
+    intervals: List[Interval] = []
+    fallback = set()
+    for fid in sorted(candidates):
+        if cancel is not None and cancel():
+            raise AcquisitionCancelled()
+        geom, feat = feats[fid]
         if not passes_filter(feat):
             continue
-        eps_km = max(_feature_buffer_m(feat, buffer_field, buffer_m), 1.0) / 1000.0
-        feat_box = geom.boundingBox()
+        fb = max(feature_buffer_m(feat), 0.0)
+        grown = _grow_rect_m(geom.boundingBox(), fb)
         for route_geom, route_box in zip(route_geoms, route_boxes):
-            if not route_box.intersects(feat_box):
+            if not route_box.intersects(grown):
                 continue
-            inter = route_geom.intersection(geom)
-            if inter is None or inter.isEmpty():
-                continue
-            for pt in _iter_points(inter):
-                hit = sampler.route.kp_at_point(QgsPointXY(pt))
-                if hit.snapped_xy is not None:
-                    intervals.append(Interval(hit.kp_km - eps_km, hit.kp_km + eps_km))
-    return eng.clip_intervals(intervals, sampler.domain)
+            try:
+                pieces = _buffer_route_kps(
+                    sampler, geom, fb, route_geom, grown.intersect(route_box))
+            except Exception:
+                # GEOS can reject a degenerate feature; answer for it with
+                # the station test instead of dropping it from the result.
+                fallback.add(fid)
+                break
+            intervals.extend(pieces)
+    if fallback:
+        intervals.extend(_station_proximity_intervals(
+            sampler, index, feats, geom_type, passes_filter, feature_buffer_m,
+            max_buffer_m, cancel, fids=fallback))
+    if not sampler.stations_km:
+        return []
+    span = Interval(sampler.stations_km[0], sampler.stations_km[-1])
+    return eng.clip_intervals(intervals, span)
 
 
 def _acquire_proximity(sampler, config, project) -> List[Interval]:
@@ -948,3 +1129,4 @@ filter_expression = _filter_expression
 feature_buffer_m = _feature_buffer_m
 acquire_manual = _acquire_manual
 scope_intervals = _scope_intervals
+rule_from_row = _rule_from_row
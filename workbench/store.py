@@ -2,10 +2,12 @@
 """WorkbenchStore — GeoPackage persistence for the Cable Route Workbench.
 
 Wraps a single per-project GeoPackage holding the registry tables declared in
-schema.py plus the per-RPL spatial layers. Registry tables are small and are
-never loaded into the QGIS project, so they are read/written whole (the
-spatial RPL layers, which ARE loaded, are only ever edited through QGIS edit
-buffers — see rpl_layer_io.py).
+schema.py plus the per-RPL spatial layers. Registry tables are never loaded
+into the QGIS project; row edits go through targeted SQL transactions
+(``burial/gpkg_sql.py``) with the whole-table writer kept for table creation,
+migrations and files that refuse direct SQL (the spatial RPL layers, which
+ARE loaded, are only ever edited through QGIS edit buffers — see
+rpl_layer_io.py).
 
 Also enforces the CRA-core topology invariants on wb_component/wb_port/
 wb_connection (see validate_topology).
@@ -17,6 +19,8 @@ import json
 import os
 import re
 import shutil
+import sqlite3
+from contextlib import contextmanager
 from typing import Dict, List, Optional, Sequence, Tuple
 
 from qgis.core import (
@@ -37,6 +41,7 @@ from ..qgis_compat import (
     FIELD_TYPE_LONG_LONG,
     WKB_NO_GEOMETRY,
 )
+from ..burial import gpkg_sql
 from . import schema
 
 PROJECT_SCOPE = "SubseaCableTools"
@@ -75,21 +80,82 @@ class WorkbenchStore:
         # Keep a per-store read-through cache; every mutator below refreshes it.
         self._table_cache: Dict[str, List[Dict]] = {}
         self._table_exists_cache: Dict[str, bool] = {}
+        # None = not probed yet; False = this file refused the direct-SQL
+        # fast path, use the legacy whole-table writer for everything.
+        self._sql_mode: Optional[bool] = None
 
     def clear_cache(self) -> None:
         """Forget registry reads, e.g. after an external Processing run."""
         self._table_cache.clear()
         self._table_exists_cache.clear()
 
+    # -- direct-SQL fast path -------------------------------------------------
+    def _sql(self) -> Optional[sqlite3.Connection]:
+        """The cached sqlite connection, or None when in legacy mode.
+
+        Same contract as ``BurialStore._sql``: probed once per store, reset
+        by ``ensure_created``/``migrate`` after they rewrite tables.
+        """
+        if self._sql_mode is False:
+            return None
+        if not os.path.exists(self.gpkg_path):
+            return None
+        try:
+            conn = gpkg_sql.connect(self.gpkg_path)
+            if self._sql_mode is None:
+                if not gpkg_sql.table_exists(conn, schema.TABLE_META):
+                    return None  # registry not created yet; re-probe later
+                self._sql_mode = True
+            return conn
+        except sqlite3.Error:
+            self._log_sql_fallback("open")
+            self._sql_mode = False
+            return None
+
+    def _log_sql_fallback(self, action: str) -> None:
+        try:
+            from qgis.core import QgsMessageLog
+
+            from ..qgis_compat import MESSAGE_INFO
+
+            QgsMessageLog.logMessage(
+                f"Direct-SQL access failed ({action}); using the legacy "
+                f"writer for {os.path.basename(self.gpkg_path)}.",
+                "Cable Route Workbench", MESSAGE_INFO)
+        except Exception:
+            pass
+
+    @contextmanager
+    def transaction(self):
+        """Group several writes into one atomic commit (SQL mode only)."""
+        conn = self._sql()
+        if conn is None:
+            yield
+            return
+        try:
+            with gpkg_sql.transaction(conn):
+                yield
+        except Exception:
+            self._table_cache.clear()  # rolled back: cached rows are ahead
+            raise
+
+    def close(self) -> None:
+        """Checkpoint and release the cached SQL connection (if any)."""
+        gpkg_sql.close(self.gpkg_path)
+
     # -- lifecycle ----------------------------------------------------------
     def exists(self) -> bool:
         return os.path.exists(self.gpkg_path) and self._table_exists(schema.TABLE_META)
 
     def ensure_created(self) -> None:
         """Create any missing registry tables (idempotent)."""
+        created = False
         for table, specs in schema.REGISTRY_TABLES.items():
             if not self._table_exists(table):
                 self._write_table_rows(table, specs, [])
+                created = True
+        if created and self._sql_mode is not False:
+            self._sql_mode = None  # tables changed under us — re-probe
         meta = self.read_meta()
         if "schema_version" not in meta:
             self.write_meta("schema_version", str(schema.SCHEMA_VERSION))
@@ -114,13 +180,19 @@ class WorkbenchStore:
                 migrator(self)
             current += 1
             self.write_meta("schema_version", str(current))
+        if self._sql_mode is not False:
+            self._sql_mode = None  # migrations rewrite tables — re-probe
 
     def backup_before(self, label: str) -> Optional[str]:
         """Copy the gpkg aside before a structural change. Returns the copy path."""
         if not os.path.exists(self.gpkg_path):
             return None
+        # Fold the WAL first so the copy is complete without its sidecars.
+        complete = gpkg_sql.checkpoint(self.gpkg_path, truncate=True)
         stem, ext = os.path.splitext(self.gpkg_path)
         target = f"{stem}.{schema.sanitize_slug(label)}.bak{ext}"
+        if not complete and gpkg_sql.backup_to(self.gpkg_path, target):
+            return target
         try:
             shutil.copy2(self.gpkg_path, target)
             return target
@@ -133,25 +205,40 @@ class WorkbenchStore:
             return self._table_exists_cache[table]
         if not os.path.exists(self.gpkg_path):
             return False
-        exists = open_gpkg_layer(self.gpkg_path, table) is not None
+        exists = None
+        conn = self._sql()
+        if conn is not None:
+            try:
+                exists = gpkg_sql.table_exists(conn, table)
+            except sqlite3.Error:
+                exists = None
+        if exists is None:
+            exists = open_gpkg_layer(self.gpkg_path, table) is not None
         self._table_exists_cache[table] = exists
         return exists
 
     def read_table(self, table: str) -> List[Dict]:
         if table in self._table_cache:
             return [dict(row) for row in self._table_cache[table]]
-        layer = open_gpkg_layer(self.gpkg_path, table)
-        if layer is None:
-            return []
-        names = [f.name() for f in layer.fields() if f.name().lower() != "fid"]
-        rows: List[Dict] = []
-        for feature in layer.getFeatures():
-            rows.append(_normalise_row({name: feature[name] for name in names}))
+        conn = self._sql()
+        if conn is not None:
+            if not gpkg_sql.table_exists(conn, table):
+                return []
+            rows = [_normalise_row(row) for row in gpkg_sql.read_rows(conn, table)]
+        else:
+            layer = open_gpkg_layer(self.gpkg_path, table)
+            if layer is None:
+                return []
+            names = [f.name() for f in layer.fields() if f.name().lower() != "fid"]
+            rows = [_normalise_row({name: feature[name] for name in names})
+                    for feature in layer.getFeatures()]
         self._table_cache[table] = [dict(row) for row in rows]
         self._table_exists_cache[table] = True
         return [dict(row) for row in rows]
 
     def write_table(self, table: str, rows: Sequence[Dict]) -> None:
+        """Rewrite a whole table (and its declared schema) — migrations and
+        bulk replacements only; row edits use the targeted helpers below."""
         specs = schema.REGISTRY_TABLES[table]
         self._write_table_rows(table, specs, list(rows))
 
@@ -168,11 +255,25 @@ class WorkbenchStore:
         self._table_cache[table] = [dict(row) for row in rows]
         self._table_exists_cache[table] = True
 
+    def _cache_replace(self, table: str, keep, rows: Sequence[Dict]) -> None:
+        """Mirror a targeted SQL write into the read cache (if populated)."""
+        cached = self._table_cache.get(table)
+        if cached is None:
+            return
+        self._table_cache[table] = [r for r in cached if keep(r)] \
+            + [dict(r) for r in rows]
+
     def upsert_rows(self, table: str, rows: Sequence[Dict]) -> None:
         """Insert or replace rows by the table's primary key."""
         key = schema.TABLE_KEYS[table]
-        existing = self.read_table(table)
+        rows = list(rows)
         incoming = {str(r[key]): r for r in rows}
+        conn = self._sql()
+        if conn is not None:
+            gpkg_sql.upsert_rows(conn, table, key, rows)
+            self._cache_replace(table, lambda r: str(r.get(key)) not in incoming, rows)
+            return
+        existing = self.read_table(table)
         merged = [r for r in existing if str(r.get(key)) not in incoming]
         merged.extend(rows)
         self.write_table(table, merged)
@@ -180,16 +281,41 @@ class WorkbenchStore:
     def delete_rows(self, table: str, keys: Sequence[str]) -> None:
         key_field = schema.TABLE_KEYS[table]
         drop = {str(k) for k in keys}
+        conn = self._sql()
+        if conn is not None:
+            gpkg_sql.delete_keys(conn, table, key_field, list(drop))
+            self._cache_replace(table, lambda r: str(r.get(key_field)) not in drop, [])
+            return
         remaining = [r for r in self.read_table(table) if str(r.get(key_field)) not in drop]
         self.write_table(table, remaining)
 
+    def _replace_child_rows(self, table: str, parent_field: str, parent_id: str,
+                            rows: Sequence[Dict]) -> None:
+        """Replace every row of ``table`` whose ``parent_field`` is ``parent_id``."""
+        rows = list(rows)
+        conn = self._sql()
+        if conn is not None:
+            gpkg_sql.replace_where(conn, table,
+                                   gpkg_sql.quote_ident(parent_field) + " = ?",
+                                   (parent_id,), rows)
+            self._cache_replace(table, lambda r: r.get(parent_field) != parent_id, rows)
+            return
+        others = [r for r in self.read_table(table) if r.get(parent_field) != parent_id]
+        self.write_table(table, others + rows)
+
     # -- meta -----------------------------------------------------------------
     def read_meta(self) -> Dict[str, str]:
         return {r["key"]: r["value"] for r in self.read_table(schema.TABLE_META) if r.get("key")}
 
     def write_meta(self, key: str, value: str) -> None:
+        row = {"key": key, "value": value}
+        conn = self._sql()
+        if conn is not None:
+            gpkg_sql.upsert_rows(conn, schema.TABLE_META, "key", [row])
+            self._cache_replace(schema.TABLE_META, lambda r: r.get("key") != key, [row])
+            return
         rows = [r for r in self.read_table(schema.TABLE_META) if r.get("key") != key]
-        rows.append({"key": key, "value": value})
+        rows.append(row)
         self._write_table_rows(schema.TABLE_META, schema.META_FIELDS, rows)
 
     # -- routes ---------------------------------------------------------------
@@ -310,10 +436,6 @@ class WorkbenchStore:
         header.setdefault("supersedes_id", "")
         header.setdefault("issued_utc", "")
         header["modified_utc"] = schema.utc_now_iso()
-        self.upsert_rows(schema.TABLE_ASSEMBLY, [header])
-        others = [
-            r for r in self.read_table(schema.TABLE_ASSEMBLY_ITEM) if r.get("assembly_id") != assembly_id
-        ]
         normalised = []
         for seq, item in enumerate(items):
             item = dict(item)
@@ -321,7 +443,10 @@ class WorkbenchStore:
             item["seq"] = seq
             item.setdefault("item_id", schema.new_id())
             normalised.append(item)
-        self.write_table(schema.TABLE_ASSEMBLY_ITEM, others + normalised)
+        with self.transaction():
+            self.upsert_rows(schema.TABLE_ASSEMBLY, [header])
+            self._replace_child_rows(schema.TABLE_ASSEMBLY_ITEM, "assembly_id",
+                                     assembly_id, normalised)
 
     def delete_assembly(self, assembly_id: str) -> None:
         placements = [
@@ -332,10 +457,8 @@ class WorkbenchStore:
             raise ValueError(
                 "Cannot delete an assembly while it is used in a cable-segment make-up.")
         self.delete_rows(schema.TABLE_ASSEMBLY, [assembly_id])
-        remaining = [
-            r for r in self.read_table(schema.TABLE_ASSEMBLY_ITEM) if r.get("assembly_id") != assembly_id
-        ]
-        self.write_table(schema.TABLE_ASSEMBLY_ITEM, remaining)
+        self._replace_child_rows(schema.TABLE_ASSEMBLY_ITEM, "assembly_id",
+                                 assembly_id, [])
         # cascade: fits and topology component referencing this assembly
         fit_ids = [r["fit_id"] for r in self.read_table(schema.TABLE_FIT) if r.get("assembly_id") == assembly_id]
         if fit_ids:
@@ -398,10 +521,7 @@ class WorkbenchStore:
         if not route_id or self.get_route(route_id) is None:
             route_id = self.create_route(old.get("name") or "Route")
             old["route_id"] = route_id
-            self.write_table(schema.TABLE_RPL, [
-                old if r.get("rpl_id") == rpl_id else r
-                for r in self.read_table(schema.TABLE_RPL)
-            ])
+            self.upsert_rows(schema.TABLE_RPL, [old])
         route = self.get_route(route_id) or {"name": old.get("name") or "Route"}
         if not rev_label:
             rev_label = schema.next_rev_label(self.revisions_of_route(route_id))
@@ -519,20 +639,15 @@ class WorkbenchStore:
 
     def _set_status(self, table: str, row_id: str, status: str) -> None:
         key = schema.TABLE_KEYS[table]
-        rows = self.read_table(table)
-        now = schema.utc_now_iso()
-        changed = False
-        for row in rows:
-            if row.get(key) == row_id:
-                row["status"] = status
-                row["issued_utc"] = now if status == schema.STATUS_ISSUED else ""
-                if "modified_utc" in row:
-                    row["modified_utc"] = now
-                changed = True
-                break
-        if not changed:
+        row = next((r for r in self.read_table(table) if r.get(key) == row_id), None)
+        if row is None:
             raise ValueError("Entity not found.")
-        self.write_table(table, rows)
+        now = schema.utc_now_iso()
+        row["status"] = status
+        row["issued_utc"] = now if status == schema.STATUS_ISSUED else ""
+        if "modified_utc" in row:
+            row["modified_utc"] = now
+        self.upsert_rows(table, [row])
 
     # -- fits ---------------------------------------------------------------------
     def list_fits(self, rpl_id: Optional[str] = None, assembly_id: Optional[str] = None) -> List[Dict]:
@@ -595,12 +710,7 @@ class WorkbenchStore:
         merged.setdefault("created_utc", schema.utc_now_iso())
         merged.setdefault("notes", "")
         merged["modified_utc"] = schema.utc_now_iso()
-        self.upsert_rows(schema.TABLE_MAKEUP, [merged])
 
-        others = [
-            row for row in self.read_table(schema.TABLE_MAKEUP_ITEM)
-            if row.get("makeup_id") != makeup_id
-        ]
         normalised = []
         for seq, source in enumerate(items):
             row = dict(source)
@@ -616,7 +726,10 @@ class WorkbenchStore:
             row.setdefault("params_json", "{}")
             row.setdefault("notes", "")
             normalised.append(row)
-        self.write_table(schema.TABLE_MAKEUP_ITEM, others + normalised)
+        with self.transaction():
+            self.upsert_rows(schema.TABLE_MAKEUP, [merged])
+            self._replace_child_rows(schema.TABLE_MAKEUP_ITEM, "makeup_id",
+                                     makeup_id, normalised)
         return makeup_id
 
     def ensure_makeup(self, route_id: str) -> Tuple[Dict, List[Dict]]:
@@ -709,11 +822,8 @@ class WorkbenchStore:
 
     def delete_makeup(self, makeup_id: str) -> None:
         self.delete_rows(schema.TABLE_MAKEUP, [makeup_id])
-        remaining = [
-            row for row in self.read_table(schema.TABLE_MAKEUP_ITEM)
-            if row.get("makeup_id") != makeup_id
-        ]
-        self.write_table(schema.TABLE_MAKEUP_ITEM, remaining)
+        self._replace_child_rows(schema.TABLE_MAKEUP_ITEM, "makeup_id",
+                                 makeup_id, [])
 
     # -- event rules ------------------------------------------------------------
     def list_event_rules(self) -> List[Dict]:
@@ -769,8 +879,6 @@ class WorkbenchStore:
         rule_set_id = header["rule_set_id"]
         header.setdefault("created_utc", schema.utc_now_iso())
         header["modified_utc"] = schema.utc_now_iso()
-        self.upsert_rows(schema.TABLE_RULE_SET, [header])
-        others = [r for r in self.read_table(schema.TABLE_RULE) if r.get("rule_set_id") != rule_set_id]
         normalised = []
         for seq, rule in enumerate(rules):
             rule = dict(rule)
@@ -778,13 +886,15 @@ class WorkbenchStore:
             rule["seq"] = seq
             rule.setdefault("rule_id", schema.new_id())
             normalised.append(rule)
-        self.write_table(schema.TABLE_RULE, others + normalised)
+        with self.transaction():
+            self.upsert_rows(schema.TABLE_RULE_SET, [header])
+            self._replace_child_rows(schema.TABLE_RULE, "rule_set_id",
+                                     rule_set_id, normalised)
         return rule_set_id
 
     def delete_rule_set(self, rule_set_id: str) -> None:
         self.delete_rows(schema.TABLE_RULE_SET, [rule_set_id])
-        remaining = [r for r in self.read_table(schema.TABLE_RULE) if r.get("rule_set_id") != rule_set_id]
-        self.write_table(schema.TABLE_RULE, remaining)
+        self._replace_child_rows(schema.TABLE_RULE, "rule_set_id", rule_set_id, [])
 
     def seed_default_rule_set(self) -> str:
         """Create the default 'Burial Assessment' template. Returns its id."""
@@ -835,11 +945,8 @@ class WorkbenchStore:
 
     def delete_assessment(self, assessment_id: str) -> None:
         self.delete_rows(schema.TABLE_ASSESSMENT, [assessment_id])
-        remaining = [
-            r for r in self.read_table(schema.TABLE_ASSESSMENT_RANGE)
-            if r.get("assessment_id") != assessment_id
-        ]
-        self.write_table(schema.TABLE_ASSESSMENT_RANGE, remaining)
+        self._replace_child_rows(schema.TABLE_ASSESSMENT_RANGE, "assessment_id",
+                                 assessment_id, [])
 
     def list_assessment_ranges(self, assessment_id: str) -> List[Dict]:
         rows = [
@@ -851,28 +958,24 @@ class WorkbenchStore:
 
     def save_assessment_ranges(self, assessment_id: str, rows: Sequence[Dict]) -> None:
         """Replace all stored ranges for one assessment."""
-        others = [
-            r for r in self.read_table(schema.TABLE_ASSESSMENT_RANGE)
-            if r.get("assessment_id") != assessment_id
-        ]
         normalised = []
         for row in rows:
             row = dict(row)
             row["assessment_id"] = assessment_id
             row.setdefault("range_id", schema.new_id())
             normalised.append(row)
-        self.write_table(schema.TABLE_ASSESSMENT_RANGE, others + normalised)
+        self._replace_child_rows(schema.TABLE_ASSESSMENT_RANGE, "assessment_id",
+                                 assessment_id, normalised)
 
     def mark_assessments_stale(self, rpl_id: str) -> None:
         """Flag every current assessment of an RPL as stale (RPL changed)."""
-        rows = self.read_table(schema.TABLE_ASSESSMENT)
-        changed = False
-        for row in rows:
+        changed = []
+        for row in self.read_table(schema.TABLE_ASSESSMENT):
             if row.get("rpl_id") == rpl_id and row.get("status") == "current":
                 row["status"] = "stale"
-                changed = True
+                changed.append(row)
         if changed:
-            self.write_table(schema.TABLE_ASSESSMENT, rows)
+            self.upsert_rows(schema.TABLE_ASSESSMENT, changed)
 
     # -- topology (CRA core) -----------------------------------------------------
     def list_components(self) -> List[Dict]:
@@ -905,15 +1008,15 @@ class WorkbenchStore:
         # wb_system is shared by the manual route grouping and the topology
         # assignment cache. Clear manual route references; topology code may
         # recreate derived rows later if the port graph still needs them.
-        routes = self.read_table(schema.TABLE_ROUTE)
-        changed = False
-        for route in routes:
+        changed = []
+        for route in self.read_table(schema.TABLE_ROUTE):
             if route.get("system_id") == system_id:
                 route["system_id"] = ""
-                changed = True
-        if changed:
-            self.write_table(schema.TABLE_ROUTE, routes)
-        self.delete_rows(schema.TABLE_SYSTEM, [system_id])
+                changed.append(route)
+        with self.transaction():
+            if changed:
+                self.upsert_rows(schema.TABLE_ROUTE, changed)
+            self.delete_rows(schema.TABLE_SYSTEM, [system_id])
 
     def save_component(self, row: Dict, port_labels: Sequence[str] = ()) -> str:
         """Upsert a component; optionally create its ports if it has none."""